@@ -25,6 +25,7 @@ from .http_types import HTTPMethod
 from .ir import (
     IRDiscriminator,
     IROperation,
+    IRPagination,
     IRParameter,
     IRRequestBody,
     IRResponse,
@@ -44,6 +45,7 @@ __all__ = [
     "IRParameter",
     "IRResponse",
     "IROperation",
+    "IRPagination",
     "IRSchema",
     "IRSpec",
     "IRRequestBody",
@@ -109,6 +111,12 @@ def generate_client(
     no_postprocess: bool = False,
     verbose: bool = False,
     naming_strategy: NamingStrategy = NamingStrategy.OPERATION_ID,
+    model_codecs: bool = False,
+    model_slots: bool = False,
+    model_frozen: bool = False,
+    model_kw_only: bool = False,
+    coalesce_operations: List[str] | None = None,
+    operation_timeouts: dict[str, float] | None = None,
 ) -> List[Path]:
     """Generate a Python client from an OpenAPI specification.
 
@@ -151,6 +159,28 @@ def generate_client(
                         from frameworks like FastAPI. 'path' ignores operationId
                         and derives names from the HTTP method and path.
 
+        model_codecs: If True, emits ahead-of-time _from_json/_to_json functions
+                     next to each dataclass model, so that structuring and
+                     unstructuring dispatch to straight-line code instead of
+                     reflecting over the classes at runtime.
+
+        model_slots: If True, models are generated as @dataclass(slots=True),
+                    without a per-instance __dict__, which cuts the memory
+                    held by each instance.
+
+        model_frozen: If True, models are generated as @dataclass(frozen=True).
+
+        model_kw_only: If True, models are generated as @dataclass(kw_only=True).
+
+        coalesce_operations: Operation IDs whose identical in-flight requests
+                            share one network call and one response, in
+                            addition to operations marked `x-coalesce: true`.
+                            Only GET and HEAD operations can be coalesced.
+
+        operation_timeouts: Default deadline in seconds of the calls to each listed
+                           operation ID, overriding `x-timeout`. Callers can still
+                           pass their own `timeout` to the endpoint method.
+
     Returns:
         List of Path objects for all generated files.
 
@@ -233,4 +263,10 @@ def generate_client(
         force=force,
         no_postprocess=no_postprocess,
         naming_strategy=naming_strategy,
+        model_codecs=model_codecs,
+        model_slots=model_slots,
+        model_frozen=model_frozen,
+        model_kw_only=model_kw_only,
+        coalesce_operations=coalesce_operations,
+        operation_timeouts=operation_timeouts,
     )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 
 import typer
 
@@ -7,6 +8,21 @@ from .generator.client_generator import ClientGenerator, GenerationError
 from .ir import NamingStrategy
 
 
+def _parse_operation_timeout(entry: str) -> tuple[str, float]:
+    """Split an `OPERATION_ID=SECONDS` option value."""
+    operation_id, _, seconds = entry.partition("=")
+    try:
+        timeout = float(seconds)
+    except ValueError:
+        timeout = 0.0
+    if not operation_id or not timeout > 0:
+        raise typer.BadParameter(
+            f"Expected OPERATION_ID=SECONDS with a positive number of seconds, got '{entry}'",
+            param_hint="--operation-timeout",
+        )
+    return operation_id, timeout
+
+
 def main(
     spec: str = typer.Argument(..., help="Path or URL to OpenAPI spec"),
     project_root: Path = typer.Option(
@@ -40,6 +56,45 @@ def main(
             "'path' ignores operationId and derives names from the HTTP method and path."
         ),
     ),
+    model_codecs: bool = typer.Option(
+        False,
+        "--model-codecs",
+        help=(
+            "Emit ahead-of-time _from_json/_to_json functions next to each dataclass model. "
+            "structure_from_dict/unstructure_to_dict dispatch to them instead of reflecting at runtime."
+        ),
+    ),
+    model_slots: bool = typer.Option(
+        False,
+        "--model-slots",
+        help="Generate models as @dataclass(slots=True): no per-instance __dict__, much less memory per instance.",
+    ),
+    model_frozen: bool = typer.Option(
+        False,
+        "--model-frozen",
+        help="Generate models as @dataclass(frozen=True): immutable, and hashable when their fields are.",
+    ),
+    model_kw_only: bool = typer.Option(
+        False, "--model-kw-only", help="Generate models as @dataclass(kw_only=True): fields are keyword-only."
+    ),
+    coalesce: List[str] | None = typer.Option(
+        None,
+        "--coalesce",
+        metavar="OPERATION_ID",
+        help=(
+            "Coalesce identical in-flight requests of this GET/HEAD operation into one network call. "
+            "Repeat for several operations; operations marked `x-coalesce: true` are always coalesced."
+        ),
+    ),
+    operation_timeout: List[str] | None = typer.Option(
+        None,
+        "--operation-timeout",
+        metavar="OPERATION_ID=SECONDS",
+        help=(
+            "Default deadline of calls to this operation, including their nested requests; overrides "
+            "`x-timeout`. Repeat for several operations."
+        ),
+    ),
 ) -> None:
     """
     Generate a Python OpenAPI client from a spec file or URL.
@@ -47,6 +102,7 @@ def main(
     """
     if core_package is None:
         core_package = output_package + ".core"
+    operation_timeouts = dict(_parse_operation_timeout(entry) for entry in operation_timeout or [])
     generator = ClientGenerator()
     # Handle both URLs (pass as-is) and file paths (resolve to absolute)
     spec_path = spec if is_url(spec) else str(Path(spec).resolve())
@@ -59,6 +115,12 @@ def main(
             no_postprocess=no_postprocess,
             core_package=core_package,
             naming_strategy=naming_strategy,
+            model_codecs=model_codecs,
+            model_slots=model_slots,
+            model_frozen=model_frozen,
+            model_kw_only=model_kw_only,
+            coalesce_operations=coalesce,
+            operation_timeouts=operation_timeouts or None,
         )
         typer.echo("Client generation complete.")
     except GenerationError as e:
@@ -57,6 +57,10 @@ class RenderContext:
         parsed_schemas: dict[str, IRSchema] | None = None,
         use_absolute_imports: bool = True,
         output_package_name: str | None = None,
+        model_codecs: bool = False,
+        model_slots: bool = False,
+        model_frozen: bool = False,
+        model_kw_only: bool = False,
     ) -> None:
         """
         Initialize a new RenderContext.
@@ -73,6 +77,10 @@ class RenderContext:
             parsed_schemas: Optional dictionary of all parsed IRSchema objects.
             use_absolute_imports: Whether to use absolute imports instead of relative imports for internal modules.
             output_package_name: The full output package name (e.g., "pyapis.business") for generating absolute imports.
+            model_codecs: Whether to emit ahead-of-time _from_json/_to_json functions next to each dataclass.
+            model_slots: Whether model dataclasses are generated with `slots=True` (no per-instance `__dict__`).
+            model_frozen: Whether model dataclasses are generated with `frozen=True`.
+            model_kw_only: Whether model dataclasses are generated with `kw_only=True`.
         """
         self.file_manager = file_manager or FileManager()
         self.import_collector = ImportCollector()
@@ -84,6 +92,10 @@ class RenderContext:
         self.parsed_schemas: dict[str, IRSchema] | None = parsed_schemas
         self.use_absolute_imports: bool = use_absolute_imports
         self.output_package_name: str | None = output_package_name
+        self.model_codecs: bool = model_codecs
+        self.model_slots: bool = model_slots
+        self.model_frozen: bool = model_frozen
+        self.model_kw_only: bool = model_kw_only
         # Dictionary to store conditional imports, keyed by condition
         self.conditional_imports: dict[str, dict[str, Set[str]]] = {}
 
@@ -0,0 +1,188 @@
+"""
+Adaptive (AIMD) limits on the requests in flight per origin.
+
+`AdaptiveConcurrency` replaces a fixed concurrency limit with one that follows the upstream's
+capacity, in the manner of TCP congestion control:
+- additive increase: the limit grows by one per limit's worth of requests answered while latency
+  stays within `latency_tolerance` times the lowest latency observed
+- multiplicative decrease: the limit is multiplied by `backoff` when a response is slower than
+  that, or is a 503, or the request times out
+
+Requests beyond the limit of their origin wait in first-in, first-out order. `HttpxTransport`
+acquires a slot around every request when it is given a controller:
+
+    transport = HttpxTransport(base_url, concurrency=AdaptiveConcurrency(max_limit=200))
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+
+# The observed minimum latency rises by this factor per response, so that it follows an upstream
+# whose baseline latency has shifted instead of treating every later response as a spike
+_MIN_LATENCY_DRIFT = 1.01
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """
+    Snapshot of the adaptive concurrency limit of one origin.
+
+    Attributes:
+        limit: Current limit on requests in flight.
+        in_flight: Requests in flight.
+        queued: Requests waiting for a slot.
+        min_latency_seconds: Baseline latency the limit adapts against (None before the first response).
+        increases: Times the limit was raised.
+        decreases: Times the limit was cut.
+    """
+
+    limit: int
+    in_flight: int
+    queued: int
+    min_latency_seconds: float | None
+    increases: int
+    decreases: int
+
+
+class OriginLimit:
+    """The adaptive limit of one origin and the requests waiting for it."""
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.min_latency: float | None = None
+        self.last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    def wake(self) -> None:
+        """Hand free slots to waiting requests, oldest first."""
+        while self.waiters and self.in_flight < int(self.limit):
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdaptiveConcurrency:
+    """
+    Per-origin concurrency limits adjusted by additive increase / multiplicative decrease.
+
+    Attributes:
+        min_limit: Lowest limit (at least 1).
+        max_limit: Highest limit.
+        latency_tolerance: A response slower than this multiple of the minimum latency counts as overload.
+        backoff: Factor applied to the limit on overload.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            initial_limit: Limit of an origin before any response was observed.
+            min_limit: Lowest limit (at least 1).
+            max_limit: Highest limit, e.g. the connection pool size.
+            latency_tolerance: A response slower than this multiple of the minimum latency counts as overload.
+            backoff: Factor (between 0 and 1) applied to the limit on overload.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Expected 1 <= min_limit <= max_limit, got {min_limit} and {max_limit}")
+        if not 0 < backoff < 1:
+            raise ValueError(f"backoff must be between 0 and 1, got {backoff}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._initial_limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._origins: dict[str, OriginLimit] = {}
+
+    def _origin(self, origin: str) -> OriginLimit:
+        state = self._origins.get(origin)
+        if state is None:
+            state = self._origins[origin] = OriginLimit(self._initial_limit)
+        return state
+
+    async def acquire(self, origin: str) -> float:
+        """
+        Wait for a slot of the origin's limit.
+
+        Returns:
+            The time (time.monotonic()) the slot was granted, to be passed to `release`.
+        """
+        state = self._origin(origin)
+        if state.in_flight < int(state.limit) and not state.waiters:
+            state.in_flight += 1
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            state.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._free(state)  # Granted just as the caller was cancelled
+                raise
+        return time.monotonic()
+
+    def release(self, origin: str, started: float, overloaded: bool = False, answered: float | None = None) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of its request.
+
+        Args:
+            origin: The origin passed to `acquire`.
+            started: The time returned by `acquire`.
+            overloaded: Whether the upstream signalled overload (a 503 or a timeout).
+            answered: When the response headers arrived (time.monotonic()), if the slot was held
+                longer, e.g. while a streamed body was read; defaults to now.
+        """
+        state = self._origins[origin]
+        now = time.monotonic()
+        latency = (answered if answered is not None else now) - started
+        slow = state.min_latency is not None and latency > state.min_latency * self.latency_tolerance
+        if not overloaded:
+            baseline = latency if state.min_latency is None else state.min_latency * _MIN_LATENCY_DRIFT
+            state.min_latency = min(latency, baseline)
+        if overloaded or slow:
+            # Requests sent before the last cut reflect the old limit: one overload episode, one cut
+            if started >= state.last_decrease:
+                state.limit = max(self.min_limit, state.limit * self.backoff)
+                state.last_decrease = now
+                state.decreases += 1
+        elif state.in_flight >= int(state.limit) // 2 and state.limit < self.max_limit:
+            # Only raise a limit that is being used; +1 per limit's worth of responses
+            previous = int(state.limit)
+            state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            if int(state.limit) > previous:
+                state.increases += 1
+        self._free(state)
+
+    @staticmethod
+    def _free(state: OriginLimit) -> None:
+        state.in_flight -= 1
+        state.wake()
+
+    def limit(self, origin: str) -> int:
+        """Current limit of an origin."""
+        return int(self._origin(origin).limit)
+
+    def stats(self) -> dict[str, ConcurrencyStats]:
+        """Adaptive limits per origin (`scheme://host[:port]`)."""
+        return {
+            origin: ConcurrencyStats(
+                limit=int(state.limit),
+                in_flight=state.in_flight,
+                queued=sum(1 for waiter in state.waiters if not waiter.done()),
+                min_latency_seconds=state.min_latency,
+                increases=state.increases,
+                decreases=state.decreases,
+            )
+            for origin, state in self._origins.items()
+        }
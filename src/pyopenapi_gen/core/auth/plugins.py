@@ -1,3 +1,6 @@
+import asyncio
+import time
+from dataclasses import dataclass
 from typing import Any, Awaitable, Callable
 
 from .base import BaseAuth
@@ -9,10 +12,20 @@ class BearerAuth(BaseAuth):
     def __init__(self, token: str) -> None:
         self.token = token
 
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        self._token = value
+        # Precomputed once instead of formatting the header value on every request
+        self._authorization = f"Bearer {value}"
+
     async def authenticate_request(self, request_args: dict[str, Any]) -> dict[str, Any]:
         # Ensure headers dict exists
         headers = dict(request_args.get("headers", {}))
-        headers["Authorization"] = f"Bearer {self.token}"
+        headers["Authorization"] = self._authorization
         request_args["headers"] = headers
         return request_args
 
@@ -63,27 +76,153 @@ class ApiKeyAuth(BaseAuth):
         return request_args
 
 
-class OAuth2Auth(BaseAuth):
-    """Authentication plugin for OAuth2 Bearer tokens, with optional auto-refresh."""
+@dataclass
+class OAuth2Token:
+    """An OAuth2 access token with its optional absolute expiry time.
+
+    Attributes:
+        access_token: The bearer token value.
+        expires_at: Expiry as a Unix timestamp (seconds, as returned by `time.time()`), or None if unknown.
+    """
+
+    access_token: str
+    expires_at: float | None = None
+
+
+class OAuth2TokenManager:
+    """Expiry-aware holder for an OAuth2 access token with single-flight refresh.
+
+    The token is refreshed only when it is about to expire (within `refresh_skew` seconds of
+    `expires_at`), so requests with a valid token never wait on the token endpoint. Concurrent
+    requests that find the token stale share one in-flight refresh instead of each starting their own.
+
+    If the expiry is unknown (`expires_at` is None and the callback returns a plain string), the
+    callback is consulted on every request as before; concurrent calls are still coalesced.
+    Return an `OAuth2Token` with `expires_at` from the callback to enable proactive refresh.
+    """
 
-    def __init__(self, access_token: str, refresh_callback: Callable[[str], Awaitable[str]] | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        refresh_callback: Callable[[str], Awaitable[str | OAuth2Token]] | None = None,
+        expires_at: float | None = None,
+        refresh_skew: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         """
         Args:
-            access_token: The OAuth2 access token.
-            refresh_callback: Optional async function to refresh the token. If provided, will be called
-            if token is expired.
+            access_token: The initial OAuth2 access token.
+            refresh_callback: Optional async function receiving the current token and returning either the
+                new token string or an `OAuth2Token` carrying its expiry.
+            expires_at: Expiry of `access_token` as a Unix timestamp, if known.
+            refresh_skew: Seconds before `expires_at` at which the token is proactively refreshed.
+            clock: Time source returning Unix timestamps (injectable for tests).
         """
-        self.access_token = access_token
+        self._token = OAuth2Token(access_token, expires_at)
         self.refresh_callback = refresh_callback
+        self.refresh_skew = refresh_skew
+        self._clock = clock
+        self._refresh_task: asyncio.Task[OAuth2Token] | None = None
+
+    @property
+    def token(self) -> OAuth2Token:
+        """The current token (possibly stale; use `get_token()` to refresh when needed)."""
+        return self._token
+
+    def set_token(self, access_token: str, expires_at: float | None = None) -> None:
+        """Replace the current token, e.g. after an out-of-band login."""
+        self._token = OAuth2Token(access_token, expires_at)
+
+    def invalidate(self) -> None:
+        """Mark the current token as expired so the next `get_token()` refreshes it (e.g. after a 401)."""
+        self._token = OAuth2Token(self._token.access_token, expires_at=0.0)
+
+    def needs_refresh(self) -> bool:
+        """Return True if the token must be refreshed before it is used."""
+        if self.refresh_callback is None:
+            return False
+        expires_at = self._token.expires_at
+        if expires_at is None:
+            return True  # Unknown expiry: defer to the callback on every request
+        return self._clock() >= expires_at - self.refresh_skew
+
+    async def get_token(self) -> str:
+        """Return a valid access token, refreshing it first if it is within the skew window."""
+        if not self.needs_refresh():
+            return self._token.access_token
+
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refresh())
+            self._refresh_task = task
+        # shield(): a cancelled caller must not cancel the refresh other callers are waiting on
+        token = await asyncio.shield(task)
+        return token.access_token
+
+    async def _refresh(self) -> OAuth2Token:
+        # needs_refresh() guarantees a callback is configured
+        callback = self.refresh_callback
+        assert callback is not None  # nosec B101 - Type narrowing for mypy
+        result = await callback(self._token.access_token)
+        if isinstance(result, OAuth2Token):
+            new_token = result
+        else:
+            new_token = OAuth2Token(result or self._token.access_token, None)
+        self._token = new_token
+        return new_token
+
+
+class OAuth2Auth(BaseAuth):
+    """Authentication plugin for OAuth2 Bearer tokens, with optional expiry-aware auto-refresh."""
+
+    def __init__(
+        self,
+        access_token: str,
+        refresh_callback: Callable[[str], Awaitable[str | OAuth2Token]] | None = None,
+        expires_at: float | None = None,
+        refresh_skew: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            access_token: The OAuth2 access token.
+            refresh_callback: Optional async function to refresh the token. It may return the new token string,
+            or an `OAuth2Token` with `expires_at` so that later refreshes happen only near expiry.
+            expires_at: Expiry of `access_token` as a Unix timestamp, if known.
+            refresh_skew: Seconds before expiry at which the token is proactively refreshed.
+        """
+        self.token_manager = OAuth2TokenManager(
+            access_token,
+            refresh_callback=refresh_callback,
+            expires_at=expires_at,
+            refresh_skew=refresh_skew,
+        )
+        self._authorization_for: str | None = None
+        self._authorization = ""
+
+    @property
+    def access_token(self) -> str:
+        return self.token_manager.token.access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        # The expiry of a token set by hand is unknown
+        self.token_manager.set_token(value)
+
+    @property
+    def refresh_callback(self) -> Callable[[str], Awaitable[str | OAuth2Token]] | None:
+        return self.token_manager.refresh_callback
+
+    @refresh_callback.setter
+    def refresh_callback(self, value: Callable[[str], Awaitable[str | OAuth2Token]] | None) -> None:
+        self.token_manager.refresh_callback = value
 
     async def authenticate_request(self, request_args: dict[str, Any]) -> dict[str, Any]:
-        # In a real implementation, check expiry and refresh if needed
-        if self.refresh_callback is not None:
-            # Optionally refresh token (user must implement expiry logic)
-            new_token = await self.refresh_callback(self.access_token)
-            if new_token and new_token != self.access_token:
-                self.access_token = new_token
+        token = await self.token_manager.get_token()
+        if token != self._authorization_for:
+            # Rebuild the header value only when the token actually changed
+            self._authorization_for = token
+            self._authorization = f"Bearer {token}"
         headers = dict(request_args.get("headers", {}))
-        headers["Authorization"] = f"Bearer {self.access_token}"
+        headers["Authorization"] = self._authorization
         request_args["headers"] = headers
         return request_args
@@ -0,0 +1,181 @@
+"""
+Bounded-concurrency execution of many endpoint calls.
+
+`Batch` runs submitted endpoint coroutines with at most `max_concurrency` of them in flight and,
+optionally, at most `per_host_limit` requests in flight per host. Each call's outcome is captured
+in a `BatchResult` instead of failing the whole batch, results are available in submission order,
+and `as_completed()` streams them as they finish:
+
+    async with client.batch(max_concurrency=32) as batch:
+        for user_id in user_ids:
+            batch.submit(client.users.get_user(user_id))
+    users = [result.unwrap() for result in batch.results()]
+"""
+
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, AsyncIterator, Awaitable, Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class HostLimiter:
+    """Per-host semaphores limiting the requests a batch has in flight to each host."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        """The semaphore of a host, created on first use."""
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+
+# Set in the tasks of a batch with a per-host limit; HttpxTransport holds a slot of it per request
+_host_limiter: ContextVar[HostLimiter | None] = ContextVar("batch_host_limiter", default=None)
+
+
+def current_host_limiter() -> HostLimiter | None:
+    """The per-host limiter of the batch running the current task, if any."""
+    return _host_limiter.get()
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """
+    Outcome of one call of a batch.
+
+    Attributes:
+        index: Position of the call in submission order.
+        value: The value returned by the call, if it succeeded.
+        error: The exception raised by the call (asyncio.CancelledError if the batch was aborted).
+    """
+
+    index: int
+    value: T | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return the value of the call, or raise its exception."""
+        if self.error is not None:
+            raise self.error
+        return cast(T, self.value)
+
+
+class Batch:
+    """
+    Runs endpoint coroutines with bounded concurrency, capturing each call's result or error.
+
+    Use it as an async context manager: leaving the block waits for every submitted call, or
+    cancels the calls still pending if the block raised.
+    """
+
+    def __init__(self, max_concurrency: int = 16, per_host_limit: int | None = None) -> None:
+        """
+        Args:
+            max_concurrency: Maximum number of submitted calls running at once.
+            per_host_limit: Maximum number of requests in flight to any one host (None: no limit).
+                Applied by HttpxTransport to the requests made by the batch's calls.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if per_host_limit is not None and per_host_limit < 1:
+            raise ValueError(f"per_host_limit must be >= 1, got {per_host_limit}")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_limiter = HostLimiter(per_host_limit) if per_host_limit is not None else None
+        self._tasks: list[asyncio.Task[BatchResult[Any]]] = []
+        self._completed: asyncio.Queue[BatchResult[Any]] = asyncio.Queue()
+
+    async def _run(self, index: int, call: Awaitable[T]) -> BatchResult[T]:
+        async with self._semaphore:
+            if self._host_limiter is not None:
+                _host_limiter.set(self._host_limiter)  # Task-local: each task runs in its own context
+            try:
+                return BatchResult(index, value=await call)
+            except Exception as e:
+                return BatchResult(index, error=e)
+
+    def submit(self, call: Awaitable[T]) -> "asyncio.Task[BatchResult[T]]":
+        """
+        Schedule an endpoint call, e.g. `batch.submit(client.users.get_user(user_id))`.
+
+        The call starts once fewer than `max_concurrency` calls are running. The returned task
+        resolves to the call's BatchResult and never raises the call's exception.
+        """
+        index = len(self._tasks)
+        task = asyncio.ensure_future(self._run(index, call))
+
+        def on_done(task: "asyncio.Task[BatchResult[T]]") -> None:
+            if task.cancelled():
+                if asyncio.iscoroutine(call):
+                    call.close()  # A call cancelled before it started was never awaited
+                self._completed.put_nowait(BatchResult(index, error=asyncio.CancelledError()))
+            else:
+                self._completed.put_nowait(task.result())
+
+        task.add_done_callback(on_done)
+        self._tasks.append(cast("asyncio.Task[BatchResult[Any]]", task))
+        return task
+
+    def __len__(self) -> int:
+        """Number of submitted calls."""
+        return len(self._tasks)
+
+    async def wait(self) -> None:
+        """Wait until every submitted call has finished."""
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    def results(self) -> list[BatchResult[Any]]:
+        """
+        Results of all submitted calls, in submission order.
+
+        Raises:
+            RuntimeError: If some calls have not finished (await `wait()` or leave the `async with` block first).
+        """
+        results: list[BatchResult[Any]] = []
+        for index, task in enumerate(self._tasks):
+            if not task.done():
+                raise RuntimeError("Batch results requested before all calls finished")
+            results.append(BatchResult(index, error=asyncio.CancelledError()) if task.cancelled() else task.result())
+        return results
+
+    async def as_completed(self) -> AsyncIterator[BatchResult[Any]]:
+        """
+        Yield the results of the submitted calls as they finish.
+
+        Calls submitted while iterating are included; the iteration ends once every call submitted
+        so far has been yielded.
+        """
+        yielded = 0
+        while yielded < len(self._tasks):
+            yield await self._completed.get()
+            yielded += 1
+
+    def cancel(self) -> None:
+        """Cancel every call that has not finished yet."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def __aenter__(self) -> "Batch":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
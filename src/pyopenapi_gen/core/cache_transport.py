@@ -0,0 +1,387 @@
+"""
+HTTP caching of GET responses for any HttpTransport (a private cache in the sense of RFC 9111).
+
+`CachingTransport` wraps another transport and:
+- serves responses while fresh according to `Cache-Control: max-age` (or `Expires`)
+- serves stale responses within `stale-while-revalidate` while refreshing them in the background
+- revalidates other stored responses with `If-None-Match` / `If-Modified-Since`, turning a
+  `304 Not Modified` into a cache hit
+- keeps entries in an in-memory LRU bounded by total size, optionally backed by a sqlite file
+  that survives restarts
+
+Only successful GET responses without `no-store` are stored. Cache keys hold the request's URL and
+`Authorization` header and the `cache_identity()` of the innermost transport that has one (HttpxTransport:
+its base URL, default headers and credentials), so clients with other credentials can share a sqlite
+file. A custom inner transport adding credentials without a `cache_identity()` needs a file of its own.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+import httpx
+
+from .http_transport import HttpTransport, open_stream
+from .json_codec import RESPONSE_CODEC_EXTENSION
+
+logger = logging.getLogger(__name__)
+
+# Response extension reporting how the cache answered: "hit", "stale", "revalidated" or "miss"
+CACHE_STATUS_EXTENSION = "cache_status"
+
+# Describe the network transfer of the stored body, not the decoded body that is stored
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+# Headers a 304 response updates on the stored response
+_REVALIDATION_HEADERS = ("cache-control", "date", "etag", "expires", "last-modified", "vary")
+
+
+def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _seconds(directives: Mapping[str, str | None], name: str) -> float:
+    try:
+        return max(float(directives.get(name) or 0), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class CacheEntry:
+    """
+    A stored response.
+
+    Attributes:
+        status_code: Status of the stored response.
+        headers: Response headers, without those describing the network transfer.
+        content: The decoded response body.
+        vary: Values of the request headers named by the response's `Vary` header.
+        fresh_until: Time (epoch seconds) until which the response is served without contacting the server.
+        stale_until: Time until which a stale response is served while it is revalidated in the background.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    vary: dict[str, str | None]
+    fresh_until: float
+    stale_until: float
+
+    @property
+    def size(self) -> int:
+        """Approximate memory used by the entry, in bytes."""
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers)
+
+    def header(self, name: str) -> str | None:
+        for header_name, value in self.headers:
+            if header_name.lower() == name:
+                return value
+        return None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, request: httpx.Request, now: float) -> "CacheEntry | None":
+        """Build the entry storing a response, or None if the response must not be stored."""
+        directives = _parse_cache_control(response.headers.get("cache-control"))
+        vary_names = [name.strip().lower() for name in response.headers.get("vary", "").split(",") if name.strip()]
+        has_validator = "etag" in response.headers or "last-modified" in response.headers
+        if response.status_code != 200 or "no-store" in directives or "*" in vary_names:
+            return None
+
+        if "no-cache" in directives:
+            lifetime = 0.0
+        elif "max-age" in directives:
+            lifetime = _seconds(directives, "max-age")
+        else:
+            expires, date = _http_date(response.headers.get("expires")), _http_date(response.headers.get("date"))
+            lifetime = max(expires - (date or now), 0.0) if expires is not None else 0.0
+        stale_window = 0.0 if "no-cache" in directives else _seconds(directives, "stale-while-revalidate")
+        if lifetime + stale_window <= 0 and not has_validator:
+            return None  # Could never be served without a full refetch
+
+        fresh_until = now + lifetime - _seconds(response.headers, "age")
+        return cls(
+            status_code=response.status_code,
+            headers=[(k, v) for k, v in response.headers.multi_items() if k.lower() not in _TRANSFER_HEADERS],
+            content=response.content,
+            vary={name: request.headers.get(name) for name in vary_names},
+            fresh_until=fresh_until,
+            stale_until=fresh_until + stale_window,
+        )
+
+
+class MemoryCacheStore:
+    """Least-recently-used entries whose total size stays within `max_bytes`."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self.delete(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.size += entry.size
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheStore:
+    """Entries in a sqlite database file, shared between runs. Calls block; run them in a thread."""
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache (key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT,"
+                " content BLOB, vary TEXT, fresh_until REAL, stale_until REAL)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, content, vary, fresh_until, stale_until FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, vary, fresh_until, stale_until = row
+        return CacheEntry(
+            status_code, [tuple(h) for h in json.loads(headers)], content, json.loads(vary), fresh_until, stale_until
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    json.dumps(entry.vary),
+                    entry.fresh_until,
+                    entry.stale_until,
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CachingTransport:
+    """
+    An HttpTransport caching the GET responses of another transport.
+
+    Responses served from the cache carry `response.extensions["cache_status"]` ("hit", "stale" or
+    "revalidated"); responses fetched in full carry "miss". Requests other than GET, with a body, or
+    with a `Cache-Control: no-store` request header go straight to the inner transport, as do streams.
+
+    Attributes:
+        inner: The wrapped transport.
+    """
+
+    def __init__(self, inner: HttpTransport, max_bytes: int = 64 * 1024 * 1024, path: str | None = None) -> None:
+        """
+        Args:
+            inner: The transport fetching responses from the network.
+            max_bytes: Size limit of the in-memory tier; least recently used entries are evicted beyond it.
+            path: Optional sqlite database file for a second, persistent tier.
+        """
+        self.inner = inner
+        self._memory = MemoryCacheStore(max_bytes)
+        self._disk = SqliteCacheStore(path) if path is not None else None
+        self._revalidations: dict[str, asyncio.Task[None]] = {}
+        self._codec: Any = None
+
+    async def _key(self, request: httpx.Request) -> str:
+        key = str(request.url)
+        authorization = request.headers.get("authorization")
+        if authorization is not None:
+            key += "#" + hashlib.sha256(authorization.encode()).hexdigest()[:16]
+        identity = await self._inner_identity()
+        if identity is not None:
+            key = f"{identity}:{key}"
+        return key
+
+    async def _inner_identity(self) -> str | None:
+        """The cache_identity() of the first transport down the chain of `inner` transports that has one."""
+        transport: Any = self.inner
+        while transport is not None:
+            cache_identity = getattr(transport, "cache_identity", None)
+            if cache_identity is not None:
+                return str(await cache_identity())
+            transport = getattr(transport, "inner", None)
+        return None
+
+    async def _lookup(self, key: str, request: httpx.Request) -> CacheEntry | None:
+        entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            entry = await asyncio.to_thread(self._disk.get, key)
+            if entry is not None:
+                self._memory.set(key, entry)
+        if entry is not None and any(request.headers.get(name) != value for name, value in entry.vary.items()):
+            return None
+        return entry
+
+    async def _store(self, key: str, entry: CacheEntry | None) -> None:
+        if entry is None:
+            self._memory.delete(key)
+            if self._disk is not None:
+                await asyncio.to_thread(self._disk.delete, key)
+            return
+        self._memory.set(key, entry)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.set, key, entry)
+
+    def _build_response(self, entry: CacheEntry, request: httpx.Request, status: str) -> httpx.Response:
+        response = httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=request,
+            extensions={CACHE_STATUS_EXTENSION: status},
+        )
+        if self._codec is not None:
+            response.extensions[RESPONSE_CODEC_EXTENSION] = self._codec
+        return response
+
+    @staticmethod
+    def _conditional_kwargs(kwargs: dict[str, Any], entry: CacheEntry) -> dict[str, Any]:
+        headers = dict(kwargs.get("headers") or {})
+        etag, last_modified = entry.header("etag"), entry.header("last-modified")
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return {**kwargs, "headers": headers}
+
+    async def _fetch(
+        self, key: str, entry: CacheEntry | None, request: httpx.Request, method: str, url: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Fetch from the network (conditionally if there is an entry) and update the cache."""
+        if entry is not None:
+            kwargs = self._conditional_kwargs(kwargs, entry)
+        response = await self.inner.request(method, url, **kwargs)
+        self._codec = response.extensions.get(RESPONSE_CODEC_EXTENSION, self._codec)
+        now = time.time()
+
+        if response.status_code == 304 and entry is not None:
+            # Not modified: the stored body with the headers of the 304
+            updated = {name for name in _REVALIDATION_HEADERS if name in response.headers}
+            headers = [(k, v) for k, v in entry.headers if k.lower() not in updated]
+            headers += [(k, v) for k, v in response.headers.multi_items() if k.lower() in updated]
+            merged = httpx.Response(200, headers=headers, content=entry.content)
+            refreshed = CacheEntry.from_response(merged, request, now)
+            await self._store(key, refreshed)
+            return self._build_response(refreshed or entry, request, "revalidated")
+
+        if response.status_code == 200:
+            await self._store(key, CacheEntry.from_response(response, request, now))
+        response.extensions[CACHE_STATUS_EXTENSION] = "miss"
+        return response
+
+    def _revalidate_in_background(
+        self, key: str, entry: CacheEntry, request: httpx.Request, method: str, url: str, kwargs: dict[str, Any]
+    ) -> None:
+        if key in self._revalidations:
+            return
+
+        async def revalidate() -> None:
+            try:
+                await self._fetch(key, entry, request, method, url, kwargs)
+            except Exception as e:
+                logger.warning(f"Background revalidation of {request.url} failed: {e!r}")
+            finally:
+                self._revalidations.pop(key, None)
+
+        self._revalidations[key] = asyncio.create_task(revalidate())
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, answering GET requests from the cache when the stored response allows it.
+
+        Returns:
+            httpx.Response: The response from the cache or the inner transport, regardless of status code.
+        """
+        request_headers = kwargs.get("headers") or {}
+        request_directives = _parse_cache_control(
+            next((v for k, v in request_headers.items() if k.lower() == "cache-control"), None)
+        )
+        if (
+            method.upper() != "GET"
+            or any(kwargs.get(body) is not None for body in ("json", "content", "data", "files"))
+            or "no-store" in request_directives
+        ):
+            return await self.inner.request(method, url, **kwargs)
+
+        request = httpx.Request(method, url, params=kwargs.get("params"), headers=request_headers)
+        key = await self._key(request)
+        entry = await self._lookup(key, request)
+        if entry is not None and "no-cache" not in request_directives:
+            now = time.time()
+            if now < entry.fresh_until:
+                return self._build_response(entry, request, "hit")
+            if now < entry.stale_until:
+                self._revalidate_in_background(key, entry, request, method, url, kwargs)
+                return self._build_response(entry, request, "stale")
+        return await self._fetch(key, entry, request, method, url, kwargs)
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> AbstractAsyncContextManager[httpx.Response]:
+        """Stream a response from the inner transport; streamed responses are not cached."""
+        return open_stream(self.inner, method, url, **kwargs)
+
+    async def close(self) -> None:
+        """Cancel pending background revalidations and close the inner transport and the sqlite tier."""
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        await asyncio.gather(*self._revalidations.values(), return_exceptions=True)
+        await self.inner.close()
+        if self._disk is not None:
+            self._disk.close()
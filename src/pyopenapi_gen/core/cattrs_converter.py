@@ -17,14 +17,30 @@ from __future__ import annotations
 import base64
 import dataclasses
 import re
+import threading
+import time
 import types
 from datetime import date, datetime
-from typing import Annotated, Any, Callable, TypeVar, Union, get_args, get_origin, get_type_hints
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import cattrs
 from cattrs.errors import BaseValidationError, ClassValidationError, IterableValidationError
 from cattrs.gen import make_dict_unstructure_fn, override
 
+from .metrics import PHASE_DESERIALIZE, metrics
+
 T = TypeVar("T")
 
 # Module-level caches: each class is processed at most once per process.
@@ -35,8 +51,19 @@ T = TypeVar("T")
 _type_hints_cache: dict[type, dict[str, Any]] = {}
 _structure_hooks_registered: set[type] = set()
 _unstructure_hooks_registered: set[type] = set()
+# Hook registration may run on a warm-up thread while requests are being decoded. The slow
+# path runs under this lock, and classes are published to the sets above only once the whole
+# object graph of the outermost registration has hooks, so the lock-free membership checks
+# never see a class whose nested hooks are still being installed.
+_registration_lock = threading.RLock()
+_registration_depth = 0
+_pending_structure_registrations: set[type] = set()
+_pending_unstructure_registrations: set[type] = set()
 # Lazily populated on first unstructure call per class; see _register_unstructure_hooks_recursively.
 _unstructure_fn_cache: dict[type, Any] = {}
+# Ahead-of-time codecs emitted next to generated models (--model-codecs); see register_model_codec.
+_model_structure_fns: dict[Any, Callable[[dict[str, Any]], Any]] = {}
+_model_unstructure_fns: dict[Any, Callable[[Any], dict[str, Any]]] = {}
 
 
 def _get_type_hints_with_extras(cls: type) -> dict[str, Any]:
@@ -229,9 +256,30 @@ def _make_dataclass_structure_fn(cls: type[T]) -> Any:
 
         return cls(**kwargs)
 
+    structure_fn._json_key_fingerprint = _dataclass_json_key_fingerprint(cls)  # type: ignore[attr-defined]
     return structure_fn
 
 
+def _dataclass_json_key_fingerprint(cls: type[Any]) -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Compute the (required JSON keys, all known JSON keys) fingerprint of a dataclass.
+
+    Union dispatchers use it to route payloads without trial structuring. Required keys are
+    the fields without default/default_factory, which is exactly the set of keys whose absence
+    makes structuring fail.
+    """
+    load_mapping: dict[str, str] = getattr(getattr(cls, "Meta", None), "key_transform_with_load", None) or {}
+    python_to_json = {python_name: json_key for json_key, python_name in load_mapping.items()}
+    required: set[str] = set()
+    known: set[str] = set()
+    for f in dataclasses.fields(cls):
+        json_key = python_to_json.get(f.name, f.name)
+        known.add(json_key)
+        if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+            required.add(json_key)
+    return frozenset(required), frozenset(known)
+
+
 def _make_dataclass_unstructure_fn(cls: type[T]) -> Any:
     """
     Create an unstructure function for a dataclass with field name transformation.
@@ -436,6 +484,264 @@ def _truncate_data_repr(data: Any, max_length: int = 200) -> str:
         return f"<{type(data).__name__}: repr failed>"
 
 
+class _UnionDispatcher:
+    """
+    Precompiled structuring plan for a single Union type.
+
+    Scenario:
+        The same Union type (e.g. the items of list[Annotated[Union[...], Discriminator]]) is
+        structured many times. Everything that only depends on the type is computed once here
+        instead of on every value.
+
+    Expected Outcome:
+        Structuring a value only inspects the value itself: the variant split, the discriminator
+        mapping (resolved to concrete classes, including forward-ref names) and the structure
+        functions of every variant are already in place.
+
+    Non-discriminated dataclass variants are routed by a JSON-key fingerprint index: variants
+    whose required keys are all present in a payload are tried first, in declaration order, so
+    the first of them that accepts the payload wins as before. The resulting try order is cached
+    per key set, so a wide union costs one set lookup per object instead of one caught exception
+    per non-matching variant. Variants ruled out by the index are still tried last, and errors
+    are reported in declaration order, so the try-all fallback and its messages are unchanged.
+    """
+
+    __slots__ = (
+        "union_type",
+        "allows_none",
+        "expected_variants",
+        "discriminators",
+        "dataclass_variants",
+        "dict_any_fallback",
+        "other_variants",
+        "fingerprints",
+        "routes",
+    )
+
+    def __init__(self, union_type: Any) -> None:
+        self.union_type = union_type
+
+        # If this is Annotated[Union[...], metadata], extract the Union and metadata
+        if get_origin(union_type) is Annotated:
+            annotated_args = get_args(union_type)
+            args = get_args(annotated_args[0]) if annotated_args else get_args(union_type)
+        else:
+            args = get_args(union_type)
+
+        self.allows_none = type(None) in args
+        self.expected_variants = [arg for arg in args if arg is not type(None)]
+
+        # Discriminators: (property_name, {discriminator_value: (variant, structure_fn)}).
+        # Metadata without a mapping never selects a variant, so it is dropped here.
+        self.discriminators: list[tuple[str, dict[Any, tuple[Any, Callable[[Any, Any], Any]]]]] = []
+        for metadata in getattr(union_type, "__metadata__", ()):
+            # Check if this is discriminator metadata (has property_name and get_mapping method)
+            if not (hasattr(metadata, "property_name") and hasattr(metadata, "get_mapping")):
+                continue
+            mapping = metadata.get_mapping()
+            if not mapping:
+                continue
+            resolved: dict[Any, tuple[Any, Callable[[Any, Any], Any]]] = {}
+            for discriminator_value, variant in mapping.items():
+                # Handle forward reference strings by finding the actual type among the union args
+                if isinstance(variant, str):
+                    variant = next(
+                        (arg for arg in args if getattr(arg, "__name__", None) == variant),
+                        variant,
+                    )
+                resolved[discriminator_value] = (variant, _build_variant_structure_fn(variant))
+            self.discriminators.append((metadata.property_name, resolved))
+
+        # Separate variants by type category
+        self.dataclass_variants: list[tuple[type[Any], str, Callable[[Any, Any], Any]]] = []
+        self.dict_any_fallback = False
+        # Can include generic types like List[T]
+        self.other_variants: list[tuple[Any, str, Callable[[Any, Any], Any]]] = []
+
+        for arg in self.expected_variants:
+            if isinstance(arg, type) and dataclasses.is_dataclass(arg):
+                self.dataclass_variants.append((arg, arg.__name__, _build_variant_structure_fn(arg)))
+            elif get_origin(arg) is dict and get_args(arg) == (str, Any):
+                # dict[str, Any] - our fallback type
+                self.dict_any_fallback = True
+            else:
+                # Includes plain types (str, int, datetime), generic types (List[T]) and
+                # other dict types, which are tried as variants
+                variant_name = getattr(arg, "__name__", str(arg))
+                self.other_variants.append((arg, variant_name, _build_variant_structure_fn(arg)))
+
+        # Fingerprints are only known for variants structured by _make_dataclass_structure_fn;
+        # variants with user-registered hooks have None and are never excluded by the index.
+        self.fingerprints: list[tuple[frozenset[str], frozenset[str]] | None] = [
+            getattr(structure_fn, "_json_key_fingerprint", None) for _, _, structure_fn in self.dataclass_variants
+        ]
+        self.routes: dict[frozenset[str], tuple[int, ...]] = {}
+
+    def route(self, data: dict[str, Any]) -> Sequence[int]:
+        """Return the order in which dataclass variants should be tried for this payload's keys."""
+        if len(self.dataclass_variants) < 2:
+            return range(len(self.dataclass_variants))
+        keys = frozenset(data)
+        order = self.routes.get(keys)
+        if order is not None:
+            return order
+
+        candidates: list[int] = []
+        excluded: list[int] = []
+        for index, fingerprint in enumerate(self.fingerprints):
+            if fingerprint is None or fingerprint[0] <= keys:
+                candidates.append(index)
+            else:
+                excluded.append(index)
+        order = (*candidates, *excluded)
+
+        # Bound the route table so that payloads with free-form keys cannot grow it unboundedly
+        if len(self.routes) < _MAX_UNION_ROUTES:
+            self.routes[keys] = order
+        return order
+
+    def structure(self, data: Any) -> Any:
+        """Structure `data` into the first matching variant; see _structure_union for the strategy."""
+        union_type = self.union_type
+
+        # Handle None explicitly
+        if data is None:
+            if self.allows_none:
+                return None
+            raise TypeError(f"None is not valid for {union_type}")
+
+        is_dict = isinstance(data, dict)
+
+        # Discriminator metadata enables O(1) lookup instead of O(n) sequential tries
+        if is_dict:
+            for property_name, mapping in self.discriminators:
+                if property_name not in data:
+                    # If discriminator property not in data, fall through to sequential try
+                    continue
+                discriminator_value = data[property_name]
+                entry = mapping.get(discriminator_value)
+                if entry is None:
+                    # Unknown discriminator value
+                    raise ValueError(
+                        f"Unknown discriminator value {discriminator_value!r} "
+                        f"for field {property_name!r}. "
+                        f"Expected one of: {list(mapping.keys())}"
+                    )
+                variant, structure_fn = entry
+                # Attempt to structure with the discriminated variant
+                try:
+                    return structure_fn(data, variant)
+                except Exception as e:
+                    # Provide clear error message for discriminated variant failure
+                    variant_name = getattr(variant, "__name__", str(variant))
+                    raise ValueError(
+                        f"Failed to deserialize as {variant_name} "
+                        f"(discriminator {property_name}={discriminator_value!r}): {e}"
+                    ) from e
+
+        # If data is a dict, try dataclass variants first
+        if is_dict:
+            errors: list[tuple[int, str, str]] = []
+            dataclass_variants = self.dataclass_variants
+            for index in self.route(data):
+                variant, variant_name, structure_fn = dataclass_variants[index]
+                try:
+                    return structure_fn(data, variant)
+                except Exception as e:
+                    errors.append((index, variant_name, str(e)))
+                    continue
+
+            # If no dataclass matched and dict fallback is available, return raw dict
+            if self.dict_any_fallback:
+                return data
+
+            # All variants failed - provide helpful error with data preview
+            if errors:
+                data_preview = _truncate_data_repr(data)
+                # Reported in declaration order, whatever order the route tried them in
+                error_details = "\n".join(f"  - {name}: {err}" for _, name, err in sorted(errors))
+                raise ValueError(
+                    f"Could not structure dict into any variant of {union_type}.\n"
+                    f"Data: {data_preview}\n"
+                    f"Tried variants:\n{error_details}"
+                )
+
+        # Try other variants using their structure hooks (accumulate errors for debugging)
+        # This handles:
+        # - Types with registered hooks (datetime, date, bytes, etc.)
+        # - Generic types (List[T], Dict[K,V], etc.)
+        # - Plain types (str, int, etc.)
+        other_errors: list[tuple[str, str]] = []
+        for variant, variant_name, structure_fn in self.other_variants:
+            try:
+                return structure_fn(data, variant)
+            except Exception as e:  # nosec B112 - intentional: trying variants until one succeeds
+                other_errors.append((variant_name, str(e)))
+                continue
+
+        # Last resort: if dict fallback is available and we have dict data
+        if self.dict_any_fallback and is_dict:
+            return data
+
+        # Include data preview in error message for debugging
+        data_preview = _truncate_data_repr(data)
+        if other_errors:
+            error_details = "\n".join(f"  - {name}: {err}" for name, err in other_errors)
+            raise TypeError(
+                f"Cannot structure {type(data).__name__} into {union_type}.\n"
+                f"Data: {data_preview}\n"
+                f"Tried variants:\n{error_details}"
+            )
+
+        raise TypeError(
+            f"Cannot structure {type(data).__name__} into {union_type}.\n"
+            f"Data: {data_preview}\n"
+            f"Expected one of: {self.expected_variants}"
+        )
+
+
+def _build_variant_structure_fn(variant: Any) -> Callable[[Any, Any], Any]:
+    """
+    Resolve the structure function for a union variant once, at dispatcher compile time.
+
+    Hooks for any dataclasses reachable from the variant are registered first, so that
+    generated container hooks (e.g. for list[Model]) capture our name-transforming hooks.
+    Unresolvable variants (e.g. a forward-ref name that is not a union member) fall back to
+    converter.structure so that they fail with cattrs' error at structuring time, as before.
+    """
+    if isinstance(variant, str):
+        return converter.structure
+    if isinstance(variant, type) and dataclasses.is_dataclass(variant):
+        _register_structure_hooks_recursively(variant)
+    else:
+        _register_hooks_for_nested_types(variant, set(), _register_structure_hooks_recursively)
+    try:
+        hook: Callable[[Any, Any], Any] = converter.get_structure_hook(variant)
+        return hook
+    except Exception:
+        return converter.structure
+
+
+# Upper bound on cached key-set routes per union dispatcher; see _UnionDispatcher.route.
+_MAX_UNION_ROUTES = 256
+
+# Compiled dispatchers keyed by the (hashable) union type; see _get_union_dispatcher.
+_union_dispatcher_cache: dict[Any, _UnionDispatcher] = {}
+
+
+def _get_union_dispatcher(union_type: Any) -> _UnionDispatcher:
+    """Return the compiled dispatcher for `union_type`, building and caching it on first use."""
+    try:
+        dispatcher = _union_dispatcher_cache.get(union_type)
+    except TypeError:
+        # Unhashable Annotated metadata: compile without caching
+        return _UnionDispatcher(union_type)
+    if dispatcher is None:
+        dispatcher = _UnionDispatcher(union_type)
+        _union_dispatcher_cache[union_type] = dispatcher
+    return dispatcher
+
+
 def _structure_union(data: Any, union_type: type) -> Any:
     """
     Structure a Union type by trying each variant.
@@ -450,11 +756,15 @@ def _structure_union(data: Any, union_type: type) -> Any:
     Strategy:
         1. If data is None and NoneType is in the union, return None
         2. Check for discriminator metadata for O(1) variant lookup
-        3. If data is a dict, try each dataclass variant
+        3. If data is a dict, try each dataclass variant, in the order given by the
+           required-key fingerprint index (likely matches first, impossible ones last)
         4. Try structuring with other variants (generic types, registered hooks)
         5. Fall back to dict[str, Any] if present
         6. Raise error if no variant matches
 
+    The type-dependent part of this work is compiled once per union type into a
+    _UnionDispatcher and cached, so only the per-value steps run on each call.
+
     Args:
         data: The raw data to structure
         union_type: The Union type to structure into
@@ -466,148 +776,7 @@ def _structure_union(data: Any, union_type: type) -> Any:
         TypeError: If data is None but NoneType not in union
         ValueError: If no Union variant matches the data
     """
-    # If this is Annotated[Union[...], metadata], extract the Union and metadata
-    origin = get_origin(union_type)
-    if origin is Annotated:
-        annotated_args = get_args(union_type)
-        if annotated_args:
-            actual_union = annotated_args[0]
-            args = get_args(actual_union)
-        else:
-            args = get_args(union_type)
-    else:
-        args = get_args(union_type)
-
-    # Handle None explicitly
-    if data is None:
-        if type(None) in args:
-            return None
-        raise TypeError(f"None is not valid for {union_type}")
-
-    # Check for discriminator metadata (from Annotated[Union[...], discriminator])
-    # This enables O(1) lookup instead of O(n) sequential tries
-    if hasattr(union_type, "__metadata__"):
-        for metadata in union_type.__metadata__:
-            # Check if this is discriminator metadata (has property_name and get_mapping method)
-            if hasattr(metadata, "property_name") and hasattr(metadata, "get_mapping"):
-                if isinstance(data, dict) and metadata.property_name in data:
-                    discriminator_value = data[metadata.property_name]
-
-                    # Get the mapping using the get_mapping method
-                    mapping = metadata.get_mapping()
-
-                    if mapping and discriminator_value in mapping:
-                        variant = mapping[discriminator_value]
-
-                        # Handle forward reference strings
-                        if isinstance(variant, str):
-                            # Try to find the actual type from union args
-                            for arg in args:
-                                if hasattr(arg, "__name__") and arg.__name__ == variant:
-                                    variant = arg
-                                    break
-
-                        # Attempt to structure with the discriminated variant
-                        try:
-                            _register_structure_hooks_recursively(variant)
-                            return converter.structure(data, variant)
-                        except Exception as e:
-                            # Provide clear error message for discriminated variant failure
-                            raise ValueError(
-                                f"Failed to deserialize as {variant.__name__} "
-                                f"(discriminator {metadata.property_name}={discriminator_value!r}): {e}"
-                            ) from e
-                    elif mapping:
-                        # Unknown discriminator value
-                        valid_values = list(mapping.keys())
-                        raise ValueError(
-                            f"Unknown discriminator value {discriminator_value!r} "
-                            f"for field {metadata.property_name!r}. "
-                            f"Expected one of: {valid_values}"
-                        )
-                # If discriminator property not in data, fall through to sequential try
-
-    # Separate variants by type category
-    dataclass_variants: list[type[Any]] = []
-    dict_any_fallback = False
-    other_variants: list[Any] = []  # Can include generic types like List[T]
-
-    for arg in args:
-        if arg is type(None):
-            continue
-        elif isinstance(arg, type) and dataclasses.is_dataclass(arg):
-            dataclass_variants.append(arg)
-        elif get_origin(arg) is dict:
-            # Check if it's dict[str, Any] - our fallback type
-            dict_args = get_args(arg)
-            if dict_args == (str, Any):
-                dict_any_fallback = True
-            else:
-                # Other dict types should be tried as variants
-                other_variants.append(arg)
-        else:
-            # Includes plain types (str, int, datetime) and generic types (List[T])
-            other_variants.append(arg)
-
-    # If data is a dict, try dataclass variants first
-    if isinstance(data, dict):
-        errors: list[tuple[str, str]] = []
-        for variant in dataclass_variants:
-            try:
-                # Ensure hooks are registered for this variant
-                _register_structure_hooks_recursively(variant)
-                return converter.structure(data, variant)
-            except Exception as e:
-                errors.append((variant.__name__, str(e)))
-                continue
-
-        # If no dataclass matched and dict fallback is available, return raw dict
-        if dict_any_fallback:
-            return data
-
-        # All variants failed - provide helpful error with data preview
-        if errors:
-            data_preview = _truncate_data_repr(data)
-            error_details = "\n".join(f"  - {name}: {err}" for name, err in errors)
-            raise ValueError(
-                f"Could not structure dict into any variant of {union_type}.\n"
-                f"Data: {data_preview}\n"
-                f"Tried variants:\n{error_details}"
-            )
-
-    # Try other variants using converter.structure (accumulate errors for debugging)
-    # This handles:
-    # - Types with registered hooks (datetime, date, bytes, etc.)
-    # - Generic types (List[T], Dict[K,V], etc.)
-    # - Plain types (str, int, etc.)
-    other_errors: list[tuple[str, str]] = []
-    for variant in other_variants:
-        try:
-            return converter.structure(data, variant)
-        except Exception as e:  # nosec B112 - intentional: trying variants until one succeeds
-            variant_name = getattr(variant, "__name__", str(variant))
-            other_errors.append((variant_name, str(e)))
-            continue
-
-    # Last resort: if dict fallback is available and we have dict data
-    if dict_any_fallback and isinstance(data, dict):
-        return data
-
-    # Include data preview in error message for debugging
-    data_preview = _truncate_data_repr(data)
-    if other_errors:
-        error_details = "\n".join(f"  - {name}: {err}" for name, err in other_errors)
-        raise TypeError(
-            f"Cannot structure {type(data).__name__} into {union_type}.\n"
-            f"Data: {data_preview}\n"
-            f"Tried variants:\n{error_details}"
-        )
-
-    raise TypeError(
-        f"Cannot structure {type(data).__name__} into {union_type}.\n"
-        f"Data: {data_preview}\n"
-        f"Expected one of: {[arg for arg in args if arg is not type(None)]}"
-    )
+    return _get_union_dispatcher(union_type).structure(data)
 
 
 def _union_structure_hook(data: Any, union_type: type) -> Any:
@@ -664,15 +833,21 @@ def _register_structure_hooks_recursively(cls: type[Any], visited: set[type[Any]
         cls: The dataclass type to register hooks for
         visited: Set of already-visited types to avoid infinite recursion
     """
-    if visited is None:
-        visited = set()
-
     # Global persistent guard: each class is registered at most once per process.
     # Without this, structure_from_dict traverses and calls get_type_hints for the
     # entire type graph on every invocation — O(N × calls) instead of O(N) total.
     if cls in _structure_hooks_registered:
         return
 
+    with _RegistrationScope():
+        _register_structure_hooks_locked(cls, visited if visited is not None else set())
+
+
+def _register_structure_hooks_locked(cls: type[Any], visited: set[type[Any]]) -> None:
+    """Body of _register_structure_hooks_recursively; runs under _registration_lock."""
+    if cls in _structure_hooks_registered or cls in _pending_structure_registrations:
+        return
+
     # Local within-call guard: prevents infinite recursion during the traversal.
     if cls in visited:
         return
@@ -683,8 +858,8 @@ def _register_structure_hooks_recursively(cls: type[Any], visited: set[type[Any]
     if not dataclasses.is_dataclass(cls):
         return
 
-    # Mark as processing before recursing to prevent cycles.
-    _structure_hooks_registered.add(cls)
+    # Mark as processing before recursing to prevent cycles; published when the scope exits.
+    _pending_structure_registrations.add(cls)
 
     try:
         structure_fn = _make_dataclass_structure_fn(cls)
@@ -715,6 +890,32 @@ def _register_structure_hooks_recursively(cls: type[Any], visited: set[type[Any]
         _register_hooks_for_nested_types(field_type, visited, _register_structure_hooks_recursively)
 
 
+class _RegistrationScope:
+    """
+    Hold _registration_lock for one (possibly nested) hook registration.
+
+    Classes registered while the scope is open are published to the registered sets when the
+    outermost scope exits, after their whole object graph has hooks.
+    """
+
+    def __enter__(self) -> None:
+        global _registration_depth
+        _registration_lock.acquire()
+        _registration_depth += 1
+
+    def __exit__(self, *exc_info: object) -> None:
+        global _registration_depth
+        try:
+            _registration_depth -= 1
+            if _registration_depth == 0:
+                _structure_hooks_registered.update(_pending_structure_registrations)
+                _unstructure_hooks_registered.update(_pending_unstructure_registrations)
+                _pending_structure_registrations.clear()
+                _pending_unstructure_registrations.clear()
+        finally:
+            _registration_lock.release()
+
+
 def _register_hooks_for_nested_types(
     type_hint: Any, visited: set[type], registrar: Callable[[type, set[type]], None]
 ) -> None:
@@ -812,6 +1013,19 @@ def structure_from_dict(data: Any, cls: type[T]) -> T:
     Returns:
         Instance of cls
     """
+    if metrics.enabled:
+        return cast(T, metrics.timed(PHASE_DESERIALIZE, _structure_from_dict, data, cls))
+    return _structure_from_dict(data, cls)
+
+
+def _structure_from_dict(data: Any, cls: type[T]) -> T:
+    # O(1) dispatch to generated codecs for Model and list[Model] targets. Any failure falls
+    # through to the reflective path below, which re-raises with its detailed error report.
+    if _model_structure_fns:
+        codec_result = _structure_with_model_codec(data, cls)
+        if codec_result is not _NO_CODEC:
+            return cast(T, codec_result)
+
     # Register structure hooks for this dataclass and all nested dataclasses
     if dataclasses.is_dataclass(cls):
         _register_structure_hooks_recursively(cls)
@@ -849,13 +1063,19 @@ def _register_unstructure_hooks_recursively(cls: type[Any], visited: set[type[An
         cls: The dataclass type to register hooks for
         visited: Set of already-visited types to avoid infinite recursion
     """
-    if visited is None:
-        visited = set()
-
     # Global persistent guard: each class is registered at most once per process.
     if cls in _unstructure_hooks_registered:
         return
 
+    with _RegistrationScope():
+        _register_unstructure_hooks_locked(cls, visited if visited is not None else set())
+
+
+def _register_unstructure_hooks_locked(cls: type[Any], visited: set[type[Any]]) -> None:
+    """Body of _register_unstructure_hooks_recursively; runs under _registration_lock."""
+    if cls in _unstructure_hooks_registered or cls in _pending_unstructure_registrations:
+        return
+
     # Local within-call guard: prevents infinite recursion during the traversal.
     if cls in visited:
         return
@@ -866,8 +1086,8 @@ def _register_unstructure_hooks_recursively(cls: type[Any], visited: set[type[An
     if not dataclasses.is_dataclass(cls):
         return
 
-    # Mark as processing before recursing to prevent cycles.
-    _unstructure_hooks_registered.add(cls)
+    # Mark as processing before recursing to prevent cycles; published when the scope exits.
+    _pending_unstructure_registrations.add(cls)
 
     # Build the unstructure function lazily on first call, then cache it.
     # make_dict_unstructure_fn uses static dispatch (captures the converter's hook
@@ -927,6 +1147,10 @@ def unstructure_to_dict(instance: Any) -> dict[str, Any]:
     """
     cls = type(instance)
 
+    to_json = _model_unstructure_fns.get(cls)
+    if to_json is not None:
+        return to_json(instance)
+
     # Register unstructure hooks for this dataclass and all nested dataclasses
     if dataclasses.is_dataclass(cls):
         _register_unstructure_hooks_recursively(cls)
@@ -935,10 +1159,222 @@ def unstructure_to_dict(instance: Any) -> dict[str, Any]:
     return result
 
 
+# Sentinel returned by _structure_with_model_codec when no generated codec applies.
+_NO_CODEC = object()
+
+
+def _structure_with_model_codec(data: Any, cls: Any) -> Any:
+    """Structure `data` with the generated codec for `cls` or list[cls], or return _NO_CODEC."""
+    try:
+        from_json = _model_structure_fns.get(cls)
+    except TypeError:
+        # Unhashable target (e.g. Annotated with unhashable metadata)
+        return _NO_CODEC
+    try:
+        if from_json is not None:
+            if isinstance(data, dict):
+                return from_json(data)
+        elif get_origin(cls) is list and isinstance(data, list):
+            item_args = get_args(cls)
+            item_from_json = _model_structure_fns.get(item_args[0]) if item_args else None
+            if item_from_json is not None:
+                return [item_from_json(item) for item in data]
+    except Exception:  # nosec B110 - the reflective path reproduces the error with full context
+        pass
+    return _NO_CODEC
+
+
+def register_model_codec(
+    cls: type[T],
+    from_json: Callable[[dict[str, Any]], T],
+    to_json: Callable[[T], dict[str, Any]],
+) -> None:
+    """
+    Register the ahead-of-time generated codec functions of a model.
+
+    Scenario:
+        Models generated with --model-codecs carry straight-line _from_json/_to_json
+        functions (field renames, nested calls and scalar codecs inlined) and register
+        them here when their module is imported.
+
+    Expected Outcome:
+        structure_from_dict/unstructure_to_dict dispatch to them with a dict lookup instead
+        of reflecting over the class, and cattrs uses them wherever the model is nested in
+        a type it structures (unions, dicts, lists). Invalid payloads are re-structured by
+        the reflective hook so that error messages stay identical.
+
+    Args:
+        cls: The generated dataclass
+        from_json: Builds a `cls` instance from a decoded JSON object
+        to_json: Converts a `cls` instance into a JSON-ready dict
+    """
+    _model_structure_fns[cls] = from_json
+    _model_unstructure_fns[cls] = to_json
+
+    reflective_fns: list[Callable[[Any, Any], Any]] = []
+
+    def structure_hook(data: Any, _type: Any) -> Any:
+        if isinstance(data, dict):
+            try:
+                return from_json(data)
+            except Exception:  # nosec B110 - the reflective hook below reports the failure
+                pass
+        if not reflective_fns:
+            reflective_fns.append(_make_dataclass_structure_fn(cls))
+        return reflective_fns[0](data, _type)
+
+    structure_hook._json_key_fingerprint = _dataclass_json_key_fingerprint(cls)  # type: ignore[attr-defined]
+
+    def predicate(t: Any, captured_cls: type[Any] = cls) -> bool:
+        return t is captured_cls
+
+    # Predicate hooks keep user-registered exact hooks in charge, as for reflective models.
+    # Marking the class registered keeps the reflective registration from installing its own
+    # hooks over these ones.
+    with _RegistrationScope():
+        converter.register_structure_hook_func(predicate, structure_hook)
+        converter.register_unstructure_hook_func(predicate, to_json)
+        _pending_structure_registrations.add(cls)
+        _pending_unstructure_registrations.add(cls)
+
+
+def structure_model(data: Any, cls: type[T]) -> T:
+    """
+    Structure a nested model value from generated codec code.
+
+    Dispatches to the registered codec of `cls` for JSON objects and otherwise defers to the
+    converter (enums, type aliases, wrapper classes, reflective dataclasses).
+    """
+    from_json = _model_structure_fns.get(cls)
+    if from_json is not None and isinstance(data, dict):
+        return cast(T, from_json(data))
+    if isinstance(cls, type) and dataclasses.is_dataclass(cls):
+        _register_structure_hooks_recursively(cls)
+    return converter.structure(data, cls)
+
+
+def unstructure_model(value: Any) -> Any:
+    """Unstructure a nested model value from generated codec code; the counterpart of structure_model."""
+    to_json = _model_unstructure_fns.get(type(value))
+    if to_json is not None:
+        return to_json(value)
+    if dataclasses.is_dataclass(value):
+        _register_unstructure_hooks_recursively(type(value))
+    return converter.unstructure(value)
+
+
+def model_field_type(cls: type[Any], field_name: str) -> Any:
+    """Return the resolved (Annotated-preserving) type of a model field, for generated fallback codecs."""
+    return _get_type_hints_with_extras(cls)[field_name]
+
+
+@dataclasses.dataclass
+class WarmupReport:
+    """
+    Outcome of warmup_models: how long pre-registering converter hooks took.
+
+    Attributes:
+        timings: Seconds spent per model name. A model's time includes nested models it
+            reached first, so the sum over timings is the total cost.
+        total_seconds: Wall-clock duration of the whole warm-up.
+        errors: Models whose warm-up failed, with the error message. They fall back to
+            lazy registration on first use.
+    """
+
+    timings: dict[str, float] = dataclasses.field(default_factory=dict)
+    total_seconds: float = 0.0
+    errors: dict[str, str] = dataclasses.field(default_factory=dict)
+    finished: threading.Event = dataclasses.field(default_factory=threading.Event, repr=False, compare=False)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a background warm-up has finished; returns False on timeout."""
+        return self.finished.wait(timeout)
+
+
+def _warm_up_type(type_hint: Any) -> None:
+    """Do, ahead of time, everything the first structure/unstructure of `type_hint` would do."""
+    if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+        _register_structure_hooks_recursively(type_hint)
+        _register_unstructure_hooks_recursively(type_hint)
+        converter.get_structure_hook(type_hint)
+        if type_hint not in _model_unstructure_fns and type_hint not in _unstructure_fn_cache:
+            _unstructure_fn_cache[type_hint] = _make_dataclass_unstructure_fn(type_hint)
+        # Union-typed fields compile their dispatchers lazily; do it now
+        for field_type in _get_type_hints_with_extras(type_hint).values():
+            _warm_up_unions(field_type)
+    elif _is_union_type(type_hint):
+        _warm_up_unions(type_hint)
+    else:
+        _register_hooks_for_nested_types(type_hint, set(), _register_structure_hooks_recursively)
+        converter.get_structure_hook(type_hint)
+
+
+def _warm_up_unions(type_hint: Any) -> None:
+    """Compile the dispatcher of every union found in `type_hint` (e.g. list[A | B])."""
+    if _is_union_type(type_hint):
+        _get_union_dispatcher(type_hint)
+        return
+    for arg in get_args(type_hint):
+        if not isinstance(arg, (str, int, float, bool)):
+            _warm_up_unions(arg)
+
+
+def warmup_models(models: Iterable[Any], background: bool = False) -> WarmupReport:
+    """
+    Pre-register structure and unstructure hooks for the given models.
+
+    Scenario:
+        The first structure/unstructure of each model pays for hook registration,
+        get_type_hints evaluation and cattrs code generation, which shows up as a latency
+        spike on the first requests after a deploy.
+
+    Expected Outcome:
+        That work is done up front, and the returned report says how long it took per model.
+        With background=True it runs in a daemon thread and the report fills in as it goes;
+        call report.wait() to block until it is complete.
+
+    Args:
+        models: Model classes (dataclasses, enums, union aliases) to warm up
+        background: Run in a daemon thread instead of the calling thread
+
+    Returns:
+        WarmupReport with per-model timings
+    """
+    report = WarmupReport()
+    model_list = list(models)
+
+    def run() -> None:
+        started = time.perf_counter()
+        try:
+            for model in model_list:
+                name = getattr(model, "__name__", str(model))
+                model_started = time.perf_counter()
+                try:
+                    _warm_up_type(model)
+                except Exception as e:  # Warm-up is best effort; first use registers lazily
+                    report.errors[name] = str(e)
+                report.timings[name] = time.perf_counter() - model_started
+        finally:
+            report.total_seconds = time.perf_counter() - started
+            report.finished.set()
+
+    if background:
+        threading.Thread(target=run, name="cattrs-warmup", daemon=True).start()
+    else:
+        run()
+    return report
+
+
 __all__ = [
     "converter",
+    "WarmupReport",
+    "warmup_models",
     "structure_from_dict",
     "unstructure_to_dict",
+    "register_model_codec",
+    "structure_model",
+    "unstructure_model",
+    "model_field_type",
     "structure_with_base64_bytes",
     "unstructure_bytes_to_base64",
     "structure_datetime",
@@ -0,0 +1,117 @@
+"""
+Single-flight coalescing of identical in-flight requests for any HttpTransport.
+
+When many coroutines request the same resource at once (e.g. a cache stampede on a cold start),
+`CoalescingTransport` sends one request and hands its response to every caller. Generated endpoint
+methods of operations marked `x-coalesce: true` (or listed with `--coalesce`) opt in by passing the
+`coalesce` request extension; other requests go straight to the inner transport.
+
+Requests are identical when their method, URL with query parameters and request headers match. The
+transport belongs to one client, so the credentials its inner transport adds are the same for every
+request. Only requests in flight at the same moment are coalesced: nothing is stored.
+"""
+
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from .http_transport import HttpTransport, open_stream
+
+# Request extension with which generated endpoint methods mark a request as coalescible
+COALESCE_EXTENSION = "coalesce"
+
+_COALESCIBLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Method, URL with query string, and sorted request headers
+_Key = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class _Flight:
+    """A request in flight and the number of callers waiting for its response."""
+
+    task: "asyncio.Task[httpx.Response]"
+    waiters: int = 0
+
+
+class CoalescingTransport:
+    """
+    An HttpTransport sharing one network call between identical, concurrent coalescible requests.
+
+    Every caller receives the same response object, or the same exception. A caller that is
+    cancelled stops waiting without affecting the others; the shared request is cancelled once no
+    caller waits for it any more.
+
+    Attributes:
+        inner: The wrapped transport.
+        coalesced: Number of requests answered by another caller's network call.
+    """
+
+    def __init__(self, inner: HttpTransport) -> None:
+        """
+        Args:
+            inner: The transport sending requests to the network.
+        """
+        self.inner = inner
+        self.coalesced = 0
+        self._flights: dict[_Key, _Flight] = {}
+
+    @staticmethod
+    def _key(method: str, url: str, kwargs: dict[str, Any]) -> _Key:
+        request = httpx.Request(method, url, params=kwargs.get("params"), headers=kwargs.get("headers"))
+        headers = tuple(
+            sorted((name.decode("latin-1"), value.decode("latin-1")) for name, value in request.headers.raw)
+        )
+        return method.upper(), str(request.url), headers
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, joining an identical one already in flight if the request is coalescible.
+
+        Returns:
+            httpx.Response: The response from the inner transport, regardless of status code.
+        """
+        extensions = kwargs.get("extensions")
+        if not extensions or not extensions.get(COALESCE_EXTENSION):
+            return await self.inner.request(method, url, **kwargs)
+        kwargs = {name: value for name, value in kwargs.items() if name != "extensions"}
+        other_extensions = {name: value for name, value in extensions.items() if name != COALESCE_EXTENSION}
+        if other_extensions:
+            kwargs["extensions"] = other_extensions
+        if method.upper() not in _COALESCIBLE_METHODS or any(
+            kwargs.get(body) is not None for body in ("json", "content", "data", "files")
+        ):
+            return await self.inner.request(method, url, **kwargs)
+
+        key = self._key(method, url, kwargs)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(self.inner.request(method, url, **kwargs)))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled: later identical requests must not join the cancelled call
+                flight.task.cancel()
+                self._land(key, flight)
+
+    def _land(self, key: _Key, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> AbstractAsyncContextManager[httpx.Response]:
+        """Stream a response from the inner transport; streamed responses are never coalesced."""
+        return open_stream(self.inner, method, url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the inner transport."""
+        await self.inner.close()
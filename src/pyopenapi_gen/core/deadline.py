@@ -0,0 +1,149 @@
+"""
+Deadlines that span every hop of a call.
+
+A deadline is a point in time carried in a context variable, so it propagates into the nested calls
+made on its behalf: the page requests of paginators, retries of wrapping transports, and the reads of
+streamed responses. Generated endpoint methods accept a `timeout` (seconds) and run under the earlier
+of that timeout and the deadline of their caller, so the budget shrinks as it is spent instead of each
+hop starting a fresh timeout. Once it is exhausted the call is cancelled and `DeadlineExceeded` is raised.
+The scope of an endpoint method also names its operation and path template, to which `metrics` and the
+slow-request sampler attribute what they measure:
+
+    async with Deadline(5.0):
+        user = await client.users.get_user(user_id)  # Both calls share the 5 second budget
+        orders = [order async for order in client.orders.iter_list_orders(user_id=user.id)]
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import AsyncIterator, TypeVar
+
+from .metrics import CallMetrics, enter_operation, exit_operation, metrics
+
+T = TypeVar("T")
+
+# time.monotonic() at which the calls of the current context must have completed
+_deadline: ContextVar[float | None] = ContextVar("pyopenapi_gen_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call is cancelled because its deadline passed."""
+
+
+def remaining() -> float | None:
+    """Seconds left until the deadline of the current context (None without one, 0.0 once it has passed)."""
+    expires = _deadline.get()
+    return None if expires is None else max(expires - time.monotonic(), 0.0)
+
+
+def _earliest(*deadlines: float | None) -> float | None:
+    known = [deadline for deadline in deadlines if deadline is not None]
+    return min(known) if known else None
+
+
+def _from_now(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+class Deadline:
+    """
+    Async context manager that bounds a block by `timeout` seconds and the deadline of its caller.
+
+    The block is cancelled when the earlier of the two passes, raising DeadlineExceeded. The timeout
+    starts when the block is entered; with a timeout of None only the caller's deadline applies.
+    With an `operation`, the block is a call of it (at path template `route`), and is measured as
+    such while metrics are enabled.
+    """
+
+    def __init__(self, timeout: float | None, operation: str | None = None, route: str | None = None) -> None:
+        self.timeout = timeout
+        self.operation = operation
+        self.route = route
+        self._expires: float | None = None
+        self._fixed = False
+        self._scope: asyncio.Timeout | None = None
+        self._token: Token[float | None] | None = None
+        self._operation_token: Token[tuple[str, str | None] | None] | None = None
+        self._owns_call = True
+        self._call: CallMetrics | None = None
+        self._call_token: Token[CallMetrics | None] | None = None
+
+    @classmethod
+    def _until(
+        cls, expires: float | None, operation: str | None, route: str | None, call: CallMetrics | None
+    ) -> "Deadline":
+        """
+        A Deadline ending at `expires` (time.monotonic()) or the deadline of its caller, if earlier,
+        within which `call` is the call of the context (its owner records it).
+        """
+        deadline = cls(None, operation, route)
+        deadline._expires, deadline._fixed, deadline._owns_call, deadline._call = expires, True, False, call
+        return deadline
+
+    async def __aenter__(self) -> None:
+        if self.operation is not None:
+            self._operation_token = enter_operation(self.operation, self.route)
+            if self._owns_call:
+                self._call = metrics.start_call(self.operation)
+        if self._call is not None:
+            self._call_token = self._call.activate()
+        inherited = _deadline.get()
+        expires = _earliest(inherited, self._expires if self._fixed else _from_now(self.timeout))
+        self._token = _deadline.set(expires)
+        # Scoped even at an inherited deadline: the block may run in a task other than its caller's,
+        # e.g. a page prefetched by a paginator, which the caller's scope would not cancel
+        if expires is not None:
+            self._scope = asyncio.timeout(max(expires - time.monotonic(), 0.0))
+            await self._scope.__aenter__()
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        if self._token is not None:
+            _deadline.reset(self._token)
+        if self._operation_token is not None:
+            exit_operation(self._operation_token)
+        if self._call_token is not None:
+            CallMetrics.deactivate(self._call_token)
+            # A call lent by iterate_with_deadline is recorded when the iteration ends
+            if self._owns_call and self._call is not None:
+                metrics.finish_call(self._call)
+        if self._scope is not None:
+            try:
+                await self._scope.__aexit__(exc_type, exc, tb)
+            except TimeoutError as error:
+                raise DeadlineExceeded("Deadline exceeded") from error
+
+
+async def iterate_with_deadline(
+    iterator: AsyncIterator[T], timeout: float | None, operation: str | None = None, route: str | None = None
+) -> AsyncIterator[T]:
+    """
+    Yield the items of an async iterator, bounding the whole iteration by `timeout` seconds and the
+    deadline of the consumer.
+
+    The timeout starts with the first item. The deadline is current while each item is produced, so
+    the requests made for it (e.g. page requests) share the budget. The iterator is closed when the
+    iteration ends early. With an `operation` (at path template `route`), the iteration is one call of it.
+
+    Raises:
+        DeadlineExceeded: When the deadline passes while an item is awaited.
+    """
+    expires = _earliest(_deadline.get(), _from_now(timeout))
+    call = metrics.start_call(operation) if operation is not None else None
+    try:
+        while True:
+            try:
+                async with Deadline._until(expires, operation, route, call):
+                    item = await anext(iterator)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        if call is not None:
+            metrics.finish_call(call)
@@ -0,0 +1,210 @@
+"""
+Hedged requests for idempotent operations, to cut tail latency for any HttpTransport.
+
+`HedgingTransport` wraps another transport. Generated endpoint methods of idempotent operations (GET,
+HEAD and those marked `x-idempotent: true`) mark their requests with the `hedge` request extension,
+whose value is the operation ID. When such a request is not answered within the `percentile` latency
+of its operation, an identical request is sent: the first response wins and the other request is
+cancelled. Latencies are tracked per operation in an online log-scale histogram, and the hedged
+requests are capped at a fraction (`budget`) of the requests sent.
+
+Requests without the extension, and streamed requests, are passed through unchanged.
+"""
+
+import asyncio
+import math
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from .http_transport import HttpTransport, open_stream
+
+HEDGE_EXTENSION = "hedge"
+
+# Histogram buckets grow by 10% from 1 ms, so a percentile is within 10% of the true latency
+_BUCKET_GROWTH = 1.1
+_FIRST_BUCKET_SECONDS = 0.001
+_BUCKETS = 160  # Up to about 4 minutes; slower requests fall in the last bucket
+# Counts are halved once a histogram holds this many samples, so it follows recent latencies
+_DECAY_SAMPLES = 1000
+
+
+class LatencyHistogram:
+    """Online histogram of request latencies in logarithmic buckets."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        index = 0
+        if seconds > _FIRST_BUCKET_SECONDS:
+            index = min(math.ceil(math.log(seconds / _FIRST_BUCKET_SECONDS, _BUCKET_GROWTH)), _BUCKETS - 1)
+        self.counts[index] += 1
+        self.total += 1
+        if self.total >= _DECAY_SAMPLES:
+            self.counts = [count // 2 for count in self.counts]
+            self.total = sum(self.counts)
+
+    def percentile(self, fraction: float) -> float:
+        """Latency (seconds) below which `fraction` of the samples fall; the upper bound of its bucket."""
+        rank = fraction * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if count and cumulative >= rank:
+                return _FIRST_BUCKET_SECONDS * _BUCKET_GROWTH**index
+        return _FIRST_BUCKET_SECONDS * _BUCKET_GROWTH ** (_BUCKETS - 1)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """
+    Snapshot of the hedging of one operation.
+
+    Attributes:
+        requests: Requests of the operation.
+        hedged: Requests for which a hedge request was sent.
+        hedge_wins: Hedged requests answered first by the hedge request.
+        delay_seconds: Current delay before a hedge request is sent (None until enough latencies were seen).
+    """
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+    delay_seconds: float | None
+
+
+class OperationLatency:
+    """Latency histogram and hedging counters of one operation."""
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+
+class HedgingTransport:
+    """
+    An HttpTransport that hedges slow requests of idempotent operations with a duplicate request.
+
+    Attributes:
+        inner: The wrapped transport.
+        percentile: Latency percentile of an operation after which a hedge request is sent.
+        budget: Largest fraction of requests that may be hedged.
+        min_samples: Latencies of an operation observed before its requests are hedged.
+    """
+
+    def __init__(
+        self, inner: HttpTransport, percentile: float = 0.95, budget: float = 0.05, min_samples: int = 20
+    ) -> None:
+        """
+        Args:
+            inner: The transport sending requests to the network.
+            percentile: Latency percentile (between 0 and 1) after which a hedge request is sent.
+            budget: Largest fraction of requests that may be hedged, capping the extra load.
+            min_samples: Latencies of an operation to observe before hedging its requests.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError(f"percentile must be between 0 and 1, got {percentile}")
+        self.inner = inner
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._operations: dict[str, OperationLatency] = {}
+        self._requests = 0
+        self._hedged = 0
+
+    def _operation(self, operation_id: str) -> OperationLatency:
+        operation = self._operations.get(operation_id)
+        if operation is None:
+            operation = self._operations[operation_id] = OperationLatency()
+        return operation
+
+    def _delay(self, operation: OperationLatency) -> float | None:
+        if operation.histogram.total < self.min_samples:
+            return None
+        return operation.histogram.percentile(self.percentile)
+
+    async def _send(self, operation: OperationLatency, method: str, url: str, kwargs: dict[str, Any]) -> httpx.Response:
+        started = time.monotonic()
+        response = await self.inner.request(method, url, **kwargs)
+        operation.histogram.record(time.monotonic() - started)
+        return response
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, and for requests marked with the `hedge` extension, a hedge request if the
+        first is slower than the operation's latency percentile and the budget allows it.
+
+        Returns:
+            httpx.Response: The first response received, regardless of status code.
+
+        Raises:
+            Exception: The error of the first request when every request sent failed.
+        """
+        extensions = kwargs.get("extensions") or {}
+        operation_id = extensions.get(HEDGE_EXTENSION)
+        if not operation_id:
+            return await self.inner.request(method, url, **kwargs)
+        kwargs["extensions"] = {name: value for name, value in extensions.items() if name != HEDGE_EXTENSION}
+        operation = self._operation(operation_id)
+        operation.requests += 1
+        self._requests += 1
+        delay = self._delay(operation)
+        started = time.monotonic()
+        tasks: list[asyncio.Future[httpx.Response]] = [
+            asyncio.ensure_future(self._send(operation, method, url, kwargs))
+        ]
+        try:
+            # Uploaded files may be readable once only: never send them twice
+            if delay is not None and not kwargs.get("files"):
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._hedged < self.budget * self._requests:
+                    self._hedged += 1
+                    operation.hedged += 1
+                    tasks.append(asyncio.ensure_future(self._send(operation, method, url, kwargs)))
+            pending: set[asyncio.Future[httpx.Response]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task in done and task.exception() is None:
+                        if task is not tasks[0]:
+                            operation.hedge_wins += 1
+                            # The first request is cancelled: it took at least this long
+                            operation.histogram.record(time.monotonic() - started)
+                        return task.result()
+            error = tasks[0].exception()
+            assert error is not None  # Every request failed, the first included
+            raise error
+        finally:
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()  # Retrieved: a losing request's error is not logged as unhandled
+                else:
+                    task.cancel()
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> AbstractAsyncContextManager[httpx.Response]:
+        """Stream a response from the inner transport; streamed requests are not hedged."""
+        return open_stream(self.inner, method, url, **kwargs)
+
+    def stats(self) -> dict[str, HedgeStats]:
+        """Hedging statistics per operation ID."""
+        return {
+            operation_id: HedgeStats(
+                requests=operation.requests,
+                hedged=operation.hedged,
+                hedge_wins=operation.hedge_wins,
+                delay_seconds=self._delay(operation),
+            )
+            for operation_id, operation in self._operations.items()
+        }
+
+    async def close(self) -> None:
+        """Close the inner transport."""
+        await self.inner.close()
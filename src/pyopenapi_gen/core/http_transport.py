@@ -1,8 +1,33 @@
-from typing import Any, Protocol
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
+from typing import Any, AsyncIterator, Callable, Hashable, Protocol, TypeVar, cast
 
 import httpx
 
+from .adaptive_concurrency import AdaptiveConcurrency, ConcurrencyStats
 from .auth.base import BaseAuth
+from .batch import current_host_limiter
+from .json_codec import RESPONSE_CODEC_EXTENSION, JsonCodec, get_json_codec
+from .metrics import PHASE_AUTH, PHASE_NETWORK, current_operation, metrics
+from .model_decoder import SINGLE_PASS_EXTENSION
+from .offload import DECODE_OFFLOAD_EXTENSION, DecodeOffload
+from .sampler import PendingTrace, SlowRequestSampler
+from .transport_registry import SharedClient, cookieless_jar, registry, shared_ssl_context
+
+
+class _Outcome:
+    """What HttpxTransport learned of a request while holding its slots (see `HttpxTransport._slots`)."""
+
+    __slots__ = ("status_code", "answered")
+
+    def __init__(self) -> None:
+        self.status_code: int | None = None
+        self.answered: float | None = None  # time.monotonic() of the response headers of a stream
 
 
 class HttpTransport(Protocol):
@@ -13,6 +38,12 @@ class HttpTransport(Protocol):
     to be used interchangeably by the generated API client. It requires
     implementing classes to provide an async `request` method.
 
+    Transports may also provide a `stream(method, url, **kwargs)` method returning an async context
+    manager that yields the response before its body has been read, with the same status-code
+    contract as `request`. Generated endpoint methods open streaming responses (SSE, NDJSON, binary
+    downloads) through `open_stream`, which uses it when present and otherwise falls back to
+    `request`, whose response body is read in full before the first chunk is available.
+
     All implementations must:
     - Provide a fully type-annotated async `request` method.
     - Return an `httpx.Response` object for all requests, regardless of status code.
@@ -63,6 +94,123 @@ class HttpTransport(Protocol):
         raise NotImplementedError()
 
 
+def open_stream(
+    transport: HttpTransport, method: str, url: str, **kwargs: Any
+) -> AbstractAsyncContextManager[httpx.Response]:
+    """
+    Open a response whose body is consumed incrementally, through `transport.stream()` if it has one.
+
+    Transports written before streaming responses were supported implement only `request`; for them
+    the response is fetched with `request` and yielded with its body already read, so streaming
+    operations keep working, without the memory savings of a streamed body.
+
+    Returns:
+        AbstractAsyncContextManager[httpx.Response]: A context manager yielding the response, regardless
+        of status code. The body may be unread: callers that need it in full must `await response.aread()`.
+    """
+    stream = getattr(transport, "stream", None)
+    if stream is not None:
+        return cast(AbstractAsyncContextManager[httpx.Response], stream(method, url, **kwargs))
+    return _buffered_stream(transport, method, url, kwargs)
+
+
+@asynccontextmanager
+async def _buffered_stream(
+    transport: HttpTransport, method: str, url: str, kwargs: dict[str, Any]
+) -> AsyncIterator[httpx.Response]:
+    yield await transport.request(method, url, **kwargs)
+
+
+T = TypeVar("T")
+
+
+def find_transport(transport: object, cls: type[T]) -> T | None:
+    """
+    Return the first transport of type `cls` in a chain of wrapping transports, or None.
+
+    Wrapping transports (e.g. CachingTransport, RateLimitingTransport) expose the transport they wrap
+    as `inner`; the chain is followed from `transport` until it ends.
+    """
+    current: object = transport
+    while current is not None:
+        if isinstance(current, cls):
+            return current
+        current = getattr(current, "inner", None)
+    return None
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of the connection pool of an HttpxTransport.
+
+    Attributes:
+        max_connections: Configured limit of open connections (None: unlimited).
+        max_keepalive_connections: Configured limit of idle connections kept open (None: unlimited).
+        connections: Open connections.
+        in_use: Connections currently serving a request (or a multiplexed HTTP/2 request).
+        idle: Connections kept alive and available for reuse.
+        waiting: Requests currently waiting for a connection. Non-zero for long means the pool is exhausted.
+        requests: Requests that obtained a connection since the transport was created.
+        total_wait_seconds: Time those requests spent waiting for a connection, in total.
+        max_wait_seconds: Longest single wait for a connection.
+    """
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    connections: int
+    in_use: int
+    idle: int
+    waiting: int
+    requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time a request waited for a connection."""
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class _PoolWaitTrace:
+    """
+    httpx `trace` extension measuring how long one request waits for a pool connection.
+
+    httpcore reports the first event of a request once it holds a connection: the TCP connect of a
+    new connection, or sending the request headers on a reused one.
+    """
+
+    __slots__ = ("_transport", "_pending", "_started", "_done")
+
+    def __init__(self, transport: "HttpxTransport", pending: PendingTrace | None = None) -> None:
+        self._transport = transport
+        self._pending = pending
+        self._started = time.perf_counter()
+        self._done = False
+        transport._waiting += 1
+        if pending is not None:
+            pending.sent = self._started
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if not self._done:
+            self.finish(time.perf_counter() - self._started)
+
+    def finish(self, wait: float | None) -> None:
+        """Record the wait (None if the request failed before obtaining a connection)."""
+        if self._done:
+            return
+        self._done = True
+        if self._pending is not None:
+            self._pending.pool_wait = wait
+        transport = self._transport
+        transport._waiting -= 1
+        if wait is not None:
+            transport._wait_count += 1
+            transport._wait_total += wait
+            if wait > transport._wait_max:
+                transport._wait_max = wait
+
+
 class HttpxTransport:
     """
     A concrete implementation of the HttpTransport protocol using the `httpx` library.
@@ -73,17 +221,46 @@ class HttpxTransport:
 
     Optionally supports authentication via any BaseAuth-compatible plugin, including CompositeAuth.
 
+    `json=` request bodies are encoded to bytes with the configured JsonCodec (with explicit
+    Content-Type and Content-Length headers), and every response records the codec so that generated
+    endpoint code decodes `response.content` with the same backend (see `json_codec.decode_json`).
+
     CONTRACT:
         - This implementation returns the `httpx.Response` unchanged for every response, including non-2xx
           responses. It does NOT raise on error status codes. Status-code handling (including raising exception
           aliases such as `NotFoundError`) is delegated to the generated endpoint methods, which inspect
           `response.status_code`. This ensures the generated exception aliases are actually raised.
 
+    The connection pool (limits, keep-alive expiry, HTTP/2, local address, proxy) and per-phase timeouts are
+    configurable, and `pool_stats()` reports pool usage and the time requests wait for a connection. With
+    `shared=True` the pool is taken from the process-wide `transport_registry`: transports with the same
+    origin and connection settings reuse one `httpx.AsyncClient` per event loop, which is closed with the
+    last of them. A shared transport binds to the client of the loop it sends its first request from, so
+    clients created in sync code and used in successive `asyncio.run` calls never reuse a closed loop's pool.
+    The shared client stores no cookies: each shared transport keeps its own, so a session cookie set
+    for one client's credentials is never sent with another's.
+    With an `AdaptiveConcurrency` controller, requests also wait for a slot of their origin's adaptive
+    limit, which grows while latency stays low and is cut on latency spikes, 503 responses and timeouts;
+    `concurrency_stats()` reports the current limits. With a `SlowRequestSampler`, slow requests (and a
+    random sample of the others) are captured as structured traces. With a `DecodeOffload`, generated
+    endpoint methods decode large response bodies in an executor instead of on the event loop; with
+    `single_pass_decode_bytes`, they decode large bodies in a single pass, without a dict tree.
+
     Attributes:
-        _client (httpx.AsyncClient): Configured HTTPX async client for all requests.
+        _client (httpx.AsyncClient | None): Configured HTTPX async client for all requests (None for a shared
+            transport until it is bound to an event loop).
+        _pool_transport (httpx.AsyncHTTPTransport | None): The pooling transport of `_client`.
+        _shared (SharedClient | None): The registry entry of `_client` when it is shared.
+        _shared_key (Hashable | None): The registry key of a shared transport's connection settings.
+        _cookies (httpx.Cookies | None): The cookies of this transport when `_client` is shared.
         _auth (BaseAuth | None): Optional authentication plugin for request signing (can be CompositeAuth).
         _bearer_token (str | None): Optional bearer token for Authorization header.
         _default_headers (dict[str, str] | None): Default headers to apply to all requests.
+        _json_codec (JsonCodec): Codec for JSON request and response bodies.
+        concurrency (AdaptiveConcurrency | None): Adaptive per-origin limit on requests in flight.
+        sampler (SlowRequestSampler | None): Captures traces of slow and randomly sampled requests.
+        decode_offload (DecodeOffload | None): Decodes large response bodies in an executor.
+        single_pass_decode_bytes (int | None): Size from which model responses are decoded in a single pass.
     """
 
     def __init__(
@@ -94,6 +271,23 @@ class HttpxTransport:
         bearer_token: str | None = None,
         default_headers: dict[str, str] | None = None,
         verify_ssl: bool = True,
+        json_codec: str | JsonCodec | None = "auto",
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        local_address: str | None = None,
+        proxy: str | None = None,
+        shared: bool = False,
+        concurrency: AdaptiveConcurrency | None = None,
+        sampler: SlowRequestSampler | None = None,
+        decode_offload: DecodeOffload | None = None,
+        single_pass_decode_bytes: int | None = None,
     ) -> None:
         """
         Initializes the HttpxTransport.
@@ -106,14 +300,106 @@ class HttpxTransport:
             default_headers (dict[str, str] | None): Default headers to apply to all requests.
             verify_ssl (bool): Whether to verify SSL certificates. Defaults to True.
                 Set to False for local development with self-signed certificates.
+            json_codec (str | JsonCodec | None): JSON backend: "auto" (orjson, then msgspec, then stdlib),
+                "orjson", "msgspec", "stdlib", or a JsonCodec instance.
+            max_connections (int | None): Maximum number of open connections (None: unlimited).
+            max_keepalive_connections (int | None): Maximum number of idle connections kept open for reuse.
+            keepalive_expiry (float | None): Seconds an idle connection is kept open.
+            http2 (bool): Negotiate HTTP/2 (requires the `h2` package: `pip install httpx[http2]`).
+            connect_timeout (float | None): Timeout for establishing a connection; None uses `timeout`.
+            read_timeout (float | None): Timeout for receiving a chunk of the response; None uses `timeout`.
+            write_timeout (float | None): Timeout for sending a chunk of the request; None uses `timeout`.
+            pool_timeout (float | None): Timeout for obtaining a connection from the pool; None uses `timeout`.
+            local_address (str | None): Local IP address to bind outgoing connections to.
+            proxy (str | None): Proxy URL for all requests. If None, proxies from the environment are used.
+            shared (bool): Use the process-wide pooled client for this origin and these connection settings
+                instead of a private one. Timeouts are then applied per request.
+            concurrency (AdaptiveConcurrency | None): Adaptive per-origin limit on requests in flight, cut
+                on latency spikes, 503 responses and timeouts (None: only the pool limits apply).
+            sampler (SlowRequestSampler | None): Captures traces of requests slower than its threshold, and of a
+                random sample of the others.
+            decode_offload (DecodeOffload | None): Decodes response bodies of at least its threshold in an
+                executor, keeping the event loop responsive (None: every body is decoded inline).
+            single_pass_decode_bytes (int | None): Model responses of at least this size are decoded in a single
+                pass over their bytes, which uses less memory but more time than the JSON codec (None: never).
 
         Note:
             If both auth and bearer_token are provided, auth takes precedence.
         """
-        self._client: httpx.AsyncClient = httpx.AsyncClient(base_url=base_url, timeout=timeout, verify=verify_ssl)
+        client_timeout = httpx.Timeout(timeout)
+        if any(t is not None for t in (connect_timeout, read_timeout, write_timeout, pool_timeout)):
+            client_timeout = httpx.Timeout(
+                connect=timeout if connect_timeout is None else connect_timeout,
+                read=timeout if read_timeout is None else read_timeout,
+                write=timeout if write_timeout is None else write_timeout,
+                pool=timeout if pool_timeout is None else pool_timeout,
+            )
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # One SSL context per process: loading the CA bundle dominates client construction
+        ssl_context = shared_ssl_context(verify_ssl, http2)
+
+        def build_client(client_base_url: str, cookies: CookieJar | None = None) -> SharedClient:
+            pool_transport = httpx.AsyncHTTPTransport(
+                verify=ssl_context, http2=http2, limits=self._limits, local_address=local_address
+            )
+            client = httpx.AsyncClient(
+                base_url=client_base_url,
+                timeout=client_timeout,
+                transport=pool_transport,
+                verify=ssl_context,  # For proxy transports
+                http2=http2,
+                limits=self._limits,
+                proxy=proxy,
+                cookies=cookies,
+            )
+            return SharedClient(client, pool_transport)
+
+        self._base_url = httpx.URL(base_url if base_url.endswith("/") else f"{base_url}/")
+        # Per-request timeout for shared clients, whose client-level timeout belongs to whoever created them
+        self._request_timeout: httpx.Timeout | None = None
+        self._shared: SharedClient | None = None
+        self._shared_key: Hashable | None = None
+        self._cookies: httpx.Cookies | None = None
+        self._released = False
+        self._client: httpx.AsyncClient | None = None
+        self._pool_transport: httpx.AsyncHTTPTransport | None = None
+        if shared:
+            origin = (self._base_url.scheme, self._base_url.host, self._base_url.port)
+            self._shared_key = (origin, verify_ssl, http2, proxy, max_connections, max_keepalive_connections,
+                                keepalive_expiry, local_address)  # fmt: skip
+            self._build_shared: Callable[[], SharedClient] = lambda: build_client("", cookieless_jar())
+            self._request_timeout = client_timeout
+            self._cookies = httpx.Cookies()
+            if self._running_loop() is not None:
+                self._bind_shared()
+        else:
+            pooled = build_client(base_url)
+            self._client, self._pool_transport = pooled.client, pooled.pool_transport
+        self._waiting = 0
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
         self._auth: BaseAuth | None = auth
         self._bearer_token: str | None = bearer_token
         self._default_headers: dict[str, str] | None = default_headers
+        self._json_codec: JsonCodec = get_json_codec(json_codec)
+        self.concurrency = concurrency
+        self.sampler = sampler
+        self.decode_offload = decode_offload
+        self.single_pass_decode_bytes = single_pass_decode_bytes
+        # Precomputed once: the Authorization value for bearer_token (only used without an auth plugin)
+        # and the headers sent when a request has no headers of its own.
+        self._bearer_header: str | None = (
+            f"Bearer {bearer_token}" if bearer_token is not None and auth is None else None
+        )
+        self._base_headers: dict[str, str] = dict(default_headers or {})
+        if self._bearer_header is not None:
+            self._base_headers["Authorization"] = self._bearer_header
+        self._cache_identity: str | None = None
 
     async def _prepare_headers(
         self,
@@ -122,41 +408,121 @@ class HttpxTransport:
         """
         Prepares headers for an HTTP request, incorporating default headers,
         request-specific headers, and authentication.
-        """
-        # Initialize headers for the current request
-        prepared_headers: dict[str, str] = {}
-
-        # 1. Apply transport-level default headers
-        if self._default_headers:
-            prepared_headers.update(self._default_headers)
-
-        # 2. Merge headers passed specifically for this request (overriding transport defaults)
-        if "headers" in current_request_kwargs and isinstance(current_request_kwargs["headers"], dict):
-            prepared_headers.update(current_request_kwargs["headers"])
-
-        # 3. Apply authentication plugin or bearer token (which can further modify headers)
-        # We pass a temporary request_args dict containing only the headers to the auth plugin,
-        # as the auth plugin might expect other keys which are not relevant for header preparation.
-        # The auth plugin is expected to modify the 'headers' key in the passed dict.
-        temp_request_args_for_auth = {"headers": prepared_headers.copy()}
-
-        if self._auth is not None:
-            authenticated_args = await self._auth.authenticate_request(temp_request_args_for_auth)
-            # Ensure 'headers' key exists and is a dict after authentication
-            if "headers" in authenticated_args and isinstance(authenticated_args["headers"], dict):
-                prepared_headers = authenticated_args["headers"]
-            else:
-                # Handle cases where auth plugin might not return headers as expected
-                # This could be an error or a specific design of an auth plugin.
-                # For now, we assume it should always return a 'headers' dict.
-                # If not, we retain the headers we had before calling the auth plugin.
-                pass  # Or raise an error, or log a warning.
-        elif self._bearer_token is not None:
-            # If no auth plugin, but bearer token is present, add/overwrite Authorization header.
-            prepared_headers["Authorization"] = f"Bearer {self._bearer_token}"
 
+        The returned dict is never mutated by the transport; for requests without their own headers and
+        without an auth plugin the precomputed base headers are returned as-is instead of being copied.
+        """
+        request_headers = current_request_kwargs.get("headers")
+        if not isinstance(request_headers, dict) or not request_headers:
+            request_headers = None
+
+        if self._auth is None:
+            if request_headers is None:
+                # Fast path: defaults (+ bearer token) were merged once at construction time.
+                return self._base_headers
+            # 1. Transport-level defaults, 2. request-specific headers (override defaults)
+            prepared_headers: dict[str, str] = (
+                {**self._default_headers, **request_headers} if self._default_headers else dict(request_headers)
+            )
+            # 3. Bearer token (overrides any request-supplied Authorization header)
+            if self._bearer_header is not None:
+                prepared_headers["Authorization"] = self._bearer_header
+            return prepared_headers
+
+        # With an auth plugin, build one fresh dict owned by this request, so that a plugin updating the
+        # headers in place can never reach the precomputed base headers.
+        prepared_headers = dict(self._base_headers)
+        if request_headers is not None:
+            prepared_headers.update(request_headers)
+
+        authenticated_args = await self._auth.authenticate_request({"headers": prepared_headers})
+        # Ensure 'headers' key exists and is a dict after authentication. If an auth plugin does not
+        # return headers as expected, we retain the headers we had before calling it.
+        authenticated_headers = authenticated_args.get("headers")
+        if isinstance(authenticated_headers, dict):
+            return authenticated_headers
         return prepared_headers
 
+    async def _build_request_args(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Builds the keyword arguments forwarded to httpx, with headers prepared and authenticated.
+        """
+        # Prepare request arguments, excluding headers and the JSON body initially
+        request_args: dict[str, Any] = {k: v for k, v in kwargs.items() if k not in ("headers", "json")}
+
+        # This method handles default headers, request-specific headers, and authentication
+        started = time.perf_counter() if metrics.enabled and self._auth is not None else None
+        headers = await self._prepare_headers(kwargs)
+        if started is not None:
+            operation = current_operation()
+            if operation is not None:
+                metrics.record(operation, PHASE_AUTH, time.perf_counter() - started)
+
+        json_body = kwargs.get("json")
+        if json_body is not None:
+            # Encode with the configured codec instead of httpx's stdlib json.dumps. The prepared
+            # headers may be the shared base headers, so they are copied rather than updated.
+            content = self._json_codec.dumps(json_body)
+            headers = {**headers, "Content-Length": str(len(content))}
+            if not any(name.lower() == "content-type" for name in headers):
+                headers["Content-Type"] = "application/json"
+            request_args["content"] = content
+
+        request_args["headers"] = headers
+        if self._request_timeout is not None and "timeout" not in request_args:
+            request_args["timeout"] = self._request_timeout
+        return request_args
+
+    @staticmethod
+    def _running_loop() -> asyncio.AbstractEventLoop | None:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _bind_shared(self) -> None:
+        """Take the shared client of the running event loop from the registry, leaving any other loop's."""
+        if self._shared is not None:
+            registry.detach(self._shared)
+        assert self._shared_key is not None
+        self._shared = registry.acquire(self._shared_key, self._build_shared)
+        self._client, self._pool_transport = self._shared.client, self._shared.pool_transport
+
+    def _pooled_client(self) -> httpx.AsyncClient:
+        """
+        The client to send with: the private one, or the shared client of the running event loop.
+
+        A shared transport created outside an event loop binds on its first request, and rebinds when
+        it is used from another loop, since pooled connections belong to the loop that opened them.
+        """
+        if self._shared_key is not None and not self._released:
+            if self._shared is None or self._shared.loop is not asyncio.get_running_loop():
+                self._bind_shared()
+        if self._client is None:
+            raise RuntimeError("Cannot send a request, as the transport has been closed.")
+        return self._client
+
+    def _merge_url(self, url: str) -> httpx.URL | str:
+        """Resolve a URL relative to the base URL, as httpx does for clients with a base_url."""
+        if self._shared_key is None:
+            return url
+        merge_url = httpx.URL(url)
+        if merge_url.is_relative_url:
+            return self._base_url.copy_with(raw_path=self._base_url.raw_path + merge_url.raw_path.lstrip(b"/"))
+        return merge_url
+
+    def _add_cookies(self, method: str, url: httpx.URL | str, request_args: dict[str, Any]) -> None:
+        """Add the Cookie header of a shared transport's own cookies, unless the request sets one."""
+        if self._cookies is None or not self._cookies.jar:
+            return
+        headers = request_args["headers"]
+        probe = httpx.Request(method, url, headers=headers)
+        self._cookies.set_cookie_header(probe)
+        cookie = probe.headers.get("Cookie")
+        if cookie is not None and not any(name.lower() == "cookie" for name in headers):
+            # The prepared headers may be the shared base headers, so they are copied
+            request_args["headers"] = {**headers, "Cookie": cookie}
+
     async def request(
         self,
         method: str,
@@ -180,15 +546,219 @@ class HttpxTransport:
             httpx.HTTPError: For network errors or invalid responses. Non-2xx HTTP responses are
                 returned unchanged; status-code handling is performed by the generated endpoint methods.
         """
-        # Prepare request arguments, excluding headers initially
-        request_args: dict[str, Any] = {k: v for k, v in kwargs.items() if k != "headers"}
+        pending = self.sampler.start(method, url) if self.sampler is not None else None
+        request_args = await self._build_request_args(kwargs)
+        if pending is not None:
+            pending.prepared = time.perf_counter()
+        response: httpx.Response | None = None
+        error: BaseException | None = None
+        try:
+            async with self._slots(url) as outcome:
+                trace = self._trace_pool_wait(request_args, pending)
+                started = time.perf_counter() if metrics.enabled else None
+                client = self._pooled_client()
+                merged_url = self._merge_url(url)
+                self._add_cookies(method, merged_url, request_args)
+                try:
+                    response = await client.request(method, merged_url, **request_args)
+                finally:
+                    trace.finish(None)
+                if self._cookies is not None:
+                    self._cookies.extract_cookies(response)
+                outcome.status_code = response.status_code
+                if started is not None:
+                    self._record_exchange(response, time.perf_counter() - started, len(response.content))
+            response.extensions[RESPONSE_CODEC_EXTENSION] = self._json_codec
+            if self.decode_offload is not None:
+                response.extensions[DECODE_OFFLOAD_EXTENSION] = self.decode_offload
+            if self.single_pass_decode_bytes is not None:
+                response.extensions[SINGLE_PASS_EXTENSION] = self.single_pass_decode_bytes
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if pending is not None:
+                pending.finish(response, len(response.content) if response is not None else None, error)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Sends an HTTP request using `httpx.AsyncClient.stream` and yields the response unread.
 
-        # This method handles default headers, request-specific headers, and authentication
-        prepared_headers = await self._prepare_headers(kwargs)
-        request_args["headers"] = prepared_headers
+        The response body is pulled from the network only as the caller iterates it, so memory use
+        stays constant for large downloads and the first chunk is available as soon as it arrives.
+
+        Args:
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The target URL path, relative to the `base_url` provided during initialization, or an absolute
+            URL.
+            **kwargs: Additional keyword arguments passed directly to `httpx.AsyncClient.stream` (e.g., headers,
+            params, json, data).
+
+        Yields:
+            httpx.Response: The HTTP response object with an unread body, regardless of status code.
+
+        Raises:
+            httpx.HTTPError: For network errors or invalid responses. Non-2xx HTTP responses are
+                yielded unchanged; status-code handling is performed by the generated endpoint methods.
+        """
+        pending = self.sampler.start(method, url) if self.sampler is not None else None
+        request_args = await self._build_request_args(kwargs)
+        if pending is not None:
+            pending.prepared = time.perf_counter()
+        streamed: httpx.Response | None = None
+        answered: float | None = None
+        error: BaseException | None = None
+        try:
+            async with self._slots(url) as outcome:
+                trace = self._trace_pool_wait(request_args, pending)
+                started = time.perf_counter() if metrics.enabled or pending is not None else None
+                client = self._pooled_client()
+                merged_url = self._merge_url(url)
+                self._add_cookies(method, merged_url, request_args)
+                try:
+                    async with client.stream(method, merged_url, **request_args) as response:
+                        trace.finish(None)
+                        if self._cookies is not None:
+                            self._cookies.extract_cookies(response)
+                        streamed = response
+                        outcome.status_code = response.status_code
+                        outcome.answered = time.monotonic()
+                        answered = time.perf_counter() if started is not None else None
+                        response.extensions[RESPONSE_CODEC_EXTENSION] = self._json_codec
+                        try:
+                            yield response
+                        finally:
+                            if metrics.enabled and started is not None and answered is not None:
+                                self._record_exchange(response, answered - started, response.num_bytes_downloaded)
+                finally:
+                    trace.finish(None)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if pending is not None:
+                downloaded = streamed.num_bytes_downloaded if streamed is not None else None
+                pending.finish(streamed, downloaded, error, answered=answered if streamed is not None else None)
+
+    @asynccontextmanager
+    async def _slots(self, url: str) -> AsyncIterator["_Outcome"]:
+        """
+        Hold the slots limiting a request: the per-host slot of the batch running the current task and
+        the adaptive concurrency slot of the target origin, if any. The adaptive limit is adjusted to the
+        outcome the caller records: a 503 or a timeout cut it.
+        """
+        outcome = _Outcome()
+        host_slot = self._host_slot(url)
+        if host_slot is not None:
+            await host_slot.acquire()
+        try:
+            if self.concurrency is None:
+                yield outcome
+                return
+            target = self._base_url.join(url)
+            origin = f"{target.scheme}://{target.netloc.decode('ascii')}"
+            started = await self.concurrency.acquire(origin)
+            overloaded = False
+            try:
+                yield outcome
+            except httpx.TimeoutException:
+                overloaded = True
+                raise
+            finally:
+                overloaded = overloaded or outcome.status_code == 503
+                self.concurrency.release(origin, started, overloaded, answered=outcome.answered)
+        finally:
+            if host_slot is not None:
+                host_slot.release()
+
+    @staticmethod
+    def _record_exchange(response: httpx.Response, network_seconds: float, response_bytes: int) -> None:
+        """Record the network time, bytes and status code of a request of the current operation, if any."""
+        operation = current_operation()
+        if operation is None:
+            return
+        metrics.record(operation, PHASE_NETWORK, network_seconds)
+        request_bytes = int(response.request.headers.get("Content-Length", 0))
+        metrics.record_exchange(operation, response.status_code, request_bytes, response_bytes)
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore | None:
+        """The per-host semaphore of the batch (core.batch.Batch) running the current task, if it has one."""
+        limiter = current_host_limiter()
+        if limiter is None:
+            return None
+        return limiter.semaphore(self._base_url.join(url).host)
+
+    def _trace_pool_wait(self, request_args: dict[str, Any], pending: PendingTrace | None = None) -> _PoolWaitTrace:
+        """
+        Attach a trace measuring the wait for a pool connection, chained with any caller trace. The request
+        has been built and holds its slots: for a sampled request, its network phase starts.
+        """
+        trace = _PoolWaitTrace(self, pending)
+        extensions: dict[str, Any] = dict(request_args.get("extensions") or {})
+        request_args["extensions"] = extensions
+        caller_trace = extensions.get("trace")
+        if caller_trace is None:
+            extensions["trace"] = trace
+        else:
+
+            async def chained(event_name: str, info: dict[str, Any]) -> None:
+                await trace(event_name, info)
+                await caller_trace(event_name, info)
+
+            extensions["trace"] = chained
+        return trace
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Return a snapshot of the connection pool: open, in-use and idle connections, requests waiting
+        for a connection, and the time requests spent waiting.
 
-        response = await self._client.request(method, url, **request_args)
-        return response
+        Pool exhaustion shows as a growing `waiting` count and wait times, before `httpx.PoolTimeout`
+        is raised once `pool_timeout` elapses.
+        """
+        # httpx does not expose its httpcore pool publicly; treat it as optional
+        pool = getattr(self._pool_transport, "_pool", None)
+        connections = [c for c in getattr(pool, "connections", []) if not c.is_closed()]
+        idle = sum(1 for c in connections if c.is_idle())
+        return PoolStats(
+            max_connections=self._limits.max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections,
+            connections=len(connections),
+            in_use=len(connections) - idle,
+            idle=idle,
+            waiting=self._waiting,
+            requests=self._wait_count,
+            total_wait_seconds=self._wait_total,
+            max_wait_seconds=self._wait_max,
+        )
+
+    async def cache_identity(self) -> str:
+        """
+        A digest of the base URL and of the headers (defaults and credentials) this transport adds to requests.
+
+        CachingTransport puts it in its cache keys, so that a response cached for one server or identity is
+        never served to a client with other credentials, including from a sqlite file shared between runs.
+        Without an auth plugin the digest never changes and is computed once.
+        """
+        if self._auth is None and self._cache_identity is not None:
+            return self._cache_identity
+        headers = await self._prepare_headers({})
+        material = json.dumps([str(self._base_url), sorted(headers.items())])
+        identity = hashlib.sha256(material.encode()).hexdigest()[:16]
+        if self._auth is None:
+            self._cache_identity = identity
+        return identity
+
+    def concurrency_stats(self) -> dict[str, ConcurrencyStats]:
+        """Return the adaptive concurrency limit of each origin (empty without a controller)."""
+        return self.concurrency.stats() if self.concurrency is not None else {}
 
     async def close(self) -> None:
         """
@@ -196,9 +766,18 @@ class HttpxTransport:
 
         This should be called when the transport is no longer needed, typically
         when the main API client is being shut down, to ensure proper cleanup
-        of network connections.
+        of network connections. A shared client is closed when its last transport is closed.
         """
-        await self._client.aclose()
+        if self.decode_offload is not None:
+            # Its pool is joined off the event loop
+            await asyncio.to_thread(self.decode_offload.close)
+        if self._shared_key is None:
+            assert self._client is not None
+            await self._client.aclose()
+        elif not self._released:
+            self._released = True
+            if self._shared is not None:
+                await registry.release(self._shared)
 
     async def __aenter__(self) -> "HttpxTransport":
         """
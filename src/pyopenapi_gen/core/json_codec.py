@@ -0,0 +1,182 @@
+"""
+Pluggable JSON codecs for request and response bodies.
+
+Generated clients decode response bodies straight from `response.content` bytes and encode
+`json=` request bodies to bytes through a JsonCodec. The codec is selected with
+`ClientConfig.json_codec`:
+
+- ``"auto"`` (default): orjson if installed, else msgspec if installed, else the standard library
+- ``"orjson"``, ``"msgspec"``, ``"stdlib"``: a specific backend (ImportError if not installed)
+- any object implementing the JsonCodec protocol
+
+The faster backends are strict JSON: unlike the standard library they reject ``NaN``/``Infinity``
+literals. orjson also rejects integers outside the 64-bit range.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, Callable, Protocol, runtime_checkable
+
+import httpx
+
+from .metrics import PHASE_DESERIALIZE, metrics
+
+# Key under which HttpxTransport records its codec in `httpx.Response.extensions`, so that
+# decode_json uses the codec of the client that sent the request.
+RESPONSE_CODEC_EXTENSION = "pyopenapi_gen.json_codec"
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """
+    Encodes Python values to JSON bytes and decodes JSON bytes to Python values.
+
+    All implementations must:
+    - Decode objects to `dict`, arrays to `list` and numbers to `int`/`float`, like `json.loads`.
+    - Encode to UTF-8 bytes without a trailing newline.
+    - Raise a `ValueError` subclass on invalid input.
+    """
+
+    name: str
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        ...
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a JSON-compatible value."""
+        ...
+
+
+class StdlibJsonCodec:
+    """JsonCodec backed by the standard library `json` module; always available."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        # Same settings httpx uses for `json=`: compact, raw UTF-8, strict about NaN/Infinity
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+class OrjsonJsonCodec:
+    """JsonCodec backed by `orjson` (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        orjson = importlib.import_module("orjson")
+        self._loads: Callable[[bytes | str], Any] = orjson.loads
+        self._dumps: Callable[..., bytes] = orjson.dumps
+        # Accept non-str dict keys, as json.dumps does
+        self._dumps_option: int = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value, option=self._dumps_option)
+
+
+class MsgspecJsonCodec:
+    """JsonCodec backed by `msgspec` (``pip install msgspec``)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec_json = importlib.import_module("msgspec.json")
+        self._decoder: Any = msgspec_json.Decoder()
+        self._encoder: Any = msgspec_json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return bytes(self._encoder.encode(value))
+
+
+_BACKENDS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonJsonCodec,
+    "msgspec": MsgspecJsonCodec,
+    "stdlib": StdlibJsonCodec,
+}
+# Preference order for "auto"
+_AUTO_ORDER = ("orjson", "msgspec", "stdlib")
+_codec_cache: dict[str, JsonCodec] = {}
+
+
+def get_json_codec(codec: str | JsonCodec | None = "auto") -> JsonCodec:
+    """
+    Resolve a codec name (or codec instance) to a JsonCodec.
+
+    Scenario:
+        A client is configured with `ClientConfig.json_codec`, which may be a backend name,
+        ``"auto"``/None, or a custom codec object.
+
+    Expected Outcome:
+        The matching codec is returned; named codecs are created once per process.
+
+    Args:
+        codec: ``"auto"``, ``"orjson"``, ``"msgspec"``, ``"stdlib"``, None (same as ``"auto"``),
+            or a JsonCodec instance (returned unchanged)
+
+    Returns:
+        The JsonCodec to use
+
+    Raises:
+        ValueError: If the name is not a known backend
+        ImportError: If a specific backend was requested but is not installed
+    """
+    if codec is None:
+        codec = "auto"
+    if not isinstance(codec, str):
+        return codec
+    cached = _codec_cache.get(codec)
+    if cached is not None:
+        return cached
+
+    resolved: JsonCodec
+    if codec == "auto":
+        resolved = StdlibJsonCodec()
+        for name in _AUTO_ORDER:
+            try:
+                resolved = get_json_codec(name)
+                break
+            except ImportError:
+                continue
+    elif codec in _BACKENDS:
+        resolved = _BACKENDS[codec]()
+    else:
+        raise ValueError(f"Unknown JSON codec {codec!r}. Expected one of: auto, {', '.join(_BACKENDS)}")
+
+    _codec_cache[codec] = resolved
+    return resolved
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """
+    Decode the JSON body of a response from its raw bytes.
+
+    Uses the codec recorded on the response by the transport that sent the request, falling back
+    to the auto-detected codec for responses from other transports.
+    """
+    codec = response.extensions.get(RESPONSE_CODEC_EXTENSION)
+    if codec is None:
+        codec = get_json_codec()
+    if metrics.enabled:
+        return metrics.timed(PHASE_DESERIALIZE, codec.loads, response.content)
+    return codec.loads(response.content)
+
+
+__all__ = [
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonJsonCodec",
+    "MsgspecJsonCodec",
+    "get_json_codec",
+    "decode_json",
+]
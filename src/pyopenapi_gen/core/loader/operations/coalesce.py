@@ -0,0 +1,69 @@
+"""Request coalescing settings for parsed operations.
+
+Operations opt in to single-flight coalescing of identical in-flight requests with the
+`x-coalesce: true` vendor extension, or through an allowlist of operation IDs given at generation
+time. Only GET and HEAD operations without a request body can be coalesced: sharing one response
+between callers is only safe for requests without side effects.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, Iterable, List, Mapping
+
+from pyopenapi_gen import HTTPMethod, IROperation
+
+COALESCE_EXTENSION = "x-coalesce"
+COALESCIBLE_METHODS = (HTTPMethod.GET, HTTPMethod.HEAD)
+
+
+def _coalescible(method: HTTPMethod, has_request_body: bool) -> bool:
+    return method in COALESCIBLE_METHODS and not has_request_body
+
+
+def detect_coalesce(node_op: Mapping[str, Any], operation_id: str, method: HTTPMethod, has_request_body: bool) -> bool:
+    """Whether an operation's `x-coalesce` extension enables request coalescing.
+
+    Contracts:
+        Postconditions:
+            - Returns True only for GET and HEAD operations without a request body
+            - Warns and returns False for an invalid or inapplicable extension value
+    """
+    extension = node_op.get(COALESCE_EXTENSION)
+    if extension is None or extension is False:
+        return False
+    if extension is not True:
+        warnings.warn(
+            f"Ignoring {COALESCE_EXTENSION} of operation '{operation_id}': must be true or false", UserWarning
+        )
+        return False
+    if not _coalescible(method, has_request_body):
+        warnings.warn(
+            f"Ignoring {COALESCE_EXTENSION} of operation '{operation_id}': "
+            f"only GET and HEAD operations without a request body can be coalesced",
+            UserWarning,
+        )
+        return False
+    return True
+
+
+def apply_coalesce_allowlist(operations: List[IROperation], operation_ids: Iterable[str]) -> None:
+    """Enable request coalescing for the operations whose IDs are listed.
+
+    Contracts:
+        Postconditions:
+            - Listed GET and HEAD operations without a request body have `coalesce` set
+            - Warns about listed IDs that match no operation or an operation that cannot be coalesced
+    """
+    by_id = {op.operation_id: op for op in operations}
+    for operation_id in operation_ids:
+        op = by_id.get(operation_id)
+        if op is None:
+            warnings.warn(f"Coalesce allowlist: no operation with ID '{operation_id}'", UserWarning)
+        elif not _coalescible(op.method, op.request_body is not None):
+            warnings.warn(
+                f"Coalesce allowlist: operation '{operation_id}' is not a GET or HEAD operation without a request body",
+                UserWarning,
+            )
+        else:
+            op.coalesce = True
@@ -0,0 +1,35 @@
+"""Idempotency of parsed operations, which makes their requests safe to hedge.
+
+GET and HEAD operations are idempotent. Other operations are when marked with the
+`x-idempotent: true` vendor extension (e.g. a PUT, or a POST deduplicated by an idempotency key),
+and `x-idempotent: false` opts a GET or HEAD operation out. Requests of idempotent operations may be
+sent twice by a HedgingTransport to cut tail latency.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, Mapping
+
+from pyopenapi_gen import HTTPMethod
+
+IDEMPOTENT_EXTENSION = "x-idempotent"
+IDEMPOTENT_METHODS = (HTTPMethod.GET, HTTPMethod.HEAD)
+
+
+def detect_idempotent(node_op: Mapping[str, Any], operation_id: str, method: HTTPMethod) -> bool:
+    """Whether an operation is idempotent, from its method and `x-idempotent` extension.
+
+    Contracts:
+        Postconditions:
+            - Returns the `x-idempotent` value when it is a boolean
+            - Otherwise returns True for GET and HEAD operations, warning about a non-boolean value
+    """
+    extension = node_op.get(IDEMPOTENT_EXTENSION)
+    if isinstance(extension, bool):
+        return extension
+    if extension is not None:
+        warnings.warn(
+            f"Ignoring {IDEMPOTENT_EXTENSION} of operation '{operation_id}': must be true or false", UserWarning
+        )
+    return method in IDEMPOTENT_METHODS
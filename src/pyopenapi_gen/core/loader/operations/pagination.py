@@ -0,0 +1,241 @@
+"""Pagination detection for parsed operations.
+
+Recognises the common shapes of paginated list endpoints so that typed iterators can be
+generated for them:
+- cursor: a next-token query parameter with a matching next-token response property
+- link: a `Link` response header (RFC 8288) carrying the next page URL
+- offset: offset/limit query parameters, optionally with a total in the response
+- page: a page number query parameter, optionally with a total or page count in the response
+
+Parameters are matched by name and schema type: cursors must be strings (not dates), and
+offsets, page numbers and page sizes integers, since the iterators do arithmetic on them.
+
+The `x-pagination` vendor extension overrides detection, or disables it with `false`.
+"""
+
+from __future__ import annotations
+
+import logging
+import warnings
+from typing import Any, Iterable, List, Mapping
+
+from pyopenapi_gen import IRParameter, IRResponse, IRSchema
+from pyopenapi_gen.ir import IRPagination
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_EXTENSION = "x-pagination"
+PAGINATION_STYLES = ("cursor", "offset", "page", "link")
+
+# Candidate names, compared after lower-casing and removing "_", "-" and "."
+_CURSOR_PARAMS = ("cursor", "pagetoken", "nexttoken", "continuationtoken", "startingafter", "after", "marker")
+_NEXT_FIELDS = (
+    "nextcursor",
+    "nextpagetoken",
+    "nexttoken",
+    "continuationtoken",
+    "nextmarker",
+    "nextpagecursor",
+    "cursor",
+)
+_OFFSET_PARAMS = ("offset", "skip", "start")
+_PAGE_PARAMS = ("page", "pagenumber", "pageno", "pagenum", "pageindex")
+# "count" is a total when it is a response property, so it is not taken for a page size
+_SIZE_PARAMS = ("limit", "pagesize", "perpage", "size", "take", "maxresults")
+_ITEMS_FIELDS = ("items", "data", "results", "records", "entries", "values", "content", "elements", "rows")
+_TOTAL_FIELDS = ("total", "totalcount", "totalitems", "totalresults", "totalelements", "count")
+_TOTAL_PAGES_FIELDS = ("totalpages", "pagecount", "pages", "numpages")
+# String formats that are values to filter on rather than opaque cursors
+_NON_CURSOR_FORMATS = ("date", "date-time", "time")
+
+
+def _normalize(name: str) -> str:
+    return name.lower().replace("_", "").replace("-", "").replace(".", "")
+
+
+def _find(names: Mapping[str, str], candidates: Iterable[str]) -> str | None:
+    """Return the original name of the first candidate present in `names` (normalized → original)."""
+    for candidate in candidates:
+        if candidate in names:
+            return names[candidate]
+    return None
+
+
+def _success_schema(responses: List[IRResponse]) -> IRSchema | None:
+    """The JSON body schema of the first 2xx response."""
+    for resp in sorted(responses, key=lambda r: r.status_code):
+        if resp.status_code.startswith("2") and not resp.stream:
+            for media_type, schema in resp.content.items():
+                if "json" in media_type:
+                    return schema
+    return None
+
+
+def _items_field(schema: IRSchema) -> str | None:
+    """The array property holding the page items: a well-known name, or the only array property."""
+    arrays = {_normalize(name): name for name, prop in schema.properties.items() if prop.type == "array"}
+    found = _find(arrays, _ITEMS_FIELDS)
+    if found is None and len(arrays) == 1:
+        found = next(iter(arrays.values()))
+    return found
+
+
+def _typed_fields(schema: IRSchema, types: tuple[str, ...]) -> dict[str, str]:
+    return {_normalize(name): name for name, prop in schema.properties.items() if prop.type in types}
+
+
+def _integer_params(query_params: Mapping[str, IRParameter]) -> dict[str, str]:
+    return {_normalize(name): name for name, p in query_params.items() if p.schema.type == "integer"}
+
+
+def _cursor_params(query_params: Mapping[str, IRParameter]) -> dict[str, str]:
+    return {
+        _normalize(name): name
+        for name, p in query_params.items()
+        if p.schema.type == "string" and p.schema.format not in _NON_CURSOR_FORMATS
+    }
+
+
+def _declares_link_header(response_nodes: Mapping[str, Any]) -> bool:
+    for status_code, node in response_nodes.items():
+        if str(status_code).startswith("2") and isinstance(node, Mapping):
+            headers = node.get("headers")
+            if isinstance(headers, Mapping) and any(str(name).lower() == "link" for name in headers):
+                return True
+    return False
+
+
+def _first_page(param: IRParameter) -> int:
+    default = param.schema.default
+    return default if isinstance(default, int) and not isinstance(default, bool) and default in (0, 1) else 1
+
+
+def _from_extension(
+    extension: Mapping[str, Any],
+    query_params: Mapping[str, IRParameter],
+    schema: IRSchema | None,
+    operation_id: str,
+) -> IRPagination | None:
+    """Build the pagination described by an `x-pagination` object, or warn and return None."""
+
+    def invalid(reason: str) -> None:
+        warnings.warn(f"Ignoring {PAGINATION_EXTENSION} of operation '{operation_id}': {reason}", UserWarning)
+
+    style = extension.get("style")
+    if style not in PAGINATION_STYLES:
+        invalid(f"'style' must be one of {', '.join(PAGINATION_STYLES)}")
+        return None
+    if schema is None:
+        invalid("the operation has no JSON success response")
+        return None
+
+    body_is_array = schema.type == "array"
+    items_field = extension.get("items")
+    if items_field is None and not body_is_array:
+        items_field = _items_field(schema)
+        if items_field is None:
+            invalid("'items' is required when the response has no single array property")
+            return None
+
+    param = extension.get("param")
+    size_param = extension.get("size_param")
+    for name in (param, size_param):
+        if name is not None and name not in query_params:
+            invalid(f"'{name}' is not a query parameter")
+            return None
+    if style != "link" and param is None:
+        invalid(f"'param' is required for the {style} style")
+        return None
+
+    fields = {key: extension.get(key) for key in ("next", "total", "total_pages")}
+    for key, name in [("items", items_field), *fields.items()]:
+        if name is not None and name not in schema.properties:
+            invalid(f"'{key}' names '{name}', which is not a property of the response")
+            return None
+    if style == "cursor" and fields["next"] is None:
+        invalid("'next' is required for the cursor style")
+        return None
+
+    first_page = extension.get("first_page")
+    if first_page is None:
+        first_page = _first_page(query_params[param]) if style == "page" and param else 1
+    return IRPagination(
+        style=style,
+        items_field=items_field,
+        param=param,
+        size_param=size_param,
+        next_field=fields["next"],
+        total_field=fields["total"],
+        total_pages_field=fields["total_pages"],
+        first_page=first_page,
+    )
+
+
+def detect_pagination(
+    node_op: Mapping[str, Any],
+    operation_id: str,
+    parameters: List[IRParameter],
+    responses: List[IRResponse],
+    response_nodes: Mapping[str, Any],
+) -> IRPagination | None:
+    """Detect how an operation paginates its results.
+
+    Contracts:
+        Preconditions:
+            - parameters and responses are the parsed IR of the operation in node_op
+            - response_nodes maps status codes to the resolved raw response objects
+        Postconditions:
+            - Returns None for operations that do not return a paginated collection
+            - Every name in the returned IRPagination is a query parameter or a property of
+              the success response body
+    """
+    query_params = {p.name: p for p in parameters if p.param_in == "query"}
+    schema = _success_schema(responses)
+
+    extension = node_op.get(PAGINATION_EXTENSION)
+    if extension is False:
+        return None
+    if isinstance(extension, Mapping):
+        return _from_extension(extension, query_params, schema, operation_id)
+
+    if schema is None:
+        return None
+    body_is_array = schema.type == "array"
+    items_field = None if body_is_array else _items_field(schema)
+    if not body_is_array and items_field is None:
+        return None
+
+    integer_params = _integer_params(query_params)
+    size_param = _find(integer_params, _SIZE_PARAMS)
+
+    cursor_param = _find(_cursor_params(query_params), _CURSOR_PARAMS)
+    if cursor_param is not None and not body_is_array:
+        next_fields = _typed_fields(schema, ("string", "integer"))
+        next_field = _find(next_fields, (*_NEXT_FIELDS, f"next{_normalize(cursor_param)}"))
+        if next_field is not None:
+            return IRPagination("cursor", items_field, cursor_param, size_param, next_field=next_field)
+
+    if _declares_link_header(response_nodes):
+        return IRPagination("link", items_field, size_param=size_param)
+
+    total_fields = {} if body_is_array else _typed_fields(schema, ("integer",))
+    total_field = _find(total_fields, _TOTAL_FIELDS)
+
+    offset_param = _find(integer_params, _OFFSET_PARAMS)
+    if offset_param is not None and size_param is not None:
+        return IRPagination("offset", items_field, offset_param, size_param, total_field=total_field)
+
+    page_param = _find(integer_params, _PAGE_PARAMS)
+    if page_param is not None:
+        return IRPagination(
+            "page",
+            items_field,
+            page_param,
+            size_param,
+            total_field=total_field,
+            total_pages_field=_find(total_fields, _TOTAL_PAGES_FIELDS),
+            first_page=_first_page(query_params[page_param]),
+        )
+
+    logger.debug(f"Operation '{operation_id}' returns a collection without a recognised pagination shape")
+    return None
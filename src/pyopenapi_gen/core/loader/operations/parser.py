@@ -10,8 +10,12 @@ import warnings
 from typing import Any, List, Mapping, cast
 
 from pyopenapi_gen import HTTPMethod, IROperation, IRParameter, IRRequestBody, IRResponse
+from pyopenapi_gen.core.loader.operations.coalesce import detect_coalesce
+from pyopenapi_gen.core.loader.operations.idempotency import detect_idempotent
+from pyopenapi_gen.core.loader.operations.pagination import detect_pagination
 from pyopenapi_gen.core.loader.operations.post_processor import post_process_operation
 from pyopenapi_gen.core.loader.operations.request_body import parse_request_body
+from pyopenapi_gen.core.loader.operations.timeouts import detect_timeout
 from pyopenapi_gen.core.loader.parameters import parse_parameter, resolve_parameter_node_if_ref
 from pyopenapi_gen.core.loader.responses import parse_response
 from pyopenapi_gen.core.parsing.context import ParsingContext
@@ -116,6 +120,7 @@ def parse_operations(
 
                 # Parse responses
                 resps: List[IRResponse] = []
+                resp_nodes: dict[str, Any] = {}
                 for sc, rn_node in cast(Mapping[str, Any], node_op.get("responses", {})).items():
                     if (
                         isinstance(rn_node, Mapping)
@@ -139,6 +144,7 @@ def parse_operations(
                         }
                     else:
                         resp_node_resolved = rn_node
+                    resp_nodes[str(sc)] = resp_node_resolved
                     resps.append(parse_response(sc, resp_node_resolved, context, operation_id_for_promo=operation_id))
 
                 op = IROperation(
@@ -151,6 +157,10 @@ def parse_operations(
                     request_body=rb,
                     responses=resps,
                     tags=list(node_op.get("tags", [])),
+                    pagination=detect_pagination(node_op, operation_id, params, resps, resp_nodes),
+                    coalesce=detect_coalesce(node_op, operation_id, HTTPMethod[mu], rb is not None),
+                    idempotent=detect_idempotent(node_op, operation_id, HTTPMethod[mu]),
+                    timeout=detect_timeout(node_op, operation_id),
                 )
             except Exception as e:
                 warnings.warn(
@@ -0,0 +1,57 @@
+"""Default deadlines of parsed operations.
+
+Generated endpoint methods accept a `timeout` bounding the whole call, including the nested requests
+made on its behalf. Its default is set per operation with the `x-timeout` vendor extension (seconds),
+or through a mapping of operation IDs to seconds given at generation time; without one, a call is only
+bounded by the deadline of its caller.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, List, Mapping
+
+from pyopenapi_gen import IROperation
+
+TIMEOUT_EXTENSION = "x-timeout"
+
+
+def detect_timeout(node_op: Mapping[str, Any], operation_id: str) -> float | None:
+    """The default deadline (seconds) an operation's `x-timeout` extension sets.
+
+    Contracts:
+        Postconditions:
+            - Returns a positive number of seconds, or None without the extension
+            - Warns and returns None for a value that is not a positive number
+    """
+    extension = node_op.get(TIMEOUT_EXTENSION)
+    if extension is None:
+        return None
+    if isinstance(extension, bool) or not isinstance(extension, (int, float)) or extension <= 0:
+        warnings.warn(
+            f"Ignoring {TIMEOUT_EXTENSION} of operation '{operation_id}': must be a positive number of seconds",
+            UserWarning,
+        )
+        return None
+    return float(extension)
+
+
+def apply_operation_timeouts(operations: List[IROperation], timeouts: Mapping[str, float]) -> None:
+    """Set the default deadline of the operations whose IDs are listed, overriding `x-timeout`.
+
+    Contracts:
+        Preconditions:
+            - Every timeout is a positive number of seconds
+        Postconditions:
+            - Listed operations have `timeout` set
+            - Warns about listed IDs that match no operation
+    """
+    by_id = {op.operation_id: op for op in operations}
+    for operation_id, seconds in timeouts.items():
+        if seconds <= 0:
+            raise ValueError(f"Timeout of operation '{operation_id}' must be positive, got {seconds}")
+        op = by_id.get(operation_id)
+        if op is None:
+            warnings.warn(f"Operation timeouts: no operation with ID '{operation_id}'", UserWarning)
+        else:
+            op.timeout = float(seconds)
@@ -0,0 +1,291 @@
+"""
+In-process metrics of API calls, broken down by operation and phase.
+
+The process-wide `metrics` registry records, per operation ID:
+- latency histograms of the phases of a call: `auth` (the auth plugin signing a request),
+  `serialize` (DataclassSerializer.serialize), `network` (sending a request and receiving its
+  response; until the headers for streamed responses), `deserialize` (structuring the response,
+  e.g. structure_from_dict) and `call` (the whole call)
+- bytes sent and received, and responses per status code
+
+It is disabled by default. Disabled, every hook is a single attribute check: no clocks are read
+and nothing is allocated. Generated endpoint methods name their operation through their `Deadline`
+scope, and `HttpxTransport` and the (de)serializers attribute what they measure to it:
+
+    from my_client.core import metrics
+
+    metrics.enable()
+    ...
+    metrics.snapshot()    # {"listUsers": {"phases": {"network": {"count": 12, "p99_seconds": ...}}, ...}}
+    metrics.prometheus()  # Prometheus text exposition format
+"""
+
+import math
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+PHASE_AUTH = "auth"
+PHASE_SERIALIZE = "serialize"
+PHASE_NETWORK = "network"
+PHASE_DESERIALIZE = "deserialize"
+PHASE_CALL = "call"
+
+# Buckets grow by 2% from 1 µs, so a percentile is within 2% of the recorded latency
+_BUCKET_GROWTH = 1.02
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+_MIN_SECONDS = 1e-6
+_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class HdrHistogram:
+    """
+    Latency histogram of constant relative precision (2%) over any range, in sparse logarithmic
+    buckets: memory grows with the spread of the latencies, not with the samples.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        index = math.ceil(math.log(seconds / _MIN_SECONDS) / _LOG_GROWTH) if seconds > _MIN_SECONDS else 0
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Latency (seconds) below which `fraction` of the samples fall (0.0 without samples)."""
+        rank = fraction * self.count
+        cumulative = 0
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            if cumulative >= rank:
+                # The upper bound of the bucket, but never beyond the slowest sample
+                return min(_MIN_SECONDS * _BUCKET_GROWTH**index, self.max)
+        return self.max
+
+
+class OperationMetrics:
+    """Phase latencies, byte counts and status codes of one operation."""
+
+    __slots__ = ("phases", "request_bytes", "response_bytes", "status_codes")
+
+    def __init__(self) -> None:
+        self.phases: dict[str, HdrHistogram] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes: dict[int, int] = {}
+
+
+class CallMetrics:
+    """The time one call spent (de)serializing, recorded as one sample of each phase when it ends."""
+
+    __slots__ = ("operation", "started", "phases", "timing")
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.timing = False  # A phase is being timed: nested hooks (e.g. decode_model's) add nothing
+
+    def activate(self) -> Token["CallMetrics | None"]:
+        """Make this the call of the current context, until `deactivate` is given the returned token."""
+        return _current_call.set(self)
+
+    @staticmethod
+    def deactivate(token: Token["CallMetrics | None"]) -> None:
+        """Restore the call of the current context from before `activate`."""
+        _current_call.reset(token)
+
+
+# The call of the current context, activated by the Deadline scope of a generated endpoint method
+_current_call: ContextVar[CallMetrics | None] = ContextVar("pyopenapi_gen_call", default=None)
+# Operation ID and path template of the call in progress, set by the same scope whether or not
+# metrics are enabled (the slow-request sampler reads them too)
+_current_operation: ContextVar[tuple[str, str | None] | None] = ContextVar("pyopenapi_gen_operation", default=None)
+
+
+def enter_operation(operation: str, route: str | None = None) -> Token[tuple[str, str | None] | None]:
+    """Make `operation` (with its path template) the operation of the current context."""
+    return _current_operation.set((operation, route))
+
+
+def exit_operation(token: Token[tuple[str, str | None] | None]) -> None:
+    """Restore the operation of the current context from before `enter_operation`."""
+    _current_operation.reset(token)
+
+
+def current_operation() -> str | None:
+    """Operation ID of the call in progress in the current context."""
+    current = _current_operation.get()
+    return None if current is None else current[0]
+
+
+def current_route() -> tuple[str, str | None] | None:
+    """Operation ID and path template (e.g. `/users/{userId}`) of the call in progress in the current context."""
+    return _current_operation.get()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    Per-operation metrics of the calls made in this process.
+
+    Attributes:
+        enabled: Whether metrics are recorded. Checked first by every hook.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._operations: dict[str, OperationMetrics] = {}
+
+    def enable(self) -> None:
+        """Start recording metrics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording metrics; those recorded so far are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discard the metrics recorded so far."""
+        self._operations = {}
+
+    def _operation(self, operation: str) -> OperationMetrics:
+        state = self._operations.get(operation)
+        if state is None:
+            state = self._operations[operation] = OperationMetrics()
+        return state
+
+    def record(self, operation: str, phase: str, seconds: float) -> None:
+        """Add a latency sample of a phase of an operation."""
+        phases = self._operation(operation).phases
+        histogram = phases.get(phase)
+        if histogram is None:
+            histogram = phases[phase] = HdrHistogram()
+        histogram.record(seconds)
+
+    def record_exchange(self, operation: str, status_code: int, request_bytes: int, response_bytes: int) -> None:
+        """Count a response of an operation and the bytes sent and received for it."""
+        state = self._operation(operation)
+        state.request_bytes += request_bytes
+        state.response_bytes += response_bytes
+        state.status_codes[status_code] = state.status_codes.get(status_code, 0) + 1
+
+    @staticmethod
+    def timed(phase: str, function: Callable[..., T], *args: Any) -> T:
+        """
+        Call `function(*args)`, adding its duration to `phase` of the call of the current context.
+
+        Hooks call this only while enabled. Outside calls, and within a phase already being timed,
+        the function is just called.
+        """
+        call = _current_call.get()
+        if call is None or call.timing:
+            return function(*args)
+        call.timing = True
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            call.timing = False
+            call.phases[phase] = call.phases.get(phase, 0.0) + time.perf_counter() - started
+
+    @staticmethod
+    def add_time(phase: str, seconds: float) -> None:
+        """
+        Add `seconds` to `phase` of the call of the current context, for work timed outside `timed`
+        (e.g. decoding awaited from an executor). Outside calls nothing is added.
+        """
+        call = _current_call.get()
+        if call is not None:
+            call.phases[phase] = call.phases.get(phase, 0.0) + seconds
+
+    def start_call(self, operation: str) -> CallMetrics | None:
+        """Begin measuring a call of an operation (None while disabled)."""
+        return CallMetrics(operation) if self.enabled else None
+
+    def finish_call(self, call: CallMetrics) -> None:
+        """Record the duration of a call and the time it spent in each phase."""
+        self.record(call.operation, PHASE_CALL, time.perf_counter() - call.started)
+        for phase, seconds in call.phases.items():
+            self.record(call.operation, phase, seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Metrics per operation ID, as plain (JSON-serializable) data:
+
+            {"listUsers": {
+                "phases": {"network": {"count": 12, "sum_seconds": 0.4, "max_seconds": 0.09,
+                                       "p50_seconds": 0.02, "p90_seconds": 0.05, "p99_seconds": 0.09}},
+                "request_bytes": 0, "response_bytes": 48213, "status_codes": {"200": 12}}}
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+        for operation, state in list(self._operations.items()):
+            phases: dict[str, Any] = {}
+            for phase, histogram in list(state.phases.items()):
+                summary: dict[str, float | int] = {
+                    "count": histogram.count,
+                    "sum_seconds": histogram.total,
+                    "max_seconds": histogram.max,
+                }
+                for quantile in _QUANTILES:
+                    summary[f"p{round(quantile * 100)}_seconds"] = histogram.percentile(quantile)
+                phases[phase] = summary
+            snapshot[operation] = {
+                "phases": phases,
+                "request_bytes": state.request_bytes,
+                "response_bytes": state.response_bytes,
+                "status_codes": {str(status): count for status, count in sorted(state.status_codes.items())},
+            }
+        return snapshot
+
+    def prometheus(self, namespace: str = "api_client") -> str:
+        """
+        The metrics in the Prometheus text exposition format: a summary of the latency of each phase
+        (`<namespace>_phase_seconds`) and counters of bytes and responses.
+        """
+        phase_lines: list[str] = []
+        byte_lines: list[str] = []
+        status_lines: list[str] = []
+        for operation, state in list(self._operations.items()):
+            op = f'operation="{_escape_label(operation)}"'
+            for phase, histogram in list(state.phases.items()):
+                labels = f'{op},phase="{phase}"'
+                for quantile in _QUANTILES:
+                    value = histogram.percentile(quantile)
+                    phase_lines.append(f'{namespace}_phase_seconds{{{labels},quantile="{quantile}"}} {value!r}')
+                phase_lines.append(f"{namespace}_phase_seconds_sum{{{labels}}} {histogram.total!r}")
+                phase_lines.append(f"{namespace}_phase_seconds_count{{{labels}}} {histogram.count}")
+            byte_lines.append(f'{namespace}_bytes_total{{{op},direction="sent"}} {state.request_bytes}')
+            byte_lines.append(f'{namespace}_bytes_total{{{op},direction="received"}} {state.response_bytes}')
+            for status, count in sorted(state.status_codes.items()):
+                status_lines.append(f'{namespace}_responses_total{{{op},status="{status}"}} {count}')
+        lines = [
+            f"# HELP {namespace}_phase_seconds Latency of the phases of API calls.",
+            f"# TYPE {namespace}_phase_seconds summary",
+            *phase_lines,
+            f"# HELP {namespace}_bytes_total Bytes of request and response bodies.",
+            f"# TYPE {namespace}_bytes_total counter",
+            *byte_lines,
+            f"# HELP {namespace}_responses_total Responses by status code.",
+            f"# TYPE {namespace}_responses_total counter",
+            *status_lines,
+        ]
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
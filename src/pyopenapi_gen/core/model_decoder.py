@@ -0,0 +1,539 @@
+"""
+Decoding of JSON response bodies into generated models, optionally in a single pass.
+
+`structure_from_dict(decode_json(response), Model)` first builds the whole `dict`/`list` tree
+of the body and then walks it again to build the dataclasses, so peak memory holds both trees.
+decode_model does this by default, with the client's JSON codec (orjson or msgspec when
+available). For bodies of at least the client's `single_pass_decode_bytes`, it instead parses
+the body text once, driven by the target type: every JSON object that maps to a generated
+dataclass is parsed field by field straight into the dataclass constructor, and no dict is ever
+built for it. That saves memory (roughly a third of the peak) but, walked in Python, takes about
+15% longer than the standard library's two passes, and more than orjson or msgspec.
+
+Only the model structure is walked in Python. Everything else (strings, numbers, lists of
+scalars, free-form objects) is read in one call to the standard library's C scanner and
+structured with the same cattrs hooks as structure_from_dict, so results are identical.
+
+A payload the typed decoder cannot handle (invalid JSON, type mismatches, missing required
+fields) is decoded again with the response's JsonCodec and passed to structure_from_dict, which
+raises its usual detailed errors.
+
+JsonArrayDecoder applies the same parsers to a JSON array fed chunk by chunk, yielding each
+item as soon as it is complete (see streaming_helpers.iter_json_array).
+"""
+
+from __future__ import annotations
+
+import codecs
+import dataclasses
+import json
+import json.scanner
+import re
+import threading
+import types
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, Callable, Generic, TypeVar, Union, cast, get_args, get_origin
+
+import cattrs
+import httpx
+
+from .cattrs_converter import (
+    _get_type_hints_with_extras,
+    _register_structure_hooks_recursively,
+    converter,
+    structure_from_dict,
+)
+from .json_codec import (
+    RESPONSE_CODEC_EXTENSION,
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
+from .metrics import PHASE_DESERIALIZE, metrics
+
+T = TypeVar("T")
+
+# Parses the JSON value starting at a non-whitespace index and returns (value, end index).
+_Parser = Callable[[str, int], tuple[Any, int]]
+
+_WHITESPACE = " \t\n\r"
+# The pattern always matches (possibly empty), so the result is never None
+_skip_whitespace = cast(Callable[[str, int], re.Match[str]], re.compile(r"[ \t\n\r]*").match)
+# The C implementations used by json.loads; scan_once parses any JSON value at an index.
+_scan_once: Callable[[str, int], tuple[Any, int]] = json.scanner.make_scanner(cast(Any, json.JSONDecoder()))
+_scanstring: Callable[[str, int, bool], tuple[str, int]] = scanstring
+# JsonArrayDecoder tracks the nesting of the body by its brackets and commas outside strings: escape
+# sequences are dropped first, so that every remaining quote opens or closes a string
+_ESCAPE_SEQUENCE = re.compile(r"\\.", re.DOTALL)
+_NON_STRUCTURAL = re.compile(r"[^][{},]+")
+
+# Compiled parsers, keyed by target type. None marks targets that are decoded the two-pass way.
+_target_parsers: dict[Any, _Parser | None] = {}
+_model_parsers: dict[type, _Parser] = {}
+_compile_lock = threading.Lock()
+
+# Codecs whose loads() matches json.loads, so decoding with the scanner gives the same values
+_BUILTIN_CODECS = (StdlibJsonCodec, OrjsonJsonCodec, MsgspecJsonCodec)
+
+# Key under which HttpxTransport records the body size from which decode_model decodes in a single pass
+SINGLE_PASS_EXTENSION = "pyopenapi_gen.single_pass_bytes"
+
+
+class _Mismatch(ValueError):
+    """The payload does not have the shape of the target type; the two-pass path takes over."""
+
+
+def _passthrough_types(type_hint: Any) -> tuple[type, ...]:
+    """
+    Types of decoded values that `type_hint`'s hook would return unchanged.
+
+    The converter's default hook for str/int/float/bool is `cls(value)`, which is a no-op when
+    the scanner already produced exactly that type; `X | None` also passes None through.
+    """
+    args = get_args(type_hint)
+    if get_origin(type_hint) in (Union, types.UnionType) and len(args) == 2 and type(None) in args:
+        inner = args[0] if args[1] is type(None) else args[1]
+        return (*_passthrough_types(inner), type(None)) if _passthrough_types(inner) else ()
+    if type_hint in (str, int, float, bool) and (
+        converter.get_structure_hook(type_hint) is cattrs.BaseConverter._structure_call
+    ):
+        return (type_hint,)
+    return ()
+
+
+def _leaf_parser(type_hint: Any) -> _Parser:
+    """Parse a value with the C scanner and structure it with the converter's hook for its type."""
+    hook = converter.get_structure_hook(type_hint)
+    passthrough = _passthrough_types(type_hint)
+
+    if passthrough:
+
+        def parse_scalar(s: str, i: int) -> tuple[Any, int]:
+            value, end = _scan_once(s, i)
+            if type(value) in passthrough:
+                return value, end
+            return hook(value, type_hint), end
+
+        return parse_scalar
+
+    def parse_leaf(s: str, i: int) -> tuple[Any, int]:
+        value, end = _scan_once(s, i)
+        return hook(value, type_hint), end
+
+    return parse_leaf
+
+
+def _is_reflective_model(type_hint: Any) -> bool:
+    """True for dataclasses structured by the converter's own hooks (not a user-registered hook)."""
+    if not (isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint)):
+        return False
+    _register_structure_hooks_recursively(type_hint)
+    # Hooks installed by cattrs_converter (reflective and --model-codecs) carry the key fingerprint
+    return hasattr(converter.get_structure_hook(type_hint), "_json_key_fingerprint")
+
+
+def _compile_typed(type_hint: Any, building: dict[type, _Parser]) -> _Parser | None:
+    """
+    Compile a parser for the parts of `type_hint` that contain models.
+
+    Returns None when no model is reached, in which case the value is read by the C scanner
+    in one call (see _leaf_parser).
+    """
+    if _is_reflective_model(type_hint):
+        return _compile_model(type_hint, building)
+
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+    if origin is list and len(args) == 1:
+        item_parser = _compile_typed(args[0], building)
+        return _array_parser(item_parser) if item_parser is not None else None
+    if origin in (Union, types.UnionType) and len(args) == 2 and type(None) in args:
+        inner = args[0] if args[1] is type(None) else args[1]
+        inner_parser = _compile_typed(inner, building)
+        return _nullable_parser(inner_parser) if inner_parser is not None else None
+    # Other unions, Annotated discriminators, dicts, enums and scalars use the converter's hooks
+    return None
+
+
+def _compile_model(cls: type, building: dict[type, _Parser]) -> _Parser:
+    """Compile the object parser of a dataclass; nested and recursive models share parsers."""
+    existing = _model_parsers.get(cls) or building.get(cls)
+    if existing is not None:
+        return existing
+
+    # JSON key -> (field name, value parser); filled after registration so that cycles resolve
+    fields: dict[str, tuple[str, _Parser]] = {}
+
+    def parse_model(s: str, i: int) -> tuple[Any, int]:
+        if s[i] != "{":
+            raise _Mismatch(f"Expected an object for {cls.__name__}")
+        i += 1
+        if s[i] in _WHITESPACE:
+            i = _skip_whitespace(s, i + 1).end()
+        kwargs: dict[str, Any] = {}
+        if s[i] == "}":
+            return cls(**kwargs), i + 1
+        while True:
+            if s[i] != '"':
+                raise _Mismatch("Expected a property name")
+            key, i = _scanstring(s, i + 1, True)
+            if s[i] != ":":
+                i = _skip_whitespace(s, i).end()
+                if s[i] != ":":
+                    raise _Mismatch("Expected ':'")
+            # Same whitespace fast path as json.decoder: usually no or a single space
+            i += 1
+            if s[i] in _WHITESPACE:
+                i += 1
+                if s[i] in _WHITESPACE:
+                    i = _skip_whitespace(s, i + 1).end()
+            field = fields.get(key)
+            if field is None:
+                # Unknown property: parsed (to find its end) and dropped, as structure_from_dict does
+                _, i = _scan_once(s, i)
+            else:
+                name, parse_value = field
+                kwargs[name], i = parse_value(s, i)
+            char = s[i]
+            if char in _WHITESPACE:
+                i = _skip_whitespace(s, i + 1).end()
+                char = s[i]
+            i += 1
+            if char == "}":
+                # Absent optional fields take their dataclass defaults; absent required fields
+                # make the constructor raise, and the two-pass path reports them
+                return cls(**kwargs), i
+            if char != ",":
+                raise _Mismatch("Expected ',' or '}'")
+            if s[i] in _WHITESPACE:
+                i += 1
+                if s[i] in _WHITESPACE:
+                    i = _skip_whitespace(s, i + 1).end()
+
+    building[cls] = parse_model
+
+    python_to_json: dict[str, str] = {}
+    load_mapping = getattr(getattr(cls, "Meta", None), "key_transform_with_load", None) or {}
+    for json_key, python_name in load_mapping.items():
+        python_to_json[python_name] = json_key
+    type_hints = _get_type_hints_with_extras(cls)
+    for f in dataclasses.fields(cls):
+        field_type = type_hints.get(f.name, f.type)
+        value_parser = _compile_typed(field_type, building) or _leaf_parser(field_type)
+        fields[python_to_json.get(f.name, f.name)] = (f.name, value_parser)
+
+    return parse_model
+
+
+def _array_parser(item_parser: _Parser) -> _Parser:
+    """Parse a JSON array whose items are parsed by `item_parser`."""
+
+    def parse_array(s: str, i: int) -> tuple[Any, int]:
+        if s[i] != "[":
+            raise _Mismatch("Expected an array")
+        i += 1
+        if s[i] in _WHITESPACE:
+            i = _skip_whitespace(s, i + 1).end()
+        items: list[Any] = []
+        if s[i] == "]":
+            return items, i + 1
+        append = items.append
+        while True:
+            item, i = item_parser(s, i)
+            append(item)
+            char = s[i]
+            if char in _WHITESPACE:
+                i = _skip_whitespace(s, i + 1).end()
+                char = s[i]
+            i += 1
+            if char == "]":
+                return items, i
+            if char != ",":
+                raise _Mismatch("Expected ',' or ']'")
+            if s[i] in _WHITESPACE:
+                i += 1
+                if s[i] in _WHITESPACE:
+                    i = _skip_whitespace(s, i + 1).end()
+
+    return parse_array
+
+
+def _nullable_parser(inner_parser: _Parser) -> _Parser:
+    """Parse `null` as None and anything else with `inner_parser`."""
+
+    def parse_nullable(s: str, i: int) -> tuple[Any, int]:
+        if s.startswith("null", i):
+            return None, i + 4
+        return inner_parser(s, i)
+
+    return parse_nullable
+
+
+def _get_target_parser(cls: Any) -> _Parser | None:
+    """Return the cached parser for a target type, compiling it on first use."""
+    try:
+        return _target_parsers[cls]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable target (e.g. Annotated with unhashable metadata)
+        return None
+
+    with _compile_lock:
+        if cls in _target_parsers:
+            return _target_parsers[cls]
+        building: dict[type, _Parser] = {}
+        try:
+            parser = _compile_typed(cls, building)
+        except Exception:  # nosec B110 - types the compiler cannot inspect use the two-pass path
+            parser = None
+            building.clear()
+        # Published only once complete: parsers of the same graph must never be seen half-built
+        _model_parsers.update(building)
+        _target_parsers[cls] = parser
+        return parser
+
+
+def structure_from_json(data: bytes | str, cls: type[T], codec: JsonCodec | None = None) -> T:
+    """
+    Decode a JSON document straight into a typed instance.
+
+    Scenario:
+        A response body holds a generated model or a list of models, possibly many megabytes.
+
+    Expected Outcome:
+        The result equals `structure_from_dict(codec.loads(data), cls)`, but objects mapped to
+        dataclasses are built directly while parsing, without an intermediate dict tree.
+        Targets without models, and payloads that do not match the target, take the two-pass
+        path so that errors are reported exactly as structure_from_dict reports them.
+
+    Args:
+        data: The JSON document (UTF-8/16/32 bytes, as accepted by json.loads, or text)
+        cls: Target type (dataclass, list[dataclass], etc.)
+        codec: Codec for the two-pass path; defaults to the auto-detected codec
+
+    Returns:
+        Instance of cls
+
+    Raises:
+        ValueError: If the document is not valid JSON or does not match `cls`
+    """
+    parser = _get_target_parser(cls)
+    if parser is not None:
+        try:
+            text = data if isinstance(data, str) else data.decode(json.detect_encoding(data), "surrogatepass")
+            start = _skip_whitespace(text, 0).end()
+            value, end = parser(text, start)
+            if _skip_whitespace(text, end).end() == len(text):
+                return cast(T, value)
+        except Exception:  # nosec B110 - the two-pass path below reports the failure
+            pass
+
+    if codec is None:
+        codec = get_json_codec()
+    return structure_from_dict(codec.loads(data), cls)
+
+
+def decode_model(response: httpx.Response, cls: type[T]) -> T:
+    """
+    Decode a response body into `cls` with the client's JSON codec.
+
+    Used by generated endpoint code for model and list-of-model responses. Bodies of at least the
+    `single_pass_decode_bytes` of the client's transport are decoded in a single pass over their
+    bytes (see structure_from_json), unless the client is configured with a custom JsonCodec,
+    whose loads() may differ from the standard parser.
+    """
+    if metrics.enabled:
+        return cast(T, metrics.timed(PHASE_DESERIALIZE, _decode_model, response, cls))
+    return _decode_model(response, cls)
+
+
+def _decode_model(response: httpx.Response, cls: type[T]) -> T:
+    extensions = response.extensions
+    return decode_body(
+        response.content, cls, extensions.get(RESPONSE_CODEC_EXTENSION), extensions.get(SINGLE_PASS_EXTENSION)
+    )
+
+
+def decode_body(
+    content: bytes, cls: type[T], codec: str | JsonCodec | None = None, single_pass_bytes: int | None = None
+) -> T:
+    """
+    Decode a response body into `cls` as decode_model does, given the settings of its client.
+
+    Takes only the body bytes, so that it can run in a worker process (see offload.DecodeOffload).
+
+    Args:
+        content: The response body
+        cls: Target type
+        codec: The client's JSON codec, or its name; defaults to the auto-detected codec
+        single_pass_bytes: Bodies this large or larger are decoded in a single pass (None: never)
+    """
+    json_codec = get_json_codec(codec)
+    if single_pass_bytes is not None and len(content) >= single_pass_bytes and is_builtin_codec(json_codec):
+        return structure_from_json(content, cls, json_codec)
+    return structure_from_dict(json_codec.loads(content), cls)
+
+
+def is_builtin_codec(codec: str | JsonCodec | None) -> bool:
+    """True for the named codecs, whose decoding the single-pass parser reproduces."""
+    return codec is None or isinstance(codec, str) or type(codec) in _BUILTIN_CODECS
+
+
+class JsonArrayDecoder(Generic[T]):
+    """
+    Incrementally decode the items of a top-level JSON array fed in byte chunks.
+
+    Scenario:
+        A list response holds millions of items and is read from the network chunk by chunk.
+
+    Expected Outcome:
+        feed() returns the items completed by each chunk, structured into `item_type` with
+        the same single-pass parsers as structure_from_json. Only the unparsed tail of the
+        body is buffered, so memory is bounded by the size of one item plus one chunk.
+        Each chunk is scanned once for the nesting of the items, and an item is parsed only
+        once the chunk closing it has arrived, so large items cost linear time.
+        An item that is valid JSON but does not match `item_type` raises the usual
+        structure_from_dict error.
+
+    Example:
+        ```python
+        decoder = JsonArrayDecoder(User)
+        async for chunk in response.aiter_bytes():
+            for user in decoder.feed(chunk):
+                ...
+        decoder.close()
+        ```
+    """
+
+    # Parser states: what the next non-whitespace character must start
+    _ARRAY_START, _FIRST_ITEM, _ITEM, _SEPARATOR, _DONE = range(5)
+
+    def __init__(self, item_type: type[T]) -> None:
+        self._item_type = item_type
+        self._parse_item: _Parser = _get_target_parser(item_type) or _leaf_parser(item_type)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        # The unparsed tail of the body, as decoded chunks joined only when an item is complete
+        self._chunks: list[str] = []
+        self._state = self._ARRAY_START
+        # Nesting scan over the body: depth (1 inside the array), inside a string, after a backslash
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, data: bytes) -> list[T]:
+        """Add a chunk of the body and return the items it completed."""
+        text = self._text_decoder.decode(data)
+        self._chunks.append(text)
+        if not self._scan(text):
+            return []
+        return self._drain(final=False)
+
+    def close(self) -> list[T]:
+        """
+        Signal the end of the body and return any remaining items.
+
+        Raises:
+            ValueError: If the body is not a complete JSON array
+        """
+        self._chunks.append(self._text_decoder.decode(b"", final=True))
+        items = self._drain(final=True)
+        if self._state != self._DONE:
+            raise ValueError("Incomplete JSON array: the response ended before the closing ']'")
+        return items
+
+    def _scan(self, text: str) -> bool:
+        """
+        Continue the nesting scan over newly decoded text.
+
+        Returns:
+            True if the text ends an item: a ',' or closing bracket at array level, or the end of an
+            object or array item
+        """
+        if self._escaped and text:
+            text, self._escaped = text[1:], False
+        text = _ESCAPE_SEQUENCE.sub("", text)
+        if text.endswith("\\"):
+            # The escaped character is at the start of the next chunk
+            text, self._escaped = text[:-1], True
+        parts = text.split('"')
+        outside_strings = parts[1::2] if self._in_string else parts[0::2]
+        self._in_string ^= len(parts) % 2 == 0
+        complete = False
+        depth = self._depth
+        for char in _NON_STRUCTURAL.sub("", "".join(outside_strings)):
+            if char == "[" or char == "{":
+                depth += 1
+                continue
+            if char != ",":
+                depth -= 1
+            complete = complete or depth <= 1
+        self._depth = depth
+        return complete
+
+    def _drain(self, final: bool) -> list[T]:
+        """Parse every complete item in the buffer and keep the unparsed tail."""
+        s = "".join(self._chunks)
+        i = 0
+        items: list[T] = []
+        while True:
+            i = _skip_whitespace(s, i).end()
+            if i == len(s):
+                break
+            char = s[i]
+            state = self._state
+            if state == self._DONE:
+                raise ValueError(f"Extra data after the JSON array at position {i}")
+            if state == self._ARRAY_START:
+                if char != "[":
+                    raise ValueError("Expected the response body to be a JSON array")
+                self._state = self._FIRST_ITEM
+                i += 1
+            elif state == self._SEPARATOR or (state == self._FIRST_ITEM and char == "]"):
+                if char == "]":
+                    self._state = self._DONE
+                elif char == "," and state == self._SEPARATOR:
+                    self._state = self._ITEM
+                else:
+                    raise ValueError(f"Expected ',' or ']' in the JSON array at position {i}")
+                i += 1
+            else:
+                parsed = self._parse_next(s, i, final)
+                if parsed is None:
+                    break
+                item, i = parsed
+                items.append(item)
+                self._state = self._SEPARATOR
+        self._chunks = [s[i:]] if i < len(s) else []
+        return items
+
+    def _parse_next(self, s: str, i: int, final: bool) -> tuple[T, int] | None:
+        """Parse the item at `i`, or return None if it is not complete in the buffer yet."""
+        try:
+            item, end = self._parse_item(s, i)
+        except Exception:
+            # Tell an item cut off by the chunk boundary from one that does not match the type
+            try:
+                raw, end = _scan_once(s, i)
+            except (StopIteration, ValueError, IndexError):
+                if final:
+                    raise json.JSONDecodeError("Invalid JSON array item", s, i) from None
+                return None
+            if end == len(s) and not final:
+                return None
+            return structure_from_dict(raw, self._item_type), end
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(s) and not final:
+            return None
+        return cast(T, item), end
+
+
+__all__ = [
+    "SINGLE_PASS_EXTENSION",
+    "structure_from_json",
+    "decode_model",
+    "decode_body",
+    "JsonArrayDecoder",
+]
@@ -0,0 +1,141 @@
+"""
+Decoding of large response bodies off the event loop.
+
+decode_model parses and structures a body on the calling thread; for a body of tens of
+megabytes that blocks the event loop, and every other coroutine of the process, for hundreds
+of milliseconds. `DecodeOffload` is given to `HttpxTransport(decode_offload=...)`, which attaches
+it to its responses. Generated endpoint methods then decode the bodies of at least
+`threshold_bytes` in an executor, and every smaller body inline exactly as before:
+
+    transport = HttpxTransport(base_url, decode_offload=DecodeOffload(8 * 1024 * 1024))
+
+- ``"thread"`` (default): a thread pool runs decode_model. The loop keeps running while a
+  body is decoded, interleaved with the decoding thread (which holds the GIL while parsing).
+- ``"process"``: a process pool is sent the raw body bytes and the target type and returns the
+  decoded models, so decoding runs in parallel with the loop. The models and the target type
+  must be picklable (generated models are) and a custom JsonCodec too; structure hooks
+  registered at runtime must also be registered in the worker processes.
+- any `concurrent.futures.Executor`, which is used as is and not shut down by `close()`.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
+import httpx
+
+from .json_codec import RESPONSE_CODEC_EXTENSION
+from .metrics import PHASE_DESERIALIZE, metrics
+from .model_decoder import SINGLE_PASS_EXTENSION, _decode_model, decode_body, is_builtin_codec
+
+T = TypeVar("T")
+
+# Key under which HttpxTransport records its DecodeOffload in `httpx.Response.extensions`
+DECODE_OFFLOAD_EXTENSION = "pyopenapi_gen.decode_offload"
+
+
+class DecodeOffload:
+    """
+    Decodes response bodies of at least `threshold_bytes` in an executor.
+
+    Attributes:
+        threshold_bytes: Size from which a body is decoded in the executor.
+        executor: "thread", "process", or the executor to use.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 8 * 1024 * 1024,
+        executor: str | Executor = "thread",
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            threshold_bytes: Bodies this large or larger are decoded in the executor.
+            executor: "thread" for a thread pool, "process" for a process pool, or an Executor.
+            max_workers: Workers of the pool created for "thread" or "process" (None: the pool's default).
+
+        Raises:
+            ValueError: If `executor` is a string other than "thread" or "process".
+        """
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError(f'executor must be "thread", "process" or an Executor, got {executor!r}')
+        self.threshold_bytes = threshold_bytes
+        self.executor = executor
+        self.max_workers = max_workers
+        self._pool: Executor | None = None  # Created by the first offloaded decode
+        self._lock = threading.Lock()
+
+    def applies_to(self, response: httpx.Response) -> bool:
+        """Whether the body of `response` is large enough to be decoded in the executor."""
+        return len(response.content) >= self.threshold_bytes
+
+    def _executor(self) -> Executor:
+        if not isinstance(self.executor, str):
+            return self.executor
+        with self._lock:
+            if self._pool is None:
+                if self.executor == "process":
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="pyopenapi-gen-decode"
+                    )
+            return self._pool
+
+    async def decode(self, response: httpx.Response, cls: type[T]) -> T:
+        """
+        Decode the body of `response` into `cls` in the executor, as decode_model would.
+
+        The time until the result is back (including any wait for a free worker) is the
+        `deserialize` phase of the call.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter() if metrics.enabled else None
+        try:
+            if self.executor == "process":
+                codec = response.extensions.get(RESPONSE_CODEC_EXTENSION)
+                # Named codecs are sent by name and created once in each worker
+                worker_codec = codec.name if codec is not None and is_builtin_codec(codec) else codec
+                single_pass_bytes = response.extensions.get(SINGLE_PASS_EXTENSION)
+                return await loop.run_in_executor(
+                    self._executor(), decode_body, response.content, cls, worker_codec, single_pass_bytes
+                )
+            return await loop.run_in_executor(self._executor(), _decode_model, response, cls)
+        finally:
+            if started is not None:
+                metrics.add_time(PHASE_DESERIALIZE, time.perf_counter() - started)
+
+    def close(self) -> None:
+        """
+        Shut down the pool created for "thread" or "process", once its running decodes are done.
+
+        Blocks while they finish: HttpxTransport.close() calls it from a worker thread. A later
+        offloaded decode creates a new pool. An executor given by the caller is left running.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def decode_offload(response: httpx.Response) -> DecodeOffload | None:
+    """
+    The DecodeOffload that should decode the body of `response`, or None to decode it inline.
+
+    Used by generated endpoint methods before decode_model: None unless the response was received
+    by a transport with a DecodeOffload and its body reaches the threshold.
+    """
+    offload: DecodeOffload | None = response.extensions.get(DECODE_OFFLOAD_EXTENSION)
+    if offload is None or not offload.applies_to(response):
+        return None
+    return offload
+
+
+__all__ = [
+    "DECODE_OFFLOAD_EXTENSION",
+    "DecodeOffload",
+    "decode_offload",
+]
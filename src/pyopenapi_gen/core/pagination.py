@@ -4,9 +4,354 @@ Pagination utilities for handling paginated API endpoints.
 This module provides functions for working with paginated API responses,
 turning them into convenient async iterators that automatically handle
 fetching subsequent pages.
+
+Pages are fetched ahead of the consumer: while the items of one page are being
+processed, the following pages are already being requested in background tasks.
+- `paginate_pipelined` (and `paginate_by_next`) follow a cursor or next-page token,
+  keeping up to `prefetch` pages requested ahead of the page being consumed.
+- `paginate_by_link` follows the `rel="next"` URL of `Link` response headers.
+- `paginate_by_offset` and `paginate_by_page` fan the remaining page requests out
+  concurrently when the first response reports the total, limited to `concurrency`
+  requests in flight, and fall back to the pipelined crawl when it does not.
+Items are always yielded in page order, and errors are raised when the consumer
+reaches the page that failed.
 """
 
-from typing import Any, AsyncIterator, Awaitable, Callable
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence, TypeVar
+
+import httpx
+
+PageT = TypeVar("PageT")
+ItemT = TypeVar("ItemT")
+
+_PAGES_DONE = object()
+
+
+def _check_limits(prefetch: int, concurrency: int = 1) -> None:
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+
+async def _pipelined_pages(
+    fetch_page: Callable[..., Awaitable[PageT]],
+    get_next_params: Callable[[PageT, dict[str, Any]], dict[str, Any] | None],
+    prefetch: int,
+    params: dict[str, Any],
+) -> AsyncGenerator[PageT, None]:
+    """
+    Yield pages in order, fetching each next page in a background task as soon as the
+    previous one has arrived, with at most `prefetch` pages fetched ahead of the consumer.
+    """
+    # One slot per page that is fetched but not yet consumed, plus the one being consumed
+    slots = asyncio.Semaphore(prefetch + 1)
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def produce() -> None:
+        page_params: dict[str, Any] | None = params
+        try:
+            while page_params is not None:
+                await slots.acquire()
+                page = await fetch_page(**page_params)
+                queue.put_nowait(page)
+                page_params = get_next_params(page, page_params)
+        except Exception as e:  # Re-raised in page order by the consumer
+            queue.put_nowait(e)
+        else:
+            queue.put_nowait(_PAGES_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is _PAGES_DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+            slots.release()
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def _fan_out_pages(
+    fetch_page: Callable[..., Awaitable[PageT]],
+    remaining_params: Iterable[dict[str, Any]],
+    concurrency: int,
+    prefetch: int,
+) -> AsyncGenerator[PageT, None]:
+    """
+    Yield the pages for `remaining_params` in order, fetching up to `prefetch` pages ahead of
+    the consumer concurrently with at most `concurrency` requests in flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    params_iter = iter(remaining_params)
+    pending: deque[asyncio.Task[PageT]] = deque()
+
+    async def fetch(page_params: dict[str, Any]) -> PageT:
+        async with semaphore:
+            return await fetch_page(**page_params)
+
+    def schedule() -> None:
+        # The page awaited next is always scheduled, even with prefetch=0
+        while len(pending) < max(prefetch, 1):
+            page_params = next(params_iter, None)
+            if page_params is None:
+                return
+            pending.append(asyncio.create_task(fetch(page_params)))
+
+    try:
+        schedule()
+        while pending:
+            page = await pending.popleft()
+            schedule()  # Refill the window while the consumer processes this page
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def paginate_pipelined(
+    fetch_page: Callable[..., Awaitable[PageT]],
+    get_items: Callable[[PageT], Iterable[ItemT]],
+    get_next_params: Callable[[PageT, dict[str, Any]], dict[str, Any] | None],
+    *,
+    prefetch: int = 2,
+    **params: Any,
+) -> AsyncIterator[ItemT]:
+    """
+    Create an async iterator over the items of pages linked by a cursor or next-page token.
+
+    The first page is fetched with `params`; `get_next_params(page, params)` returns the
+    parameters for the page after it, or None when it is the last page. Each next page is
+    requested as soon as the previous one arrives, so up to `prefetch` pages are fetched
+    ahead of the page whose items are being consumed (0 fetches strictly on demand).
+
+    Args:
+        fetch_page: Async function to fetch a page of results
+        get_items: Returns the items of a page
+        get_next_params: Returns the parameters of the next page, or None after the last page
+        prefetch: Maximum number of pages fetched ahead of the consumer (default: 2)
+        **params: Initial parameters to pass to fetch_page
+
+    Returns:
+        An AsyncIterator that yields individual items from all pages, in order
+
+    Example:
+        ```python
+        async for user in paginate_pipelined(
+            client.users.list_users,
+            lambda page: page.data,
+            lambda page, params: {**params, "cursor": page.next_cursor} if page.next_cursor else None,
+            prefetch=4,
+            limit=100,
+        ):
+            print(user.name)
+        ```
+    """
+    _check_limits(prefetch)
+
+    async def _paginate() -> AsyncIterator[ItemT]:
+        async with aclosing(_pipelined_pages(fetch_page, get_next_params, prefetch, params)) as pages:
+            async for page in pages:
+                for item in get_items(page):
+                    yield item
+
+    return _paginate()
+
+
+def paginate_by_link(
+    fetch_page: Callable[[str, dict[str, Any] | None], Awaitable[httpx.Response]],
+    get_items: Callable[[httpx.Response], Iterable[ItemT]],
+    url: str,
+    params: dict[str, Any] | None = None,
+    *,
+    prefetch: int = 2,
+) -> AsyncIterator[ItemT]:
+    """
+    Create an async iterator over the items of pages linked by `Link: <url>; rel="next"` headers.
+
+    The first page is fetched with `fetch_page(url, params)`; later pages with the next URL
+    (resolved against the page URL) and no extra params, since it carries its own query.
+    Pages are prefetched like `paginate_pipelined`.
+
+    Args:
+        fetch_page: Async function returning the response for a URL and query parameters
+        get_items: Decodes the items of a page response
+        url: URL of the first page
+        params: Query parameters of the first page
+        prefetch: Maximum number of pages fetched ahead of the consumer (default: 2)
+
+    Returns:
+        An AsyncIterator that yields individual items from all pages, in order
+    """
+    _check_limits(prefetch)
+
+    async def fetch(url: str, params: dict[str, Any] | None) -> httpx.Response:
+        return await fetch_page(url, params)
+
+    def next_params(response: httpx.Response, page_params: dict[str, Any]) -> dict[str, Any] | None:
+        next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            return None
+        return {"url": str(response.url.join(next_url)), "params": None}
+
+    async def _paginate() -> AsyncIterator[ItemT]:
+        pages = _pipelined_pages(fetch, next_params, prefetch, {"url": url, "params": params})
+        async with aclosing(pages):
+            async for page in pages:
+                for item in get_items(page):
+                    yield item
+
+    return _paginate()
+
+
+def paginate_by_offset(
+    fetch_page: Callable[..., Awaitable[PageT]],
+    get_items: Callable[[PageT], Sequence[ItemT]],
+    get_total: Callable[[PageT], int | None],
+    *,
+    offset_param: str = "offset",
+    limit_param: str = "limit",
+    concurrency: int = 4,
+    prefetch: int = 8,
+    **params: Any,
+) -> AsyncIterator[ItemT]:
+    """
+    Create an async iterator over the items of an offset/limit paginated collection.
+
+    The page size is the size of the first page, not the `limit_param` value in `params`:
+    servers may return fewer items than requested. When `get_total` returns the total number
+    of items from the first page, the offsets of all remaining pages up to the total are known
+    and they are fetched concurrently (at most `concurrency` requests in flight, at most
+    `prefetch` pages ahead of the consumer). Otherwise pages are crawled, prefetching like
+    `paginate_pipelined`, until a page shorter than the first one or an empty page.
+
+    Args:
+        fetch_page: Async function to fetch a page of results
+        get_items: Returns the items of a page
+        get_total: Returns the total number of items, or None when the API does not report it
+        offset_param: Name of the offset parameter (default: "offset")
+        limit_param: Name of the page size parameter (default: "limit"), sent unchanged with every page
+        concurrency: Maximum number of concurrent page requests (default: 4)
+        prefetch: Maximum number of pages fetched ahead of the consumer (default: 8)
+        **params: Initial parameters to pass to fetch_page
+
+    Returns:
+        An AsyncIterator that yields individual items from all pages, in order
+    """
+    _check_limits(prefetch, concurrency)
+
+    async def _paginate() -> AsyncIterator[ItemT]:
+        first_page = await fetch_page(**params)
+        first_items = get_items(first_page)
+        for item in first_items:
+            yield item
+
+        if not first_items:
+            return
+        # A first page shorter than the requested limit is either the last one or capped by the
+        # server, so the crawl continues in steps of its length until the total or a short page
+        page_size = len(first_items)
+        start = (params.get(offset_param) or 0) + page_size
+
+        total = get_total(first_page)
+        pages: AsyncGenerator[PageT, None]
+        if total is not None:
+            if start >= total:
+                return
+            remaining = ({**params, offset_param: offset} for offset in range(start, total, page_size))
+            pages = _fan_out_pages(fetch_page, remaining, concurrency, prefetch)
+        else:
+
+            def next_params(page: PageT, page_params: dict[str, Any]) -> dict[str, Any] | None:
+                count = len(get_items(page))
+                if count < page_size or count == 0:
+                    return None
+                return {**page_params, offset_param: page_params[offset_param] + count}
+
+            pages = _pipelined_pages(fetch_page, next_params, prefetch, {**params, offset_param: start})
+        # Closing the iterator early cancels the page requests still in flight
+        async with aclosing(pages):
+            async for page in pages:
+                for item in get_items(page):
+                    yield item
+
+    return _paginate()
+
+
+def paginate_by_page(
+    fetch_page: Callable[..., Awaitable[PageT]],
+    get_items: Callable[[PageT], Sequence[ItemT]],
+    get_total_pages: Callable[[PageT], int | None],
+    *,
+    page_param: str = "page",
+    first_page: int = 1,
+    concurrency: int = 4,
+    prefetch: int = 8,
+    **params: Any,
+) -> AsyncIterator[ItemT]:
+    """
+    Create an async iterator over the items of a page-number paginated collection.
+
+    When `get_total_pages` returns the number of pages from the first response, all
+    remaining pages are fetched concurrently (at most `concurrency` requests in flight, at
+    most `prefetch` pages ahead of the consumer). Otherwise pages are crawled until an empty
+    page, prefetching like `paginate_pipelined`.
+
+    Args:
+        fetch_page: Async function to fetch a page of results
+        get_items: Returns the items of a page
+        get_total_pages: Returns the total number of pages, or None when the API does not report it
+        page_param: Name of the page number parameter (default: "page")
+        first_page: Number of the first page when `page_param` is not in `params` (default: 1)
+        concurrency: Maximum number of concurrent page requests (default: 4)
+        prefetch: Maximum number of pages fetched ahead of the consumer (default: 8)
+        **params: Initial parameters to pass to fetch_page
+
+    Returns:
+        An AsyncIterator that yields individual items from all pages, in order
+    """
+    _check_limits(prefetch, concurrency)
+
+    async def _paginate() -> AsyncIterator[ItemT]:
+        first = await fetch_page(**params)
+        first_items = get_items(first)
+        for item in first_items:
+            yield item
+        if not first_items:
+            return
+        start = params[page_param] if params.get(page_param) is not None else first_page
+
+        total_pages = get_total_pages(first)
+        pages: AsyncGenerator[PageT, None]
+        if total_pages is not None:
+            last_page = total_pages + first_page - 1
+            remaining: Iterator[dict[str, Any]] = (
+                {**params, page_param: number} for number in range(start + 1, last_page + 1)
+            )
+            pages = _fan_out_pages(fetch_page, remaining, concurrency, prefetch)
+        else:
+
+            def next_params(page: PageT, page_params: dict[str, Any]) -> dict[str, Any] | None:
+                if not get_items(page):
+                    return None
+                return {**page_params, page_param: page_params[page_param] + 1}
+
+            pages = _pipelined_pages(fetch_page, next_params, prefetch, {**params, page_param: start + 1})
+        # Closing the iterator early cancels the page requests still in flight
+        async with aclosing(pages):
+            async for page in pages:
+                for item in get_items(page):
+                    yield item
+
+    return _paginate()
 
 
 def paginate_by_next(
@@ -21,7 +366,8 @@ def paginate_by_next(
     This function creates a paginator that automatically handles fetching
     subsequent pages of results by using a "next page token" pattern. It calls
     the provided `fetch_page` function repeatedly with the given parameters,
-    updating the next token parameter between calls.
+    updating the next token parameter between calls. The next page is requested
+    while the items of the current page are being consumed.
 
     Args:
         fetch_page: Async function to fetch a page of results
@@ -48,17 +394,18 @@ def paginate_by_next(
         ```
     """
 
+    def next_params(result: dict[str, Any], page_params: dict[str, Any]) -> dict[str, Any] | None:
+        token = result.get(next_key)
+        if not token:
+            return None
+        return {**page_params, next_key: token}
+
     async def _paginate() -> AsyncIterator[Any]:
-        while True:
-            result = await fetch_page(**params)
-            # result is expected to be a dict
-            # (assumed since fetch_page is typed to return dict[str, Any])
-            items = result.get(items_key, [])
-            for item in items:
-                yield item
-            token = result.get(next_key)
-            if not token:
-                break
-            params[next_key] = token
+        # result is expected to be a dict
+        # (assumed since fetch_page is typed to return dict[str, Any])
+        async with aclosing(_pipelined_pages(fetch_page, next_params, 1, params)) as results:
+            async for result in results:
+                for item in result.get(items_key, []):
+                    yield item
 
     return _paginate()
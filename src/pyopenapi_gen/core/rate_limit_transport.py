@@ -0,0 +1,293 @@
+"""
+Client-side scheduling against server rate limits for any HttpTransport.
+
+`RateLimitingTransport` wraps another transport and keeps a request budget per origin from the
+headers the server advertises:
+- `RateLimit-Limit` / `RateLimit-Remaining` / `RateLimit-Reset` (IETF draft), the combined
+  `RateLimit: limit=100, remaining=42, reset=30` (or `"default";r=42;t=30`) field, and the common
+  `X-RateLimit-*` variants
+- `Retry-After` on 429 and 503 responses, which pauses every request to the origin
+
+While the budget of an origin is spent, its requests wait in a first-in, first-out queue until the
+window resets, so the client stays under the limit instead of collecting 429 responses. A 429 is
+retried after the delay the server asks for, up to `max_retries` times, unless the delay would outlast
+the deadline of the call (see `deadline.py`).
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator
+
+import httpx
+
+from .deadline import remaining
+from .http_transport import HttpTransport, open_stream
+from .sampler import retry_attempt
+
+# A window reset this far in the future is an epoch timestamp (X-RateLimit-Reset), not delta-seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+# Parameters of the structured `RateLimit: "policy";r=42;t=30` field (later drafts)
+_SHORT_PARAMETERS = {"r": "remaining", "t": "reset", "q": "limit"}
+# Assumed window when a response reports no remaining budget without saying when it resets
+_DEFAULT_RESET_SECONDS = 1.0
+
+
+def _number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(float(value.strip().split(",")[0].split(";")[0]), 0.0)
+    except ValueError:
+        return None
+
+
+def _retry_after(headers: httpx.Headers) -> float | None:
+    """Seconds to wait according to a `Retry-After` header (delta-seconds or HTTP date)."""
+    value = headers.get("retry-after")
+    seconds = _number(value)
+    if seconds is not None or value is None:
+        return seconds
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parameters(value: str | None) -> dict[str, str]:
+    """Parameters of a combined `limit=100, remaining=42` or structured `"default";r=42;t=30` field."""
+    parameters: dict[str, str] = {}
+    for item in (value or "").replace(";", ",").split(","):
+        name, _, argument = item.strip().partition("=")
+        if argument:
+            name = name.strip().lower()
+            parameters[_SHORT_PARAMETERS.get(name, name)] = argument
+    return parameters
+
+
+def parse_rate_limit(headers: httpx.Headers) -> tuple[float | None, float | None, float | None]:
+    """
+    Read the advertised rate limit of a response.
+
+    Returns:
+        (limit, remaining, reset): requests per window, requests left in the current window, and
+        seconds until the window resets; None for the values the response does not advertise.
+    """
+    combined = _parameters(headers.get("ratelimit"))
+    policy = headers.get("ratelimit-policy")
+    # The quota of `RateLimit-Policy: 100;w=60` (earlier drafts) or `"default";q=100;w=60`
+    combined.setdefault("limit", _parameters(policy).get("limit") or (policy or "").split(";")[0])
+    limit, remaining, reset = (
+        _number(combined.get(name) or headers.get(f"ratelimit-{name}") or headers.get(f"x-ratelimit-{name}"))
+        for name in ("limit", "remaining", "reset")
+    )
+    if reset is not None and reset > _EPOCH_THRESHOLD:
+        reset = max(reset - time.time(), 0.0)
+    return limit, remaining, reset
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """
+    Snapshot of the request scheduling for one origin.
+
+    Attributes:
+        limit: Requests allowed per window, as last advertised (None if never advertised).
+        remaining: Requests left in the current window (None if unknown: requests are not delayed).
+        reset_seconds: Seconds until the current window resets or the Retry-After pause ends.
+        queued: Requests currently waiting for budget.
+        requests: Requests sent, including retries.
+        delayed: Requests that had to wait for budget.
+        throttled: 429 responses received.
+        total_wait_seconds: Time requests spent waiting for budget, in total.
+        max_wait_seconds: Longest time a request waited for budget.
+    """
+
+    limit: int | None
+    remaining: int | None
+    reset_seconds: float
+    queued: int
+    requests: int
+    delayed: int
+    throttled: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean time a delayed request waited for budget."""
+        return self.total_wait_seconds / self.delayed if self.delayed else 0.0
+
+
+class OriginBudget:
+    """The request budget of one origin, updated from every response."""
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()  # Served first-in, first-out: the queue of requests waiting for budget
+        self.limit: float | None = None
+        self.remaining: float | None = None
+        self.reset_at = 0.0  # time.monotonic() at which the current window ends
+        self.window: float | None = None  # Longest reset delay seen: the length of a window
+        self.blocked_until = 0.0  # time.monotonic() until which Retry-After pauses requests
+        self.in_flight = 0
+        self.queued = 0
+        self.requests = 0
+        self.delayed = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next request may be sent (0: now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.remaining is not None and self.remaining < 1:
+            if now < self.reset_at:
+                return self.reset_at - now
+            # A new window, assumed as long as the previous ones until a response says otherwise
+            self.remaining, self.reset_at = self.limit, now + (self.window or _DEFAULT_RESET_SECONDS)
+        return 0.0
+
+    def take(self) -> None:
+        """Spend one request of the budget."""
+        if self.remaining is not None:
+            self.remaining -= 1
+        self.in_flight += 1
+        self.requests += 1
+
+    def update(self, response: httpx.Response, now: float) -> None:
+        """Update the budget from the headers of a response to a request that is no longer in flight."""
+        limit, remaining, reset = parse_rate_limit(response.headers)
+        if limit is not None:
+            self.limit = limit
+        if reset is not None:
+            self.window = max(self.window or 0.0, reset)
+        if remaining is not None:
+            reset_at = now + (reset if reset is not None else self.window or _DEFAULT_RESET_SECONDS)
+            # Requests still in flight were not counted by the server yet
+            remaining = max(remaining - self.in_flight, 0.0)
+            if self.remaining is not None and now < self.reset_at and reset_at <= self.reset_at + 1.0:
+                remaining = min(remaining, self.remaining)  # Same window: an older response may arrive last
+            self.remaining, self.reset_at = remaining, reset_at
+        if response.status_code in (429, 503):
+            retry_after = _retry_after(response.headers)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+        if response.status_code == 429:
+            self.throttled += 1
+
+    def stats(self, now: float) -> RateLimitStats:
+        reset_seconds = max(self.blocked_until - now, self.reset_at - now if self.remaining is not None else 0.0, 0.0)
+        return RateLimitStats(
+            limit=int(self.limit) if self.limit is not None else None,
+            remaining=int(self.remaining) if self.remaining is not None else None,
+            reset_seconds=reset_seconds,
+            queued=self.queued,
+            requests=self.requests,
+            delayed=self.delayed,
+            throttled=self.throttled,
+            total_wait_seconds=self.total_wait,
+            max_wait_seconds=self.max_wait,
+        )
+
+
+class RateLimitingTransport:
+    """
+    An HttpTransport that paces requests per origin to stay within the server's advertised rate limits.
+
+    Attributes:
+        inner: The wrapped transport.
+        max_retries: Times a request answered with 429 is sent again after the advertised delay.
+        max_retry_wait: Longest delay (seconds) waited before retrying a 429; longer delays return the 429.
+    """
+
+    def __init__(self, inner: HttpTransport, max_retries: int = 3, max_retry_wait: float = 60.0) -> None:
+        """
+        Args:
+            inner: The transport sending requests to the network.
+            max_retries: Times a request answered with 429 is retried (0: never).
+            max_retry_wait: Longest Retry-After delay, in seconds, that is waited out before retrying.
+        """
+        self.inner = inner
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        self._budgets: dict[str, OriginBudget] = {}
+
+    def _budget(self, url: str) -> OriginBudget:
+        parsed = httpx.URL(url)
+        origin = f"{parsed.scheme}://{parsed.netloc.decode('ascii')}" if parsed.is_absolute_url else ""
+        budget = self._budgets.get(origin)
+        if budget is None:
+            budget = self._budgets[origin] = OriginBudget()
+        return budget
+
+    async def _acquire(self, budget: OriginBudget) -> None:
+        """Wait in the origin's queue until its budget allows a request, and spend it."""
+        start = time.monotonic()
+        budget.queued += 1
+        try:
+            async with budget.lock:
+                while (delay := budget.delay(time.monotonic())) > 0:
+                    await asyncio.sleep(delay)
+                budget.take()
+        finally:
+            budget.queued -= 1
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            budget.delayed += 1
+            budget.total_wait += waited
+            budget.max_wait = max(budget.max_wait, waited)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request once the origin's budget allows it, retrying 429 responses after the advertised delay.
+
+        Returns:
+            httpx.Response: The response from the inner transport, regardless of status code.
+        """
+        budget = self._budget(url)
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(budget)
+            try:
+                with retry_attempt(attempt):  # Recorded in the traces of slow requests
+                    response = await self.inner.request(method, url, **kwargs)
+            finally:
+                budget.in_flight -= 1
+            now = time.monotonic()
+            budget.update(response, now)
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            if budget.blocked_until <= now:
+                budget.blocked_until = now + min(2.0**attempt, self.max_retry_wait)  # No Retry-After: back off
+            # Return the 429 rather than wait beyond max_retry_wait or the deadline of the call
+            left = remaining()
+            if budget.blocked_until - now > (self.max_retry_wait if left is None else min(self.max_retry_wait, left)):
+                break
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Stream a response once the origin's budget allows the request; streams are not retried."""
+        budget = self._budget(url)
+        await self._acquire(budget)
+        answered = False
+        try:
+            async with open_stream(self.inner, method, url, **kwargs) as response:
+                answered = True
+                budget.in_flight -= 1
+                budget.update(response, time.monotonic())
+                yield response
+        finally:
+            if not answered:
+                budget.in_flight -= 1
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Scheduling statistics per origin (`scheme://host[:port]`)."""
+        now = time.monotonic()
+        return {origin: budget.stats(now) for origin, budget in self._budgets.items()}
+
+    async def close(self) -> None:
+        """Close the inner transport."""
+        await self.inner.close()
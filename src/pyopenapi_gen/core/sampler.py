@@ -0,0 +1,238 @@
+"""
+Structured traces of slow requests, captured by the transport.
+
+`SlowRequestSampler` is given to `HttpxTransport(sampler=...)`. Every request slower than
+`threshold_seconds`, plus a random `sample_rate` of the others, is captured as a `RequestTrace`:
+its operation ID and path template (named by the Deadline scope of the generated endpoint method),
+request and response sizes, the time spent waiting for a pool connection, its retry number and the
+timing of its phases. Traces are kept in a ring buffer of the latest `capacity`, to be dumped on
+demand:
+
+    sampler = SlowRequestSampler(threshold_seconds=0.5, sample_rate=0.001)
+    transport = HttpxTransport(base_url, sampler=sampler)
+    sampler.install_signal_handler()  # `kill -USR1 <pid>` writes the traces to stderr as JSON lines
+    ...
+    sampler.dump()                    # The traces as plain data
+
+Requests that are not captured cost a few clock reads and a random number.
+"""
+
+import json
+import random
+import signal
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from types import FrameType
+from typing import Any, Iterator, TextIO
+
+import httpx
+
+from .metrics import current_route
+
+PHASE_PREPARE = "prepare"  # Building the request: headers, auth and the JSON body
+PHASE_QUEUE = "queue"  # Waiting for a batch host slot or an adaptive concurrency slot
+PHASE_POOL_WAIT = "pool_wait"  # Waiting for a pool connection
+PHASE_NETWORK = "network"  # Sending the request and receiving the response (its headers, for streams)
+PHASE_BODY = "body"  # Reading a streamed response body, at the pace of the caller
+
+# Retries of the current request by a wrapping transport (e.g. RateLimitingTransport)
+_retries: ContextVar[int] = ContextVar("pyopenapi_gen_retries", default=0)
+
+
+@contextmanager
+def retry_attempt(retries: int) -> Iterator[None]:
+    """Mark the requests sent within the block as the `retries`-th retry of their request."""
+    token = _retries.set(retries)
+    try:
+        yield
+    finally:
+        _retries.reset(token)
+
+
+@dataclass(frozen=True)
+class RequestTrace:
+    """
+    A captured request.
+
+    Attributes:
+        reason: "slow" (slower than the threshold) or "sampled" (picked at random).
+        operation: Operation ID, or None for requests made outside generated endpoint methods.
+        url_template: Path template of the operation (e.g. `/users/{userId}`).
+        method: HTTP method.
+        url: Requested URL.
+        status_code: Response status code (None when the request failed).
+        error: Exception type and message when the request failed.
+        started_at: Wall-clock time (time.time()) the request started.
+        duration_seconds: Time until the response was received (its headers, for streams).
+        request_bytes: Size of the request body, when known from its Content-Length.
+        response_bytes: Size of the response body (read so far, for streams).
+        pool_wait_seconds: Time waited for a pool connection (None if none was obtained).
+        retries: Earlier attempts of the request by a retrying transport.
+        phases: Seconds spent in each phase (`prepare`, `queue`, `pool_wait`, `network`, `body`).
+    """
+
+    reason: str
+    operation: str | None
+    url_template: str | None
+    method: str
+    url: str
+    status_code: int | None
+    error: str | None
+    started_at: float
+    duration_seconds: float
+    request_bytes: int | None
+    response_bytes: int | None
+    pool_wait_seconds: float | None
+    retries: int
+    phases: dict[str, float]
+
+
+class PendingTrace:
+    """The timing of one request in flight, turned into a RequestTrace if it is captured."""
+
+    __slots__ = ("_sampler", "method", "url", "route", "retries", "started", "prepared", "sent", "pool_wait")
+
+    def __init__(self, sampler: "SlowRequestSampler", method: str, url: str) -> None:
+        self._sampler = sampler
+        self.method = method
+        self.url = url
+        self.route = current_route()
+        self.retries = _retries.get()
+        self.started = time.perf_counter()
+        self.prepared: float | None = None  # perf_counter() once the request was built
+        self.sent: float | None = None  # perf_counter() once its slots were obtained
+        self.pool_wait: float | None = None
+
+    def finish(
+        self,
+        response: httpx.Response | None,
+        response_bytes: int | None,
+        error: BaseException | None = None,
+        answered: float | None = None,
+    ) -> None:
+        """
+        Capture the request if it is slow or sampled.
+
+        Args:
+            response: The response, or None if the request failed.
+            response_bytes: Size of the response body.
+            error: The exception the request failed with.
+            answered: perf_counter() when the response headers of a stream were received; the time
+                after it is the `body` phase and does not count towards the duration.
+        """
+        ended = time.perf_counter()
+        until = answered if answered is not None else ended
+        duration = until - self.started
+        reason = self._sampler._reason(duration)
+        if reason is None:
+            return
+        phases: dict[str, float] = {}
+        prepared = self.prepared if self.prepared is not None else until
+        phases[PHASE_PREPARE] = prepared - self.started
+        if self.sent is not None:
+            phases[PHASE_QUEUE] = self.sent - prepared
+            pool_wait = self.pool_wait or 0.0
+            if self.pool_wait is not None:
+                phases[PHASE_POOL_WAIT] = pool_wait
+            phases[PHASE_NETWORK] = max(until - self.sent - pool_wait, 0.0)
+        if answered is not None:
+            phases[PHASE_BODY] = ended - answered
+        request_bytes = None
+        if response is not None:
+            content_length = response.request.headers.get("Content-Length")
+            request_bytes = int(content_length) if content_length is not None else None
+        operation, url_template = self.route if self.route is not None else (None, None)
+        self._sampler.traces.append(
+            RequestTrace(
+                reason=reason,
+                operation=operation,
+                url_template=url_template,
+                method=self.method,
+                url=self.url,
+                status_code=response.status_code if response is not None else None,
+                error=f"{type(error).__name__}: {error}" if error is not None else None,
+                started_at=time.time() - (ended - self.started),
+                duration_seconds=duration,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                pool_wait_seconds=self.pool_wait,
+                retries=self.retries,
+                phases=phases,
+            )
+        )
+
+
+class SlowRequestSampler:
+    """
+    Captures traces of slow requests, and of a random sample of all requests, in a ring buffer.
+
+    Attributes:
+        threshold_seconds: Requests taking at least this long are captured (None: none for being slow).
+        sample_rate: Fraction of the other requests captured at random.
+        traces: The latest captured traces, oldest first.
+    """
+
+    def __init__(self, threshold_seconds: float | None = 1.0, sample_rate: float = 0.0, capacity: int = 100) -> None:
+        """
+        Args:
+            threshold_seconds: Latency at or above which a request is captured.
+            sample_rate: Fraction (between 0 and 1) of the faster requests captured at random.
+            capacity: Traces kept; the oldest are discarded first.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.threshold_seconds = threshold_seconds
+        self.sample_rate = sample_rate
+        self.traces: deque[RequestTrace] = deque(maxlen=capacity)
+
+    def start(self, method: str, url: str) -> PendingTrace:
+        """Begin timing a request, in the context of its call."""
+        return PendingTrace(self, method, url)
+
+    def _reason(self, duration: float) -> str | None:
+        if self.threshold_seconds is not None and duration >= self.threshold_seconds:
+            return "slow"
+        if self.sample_rate and random.random() < self.sample_rate:  # nosec B311 - sampling, not security
+            return "sampled"
+        return None
+
+    def dump(self, file: TextIO | None = None) -> list[dict[str, Any]]:
+        """
+        The captured traces as plain (JSON-serializable) data, oldest first.
+
+        Args:
+            file: Also written there, one JSON object per line.
+        """
+        traces = [asdict(trace) for trace in list(self.traces)]
+        if file is not None:
+            file.write("".join(json.dumps(trace) + "\n" for trace in traces))
+            file.flush()
+        return traces
+
+    def clear(self) -> None:
+        """Discard the captured traces."""
+        self.traces.clear()
+
+    def install_signal_handler(self, signum: int | None = None, file: TextIO | None = None) -> None:
+        """
+        Dump the traces as JSON lines whenever the process receives a signal.
+
+        Must be called from the main thread.
+
+        Args:
+            signum: The signal; SIGUSR1 by default.
+            file: Where the traces are written; stderr by default.
+        """
+        if signum is None:
+            signum = getattr(signal, "SIGUSR1", None)
+            if signum is None:
+                raise ValueError("This platform has no SIGUSR1: pass the signal to dump the traces on")
+
+        def handler(received: int, frame: FrameType | None) -> None:
+            self.dump(file if file is not None else sys.stderr)
+
+        signal.signal(signum, handler)
@@ -1,8 +1,12 @@
 import json
-from typing import Any, AsyncIterator, List
+from typing import Any, AsyncIterator, List, TypeVar
 
 import httpx
 
+from .model_decoder import JsonArrayDecoder
+
+T = TypeVar("T")
+
 
 class SSEEvent:
     def __init__(self, data: str, event: str | None = None, id: str | None = None, retry: int | None = None) -> None:
@@ -27,6 +31,22 @@ async def iter_ndjson(response: httpx.Response) -> AsyncIterator[Any]:
             yield json.loads(line)
 
 
+async def iter_json_array(response: httpx.Response, item_type: type[T]) -> AsyncIterator[T]:
+    """
+    Yield the items of a JSON array response as they arrive, structured into `item_type`.
+
+    Only the unparsed tail of the body is held in memory, so arrays of any length can be
+    processed while they download. Raises ValueError if the body is not a JSON array or an
+    item does not match `item_type`.
+    """
+    decoder = JsonArrayDecoder(item_type)
+    async for chunk in response.aiter_bytes():
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
+
+
 async def iter_sse(response: httpx.Response) -> AsyncIterator[SSEEvent]:
     """Parse Server-Sent Events (SSE) from a streaming response."""
     event_lines: list[str] = []
@@ -3,12 +3,116 @@ Telemetry client for usage tracking and analytics.
 
 This module provides the TelemetryClient class, which handles anonymous
 usage telemetry for PyOpenAPI Generator. Telemetry is opt-in only.
+
+Tracking an event only appends it to a bounded in-memory queue; a background thread
+serializes the queued events and writes them in batches to a sink (stdout, an append-only
+JSONL file or an HTTP collector), so the caller never waits on I/O. When the queue is full
+new events are dropped and counted. Queued events are flushed when the process exits.
 """
 
+import atexit
 import json
+import logging
 import os
+import queue
+import threading
 import time
-from typing import Any
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Reported to the sink, with the number of events dropped since the previous report
+DROPPED_EVENT = "telemetry_dropped"
+
+
+class TelemetrySink(Protocol):
+    """Destination of telemetry events, written in batches from the background thread."""
+
+    def write(self, events: list[dict[str, Any]]) -> None:
+        """Write a batch of events; may raise, the batch is then counted as failed."""
+        ...
+
+    def close(self) -> None:
+        """Release the resources of the sink."""
+        ...
+
+
+class StdoutSink:
+    """Prints each event as a `TELEMETRY <json>` line."""
+
+    def write(self, events: list[dict[str, Any]]) -> None:
+        for event in events:
+            print("TELEMETRY", json.dumps(event))
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlFileSink:
+    """Appends each event as a JSON line to a file, created with its parent directories if needed."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def write(self, events: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(event) + "\n" for event in events)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+    def close(self) -> None:
+        pass
+
+
+class HttpSink:
+    """POSTs each batch of events as a JSON array to a collector URL."""
+
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._client: httpx.Client | None = None  # Created by the first write, on the background thread
+
+    def write(self, events: list[dict[str, Any]]) -> None:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout)
+        self._client.post(self.url, json=events).raise_for_status()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+
+def _sink_from_env() -> TelemetrySink:
+    """The sink named by PYOPENAPI_TELEMETRY_URL or PYOPENAPI_TELEMETRY_FILE, else stdout."""
+    url = os.getenv("PYOPENAPI_TELEMETRY_URL")
+    if url:
+        return HttpSink(url)
+    path = os.getenv("PYOPENAPI_TELEMETRY_FILE")
+    if path:
+        return JsonlFileSink(path)
+    return StdoutSink()
+
+
+@dataclass(frozen=True)
+class TelemetryStats:
+    """
+    Snapshot of the delivery of telemetry events.
+
+    Attributes:
+        sent: Events written to the sink.
+        dropped: Events dropped because the queue was full.
+        failed: Events lost because the sink failed to write their batch.
+        pending: Events tracked but not yet written (queued or being written).
+    """
+
+    sent: int
+    dropped: int
+    failed: int
+    pending: int
 
 
 class TelemetryClient:
@@ -20,36 +124,66 @@ class TelemetryClient:
     enabled either through the PYOPENAPI_TELEMETRY_ENABLED environment
     variable or by passing enabled=True to the constructor.
 
+    Events are delivered by a daemon thread, started with the first event, which
+    writes the queued events as soon as it is idle, up to `batch_size` at a time.
+    `flush()` waits for the queued events to be written and `close()` also stops
+    the thread; it is called at exit.
+
     Attributes:
         enabled: Whether telemetry is currently enabled
+        sink: Where events are written
     """
 
-    def __init__(self, enabled: bool | None = None) -> None:
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        sink: TelemetrySink | None = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+    ) -> None:
         """
         Initialize a new TelemetryClient.
 
         Args:
             enabled: Explicitly enable or disable telemetry. If None, the environment
                     variable PYOPENAPI_TELEMETRY_ENABLED is checked.
+            sink: Where events are written. If None, the PYOPENAPI_TELEMETRY_URL
+                    (HTTP collector) or PYOPENAPI_TELEMETRY_FILE (JSONL file) environment
+                    variable is checked, and events are printed without either.
+            max_queue_size: Events held before new ones are dropped.
+            batch_size: Largest number of events written to the sink at once.
         """
         if enabled is None:
             env = os.getenv("PYOPENAPI_TELEMETRY_ENABLED", "false").lower()
             self.enabled = env in ("1", "true", "yes")
         else:
             self.enabled = enabled
+        self.sink: TelemetrySink = sink if sink is not None else _sink_from_env()
+        self.batch_size = batch_size
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._pending = 0
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._unreported_drops = 0
 
     def track_event(self, event: str, properties: dict[str, Any] | None = None) -> None:
         """
         Track a telemetry event if telemetry is enabled.
 
-        This method sends a telemetry event with additional properties.
-        Events are silently dropped if telemetry is disabled.
+        This method queues a telemetry event with additional properties and returns
+        without waiting for it to be written. Events are silently dropped if telemetry
+        is disabled or the client is closed, and dropped and counted if the queue is full.
 
         Args:
             event: The name of the event to track
             properties: Optional dictionary of additional properties to include
         """
-        if not self.enabled:
+        if not self.enabled or self._closed:
             return
 
         data: dict[str, Any] = {
@@ -58,12 +192,110 @@ class TelemetryClient:
             "timestamp": time.time(),
         }
 
+        if self._thread is None:
+            self._start()
+        with self._lock:
+            try:
+                self._queue.put_nowait(data)
+            except queue.Full:
+                self._dropped += 1
+                self._unreported_drops += 1
+                return
+            self._pending += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="pyopenapi-gen-telemetry", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Write the queued events in batches until the stop sentinel (None) is received."""
+        stopping = False
+        while not stopping:
+            # Events queued while the previous batch was written make up the next one
+            first = self._queue.get()
+            batch: list[dict[str, Any]] = []
+            if first is None:
+                stopping = True
+            else:
+                batch.append(first)
+            while not stopping and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        with self._lock:
+            drops, self._unreported_drops = self._unreported_drops, 0
+        events = batch
+        failed = False
+        if drops:
+            events = batch + [{"event": DROPPED_EVENT, "properties": {"count": drops}, "timestamp": time.time()}]
+        if events:
+            try:
+                self.sink.write(events)
+            except Exception as e:
+                # Telemetry failures should not affect execution, but log for debugging
+                logger.debug(f"Telemetry batch of {len(batch)} events failed: {e}")
+                failed = True
+        with self._lock:
+            if batch:
+                if failed:
+                    self._failed += len(batch)
+                else:
+                    self._sent += len(batch)
+            self._pending -= len(batch)
+            self._written.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the events tracked so far are written (or failed to be).
+
+        Args:
+            timeout: Seconds to wait at most; None waits without limit.
+
+        Returns:
+            bool: Whether every event was written within the timeout.
+        """
+        with self._lock:
+            if self._thread is None:
+                return True
+            return self._written.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """
+        Flush the queued events, stop the background thread and close the sink.
+
+        Events tracked afterwards are ignored. Called at exit once an event was tracked.
+
+        Args:
+            timeout: Seconds to wait for the queued events to be written.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._thread
+        if thread is not None:
+            atexit.unregister(self.close)
+            # A thread still writing when the timeout expires is abandoned: it is a daemon thread
+            if self.flush(timeout):
+                self._queue.put(None)
+                thread.join(timeout)
         try:
-            # Using print as a stub for actual telemetry transport
-            # In production, this would be replaced with a proper telemetry client
-            print("TELEMETRY", json.dumps(data))
+            self.sink.close()
         except Exception as e:
-            # Telemetry failures should not affect execution, but log for debugging
-            import logging
+            logger.debug(f"Telemetry sink failed to close: {e}")
 
-            logging.getLogger(__name__).debug(f"Telemetry event failed: {e}")
+    def stats(self) -> TelemetryStats:
+        """Counts of the events sent, dropped, failed and pending so far."""
+        with self._lock:
+            return TelemetryStats(sent=self._sent, dropped=self._dropped, failed=self._failed, pending=self._pending)
@@ -0,0 +1,140 @@
+"""
+Process-wide registry of pooled httpx clients shared between transports.
+
+Generated clients that share a core package reach the same hosts; sharing one `httpx.AsyncClient`
+per origin lets them reuse each other's connections (and TLS sessions) instead of each building its
+own pool, and sharing SSL contexts avoids reloading the CA bundle for every client.
+"""
+
+import asyncio
+import ssl
+import threading
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Callable, Hashable
+
+import httpx
+
+_ssl_contexts: dict[tuple[bool, bool], ssl.SSLContext] = {}
+_ssl_lock = threading.Lock()
+
+
+def shared_ssl_context(verify: bool = True, http2: bool = False) -> ssl.SSLContext:
+    """
+    Return the process-wide SSL context for a verification mode, creating it on first use.
+
+    Contexts are kept per HTTP/2 setting because httpcore sets the ALPN protocols of the
+    context it connects with.
+    """
+    key = (verify, http2)
+    context = _ssl_contexts.get(key)
+    if context is None:
+        with _ssl_lock:
+            context = _ssl_contexts.get(key)
+            if context is None:
+                context = httpx.create_ssl_context(verify=verify)
+                _ssl_contexts[key] = context
+    return context
+
+
+def cookieless_jar() -> CookieJar:
+    """
+    A cookie jar that never stores a cookie, for clients shared between transports.
+
+    Transports with different credentials share a client, so a cookie set for one of them must not
+    be sent by the others; each shared transport keeps its own cookies instead.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+@dataclass
+class SharedClient:
+    """
+    A pooled `httpx.AsyncClient` and the number of transports using it.
+
+    Attributes:
+        client: The shared client. It has no base URL; transports send absolute URLs.
+        pool_transport: The pooling transport of `client`.
+        refs: Transports holding the client. It is closed when this drops to zero.
+        loop: The event loop its connections belong to (None when acquired outside a loop).
+    """
+
+    client: httpx.AsyncClient
+    pool_transport: httpx.AsyncHTTPTransport
+    refs: int = field(default=0)
+    loop: asyncio.AbstractEventLoop | None = field(default=None)
+
+
+class TransportRegistry:
+    """
+    Reference-counted `httpx.AsyncClient`s keyed by origin, TLS, HTTP/2, proxy and pool settings.
+
+    Clients are also keyed by the running event loop at acquisition (None outside a loop), since
+    pooled connections cannot be used from another loop. Clients of a closed loop are dropped from
+    the registry when the next client is acquired.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[Hashable, SharedClient] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _loop() -> asyncio.AbstractEventLoop | None:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def acquire(self, key: Hashable, factory: Callable[[], SharedClient]) -> SharedClient:
+        """
+        Return the shared client for `key` in the running event loop, creating it with `factory` if
+        there is none, and count one more reference to it.
+        """
+        loop = self._loop()
+        full_key = (key, loop)
+        with self._lock:
+            for stale_key, stale in list(self._clients.items()):
+                if stale.loop is not None and stale.loop.is_closed():
+                    # Its connections cannot be used or closed any more; transports still holding it rebind
+                    del self._clients[stale_key]
+            shared = self._clients.get(full_key)
+            if shared is None or shared.client.is_closed:
+                shared = factory()
+                shared.loop = loop
+                self._clients[full_key] = shared
+            shared.refs += 1
+            return shared
+
+    def detach(self, shared: SharedClient) -> None:
+        """
+        Drop one reference to a shared client without closing it, for a transport moving to another
+        event loop. A client left without references is forgotten: its loop, which owns the
+        connections, is closed or will close them.
+        """
+        with self._lock:
+            shared.refs -= 1
+            if shared.refs <= 0:
+                self._forget(shared)
+
+    async def release(self, shared: SharedClient) -> None:
+        """Drop one reference to a shared client, closing it once it has no references left."""
+        with self._lock:
+            shared.refs -= 1
+            if shared.refs > 0:
+                return
+            self._forget(shared)
+        if shared.loop is not None and shared.loop.is_closed():
+            return  # Its connections died with their loop
+        await shared.client.aclose()
+
+    def _forget(self, shared: SharedClient) -> None:
+        for key, value in list(self._clients.items()):
+            if value is shared:
+                del self._clients[key]
+
+    def __len__(self) -> int:
+        """Number of shared clients currently open."""
+        return len(self._clients)
+
+
+registry = TransportRegistry()
@@ -10,6 +10,8 @@ import logging
 import re
 from typing import Any, Set, Type, TypeVar, cast
 
+from .metrics import PHASE_SERIALIZE, metrics
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -401,6 +403,8 @@ class DataclassSerializer:
         - Circular references: Handled gracefully (returns None for cycles)
         - Custom cattrs hooks: Applied automatically for types with registered hooks
         """
+        if metrics.enabled:
+            return metrics.timed(PHASE_SERIALIZE, DataclassSerializer._serialize_with_tracking, obj, set())
         return DataclassSerializer._serialize_with_tracking(obj, set())
 
     @staticmethod
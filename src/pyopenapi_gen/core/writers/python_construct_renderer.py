@@ -214,6 +214,25 @@ class PythonConstructRenderer:
         writer.dedent()
         return writer.get_code()
 
+    @staticmethod
+    def dataclass_decorator(context: RenderContext) -> str:
+        """
+        The `@dataclass` decorator of generated models, with the options chosen for the client.
+
+        Returns `@dataclass`, or e.g. `@dataclass(slots=True, frozen=True)` with --model-slots and
+        --model-frozen (`slots`, `frozen` and `kw_only` in this order).
+        """
+        options = [
+            f"{name}=True"
+            for name, enabled in (
+                ("slots", context.model_slots),
+                ("frozen", context.model_frozen),
+                ("kw_only", context.model_kw_only),
+            )
+            if enabled
+        ]
+        return f"@dataclass({', '.join(options)})" if options else "@dataclass"
+
     def render_dataclass(
         self,
         class_name: str,
@@ -263,7 +282,7 @@ class PythonConstructRenderer:
         writer.write_line(f'__all__ = ["{class_name}"]')
         writer.write_line("")  # Add a blank line for separation
 
-        writer.write_line("@dataclass")
+        writer.write_line(self.dataclass_decorator(context))
         writer.write_line(f"class {class_name}:")
         writer.indent()
 
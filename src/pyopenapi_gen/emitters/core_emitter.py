@@ -7,10 +7,23 @@ from pyopenapi_gen.context.file_manager import FileManager
 # Each tuple: (module, filename, destination)
 RUNTIME_FILES = [
     ("pyopenapi_gen.core", "http_transport.py", "core/http_transport.py"),
+    ("pyopenapi_gen.core", "adaptive_concurrency.py", "core/adaptive_concurrency.py"),
+    ("pyopenapi_gen.core", "transport_registry.py", "core/transport_registry.py"),
+    ("pyopenapi_gen.core", "batch.py", "core/batch.py"),
+    ("pyopenapi_gen.core", "cache_transport.py", "core/cache_transport.py"),
+    ("pyopenapi_gen.core", "coalescing_transport.py", "core/coalescing_transport.py"),
+    ("pyopenapi_gen.core", "rate_limit_transport.py", "core/rate_limit_transport.py"),
+    ("pyopenapi_gen.core", "hedging_transport.py", "core/hedging_transport.py"),
+    ("pyopenapi_gen.core", "deadline.py", "core/deadline.py"),
+    ("pyopenapi_gen.core", "metrics.py", "core/metrics.py"),
+    ("pyopenapi_gen.core", "sampler.py", "core/sampler.py"),
+    ("pyopenapi_gen.core", "offload.py", "core/offload.py"),
+    ("pyopenapi_gen.core", "json_codec.py", "core/json_codec.py"),
     ("pyopenapi_gen.core", "exceptions.py", "core/exceptions.py"),
     ("pyopenapi_gen.core", "streaming_helpers.py", "core/streaming_helpers.py"),
     ("pyopenapi_gen.core", "pagination.py", "core/pagination.py"),
     ("pyopenapi_gen.core", "cattrs_converter.py", "core/cattrs_converter.py"),
+    ("pyopenapi_gen.core", "model_decoder.py", "core/model_decoder.py"),
     ("pyopenapi_gen.core", "utils.py", "core/utils.py"),
     ("pyopenapi_gen.core.auth", "base.py", "core/auth/base.py"),
     ("pyopenapi_gen.core.auth", "plugins.py", "core/auth/plugins.py"),
@@ -22,10 +35,72 @@ CORE_README_TEMPLATE_FILENAME = "README.md"
 
 CONFIG_TEMPLATE = """
 from dataclasses import dataclass
+
+from .json_codec import JsonCodec
+
+
 @dataclass
 class ClientConfig:
     base_url: str
     timeout: float | None = 30.0
+    # JSON backend for request/response bodies: "auto" (orjson, then msgspec, then stdlib),
+    # "orjson", "msgspec", "stdlib", or a JsonCodec instance
+    json_codec: str | JsonCodec | None = "auto"
+    # Connection pool: open connections, idle connections kept for reuse, and their idle lifetime (seconds)
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    # Negotiate HTTP/2 (requires the h2 package: pip install httpx[http2])
+    http2: bool = False
+    # Per-phase timeouts in seconds; None uses `timeout`. pool_timeout bounds the wait for a free connection.
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    # Local IP address to bind outgoing connections to
+    local_address: str | None = None
+    # Proxy URL for all requests; None uses the proxy environment variables
+    proxy: str | None = None
+    # Share one connection pool (and SSL context) with every client of this core package that reaches
+    # the same origin with the same connection settings; it is closed when the last client is closed
+    shared_transport: bool = True
+    # Adapt the requests in flight per origin to its latency: the limit grows while latency stays near
+    # the lowest observed and is halved on latency spikes, 503 responses and timeouts (up to max_connections)
+    adaptive_concurrency: bool = False
+    # Pace requests per origin to stay within the rate limit the server advertises (RateLimit-*,
+    # X-RateLimit-* and Retry-After headers); 429 responses are retried up to rate_limit_retries times
+    # when the server asks to wait no longer than rate_limit_max_wait seconds
+    rate_limit: bool = False
+    rate_limit_retries: int = 3
+    rate_limit_max_wait: float = 60.0
+    # Hedge slow requests of idempotent operations (GET, HEAD, x-idempotent): once a request takes longer
+    # than the hedge_percentile latency of its operation a duplicate is sent and the first response wins;
+    # at most hedge_budget of the requests are hedged
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_budget: float = 0.05
+    # HTTP cache for GET responses (Cache-Control max-age/stale-while-revalidate, ETag/Last-Modified
+    # revalidation): an in-memory LRU of up to cache_max_bytes, plus an optional sqlite file
+    cache: bool = False
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_path: str | None = None
+    # Capture structured traces of requests taking at least slow_request_threshold seconds, and of a random
+    # slow_request_sample_rate of the others, keeping the latest slow_request_traces (see slow_request_sampler())
+    slow_request_threshold: float | None = None
+    slow_request_sample_rate: float = 0.0
+    slow_request_traces: int = 100
+    # Decode model responses of at least decode_offload_bytes in a "thread" or "process" pool
+    # (decode_offload_executor) instead of on the event loop; smaller bodies are decoded inline
+    decode_offload_bytes: int | None = None
+    decode_offload_executor: str = "thread"
+    # Decode model responses of at least single_pass_decode_bytes in a single pass, without building the
+    # dict tree: less peak memory, but slower than json_codec's two passes (None: always json_codec)
+    single_pass_decode_bytes: int | None = None
+    # Identical in-flight requests of operations marked x-coalesce (or --coalesce) share one network call
+    coalesce: bool = True
+    # Pre-register the converter hooks of the operations' models in a daemon thread when the client is
+    # created, so the first requests do not pay for it (see APIClient.warmup() and warmup_report)
+    warmup: bool = False
 """
 
 
@@ -85,9 +160,19 @@ class CoreEmitter:
             "from .exception_aliases import *  # noqa: F403",
             "",
             "# Re-export other commonly used core components",
-            "from .http_transport import HttpTransport, HttpxTransport",
+            "from .http_transport import HttpTransport, HttpxTransport, PoolStats",
+            "from .adaptive_concurrency import AdaptiveConcurrency, ConcurrencyStats",
+            "from .json_codec import JsonCodec, decode_json, get_json_codec",
+            "from .batch import Batch, BatchResult",
+            "from .rate_limit_transport import RateLimitStats",
+            "from .hedging_transport import HedgeStats",
+            "from .deadline import Deadline, DeadlineExceeded, remaining",
+            "from .metrics import MetricsRegistry, metrics",
+            "from .sampler import RequestTrace, SlowRequestSampler",
+            "from .offload import DecodeOffload",
             "from .config import ClientConfig",
             "from .cattrs_converter import structure_from_dict, unstructure_to_dict, converter",
+            "from .model_decoder import decode_model, structure_from_json",
             "from .utils import DataclassSerializer",
             "from .auth.base import BaseAuth",
             "from .auth.plugins import ApiKeyAuth, BearerAuth, OAuth2Auth",
@@ -102,6 +187,24 @@ class CoreEmitter:
             "    # Transport layer",
             '    "HttpTransport",',
             '    "HttpxTransport",',
+            '    "PoolStats",',
+            '    "AdaptiveConcurrency",',
+            '    "ConcurrencyStats",',
+            '    "Batch",',
+            '    "BatchResult",',
+            '    "RateLimitStats",',
+            '    "HedgeStats",',
+            '    "Deadline",',
+            '    "DeadlineExceeded",',
+            '    "remaining",',
+            '    "MetricsRegistry",',
+            '    "metrics",',
+            '    "RequestTrace",',
+            '    "SlowRequestSampler",',
+            '    "DecodeOffload",',
+            '    "JsonCodec",',
+            '    "decode_json",',
+            '    "get_json_codec",',
             "",
             "    # Configuration",
             '    "ClientConfig",',
@@ -110,6 +213,8 @@ class CoreEmitter:
             '    "structure_from_dict",',
             '    "unstructure_to_dict",',
             '    "converter",',
+            '    "decode_model",',
+            '    "structure_from_json",',
             "",
             "    # Utilities",
             '    "DataclassSerializer",',
@@ -138,13 +243,15 @@ class CoreEmitter:
             auth_init_content = [
                 "# Core Auth __init__",
                 "from .base import BaseAuth",
-                "from .plugins import ApiKeyAuth, BearerAuth, OAuth2Auth",
+                "from .plugins import ApiKeyAuth, BearerAuth, OAuth2Auth, OAuth2Token, OAuth2TokenManager",
                 "",
                 "__all__ = [",
                 '    "BaseAuth",',
                 '    "ApiKeyAuth",',
                 '    "BearerAuth",',
                 '    "OAuth2Auth",',
+                '    "OAuth2Token",',
+                '    "OAuth2TokenManager",',
                 "]",
             ]
             self.file_manager.write_file(auth_init_path, "\n".join(auth_init_content) + "\n")
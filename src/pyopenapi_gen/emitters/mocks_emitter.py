@@ -45,6 +45,9 @@ class MocksEmitter:
             mocks_dir = output_dir_abs / "mocks"
             mocks_dir.mkdir(parents=True, exist_ok=True)
 
+            # Mock methods must mirror the real client, which is generated with the spec's schemas
+            self.endpoint_visitor = EndpointVisitor(spec.schemas)
+
             # Group operations by tag
             operations_by_tag = self._group_operations_by_tag(spec)
 
@@ -147,6 +147,14 @@ class ModelsEmitter:
         init_writer = CodeWriter()
         init_writer.write_line("from typing import List")
         init_writer.write_line("")
+        # Aliased so that schemas named e.g. "WarmupReport" cannot collide with the helpers
+        init_writer.write_line(
+            f"from {self.context.core_package_name}.cattrs_converter import WarmupReport as _WarmupReport"
+        )
+        init_writer.write_line(
+            f"from {self.context.core_package_name}.cattrs_converter import warmup_models as _warmup_models"
+        )
+        init_writer.write_line("")
 
         all_class_names_to_export: Set[str] = set()
 
@@ -188,6 +196,30 @@ class ModelsEmitter:
         for name_to_export in sorted(list(all_class_names_to_export)):
             init_writer.write_line(f"    '{name_to_export}',")
         init_writer.write_line("]")
+        init_writer.write_line("")
+        init_writer.write_line("")
+        init_writer.write_line("def warmup(background: bool = False) -> _WarmupReport:")
+        init_writer.write_line('    """')
+        init_writer.write_line("    Pre-register converter hooks for every model in this package.")
+        init_writer.write_line("")
+        init_writer.write_line(
+            "    Moves the one-off cost of the first structure/unstructure of each model to startup."
+        )
+        init_writer.write_line("    Call `warmup(background=True)` at import time to do it in a daemon thread.")
+        init_writer.write_line("")
+        init_writer.write_line("    Returns:")
+        init_writer.write_line("        WarmupReport with the time spent per model")
+        init_writer.write_line('    """')
+        if all_class_names_to_export:
+            init_writer.write_line("    return _warmup_models(")
+            init_writer.write_line("        [")
+            for name_to_export in sorted(all_class_names_to_export):
+                init_writer.write_line(f"            {name_to_export},")
+            init_writer.write_line("        ],")
+            init_writer.write_line("        background=background,")
+            init_writer.write_line("    )")
+        else:
+            init_writer.write_line("    return _warmup_models([], background=background)")
 
         generated_content = init_writer.get_code()
         return generated_content
@@ -13,6 +13,8 @@ from typing import Any, List
 
 from pyopenapi_gen.context.render_context import RenderContext
 from pyopenapi_gen.core.loader.loader import load_ir_from_spec
+from pyopenapi_gen.core.loader.operations.coalesce import apply_coalesce_allowlist
+from pyopenapi_gen.core.loader.operations.timeouts import apply_operation_timeouts
 from pyopenapi_gen.core.postprocess_manager import PostprocessManager
 from pyopenapi_gen.core.spec_fetcher import fetch_spec
 from pyopenapi_gen.core.warning_collector import WarningCollector
@@ -92,6 +94,12 @@ class ClientGenerator:
         no_postprocess: bool = False,
         core_package: str | None = None,
         naming_strategy: NamingStrategy = NamingStrategy.OPERATION_ID,
+        model_codecs: bool = False,
+        model_slots: bool = False,
+        model_frozen: bool = False,
+        model_kw_only: bool = False,
+        coalesce_operations: List[str] | None = None,
+        operation_timeouts: dict[str, float] | None = None,
     ) -> List[Path]:
         """Generate the client code from the OpenAPI spec.
 
@@ -103,6 +111,12 @@ class ClientGenerator:
             no_postprocess: Skip post-processing (type checking, etc.).
             core_package: Python package path for the core package.
             naming_strategy: Strategy for deriving method names from operations.
+            model_codecs: Emit ahead-of-time _from_json/_to_json functions for every dataclass model.
+            model_slots: Generate models as @dataclass(slots=True).
+            model_frozen: Generate models as @dataclass(frozen=True).
+            model_kw_only: Generate models as @dataclass(kw_only=True).
+            coalesce_operations: IDs of operations to coalesce, in addition to those marked `x-coalesce`.
+            operation_timeouts: Default deadline in seconds per operation ID, overriding `x-timeout`.
 
         Raises:
             GenerationError: If generation fails or diffs are found (when not forcing overwrite).
@@ -118,6 +132,10 @@ class ClientGenerator:
         # Stage 2: Parse to IR
         self._log_progress(f"Parsing specification into intermediate representation", "PARSE_IR")
         ir = load_ir_from_spec(spec_dict, naming_strategy=naming_strategy)
+        if coalesce_operations:
+            apply_coalesce_allowlist(ir.operations, coalesce_operations)
+        if operation_timeouts:
+            apply_operation_timeouts(ir.operations, operation_timeouts)
 
         # Log stats about the IR
         schema_count = len(ir.schemas) if ir.schemas else 0
@@ -170,6 +188,10 @@ class ClientGenerator:
             overall_project_root=str(project_root),
             parsed_schemas=ir.schemas,
             output_package_name=output_package,
+            model_codecs=model_codecs,
+            model_slots=model_slots,
+            model_frozen=model_frozen,
+            model_kw_only=model_kw_only,
         )
 
         if not force and out_dir.exists():
@@ -236,6 +258,10 @@ class ClientGenerator:
                     overall_project_root=str(tmp_project_root_for_diff),
                     parsed_schemas=ir.schemas,
                     output_package_name=output_package,
+                    model_codecs=model_codecs,
+                    model_slots=model_slots,
+                    model_frozen=model_frozen,
+                    model_kw_only=model_kw_only,
                 )
                 models_emitter = ModelsEmitter(
                     context=tmp_render_context_for_diff,
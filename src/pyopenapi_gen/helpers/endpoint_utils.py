@@ -37,6 +37,18 @@ def get_params(op: IROperation, context: RenderContext, schemas: dict[str, IRSch
     return params
 
 
+def get_timeout_param_name(op: IROperation) -> str:
+    """
+    Returns the name of the keyword argument bounding a call to the endpoint method of an operation:
+    `timeout`, with trailing underscores while an API parameter of the operation has that name.
+    """
+    taken = {NameSanitizer.sanitize_method_name(param.name) for param in op.parameters}
+    name = "timeout"
+    while name in taken:
+        name += "_"
+    return name
+
+
 def get_param_type(param: IRParameter, context: RenderContext, schemas: dict[str, IRSchema]) -> str:
     """Returns the Python type hint for a parameter, resolving references using the schemas dict."""
     # Use unified service for type resolution
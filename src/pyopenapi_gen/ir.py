@@ -174,6 +174,24 @@ class IRRequestBody:
     description: str | None = None
 
 
+@dataclass(slots=True)
+class IRPagination:
+    """How an operation pages through a collection, detected from its shape or `x-pagination`.
+
+    Field names are the API names: `param` and `size_param` are query parameters, the other
+    fields are properties of the success response body.
+    """
+
+    style: str  # "cursor", "offset", "page" or "link"
+    items_field: str | None  # Response property holding the page items; None when the body is the array
+    param: str | None = None  # Query parameter advanced between pages (cursor token, offset, page number)
+    size_param: str | None = None  # Query parameter setting the page size
+    next_field: str | None = None  # cursor: response property with the next page token
+    total_field: str | None = None  # offset/page: response property with the total number of items
+    total_pages_field: str | None = None  # page: response property with the number of pages
+    first_page: int = 1  # page: number of the first page
+
+
 @dataclass(slots=True)
 class IROperation:
     operation_id: str
@@ -185,6 +203,10 @@ class IROperation:
     request_body: IRRequestBody | None = None
     responses: List[IRResponse] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
+    pagination: IRPagination | None = None  # Set when the operation returns a paginated collection
+    coalesce: bool = False  # Identical in-flight requests share one network call (`x-coalesce`)
+    idempotent: bool = False  # Safe to send more than once, e.g. as a hedged request (GET/HEAD, `x-idempotent`)
+    timeout: float | None = None  # Default deadline of a call in seconds (`x-timeout`, --operation-timeout)
 
 
 @dataclass(slots=True)
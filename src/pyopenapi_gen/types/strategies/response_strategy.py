@@ -36,6 +36,9 @@ class ResponseStrategy:
     # Multi-content-type support
     content_type_mapping: dict[str, str] | None = None  # Maps content-type to Python type for Union responses
 
+    # Item type of a JSON array response streamed item by item (`stream_<operation>()` variants)
+    array_item_type: str | None = None
+
 
 class ResponseStrategyResolver:
     """Single source of truth for response handling decisions.
@@ -3,7 +3,7 @@ import re
 import textwrap
 from typing import TYPE_CHECKING, cast
 
-from pyopenapi_gen import IRSpec
+from pyopenapi_gen import IRSchema, IRSpec
 
 from ..context.render_context import RenderContext
 from ..core.utils import NameSanitizer
@@ -71,6 +71,53 @@ class ClientVisitor:
         # Step 4: Combine Protocol and implementation
         return f"{protocol_code}\n\n\n{impl_code}"
 
+    @staticmethod
+    def _operation_model_names(spec: IRSpec) -> list[str]:
+        """
+        Class names of the generated models that the operations send or return.
+
+        Inline schemas (arrays, unions, objects) are searched for the models they reference; the
+        nested models of a model are left to warmup_models, which registers them recursively.
+        """
+        exported = {
+            id(schema): schema.generation_name
+            for schema in spec.schemas.values()
+            if schema.generation_name
+            and schema.final_module_stem
+            and schema.final_module_stem != "__init__"
+            and not schema._from_unresolved_ref
+        }
+        names: set[str] = set()
+        visited: set[int] = set()
+
+        def collect(schema: IRSchema | None) -> None:
+            if schema is None or id(schema) in visited:
+                return
+            visited.add(id(schema))
+            name = exported.get(id(schema))
+            if name:
+                names.add(name)
+                return
+            collect(schema.items)
+            if isinstance(schema.additional_properties, IRSchema):
+                collect(schema.additional_properties)
+            for nested in (
+                *schema.properties.values(),
+                *(schema.any_of or []),
+                *(schema.one_of or []),
+                *(schema.all_of or []),
+            ):
+                collect(nested)
+
+        for op in spec.operations:
+            if op.request_body:
+                for schema in op.request_body.content.values():
+                    collect(schema)
+            for response in op.responses:
+                for schema in response.content.values():
+                    collect(schema)
+        return sorted(names)
+
     def _generate_client_implementation(
         self, spec: IRSpec, context: RenderContext, tag_tuples: list[tuple[str, str, str]]
     ) -> str:
@@ -152,11 +199,83 @@ class ClientVisitor:
         writer.write_line("def __init__(self, config: ClientConfig, transport: HttpTransport | None = None) -> None:")
         writer.indent()
         writer.write_line("self.config = config")
+        writer.write_line("if transport is None:")
+        writer.indent()
+        writer.write_line("transport = HttpxTransport(")
+        writer.indent()
+        writer.write_line("str(config.base_url),")
+        writer.write_line("config.timeout,")
+        for option in (
+            "json_codec",
+            "max_connections",
+            "max_keepalive_connections",
+            "keepalive_expiry",
+            "http2",
+            "connect_timeout",
+            "read_timeout",
+            "write_timeout",
+            "pool_timeout",
+            "local_address",
+            "proxy",
+        ):
+            writer.write_line(f"{option}=config.{option},")
+        writer.write_line("shared=config.shared_transport,")
+        context.add_import(f"{context.core_package_name}.adaptive_concurrency", "AdaptiveConcurrency")
+        writer.write_line(
+            "concurrency=AdaptiveConcurrency(max_limit=config.max_connections or 100)"
+            " if config.adaptive_concurrency else None,"
+        )
+        context.add_import(f"{context.core_package_name}.sampler", "SlowRequestSampler")
+        writer.write_line(
+            "sampler=SlowRequestSampler(config.slow_request_threshold, config.slow_request_sample_rate,"
+            " config.slow_request_traces)"
+        )
+        writer.write_line("if config.slow_request_threshold is not None or config.slow_request_sample_rate else None,")
+        context.add_import(f"{context.core_package_name}.offload", "DecodeOffload")
+        writer.write_line(
+            "decode_offload=DecodeOffload(config.decode_offload_bytes, config.decode_offload_executor)"
+            " if config.decode_offload_bytes is not None else None,"
+        )
+        writer.write_line("single_pass_decode_bytes=config.single_pass_decode_bytes,")
+        writer.dedent()
+        writer.write_line(")")
+        writer.dedent()
+        context.add_import(f"{context.core_package_name}.rate_limit_transport", "RateLimitingTransport")
+        writer.write_line("if config.rate_limit:")
+        writer.indent()
+        writer.write_line("transport = RateLimitingTransport(")
+        writer.indent()
+        writer.write_line("transport, max_retries=config.rate_limit_retries, max_retry_wait=config.rate_limit_max_wait")
+        writer.dedent()
+        writer.write_line(")")
+        writer.dedent()
+        hedged = any(op.idempotent for op in spec.operations)
+        if hedged:
+            context.add_import(f"{context.core_package_name}.hedging_transport", "HedgingTransport")
+            writer.write_line("if config.hedge:")
+            writer.indent()
+            writer.write_line(
+                "transport = HedgingTransport(transport, percentile=config.hedge_percentile, budget=config.hedge_budget)"
+            )
+            writer.dedent()
+        context.add_import(f"{context.core_package_name}.cache_transport", "CachingTransport")
+        writer.write_line("if config.cache:")
+        writer.indent()
         writer.write_line(
-            "self.transport = transport if transport is not None else "
-            "HttpxTransport(str(config.base_url), config.timeout)"
+            "transport = CachingTransport(transport, max_bytes=config.cache_max_bytes, path=config.cache_path)"
         )
+        writer.dedent()
+        if any(op.coalesce for op in spec.operations):
+            context.add_import(f"{context.core_package_name}.coalescing_transport", "CoalescingTransport")
+            writer.write_line("if config.coalesce:")
+            writer.indent()
+            writer.write_line("transport = CoalescingTransport(transport)")
+            writer.dedent()
+        writer.write_line("self.transport = transport")
         writer.write_line("self._base_url: str = str(self.config.base_url)")
+        writer.write_line(
+            "self.warmup_report: WarmupReport | None = self.warmup(background=True) if config.warmup else None"
+        )
         # Initialize private fields for each tag client
         for tag, class_name, module_name in tag_tuples:
             context.add_typing_imports_for_type(f"{class_name} | None")
@@ -212,6 +331,116 @@ class ClientVisitor:
         writer.dedent()
         writer.dedent()
         writer.write_line("")
+        # warmup method: pre-registers converter hooks for the models the operations return/accept
+        context.add_import(f"{context.core_package_name}.cattrs_converter", "WarmupReport")
+        context.add_import(f"{context.core_package_name}.cattrs_converter", "warmup_models")
+        model_names = self._operation_model_names(spec)
+        writer.write_line("def warmup(self, background: bool = False) -> WarmupReport:")
+        writer.indent()
+        writer.write_line('"""')
+        writer.write_line("Pre-register converter hooks for the models this client's operations send or return.")
+        writer.write_line("")
+        writer.write_line("Moves the one-off cost of the first (de)serialisation of each model out of the")
+        writer.write_line("first requests. With background=True the work runs in a daemon thread; call")
+        writer.write_line("`report.wait()` to block until it has finished. Runs in the background when the")
+        writer.write_line("client is created with config.warmup.")
+        writer.write_line("")
+        writer.write_line("Returns:")
+        writer.write_line("    WarmupReport with the time spent per model")
+        writer.write_line('"""')
+        if model_names:
+            writer.write_line("from . import models")
+            writer.write_line("")
+            writer.write_line("return warmup_models(")
+            writer.indent()
+            writer.write_line("[")
+            writer.indent()
+            for name in model_names:
+                writer.write_line(f"models.{name},")
+            writer.dedent()
+            writer.write_line("],")
+            writer.write_line("background=background,")
+            writer.dedent()
+            writer.write_line(")")
+        else:
+            writer.write_line("return warmup_models([], background=background)")
+        writer.dedent()
+        writer.write_line("")
+        # pool_stats method: connection pool usage of the default transport
+        context.add_import(f"{context.core_package_name}.http_transport", "PoolStats")
+        context.add_import(f"{context.core_package_name}.http_transport", "find_transport")
+        writer.write_line("def pool_stats(self) -> PoolStats | None:")
+        writer.indent()
+        writer.write_line('"""Connection pool usage of the HttpxTransport, or None for a custom transport."""')
+        writer.write_line("transport = find_transport(self.transport, HttpxTransport)")
+        writer.write_line("return transport.pool_stats() if transport is not None else None")
+        writer.dedent()
+        writer.write_line("")
+        # concurrency_stats method: adaptive concurrency limits of the default transport
+        context.add_import(f"{context.core_package_name}.adaptive_concurrency", "ConcurrencyStats")
+        writer.write_line("def concurrency_stats(self) -> dict[str, ConcurrencyStats]:")
+        writer.indent()
+        writer.write_line('"""Adaptive concurrency limit per origin (empty unless config.adaptive_concurrency)."""')
+        writer.write_line("transport = find_transport(self.transport, HttpxTransport)")
+        writer.write_line("return transport.concurrency_stats() if transport is not None else {}")
+        writer.dedent()
+        writer.write_line("")
+        # slow_request_sampler method: traces of slow requests captured by the default transport
+        writer.write_line("def slow_request_sampler(self) -> SlowRequestSampler | None:")
+        writer.indent()
+        writer.write_line(
+            '"""Traces of slow requests (None unless config.slow_request_threshold or slow_request_sample_rate)."""'
+        )
+        writer.write_line("transport = find_transport(self.transport, HttpxTransport)")
+        writer.write_line("return transport.sampler if transport is not None else None")
+        writer.dedent()
+        writer.write_line("")
+        # rate_limit_stats method: request scheduling of the rate-limiting transport
+        context.add_import(f"{context.core_package_name}.rate_limit_transport", "RateLimitStats")
+        writer.write_line("def rate_limit_stats(self) -> dict[str, RateLimitStats]:")
+        writer.indent()
+        writer.write_line(
+            '"""Rate-limit budget, queue depth and wait times per origin (empty unless config.rate_limit)."""'
+        )
+        writer.write_line("rate_limiter = find_transport(self.transport, RateLimitingTransport)")
+        writer.write_line("return rate_limiter.stats() if rate_limiter is not None else {}")
+        writer.dedent()
+        writer.write_line("")
+        if hedged:
+            # hedge_stats method: hedged requests per operation
+            context.add_import(f"{context.core_package_name}.hedging_transport", "HedgeStats")
+            writer.write_line("def hedge_stats(self) -> dict[str, HedgeStats]:")
+            writer.indent()
+            writer.write_line('"""Hedged requests and hedge delay per operation ID (empty unless config.hedge)."""')
+            writer.write_line("hedger = find_transport(self.transport, HedgingTransport)")
+            writer.write_line("return hedger.stats() if hedger is not None else {}")
+            writer.dedent()
+            writer.write_line("")
+        # batch method: bounded-concurrency execution of many endpoint calls
+        context.add_import(f"{context.core_package_name}.batch", "Batch")
+        writer.write_line(
+            "def batch(self, max_concurrency: int | None = None, per_host_limit: int | None = None) -> Batch:"
+        )
+        writer.indent()
+        writer.write_line('"""')
+        writer.write_line("Run many endpoint calls with bounded concurrency, capturing each call's result or error.")
+        writer.write_line("")
+        writer.write_line("    async with client.batch(max_concurrency=32) as batch:")
+        writer.write_line("        for user_id in user_ids:")
+        writer.write_line("            batch.submit(client.users.get_user(user_id))")
+        writer.write_line("    users = [result.unwrap() for result in batch.results()]")
+        writer.write_line("")
+        writer.write_line("Args:")
+        writer.write_line("    max_concurrency: Calls running at once; defaults to the connection pool size")
+        writer.write_line("    per_host_limit: Requests in flight per host (None: no limit)")
+        writer.write_line('"""')
+        writer.write_line("if max_concurrency is None:")
+        writer.indent()
+        writer.write_line("max_concurrency = self.config.max_connections or 100")
+        writer.dedent()
+        writer.write_line("return Batch(max_concurrency=max_concurrency, per_host_limit=per_host_limit)")
+        writer.dedent()
+        writer.write_line("")
         # __aenter__ for async context management (dedented)
         writer.write_line("async def __aenter__(self) -> 'APIClient':")
         writer.indent()
@@ -174,8 +174,10 @@ class EndpointVisitor(Visitor[IROperation, str]):
                             writer.write_line("")  # Blank line after method
 
                             # For Protocol, we only want the signature stub, not the implementation
-                            # Skip all remaining lines of this method by jumping to end
-                            i = len(lines)  # This will exit the while loop
+                            # Skip the method body up to the next top-level line (e.g. a stream_ variant)
+                            i += 1
+                            while i < len(lines) and (not lines[i].strip() or lines[i][0].isspace()):
+                                i += 1
                             break
 
                         i += 1
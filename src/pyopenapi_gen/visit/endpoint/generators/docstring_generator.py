@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyopenapi_gen.core.writers.code_writer import CodeWriter
 from pyopenapi_gen.core.writers.documentation_writer import DocumentationBlock, DocumentationWriter
-from pyopenapi_gen.helpers.endpoint_utils import get_param_type, get_request_body_type
+from pyopenapi_gen.helpers.endpoint_utils import get_param_type, get_request_body_type, get_timeout_param_name
 
 if TYPE_CHECKING:
     from pyopenapi_gen import IROperation
@@ -77,6 +77,9 @@ class EndpointDocstringGenerator:
             else:  # Fallback for other types like application/octet-stream
                 args.append(("bytes_content", "bytes", body_desc + f" ({primary_content_type})"))
 
+        timeout_desc = "Seconds the call may take, including its nested requests; DeadlineExceeded is raised after."
+        args.append((get_timeout_param_name(op), "float | None", timeout_desc))
+
         return_type = response_strategy.return_type
         response_desc = None
         # Prioritize 2xx success codes for the main response description
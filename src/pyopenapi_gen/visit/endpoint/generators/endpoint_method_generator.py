@@ -1,3 +1,5 @@
+import dataclasses
+import json
 import logging
 import re
 from typing import Any
@@ -7,11 +9,13 @@ from pyopenapi_gen import IROperation
 from ....context.render_context import RenderContext
 from ....core.utils import Formatter, NameSanitizer
 from ....core.writers.code_writer import CodeWriter
-from ....types.strategies import ResponseStrategyResolver
+from ....helpers.endpoint_utils import get_timeout_param_name
+from ....types.strategies import ResponseStrategy, ResponseStrategyResolver
 from ..processors.import_analyzer import EndpointImportAnalyzer
 from ..processors.parameter_processor import EndpointParameterProcessor
 from .docstring_generator import EndpointDocstringGenerator
 from .overload_generator import OverloadMethodGenerator
+from .pagination_generator import EndpointPaginationGenerator
 from .request_generator import EndpointRequestGenerator
 from .response_handler_generator import EndpointResponseHandlerGenerator
 from .signature_generator import EndpointMethodSignatureGenerator
@@ -37,6 +41,7 @@ class EndpointMethodGenerator:
         self.request_generator = EndpointRequestGenerator(self.schemas)
         self.response_handler_generator = EndpointResponseHandlerGenerator(self.schemas)
         self.overload_generator = OverloadMethodGenerator(self.schemas)
+        self.pagination_generator = EndpointPaginationGenerator(self.schemas)
 
     def generate(self, op: IROperation, context: RenderContext) -> str:
         """
@@ -45,6 +50,11 @@ class EndpointMethodGenerator:
 
         If the operation has multiple content types, generates @overload signatures
         followed by the implementation method with runtime dispatch.
+
+        Operations returning a JSON array also get a `stream_<operation>()` async-iterator
+        variant, emitted after the method, that yields the items as they are received.
+        Paginated operations also get an `iter_<operation>()` async iterator over the items
+        of all pages.
         """
         context.add_import(f"{context.core_package_name}.http_transport", "HttpTransport")
         context.add_import(f"{context.core_package_name}.exceptions", "HTTPError")
@@ -60,7 +70,48 @@ class EndpointMethodGenerator:
         if self.overload_generator.has_multiple_content_types(op):
             return self._generate_overloaded_method(op, context, response_strategy)
         else:
-            return self._generate_standard_method(op, context, response_strategy)
+            methods = [
+                self._generate_standard_method(op, context, response_strategy),
+                self._generate_array_stream_variant(op, context, response_strategy),
+                self.pagination_generator.generate(op, context, response_strategy),
+            ]
+            return "\n\n\n".join(method for method in methods if method is not None)
+
+    def _generate_array_stream_variant(
+        self, op: IROperation, context: RenderContext, response_strategy: ResponseStrategy
+    ) -> str | None:
+        """
+        Generate `stream_<operation>()`, which yields the items of a JSON array response one by one.
+
+        The body is read from `open_stream(self._transport, ...)` and parsed incrementally, so only one
+        item is held in memory at a time. Returns None for operations whose success response is
+        not a JSON array, or whose other 2xx responses carry a body.
+        """
+        if response_strategy.is_streaming or response_strategy.content_type_mapping:
+            return None
+        response_ir = response_strategy.response_ir
+        if response_ir is None or not any("json" in content_type for content_type in response_ir.content):
+            return None
+        item_type = self.response_handler_generator.get_array_item_type(response_strategy.return_type)
+        if item_type is None:
+            return None
+        # An async generator cannot return the bodies of other success responses
+        if any(r is not response_ir and r.status_code.startswith("2") and r.content for r in op.responses):
+            return None
+
+        stream_strategy = dataclasses.replace(
+            response_strategy,
+            return_type=f"AsyncIterator[{item_type}]",
+            is_streaming=True,
+            array_item_type=item_type,
+        )
+        note = "Streams the items of the response array as they are received, without buffering the whole list."
+        stream_op = dataclasses.replace(
+            op,
+            operation_id=f"stream_{op.operation_id}",
+            description=f"{op.description}\n\n{note}" if op.description else note,
+        )
+        return self._generate_standard_method(stream_op, context, stream_strategy)
 
     def _generate_standard_method(self, op: IROperation, context: RenderContext, response_strategy: Any) -> str:
         """Generate standard method without overloads."""
@@ -75,6 +126,19 @@ class EndpointMethodGenerator:
 
         self.docstring_generator.generate_docstring(writer, op, context, primary_content_type, response_strategy)
 
+        # The `timeout` argument bounds the whole call, which is a call of the operation at its path. An
+        # async generator cannot hold a deadline scope across its yields, so its body runs in a nested
+        # generator bounded item by item.
+        timeout_param = get_timeout_param_name(op)
+        operation_arg = f"operation={json.dumps(op.operation_id)}, route={json.dumps(op.path)}"
+        if response_strategy.is_streaming:
+            context.add_import(f"{context.core_package_name}.deadline", "iterate_with_deadline")
+            writer.write_line(f"async def _iterate() -> {response_strategy.return_type}:")
+        else:
+            context.add_import(f"{context.core_package_name}.deadline", "Deadline")
+            writer.write_line(f"async with Deadline({timeout_param}, {operation_arg}):")
+        writer.indent()
+
         # Snapshot of code *before* main body parts are written
         # This includes signature and docstring.
         code_snapshot_before_body_parts = writer.get_code()
@@ -82,10 +146,21 @@ class EndpointMethodGenerator:
         has_header_params = self.url_args_generator.generate_url_and_args(
             writer, op, context, ordered_params, primary_content_type, resolved_body_type
         )
-        self.request_generator.generate_request_call(writer, op, context, has_header_params, primary_content_type)
+        # Streaming responses are handled inside `async with open_stream(self._transport, ...)` so the
+        # body is consumed incrementally instead of being buffered by the transport.
+        self.request_generator.generate_request_call(
+            writer,
+            op,
+            context,
+            has_header_params,
+            primary_content_type,
+            streaming=response_strategy.is_streaming,
+        )
 
         # Call the new response handler generator with strategy
         self.response_handler_generator.generate_response_handling(writer, op, context, response_strategy)
+        if response_strategy.is_streaming:
+            writer.dedent()  # Close the `async with open_stream(self._transport, ...)` block
 
         # Check if any actual statements were added for the body
         current_full_code = writer.get_code()
@@ -103,6 +178,15 @@ class EndpointMethodGenerator:
         if body_is_effectively_empty:
             writer.write_line("pass")
 
+        writer.dedent()  # Close the deadline scope or the nested generator
+        if response_strategy.is_streaming:
+            writer.write_line(
+                f"async for _item in iterate_with_deadline(_iterate(), {timeout_param}, {operation_arg}):"
+            )
+            writer.indent()
+            writer.write_line("yield _item")
+            writer.dedent()
+
         writer.dedent()  # This matches the indent() from _write_method_signature
 
         return writer.get_code().strip()
@@ -148,6 +232,12 @@ class EndpointMethodGenerator:
         for content_type in op.request_body.content.keys():
             writer.write_line(f"- {content_type}")
         writer.write_line('"""')
+        context.add_import(f"{context.core_package_name}.deadline", "Deadline")
+        writer.write_line(
+            f"async with Deadline({get_timeout_param_name(op)}, operation={json.dumps(op.operation_id)},"
+            f" route={json.dumps(op.path)}):"
+        )
+        writer.indent()
 
         # Generate URL construction with sanitized path variables
         formatted_path = re.sub(
@@ -217,6 +307,7 @@ class EndpointMethodGenerator:
         # Generate response handling (reuse existing generator)
         self.response_handler_generator.generate_response_handling(writer, op, context, response_strategy)
 
+        writer.dedent()  # Close the deadline scope
         writer.dedent()
 
         return writer.get_code().strip()
@@ -6,6 +6,7 @@ allowing users to create test doubles by subclassing and overriding
 only the methods they need.
 """
 
+import re
 from typing import Any
 
 from ....context.render_context import RenderContext
@@ -116,8 +117,9 @@ class MockGenerator:
                 writer.write_line("the behavior needed for your test scenario.")
                 writer.write_line('"""')
 
-                # Error message
-                method_name = NameSanitizer.sanitize_method_name(op.operation_id)
+                # Error message (named after the signature, which may be a stream_ variant)
+                name_match = re.match(r"(?:async\s+)?def\s+(\w+)", signature_lines[0])
+                method_name = name_match.group(1) if name_match else NameSanitizer.sanitize_method_name(op.operation_id)
                 tag = op.tags[0] if op.tags else "Client"
                 class_name = f"Mock{NameSanitizer.sanitize_class_name(tag)}Client"
                 error_msg = (
@@ -131,9 +133,15 @@ class MockGenerator:
 
                 writer.dedent()
 
-                # Skip the rest of this method implementation in the original code
-                i = len(lines)  # Exit the loop
-                break
+                # Skip the rest of this method implementation in the original code,
+                # up to the next top-level line (e.g. a stream_ variant)
+                i = temp_i + 1
+                while i < len(lines) and (not lines[i].strip() or lines[i][0].isspace()):
+                    i += 1
+                if i < len(lines):
+                    writer.write_line("")
+                    writer.write_line("")
+                continue
 
             i += 1
 
@@ -8,6 +8,7 @@ from pyopenapi_gen import IROperation
 from ....context.render_context import RenderContext
 from ....core.utils import NameSanitizer
 from ....core.writers.code_writer import CodeWriter
+from ....helpers.endpoint_utils import get_timeout_param_name
 from ..processors.parameter_processor import EndpointParameterProcessor
 from .docstring_generator import EndpointDocstringGenerator
 from .signature_generator import EndpointMethodSignatureGenerator
@@ -132,6 +133,7 @@ class OverloadMethodGenerator:
 
         # Add content_type parameter with Literal type
         param_parts.append(f'content_type: Literal["{content_type}"] = "{content_type}"')
+        param_parts.append(f"{get_timeout_param_name(op)}: float | None = {op.timeout!r}")
 
         # Get return type from response strategy
         return_type = response_strategy.return_type
@@ -234,6 +236,7 @@ class OverloadMethodGenerator:
 
         # Add content_type parameter (no Literal, just str)
         param_parts.append('content_type: str = "application/json"')
+        param_parts.append(f"{get_timeout_param_name(op)}: float | None = {op.timeout!r}")
 
         # Get return type
         return_type = response_strategy.return_type
@@ -0,0 +1,246 @@
+"""
+Helper class for generating the `iter_<operation>()` method of a paginated endpoint.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pyopenapi_gen.core.utils import NameSanitizer
+from pyopenapi_gen.core.writers.code_writer import CodeWriter
+from pyopenapi_gen.helpers.endpoint_utils import get_timeout_param_name
+from pyopenapi_gen.types.services.type_service import UnifiedTypeService
+
+from ..processors.parameter_processor import EndpointParameterProcessor
+from .docstring_generator import EndpointDocstringGenerator
+from .request_generator import EndpointRequestGenerator
+from .response_handler_generator import EndpointResponseHandlerGenerator
+from .signature_generator import EndpointMethodSignatureGenerator
+from .url_args_generator import EndpointUrlArgsGenerator
+
+if TYPE_CHECKING:
+    from pyopenapi_gen import IROperation, IRSchema
+    from pyopenapi_gen.context.render_context import RenderContext
+    from pyopenapi_gen.ir import IRPagination
+    from pyopenapi_gen.types.strategies.response_strategy import ResponseStrategy
+
+logger = logging.getLogger(__name__)
+
+_ITER_NOTE = "Iterates over the items of all pages, requesting the next pages ahead of the consumer."
+
+
+class EndpointPaginationGenerator:
+    """Generates the typed `iter_<operation>()` async iterator of an operation with `op.pagination`.
+
+    The iterator calls the generated method for each page through the prefetching paginators of
+    `core.pagination` (`paginate_pipelined`, `paginate_by_offset`, `paginate_by_page`), or fetches
+    the pages itself for `Link` header pagination (`paginate_by_link`).
+    """
+
+    def __init__(self, schemas: dict[str, Any] | None = None) -> None:
+        self.schemas: dict[str, Any] = schemas or {}
+        self.parameter_processor = EndpointParameterProcessor(self.schemas)
+        self.signature_generator = EndpointMethodSignatureGenerator(self.schemas)
+        self.docstring_generator = EndpointDocstringGenerator(self.schemas)
+        self.url_args_generator = EndpointUrlArgsGenerator(self.schemas)
+        self.request_generator = EndpointRequestGenerator(self.schemas)
+        self.response_handler_generator = EndpointResponseHandlerGenerator(self.schemas)
+
+    def _field(self, schema: IRSchema | None, name: str) -> tuple[str, bool]:
+        """Python attribute name of a response property, and whether it may be None."""
+        prop = schema.properties.get(name) if schema else None
+        optional = schema is None or prop is None or name not in schema.required or prop.is_nullable
+        return NameSanitizer.sanitize_method_name(name), optional
+
+    def _item_type(self, pagination: IRPagination, strategy: ResponseStrategy, context: RenderContext) -> str | None:
+        if pagination.items_field is None:
+            return self.response_handler_generator.get_array_item_type(strategy.return_type)
+        schema = strategy.response_schema
+        prop = schema.properties.get(pagination.items_field) if schema else None
+        if prop is None:
+            return None
+        items_type = UnifiedTypeService(self.schemas).resolve_schema_type(prop, context, required=True)
+        return self.response_handler_generator.get_array_item_type(items_type.removesuffix(" | None"))
+
+    def _items_expr(self, pagination: IRPagination, schema: IRSchema | None, page_expr: str) -> str:
+        if pagination.items_field is None:
+            return page_expr
+        attr, optional = self._field(schema, pagination.items_field)
+        return f"{page_expr}.{attr} or []" if optional else f"{page_expr}.{attr}"
+
+    def generate(self, op: IROperation, context: RenderContext, strategy: ResponseStrategy) -> str | None:
+        """
+        Generate `iter_<operation>()` for a paginated operation.
+
+        Returns None when the operation is not paginated, or when the item type of its pages
+        cannot be determined.
+        """
+        pagination = op.pagination
+        if pagination is None or strategy.is_streaming or strategy.content_type_mapping:
+            return None
+        item_type = self._item_type(pagination, strategy, context)
+        if item_type is None:
+            logger.warning(f"Skipping iter_{op.operation_id}(): cannot determine the item type of its pages")
+            return None
+
+        # The paginator owns the page parameter; every other parameter is passed through
+        parameters = op.parameters
+        if pagination.style != "link":
+            parameters = [p for p in op.parameters if p.name != pagination.param]
+        iter_op = dataclasses.replace(
+            op,
+            operation_id=f"iter_{op.operation_id}",
+            parameters=parameters,
+            description=f"{op.description}\n\n{_ITER_NOTE}" if op.description else _ITER_NOTE,
+            timeout=None,  # Bounds the whole iteration; each page request keeps the operation's timeout
+        )
+        iter_strategy = dataclasses.replace(strategy, return_type=f"AsyncIterator[{item_type}]", is_streaming=True)
+
+        writer = CodeWriter()
+        ordered_params, primary_content_type, resolved_body_type = self.parameter_processor.process_parameters(
+            iter_op, context
+        )
+        self.signature_generator.generate_signature(writer, iter_op, context, ordered_params, iter_strategy)
+        self.docstring_generator.generate_docstring(writer, iter_op, context, primary_content_type, iter_strategy)
+
+        if pagination.style == "link":
+            self._write_link_pagination(
+                writer,
+                iter_op,
+                context,
+                strategy,
+                pagination,
+                ordered_params,
+                primary_content_type,
+                resolved_body_type,
+                page_timeout=op.timeout,
+            )
+        else:
+            self._write_method_pagination(writer, op, context, strategy, pagination, ordered_params)
+        context.add_import(f"{context.core_package_name}.deadline", "iterate_with_deadline")
+        timeout_arg = get_timeout_param_name(iter_op)
+        if pagination.style == "link":
+            # The pages are requested here rather than by calls of the operation's method: measure the
+            # iteration as one call of the operation
+            timeout_arg += f", operation={json.dumps(op.operation_id)}, route={json.dumps(op.path)}"
+        writer.write_line(f"async for item in iterate_with_deadline(pages, {timeout_arg}):")
+        writer.indent()
+        writer.write_line("yield item")
+        writer.dedent()
+
+        writer.dedent()
+        return writer.get_code().strip()
+
+    def _write_method_pagination(
+        self,
+        writer: CodeWriter,
+        op: IROperation,
+        context: RenderContext,
+        strategy: ResponseStrategy,
+        pagination: IRPagination,
+        ordered_params: list[dict[str, Any]],
+    ) -> None:
+        """Page through the generated method with paginate_pipelined/by_offset/by_page."""
+        schema = strategy.response_schema
+        page_param = NameSanitizer.sanitize_method_name(pagination.param or "")
+        size_param = NameSanitizer.sanitize_method_name(pagination.size_param) if pagination.size_param else None
+        args = [f"self.{NameSanitizer.sanitize_method_name(op.operation_id)}"]
+        args.append(f"lambda page: {self._items_expr(pagination, schema, 'page')}")
+
+        if pagination.style == "cursor":
+            paginator = "paginate_pipelined"
+            next_attr, _ = self._field(schema, pagination.next_field or "")
+            args.append(
+                f'lambda page, params: {{**params, "{page_param}": page.{next_attr}}} if page.{next_attr} else None'
+            )
+        elif pagination.style == "offset":
+            paginator = "paginate_by_offset"
+            total = f"page.{self._field(schema, pagination.total_field)[0]}" if pagination.total_field else "None"
+            args.append(f"lambda page: {total}")
+            args.append(f'offset_param="{page_param}"')
+            if size_param:
+                args.append(f'limit_param="{size_param}"')
+        else:
+            paginator = "paginate_by_page"
+            if pagination.total_pages_field:
+                total_pages = f"page.{self._field(schema, pagination.total_pages_field)[0]}"
+            elif pagination.total_field:
+                # Pages of the size of the first (full) page
+                context.add_plain_import("math")
+                total_attr, total_optional = self._field(schema, pagination.total_field)
+                total_pages = f"math.ceil(page.{total_attr} / len({self._items_expr(pagination, schema, 'page')}))"
+                if total_optional:
+                    total_pages = f"None if page.{total_attr} is None else {total_pages}"
+            else:
+                total_pages = "None"
+            args.append(f"lambda page: {total_pages}")
+            args.append(f'page_param="{page_param}"')
+            if pagination.first_page != 1:
+                args.append(f"first_page={pagination.first_page}")
+
+        for p in ordered_params:
+            name = NameSanitizer.sanitize_method_name(p["name"])
+            args.append(f"{name}={name}")
+
+        context.add_import(f"{context.core_package_name}.pagination", paginator)
+        writer.write_line(f"pages = {paginator}(")
+        writer.indent()
+        for arg in args:
+            writer.write_line(f"{arg},")
+        writer.dedent()
+        writer.write_line(")")
+
+    def _write_link_pagination(
+        self,
+        writer: CodeWriter,
+        op: IROperation,
+        context: RenderContext,
+        strategy: ResponseStrategy,
+        pagination: IRPagination,
+        ordered_params: list[dict[str, Any]],
+        primary_content_type: str | None,
+        resolved_body_type: str | None,
+        page_timeout: float | None,
+    ) -> None:
+        """Fetch the pages directly, following the next URL of their `Link` headers, each within `page_timeout`."""
+        context.add_plain_import("httpx")
+        context.add_import(f"{context.core_package_name}.pagination", "paginate_by_link")
+        context.add_import(f"{context.core_package_name}.exceptions", "HTTPError")
+        has_header_params = self.url_args_generator.generate_url_and_args(
+            writer, op, context, ordered_params, primary_content_type, resolved_body_type
+        )
+
+        writer.write_line("async def fetch_page(url: str, params: dict[str, Any] | None) -> httpx.Response:")
+        writer.indent()
+        if page_timeout is not None:
+            context.add_import(f"{context.core_package_name}.deadline", "Deadline")
+            writer.write_line(f"async with Deadline({page_timeout!r}):")
+            writer.indent()
+        self.request_generator.generate_request_call(writer, op, context, has_header_params, primary_content_type)
+        if page_timeout is not None:
+            writer.dedent()
+        writer.write_line("if not 200 <= response.status_code < 300:")
+        writer.indent()
+        writer.write_line(
+            'raise HTTPError(response=response, message="Failed to fetch page", status_code=response.status_code)'
+        )
+        writer.dedent()
+        writer.write_line("return response")
+        writer.dedent()
+        writer.write_line("")
+
+        page_expr = self.response_handler_generator._get_extraction_code(strategy.return_type, context, op)
+        if pagination.items_field is not None:
+            page_expr = f"({page_expr})"
+        first_params = "params" if any(p.param_in == "query" for p in op.parameters) else "None"
+        writer.write_line("pages = paginate_by_link(")
+        writer.indent()
+        writer.write_line("fetch_page,")
+        writer.write_line(f"lambda response: {self._items_expr(pagination, strategy.response_schema, page_expr)},")
+        writer.write_line("url,")
+        writer.write_line(f"{first_params},")
+        writer.dedent()
+        writer.write_line(")")
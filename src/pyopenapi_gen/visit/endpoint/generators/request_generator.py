@@ -4,6 +4,7 @@ Helper class for generating the HTTP request call for an endpoint method.
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 
 
 class EndpointRequestGenerator:
-    """Generates the self._transport.request(...) call for an endpoint method."""
+    """Generates the self._transport.request(...) (or open_stream(...)) call for an endpoint method."""
 
     def __init__(self, schemas: dict[str, Any] | None = None) -> None:
         self.schemas: dict[str, Any] = schemas or {}
@@ -32,8 +33,15 @@ class EndpointRequestGenerator:
         has_header_params: bool,
         primary_content_type: str | None,
         # resolved_body_type: str | None, # May not be directly needed here if logic relies on var names
+        streaming: bool = False,
     ) -> None:
-        """Writes the self._transport.request call to the CodeWriter."""
+        """Writes the self._transport.request call to the CodeWriter.
+
+        When `streaming` is True, an `async with open_stream(self._transport, ...) as response:` block
+        is opened instead so the response body is not buffered by transports with a `stream` method.
+        The writer is left indented inside that block; the caller must dedent once the response
+        handling has been written.
+        """
         # Logic from EndpointMethodGenerator._write_request
         args_list = []
 
@@ -75,6 +83,17 @@ class EndpointRequestGenerator:
         else:
             args_list.append("headers=None")
 
+        # Request extensions read by wrapping transports; streamed responses are neither shared nor hedged
+        extensions = []
+        if op.coalesce and not streaming:
+            # Opt in to single-flight coalescing by a CoalescingTransport (x-coalesce / --coalesce)
+            extensions.append('"coalesce": True')
+        if op.idempotent and not streaming:
+            # Allow a HedgingTransport to hedge the request, tracking latency under the operation ID
+            extensions.append(f'"hedge": {json.dumps(op.operation_id)}')
+        if extensions:
+            args_list.append(f"extensions={{{', '.join(extensions)}}}")
+
         positional_args_str = f'"{op.method.upper()}", url'  # url variable is assumed to be defined
         keyword_args_str = ", ".join(args_list)
 
@@ -83,12 +102,20 @@ class EndpointRequestGenerator:
         # A rough estimate, effective line length for arguments should be less than ~120 - ~40 = 80
         effective_args_len = len(positional_args_str) + len(", ") + len(keyword_args_str)
 
-        base_call_len = len("response = await self._transport.request()") + 2  # +2 for (,)
+        if streaming:
+            context.add_import(f"{context.core_package_name}.http_transport", "open_stream")
+            call_open = "async with open_stream(self._transport, "
+            call_close = ") as response:"
+        else:
+            call_open = "response = await self._transport.request("
+            call_close = ")"
+
+        base_call_len = len(call_open) + len(call_close) + 2  # +2 for (,)
 
         if base_call_len + effective_args_len <= 100:  # Adjusted for typical black formatting preference
-            writer.write_line(f"response = await self._transport.request({positional_args_str}, {keyword_args_str})")
+            writer.write_line(f"{call_open}{positional_args_str}, {keyword_args_str}{call_close}")
         else:
-            writer.write_line(f"response = await self._transport.request(")
+            writer.write_line(call_open)
             writer.indent()
             writer.write_line(f"{positional_args_str},")
             # Filter out "*=None" for cleaner multi-line calls if they are truly None and not just assigned None
@@ -99,5 +126,7 @@ class EndpointRequestGenerator:
                 line_end = "," if i < num_args - 1 else ""
                 writer.write_line(f"{arg}{line_end}")
             writer.dedent()
-            writer.write_line(")")
+            writer.write_line(call_close)
+        if streaming:
+            writer.indent()
         writer.write_line("")  # Add a blank line for readability after the request call
@@ -47,6 +47,58 @@ class EndpointResponseHandlerGenerator:
     def __init__(self, schemas: dict[str, Any] | None = None) -> None:
         self.schemas: dict[str, Any] = schemas or {}
 
+    def _json_body_expr(self, context: RenderContext) -> str:
+        """Expression decoding the JSON response body from its bytes with the client's JSON codec."""
+        context.add_import(f"{context.core_package_name}.json_codec", "decode_json")
+        return "decode_json(response)"
+
+    def _get_model_decode_code(self, return_type: str, context: RenderContext) -> str | None:
+        """
+        Single-pass decode expression for model and list-of-model return types.
+
+        Returns `decode_model(response, T)`, which builds the models straight from the response
+        bytes without an intermediate dict tree, or None when `return_type` is not a model,
+        a list of models or an array alias (nullable types keep structure_from_dict).
+        """
+        if not self._should_use_cattrs_structure(return_type):
+            return None
+        is_list = return_type.startswith(("List[", "list["))
+        if "[" in return_type and not is_list:
+            return None
+        if "|" in return_type:
+            return None
+        context.add_import(f"{context.core_package_name}.model_decoder", "decode_model")
+        return f"decode_model(response, {return_type})"
+
+    def _write_model_decode_return(
+        self, writer: CodeWriter, return_type: str, model_decode_code: str, context: RenderContext
+    ) -> None:
+        """
+        Write the return of a model or list-of-model body, decoded in the transport's executor when
+        it reaches the client's `decode_offload_bytes` and inline with `model_decode_code` otherwise.
+        """
+        context.add_import(f"{context.core_package_name}.offload", "decode_offload")
+        writer.write_line("if (offload := decode_offload(response)) is not None:")
+        writer.indent()
+        writer.write_line(f"return await offload.decode(response, {return_type})")
+        writer.dedent()
+        writer.write_line(f"return {model_decode_code}")
+
+    def get_array_item_type(self, return_type: str) -> str | None:
+        """
+        Item type of an array return type, for streaming the response item by item.
+
+        Returns X for `List[X]`/`list[X]` and the item model of array type aliases, or None for
+        any other return type (including nullable arrays).
+        """
+        if return_type.startswith(("List[", "list[")) and return_type.endswith("]"):
+            return return_type[5:-1].strip()
+        if self._is_type_alias_to_array(return_type):
+            item_type = self._extract_array_item_type(return_type)
+            if self._is_dataclass_type(item_type):
+                return item_type
+        return None
+
     def _register_cattrs_import(self, context: RenderContext) -> None:
         """Register the cattrs structure_from_dict import."""
         context.add_import(f"{context.core_package_name}.cattrs_converter", "structure_from_dict")
@@ -397,8 +449,9 @@ class EndpointResponseHandlerGenerator:
         elif return_type == "bytes":
             return "response.content"
         elif return_type == "Any":
+            data_expr = self._json_body_expr(context)
             context.add_import("typing", "Any")
-            return "response.json()  # Type is Any"
+            return f"{data_expr}  # Type is Any"
         elif return_type == "None":
             return "None"  # This will be handled by generate_response_handling directly
         else:  # Includes schema-defined models, List[], dict[], Optional[]
@@ -412,11 +465,14 @@ class EndpointResponseHandlerGenerator:
                 context.add_import("typing", "cast")
 
             # Direct deserialization using schemas as-is (no unwrapping)
-            if use_base_schema:
-                deserialization_code = self._get_cattrs_deserialization_code(return_type, "response.json()")
+            model_decode_code = self._get_model_decode_code(return_type, context) if use_base_schema else None
+            if model_decode_code is not None:
+                return model_decode_code
+            elif use_base_schema:
+                deserialization_code = self._get_cattrs_deserialization_code(return_type, self._json_body_expr(context))
                 return deserialization_code
             else:
-                return f"cast({return_type}, response.json())"
+                return f"cast({return_type}, {self._json_body_expr(context)})"
 
     def generate_response_handling(
         self,
@@ -463,29 +519,35 @@ class EndpointResponseHandlerGenerator:
                 if resp_ir.status_code.startswith("2"):
                     # Other 2xx success responses - resolve each response individually
                     if not resp_ir.content:
-                        writer.write_line("return None")
+                        # Async generators (streaming methods) cannot return a value
+                        writer.write_line("return" if strategy.is_streaming else "return None")
                     else:
                         # Resolve the specific return type for this response
                         resp_schema = self._get_response_schema(resp_ir)
                         if resp_schema:
-                            # Use response.json() directly - no automatic unwrapping
-                            data_expr = "response.json()"
-
                             type_service = UnifiedTypeService(self.schemas)
                             response_type = type_service.resolve_schema_type(resp_schema, context)
-                            if self._should_use_cattrs_structure(response_type):
+                            model_decode_code = self._get_model_decode_code(response_type, context)
+                            if model_decode_code is not None:
+                                # Models and lists of models are decoded straight from the body bytes
+                                self._write_model_decode_return(writer, response_type, model_decode_code, context)
+                                self._register_imports_for_type(response_type, context)
+                            elif self._should_use_cattrs_structure(response_type):
+                                # Decode the full body directly - no automatic unwrapping
+                                data_expr = self._json_body_expr(context)
                                 deserialization_code = self._get_cattrs_deserialization_code(response_type, data_expr)
                                 writer.write_line(f"return {deserialization_code}")
                                 self._register_imports_for_type(response_type, context)
                             else:
                                 context.add_import("typing", "cast")
-                                writer.write_line(f"return cast({response_type}, {data_expr})")
+                                writer.write_line(f"return cast({response_type}, {self._json_body_expr(context)})")
                         else:
                             writer.write_line("return None")
                 else:
                     # Error responses - use human-readable exception names
                     error_class_name = get_exception_class_name(status_code_val)
                     context.add_import(f"{context.core_package_name}", error_class_name)
+                    self._write_error_body_read(writer, strategy)
                     writer.write_line(f"raise {error_class_name}(response=response)")
 
                 writer.dedent()
@@ -506,6 +568,7 @@ class EndpointResponseHandlerGenerator:
                 self._write_strategy_based_return(writer, strategy, context)
             else:
                 context.add_import(f"{context.core_package_name}.exceptions", "HTTPError")
+                self._write_error_body_read(writer, strategy)
                 writer.write_line(
                     'raise HTTPError(response=response, message="Default error", status_code=response.status_code)'
                 )
@@ -515,6 +578,7 @@ class EndpointResponseHandlerGenerator:
             writer.write_line("case _:")
             writer.indent()
             context.add_import(f"{context.core_package_name}.exceptions", "HTTPError")
+            self._write_error_body_read(writer, strategy)
             writer.write_line(
                 'raise HTTPError(response=response, message="Unhandled status code", status_code=response.status_code)'
             )
@@ -528,6 +592,15 @@ class EndpointResponseHandlerGenerator:
         writer.write_line("raise RuntimeError('Unexpected code path')  # pragma: no cover")
         writer.write_line("")  # Add a blank line for readability
 
+    def _write_error_body_read(self, writer: CodeWriter, strategy: ResponseStrategy) -> None:
+        """Read the body of a streamed error response before raising.
+
+        Streaming operations receive the response from `open_stream()`, usually with an unread body.
+        Exception aliases access `response.text`, so the (typically small) error body is read first.
+        """
+        if strategy.is_streaming:
+            writer.write_line("await response.aread()")
+
     def _write_strategy_based_return(
         self,
         writer: CodeWriter,
@@ -541,7 +614,16 @@ class EndpointResponseHandlerGenerator:
         """
         if strategy.is_streaming:
             # Handle streaming responses
-            if "AsyncIterator[bytes]" in strategy.return_type:
+            if strategy.array_item_type is not None:
+                # JSON arrays are parsed incrementally, holding at most one item in memory
+                context.add_import(f"{context.core_package_name}.streaming_helpers", "iter_json_array")
+                context.add_typing_imports_for_type(strategy.array_item_type)
+                writer.write_line(f"async for item in iter_json_array(response, {strategy.array_item_type}):")
+                writer.indent()
+                writer.write_line("yield item")
+                writer.dedent()
+                writer.write_line("return  # Explicit return for async generator")
+            elif "AsyncIterator[bytes]" in strategy.return_type:
                 context.add_import(f"{context.core_package_name}.streaming_helpers", "iter_bytes")
                 writer.write_line("async for chunk in iter_bytes(response):")
                 writer.indent()
@@ -559,18 +641,25 @@ class EndpointResponseHandlerGenerator:
                 writer.write_line("return  # Explicit return for async generator")
             return
 
-        # Use response.json() directly - no automatic unwrapping
-        data_expr = "response.json()"
-
         # Handle responses using the schema
+        if strategy.return_type.startswith("Union[") and strategy.content_type_mapping:
+            # Multi-content-type Union: generate Content-Type header checking code
+            self._write_content_type_conditional_handling(writer, context, strategy)
+            return
+
+        # Models and lists of models are decoded straight from the body bytes
+        model_decode_code = self._get_model_decode_code(strategy.return_type, context)
+        if model_decode_code is not None:
+            self._write_model_decode_return(writer, strategy.return_type, model_decode_code, context)
+            self._register_imports_for_type(strategy.return_type, context)
+            return
+
+        # Decode the full body directly - no automatic unwrapping
+        data_expr = self._json_body_expr(context)
+
         if strategy.return_type.startswith("Union["):
-            # Check if this is a multi-content-type Union (has content_type_mapping)
-            if strategy.content_type_mapping:
-                # Generate Content-Type header checking code
-                self._write_content_type_conditional_handling(writer, context, strategy)
-            else:
-                # Traditional Union handling with try/except fallback
-                self._write_union_response_handling(writer, context, strategy.return_type, data_expr)
+            # Traditional Union handling with try/except fallback
+            self._write_union_response_handling(writer, context, strategy.return_type, data_expr)
         elif self._should_use_cattrs_structure(strategy.return_type):
             # Register cattrs import
             context.add_import(f"{context.core_package_name}.cattrs_converter", "structure_from_dict")
@@ -702,11 +791,17 @@ class EndpointResponseHandlerGenerator:
             elif self._should_use_cattrs_structure(python_type):
                 # Complex type - use cattrs deserialization
                 context.add_typing_imports_for_type(python_type)
-                deserialization_code = self._get_cattrs_deserialization_code(python_type, "response.json()")
-                writer.write_line(f"return {deserialization_code}")
+                model_decode_code = self._get_model_decode_code(python_type, context)
+                if model_decode_code is not None:
+                    self._write_model_decode_return(writer, python_type, model_decode_code, context)
+                else:
+                    deserialization_code = self._get_cattrs_deserialization_code(
+                        python_type, self._json_body_expr(context)
+                    )
+                    writer.write_line(f"return {deserialization_code}")
             else:
                 # Simple type - use cast
                 context.add_import("typing", "cast")
-                writer.write_line(f"return cast({python_type}, response.json())")
+                writer.write_line(f"return cast({python_type}, {self._json_body_expr(context)})")
 
             writer.dedent()
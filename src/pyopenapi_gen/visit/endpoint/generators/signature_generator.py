@@ -11,7 +11,7 @@ from pyopenapi_gen.core.utils import NameSanitizer
 from pyopenapi_gen.core.writers.code_writer import CodeWriter
 
 # Import necessary helpers from endpoint_utils
-from pyopenapi_gen.helpers.endpoint_utils import get_param_type
+from pyopenapi_gen.helpers.endpoint_utils import get_param_type, get_timeout_param_name
 from pyopenapi_gen.types.strategies.response_strategy import ResponseStrategy
 
 if TYPE_CHECKING:
@@ -72,6 +72,8 @@ class EndpointMethodSignatureGenerator:
                 # (e.g., enum-typed params with string defaults)
                 arg_str += " = None"
             args.append(arg_str)
+        # Deadline of the whole call, defaulting to the operation's (x-timeout / --operation-timeout)
+        args.extend(["*", f"{get_timeout_param_name(op)}: float | None = {op.timeout!r}"])
 
         actual_return_type = return_type
         writer.write_function_signature(
@@ -0,0 +1,278 @@
+"""
+Generates ahead-of-time JSON codec functions for dataclass models.
+
+With the ``--model-codecs`` option each generated dataclass module also gets straight-line
+``_<model>_from_json`` / ``_<model>_to_json`` functions. Field renames, nested model calls and
+scalar codecs are inlined at generation time, so structuring a payload needs no runtime
+reflection. The functions are registered with the core ``register_model_codec`` so that
+``structure_from_dict``/``unstructure_to_dict`` dispatch to them with a dict lookup.
+"""
+
+import re
+from typing import List, NamedTuple
+
+from pyopenapi_gen import IRSchema
+from pyopenapi_gen.context.render_context import RenderContext
+from pyopenapi_gen.core.writers.code_writer import CodeWriter
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_QUOTED_IDENTIFIER_RE = re.compile(r"^[\"']([A-Za-z_][A-Za-z0-9_]*)[\"']$")
+
+# Scalars cattrs structures by calling the type itself, and leaves untouched when unstructuring.
+_CALLABLE_SCALARS = {"str", "int", "float", "bool"}
+
+
+class CodecField(NamedTuple):
+    """One dataclass field as seen by the codec generator."""
+
+    name: str
+    json_key: str
+    type_hint: str
+    default_expr: str | None
+
+
+class ModelCodecGenerator:
+    """Generates the ``_from_json``/``_to_json`` functions for one dataclass."""
+
+    def __init__(self, all_schemas: dict[str, IRSchema] | None):
+        self.all_schemas = all_schemas if all_schemas is not None else {}
+        # Generated class name -> schema, to tell enums apart from other named models
+        self._schemas_by_class_name: dict[str, IRSchema] = {}
+        for schema in self.all_schemas.values():
+            class_name = schema.generation_name or schema.name
+            if class_name:
+                self._schemas_by_class_name.setdefault(class_name, schema)
+
+    def generate(self, class_name: str, fields: List[CodecField], context: RenderContext) -> str:
+        """
+        Render the codec functions and their registration for ``class_name``.
+
+        Contracts:
+            Pre-conditions:
+                - ``class_name`` is the name of a dataclass rendered in the same module.
+                - ``fields`` lists every dataclass field with its JSON key.
+            Post-conditions:
+                - Returns code defining both functions and calling ``register_model_codec``.
+                - The core imports the code relies on are registered in ``context``.
+        """
+        if not class_name:
+            raise ValueError("Class name cannot be empty for codec generation.")
+
+        self._context = context
+        self._class_name = class_name
+        self._needs_converter = False
+        core_module = f"{context.core_package_name}.cattrs_converter"
+        context.add_import("typing", "Any")
+        context.add_import(core_module, "register_model_codec")
+
+        prefix = f"_{class_name.lower()}"
+        writer = CodeWriter()
+
+        writer.write_line(f"def {prefix}_from_json(data: dict[str, Any]) -> {class_name}:")
+        writer.indent()
+        writer.write_line(f'"""Build {class_name} from a decoded JSON object (generated; no runtime reflection)."""')
+        if fields:
+            writer.write_line(f"return {class_name}(")
+            writer.indent()
+            for codec_field in fields:
+                writer.write_line(f"{codec_field.name}={self._structure_field(codec_field)},")
+            writer.dedent()
+            writer.write_line(")")
+        else:
+            writer.write_line(f"return {class_name}()")
+        writer.dedent()
+        writer.write_line("")
+        writer.write_line("")
+
+        writer.write_line(f"def {prefix}_to_json(obj: {class_name}) -> dict[str, Any]:")
+        writer.indent()
+        writer.write_line(f'"""Convert {class_name} into a JSON-ready dict (generated; no runtime reflection)."""')
+        if fields:
+            writer.write_line("return {")
+            writer.indent()
+            for codec_field in fields:
+                writer.write_line(f'"{codec_field.json_key}": {self._unstructure_field(codec_field)},')
+            writer.dedent()
+            writer.write_line("}")
+        else:
+            writer.write_line("return {}")
+        writer.dedent()
+        writer.write_line("")
+        writer.write_line("")
+
+        writer.write_line(f"register_model_codec({class_name}, {prefix}_from_json, {prefix}_to_json)")
+
+        if self._needs_converter:
+            context.add_import(core_module, "converter")
+            context.add_import(core_module, "model_field_type")
+        return writer.get_code()
+
+    # --- Structuring -----------------------------------------------------------------------
+
+    def _structure_field(self, codec_field: CodecField) -> str:
+        """Expression that builds the field value from ``data``."""
+        key = f'"{codec_field.json_key}"'
+        present = f"data[{key}]"
+
+        if codec_field.default_expr is None:
+            # Required: a missing key raises, and the reflective path reports it
+            value_expr = self._structure_value(present, codec_field.type_hint, depth=0)
+            if value_expr is None:
+                value_expr = self._structure_fallback(present, codec_field.name)
+            return value_expr
+
+        if codec_field.default_expr == "None":
+            # Absent and null both give None
+            base, _ = _split_optional(codec_field.type_hint)
+            inner = self._structure_value(present, base, depth=0)
+            if inner is None:
+                inner = self._structure_fallback(present, codec_field.name)
+            return f"None if data.get({key}) is None else {inner}"
+
+        value_expr = self._structure_value(present, codec_field.type_hint, depth=0)
+        if value_expr is None:
+            value_expr = self._structure_fallback(present, codec_field.name)
+        return f"({value_expr}) if {key} in data else {_default_value(codec_field.default_expr)}"
+
+    def _structure_value(self, expr: str, type_hint: str, depth: int) -> str | None:
+        """Inline structuring expression for ``expr`` of ``type_hint``, or None if not inlinable."""
+        base, nullable = _split_optional(type_hint)
+        inner = self._structure_non_null(expr, base, depth)
+        if inner is None:
+            return None
+        if nullable:
+            return f"None if {expr} is None else {inner}"
+        return inner
+
+    def _structure_non_null(self, expr: str, type_hint: str, depth: int) -> str | None:
+        type_hint = _unquote(type_hint)
+        if type_hint in _CALLABLE_SCALARS:
+            return f"{type_hint}({expr})"
+        if type_hint == "Any":
+            return expr
+        if type_hint in ("datetime", "date"):
+            self._context.add_import(f"{self._context.core_package_name}.cattrs_converter", f"structure_{type_hint}")
+            return f"structure_{type_hint}({expr}, {type_hint})"
+        if type_hint == "bytes":
+            self._context.add_import(
+                f"{self._context.core_package_name}.cattrs_converter", "structure_with_base64_bytes"
+            )
+            return f"structure_with_base64_bytes({expr}, bytes)"
+        item_type = _list_item_type(type_hint)
+        if item_type is not None:
+            item_var = f"item{depth}"
+            item_expr = self._structure_value(item_var, item_type, depth + 1)
+            if item_expr is None:
+                return None
+            return f"[{item_expr} for {item_var} in {expr}]"
+        if _IDENTIFIER_RE.match(type_hint) and type_hint in self._schemas_by_class_name:
+            if self._schemas_by_class_name[type_hint].enum:
+                return f"{type_hint}({expr})"
+            self._context.add_import(f"{self._context.core_package_name}.cattrs_converter", "structure_model")
+            return f"structure_model({expr}, {type_hint})"
+        return None
+
+    def _structure_fallback(self, expr: str, field_name: str) -> str:
+        """Structure through the converter using the field's resolved (Annotated-preserving) type."""
+        self._needs_converter = True
+        return f'converter.structure({expr}, model_field_type({self._class_name}, "{field_name}"))'
+
+    # --- Unstructuring ---------------------------------------------------------------------
+
+    def _unstructure_field(self, codec_field: CodecField) -> str:
+        """Expression that converts ``obj.<field>`` into its JSON value."""
+        expr = f"obj.{codec_field.name}"
+        value_expr = self._unstructure_value(expr, codec_field.type_hint, depth=0)
+        if value_expr is None:
+            self._needs_converter = True
+            value_expr = f'converter.unstructure({expr}, model_field_type({self._class_name}, "{codec_field.name}"))'
+        return value_expr
+
+    def _unstructure_value(self, expr: str, type_hint: str, depth: int) -> str | None:
+        base, nullable = _split_optional(type_hint)
+        inner = self._unstructure_non_null(expr, base, depth)
+        if inner is None:
+            return None
+        if nullable and inner != expr:
+            return f"None if {expr} is None else {inner}"
+        return inner
+
+    def _unstructure_non_null(self, expr: str, type_hint: str, depth: int) -> str | None:
+        type_hint = _unquote(type_hint)
+        if type_hint in _CALLABLE_SCALARS or type_hint == "Any":
+            return expr
+        if type_hint in ("datetime", "date"):
+            return f"{expr}.isoformat()"
+        if type_hint == "bytes":
+            self._context.add_import(
+                f"{self._context.core_package_name}.cattrs_converter", "unstructure_bytes_to_base64"
+            )
+            return f"unstructure_bytes_to_base64({expr})"
+        item_type = _list_item_type(type_hint)
+        if item_type is not None:
+            item_var = f"item{depth}"
+            item_expr = self._unstructure_value(item_var, item_type, depth + 1)
+            if item_expr is None:
+                return None
+            if item_expr == item_var:
+                return f"list({expr})"
+            return f"[{item_expr} for {item_var} in {expr}]"
+        if _IDENTIFIER_RE.match(type_hint) and type_hint in self._schemas_by_class_name:
+            if self._schemas_by_class_name[type_hint].enum:
+                return f"{expr}.value"
+            self._context.add_import(f"{self._context.core_package_name}.cattrs_converter", "unstructure_model")
+            return f"unstructure_model({expr})"
+        return None
+
+
+def _split_top_level(type_hint: str, separator: str) -> List[str]:
+    """Split ``type_hint`` on ``separator`` outside of brackets."""
+    parts: List[str] = []
+    depth = 0
+    current = ""
+    for char in type_hint:
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    parts.append(current.strip())
+    return parts
+
+
+def _split_optional(type_hint: str) -> tuple[str, bool]:
+    """Return (type without None, whether None was part of the type)."""
+    type_hint = type_hint.strip()
+    if type_hint.startswith("Optional[") and type_hint.endswith("]"):
+        return type_hint[len("Optional[") : -1].strip(), True
+    members = _split_top_level(type_hint, "|")
+    non_null = [member for member in members if member != "None"]
+    return " | ".join(non_null), len(non_null) != len(members)
+
+
+def _list_item_type(type_hint: str) -> str | None:
+    for prefix in ("List[", "list["):
+        if type_hint.startswith(prefix) and type_hint.endswith("]"):
+            inner = type_hint[len(prefix) : -1]
+            if len(_split_top_level(inner, ",")) == 1:
+                return inner.strip()
+    return None
+
+
+def _unquote(type_hint: str) -> str:
+    """Forward references to models in the same module are quoted; the codec runs after import."""
+    match = _QUOTED_IDENTIFIER_RE.match(type_hint)
+    return match.group(1) if match else type_hint
+
+
+def _default_value(default_expr: str) -> str:
+    """Turn a dataclass default expression into the value used when the key is absent."""
+    if default_expr == "field(default_factory=list)":
+        return "[]"
+    if default_expr == "field(default_factory=dict)":
+        return "{}"
+    return default_expr
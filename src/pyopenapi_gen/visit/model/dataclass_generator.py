@@ -13,6 +13,8 @@ from pyopenapi_gen.core.writers.python_construct_renderer import PythonConstruct
 from pyopenapi_gen.helpers.type_resolution.finalizer import TypeFinalizer
 from pyopenapi_gen.types.services.type_service import UnifiedTypeService
 
+from .codec_generator import CodecField, ModelCodecGenerator
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,7 @@ class DataclassGenerator:
         self.renderer = renderer
         self.all_schemas = all_schemas if all_schemas is not None else {}
         self.type_service = UnifiedTypeService(self.all_schemas)
+        self.codec_generator = ModelCodecGenerator(self.all_schemas)
 
     def _is_arbitrary_json_object(self, schema: IRSchema) -> bool:
         """
@@ -111,6 +114,17 @@ class DataclassGenerator:
 
         return code
 
+    @staticmethod
+    def _setitem_method(value_type: str, context: RenderContext) -> str:
+        """The `__setitem__` of a dict wrapper; frozen wrappers (--model-frozen) have none."""
+        if context.model_frozen:
+            return ""
+        return f'''    def __setitem__(self, key: str, value: {value_type}) -> None:
+        """Set value for key."""
+        self._data[key] = value
+
+'''
+
     def _generate_untyped_wrapper_class(
         self,
         class_name: str,
@@ -118,9 +132,15 @@ class DataclassGenerator:
         context: RenderContext,
     ) -> str:
         """Generate wrapper class for untyped additionalProperties (Any values)."""
+        if context.model_frozen:
+            untyped_example_setitem = ""
+            untyped_example_result = '{"key": "value"}'
+        else:
+            untyped_example_setitem = '\n        obj["new_key"] = "new_value"'
+            untyped_example_result = '{"key": "value", "new_key": "new_value"}'
         return f'''__all__ = ["{class_name}"]
 
-@dataclass
+{self.renderer.dataclass_decorator(context)}
 class {class_name}:
     """
     {description}
@@ -135,11 +155,10 @@ class {class_name}:
         obj = structure_from_dict({{"key": "value"}}, {class_name})
 
         # Access data
-        print(obj["key"])  # "value"
-        obj["new_key"] = "new_value"
+        print(obj["key"])  # "value"{untyped_example_setitem}
 
         # Serialize for API request
-        data = unstructure_to_dict(obj)  # {{"key": "value", "new_key": "new_value"}}
+        data = unstructure_to_dict(obj)  # {untyped_example_result}
     """
 
     _data: dict[str, Any] = field(default_factory=dict, repr=False)
@@ -152,11 +171,7 @@ class {class_name}:
         """Get value for key."""
         return self._data[key]
 
-    def __setitem__(self, key: str, value: Any) -> None:
-        """Set value for key."""
-        self._data[key] = value
-
-    def __contains__(self, key: str) -> bool:
+{self._setitem_method("Any", context)}    def __contains__(self, key: str) -> bool:
         """Check if key exists."""
         return key in self._data
 
@@ -222,7 +237,7 @@ converter.register_unstructure_hook({class_name}, _unstructure_{class_name.lower
 
         return f'''__all__ = ["{class_name}"]
 
-@dataclass
+{self.renderer.dataclass_decorator(context)}
 class {class_name}:
     """
     {description}
@@ -257,11 +272,7 @@ class {class_name}:
         """Get value for key."""
         return self._data[key]
 
-    def __setitem__(self, key: str, value: {value_type}) -> None:
-        """Set value for key."""
-        self._data[key] = value
-
-    def __contains__(self, key: str) -> bool:
+{self._setitem_method(value_type, context)}    def __contains__(self, key: str) -> bool:
         """Check if key exists."""
         return key in self._data
 
@@ -550,4 +561,14 @@ converter.register_unstructure_hook({class_name}, _unstructure_{class_name.lower
             if "field" not in context.import_collector.imports.get("dataclasses", set()):
                 raise RuntimeError("'field' import from dataclasses missing when default_factory is used.")
 
+        if context.model_codecs:
+            # Ahead-of-time _from_json/_to_json functions next to the dataclass (--model-codecs)
+            json_keys = {field_name: api_name for api_name, field_name in field_mappings.items()}
+            codec_fields = [
+                CodecField(name, json_keys.get(name, name), type_hint, default_expr)
+                for name, type_hint, default_expr, _ in fields_data
+            ]
+            codec_code = self.codec_generator.generate(class_name, codec_fields, context)
+            rendered_code = f"{rendered_code}\n\n\n{codec_code}"
+
         return rendered_code
@@ -131,3 +131,120 @@ async def test_oauth2_auth__refresh_callback__updates_token() -> None:
     # Token should be updated for next call
     result2 = await auth.authenticate_request({})
     assert result2["headers"]["Authorization"] == "Bearer newtoken"
+
+
+@pytest.mark.asyncio
+async def test_oauth2_auth__token_with_expiry__refreshes_only_inside_skew_window() -> None:
+    """
+    Scenario:
+        OAuth2Auth holds a token with a known expiry and a refresh callback returning OAuth2Token.
+    Expected Outcome:
+        No refresh happens while the token is valid; a single refresh happens once the clock
+        enters the skew window, and the refreshed token's expiry is honoured afterwards.
+    """
+    from pyopenapi_gen.core.auth.plugins import OAuth2Auth, OAuth2Token
+
+    now = [1000.0]
+    calls: list[str] = []
+
+    async def refresh_cb(old_token: str) -> OAuth2Token:
+        calls.append(old_token)
+        return OAuth2Token("fresh", expires_at=now[0] + 3600)
+
+    auth = OAuth2Auth("initial", refresh_callback=refresh_cb, expires_at=1100.0, refresh_skew=30.0)
+    auth.token_manager._clock = lambda: now[0]
+
+    result = await auth.authenticate_request({})
+    assert result["headers"]["Authorization"] == "Bearer initial"
+    assert calls == []
+
+    now[0] = 1075.0  # Inside the 30s skew window before expiry
+    result = await auth.authenticate_request({})
+    assert result["headers"]["Authorization"] == "Bearer fresh"
+
+    result = await auth.authenticate_request({})
+    assert result["headers"]["Authorization"] == "Bearer fresh"
+    assert calls == ["initial"]
+
+
+@pytest.mark.asyncio
+async def test_oauth2_token_manager__concurrent_stale_requests__share_single_refresh() -> None:
+    """
+    Scenario:
+        Many coroutines request a token at the same time while it is expired.
+    Expected Outcome:
+        The refresh callback runs exactly once and every caller receives the refreshed token.
+    """
+    import asyncio
+
+    from pyopenapi_gen.core.auth.plugins import OAuth2Token, OAuth2TokenManager
+
+    calls = 0
+
+    async def refresh_cb(old_token: str) -> OAuth2Token:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return OAuth2Token(f"token-{calls}", expires_at=float("inf"))
+
+    manager = OAuth2TokenManager("expired", refresh_callback=refresh_cb, expires_at=0.0)
+
+    tokens = await asyncio.gather(*(manager.get_token() for _ in range(20)))
+
+    assert calls == 1
+    assert set(tokens) == {"token-1"}
+    assert not manager.needs_refresh()
+
+
+@pytest.mark.asyncio
+async def test_header_plugins__shared_headers_dict__left_unchanged() -> None:
+    """
+    Scenario:
+        BearerAuth, HeadersAuth, OAuth2Auth and a CompositeAuth of them authenticate request
+        arguments whose headers dict the caller reuses between requests.
+    Expected Outcome:
+        Each returns a new headers dict with its headers; the caller's dict is never written to.
+    """
+    from pyopenapi_gen.core.auth.base import CompositeAuth
+    from pyopenapi_gen.core.auth.plugins import OAuth2Auth
+
+    shared_headers = {"X-Client": "demo"}
+    plugins = [
+        BearerAuth("tok"),
+        HeadersAuth({"X-A": "1"}),
+        OAuth2Auth("oauth"),
+        CompositeAuth(BearerAuth("tok"), HeadersAuth({"X-A": "1"})),
+    ]
+
+    for plugin in plugins:
+        result = await plugin.authenticate_request({"headers": shared_headers})
+        assert result["headers"] is not shared_headers
+        assert result["headers"]["X-Client"] == "demo"
+
+    assert shared_headers == {"X-Client": "demo"}
+
+
+@pytest.mark.asyncio
+async def test_oauth2_auth__attributes_assigned__update_the_token_manager() -> None:
+    """
+    Scenario:
+        The access_token and refresh_callback of an OAuth2Auth are assigned after construction.
+    Expected Outcome:
+        The next request uses the assigned token, and the assigned callback refreshes it.
+    """
+    from pyopenapi_gen.core.auth.plugins import OAuth2Auth
+
+    async def refresh_cb(old_token: str) -> str:
+        return f"{old_token}-refreshed"
+
+    auth = OAuth2Auth("initial")
+
+    auth.access_token = "assigned"
+    result = await auth.authenticate_request({})
+    assert result["headers"]["Authorization"] == "Bearer assigned"
+    assert auth.token_manager.token.access_token == "assigned"
+
+    auth.refresh_callback = refresh_cb
+    result = await auth.authenticate_request({})
+    assert auth.refresh_callback is refresh_cb
+    assert result["headers"]["Authorization"] == "Bearer assigned-refreshed"
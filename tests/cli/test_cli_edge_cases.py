@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -98,3 +99,33 @@ def test_cli_no_args_shows_help_and_exits_cleanly() -> None:
         import pytest
 
         pytest.skip("CLI modules not available due to environment setup")
+
+
+def test_cli_operation_timeout__invalid_value__usage_error(tmp_path: Path) -> None:
+    """
+    Scenario:
+        Run the CLI with `--operation-timeout get_status=soon`.
+    Expected Outcome:
+        The option is rejected as a usage error (exit code 2) before anything is generated.
+    """
+    # Arrange
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(MIN_SPEC))
+
+    # Act
+    result = CliRunner().invoke(
+        app,
+        [
+            str(spec_file),
+            "--project-root",
+            str(tmp_path),
+            "--output-package",
+            "client",
+            "--operation-timeout",
+            "get_status=soon",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 2
+    assert not (tmp_path / "client").exists()
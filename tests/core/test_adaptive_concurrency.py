@@ -0,0 +1,179 @@
+"""
+Tests for adaptive (AIMD) per-origin concurrency limits (core/adaptive_concurrency.py).
+"""
+
+import asyncio
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.adaptive_concurrency import AdaptiveConcurrency
+from pyopenapi_gen.core.http_transport import HttpxTransport
+
+ORIGIN = "https://api.example.com"
+
+
+def _transport(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> HttpxTransport:
+    """An HttpxTransport with an adaptive concurrency controller whose requests are answered by `handler`."""
+    transport = HttpxTransport(base_url=ORIGIN, concurrency=AdaptiveConcurrency(**kwargs))
+    transport._client._transport = httpx.MockTransport(handler)
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_request__steady_latency__limit_grows_up_to_max_limit() -> None:
+    """
+    Scenario:
+        100 concurrent requests are answered in a steady 10 ms, starting from a limit of 2.
+    Expected Outcome:
+        The limit grows while latency stays near its minimum, never beyond max_limit, and the server
+        never sees more requests at once than the limit allowed.
+    """
+    # Arrange
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    transport = _transport(handler, initial_limit=2, max_limit=6, latency_tolerance=50.0)
+
+    # Act
+    responses = await asyncio.gather(*(transport.request("GET", "/items") for _ in range(100)))
+    stats = transport.concurrency_stats()[ORIGIN]
+    await transport.close()
+
+    # Assert
+    assert all(response.status_code == 200 for response in responses)
+    assert stats.limit == 6
+    assert (stats.increases, stats.decreases) == (4, 0)
+    assert (stats.in_flight, stats.queued) == (0, 0)
+    assert peak <= 6
+    assert stats.min_latency_seconds is not None and stats.min_latency_seconds >= 0.01
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", ["503", "timeout"])
+async def test_request__overload__limit_cut_once_per_episode(failure: str) -> None:
+    """
+    Scenario:
+        Eight concurrent requests are all answered with 503 or time out, and then one more request is.
+    Expected Outcome:
+        The eight concurrent failures halve the limit once, as they were sent under the same limit;
+        the later failure halves it again.
+    """
+
+    # Arrange
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        if failure == "timeout":
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(503)
+
+    transport = _transport(handler, initial_limit=8)
+
+    # Act
+    await asyncio.gather(*(transport.request("GET", "/items") for _ in range(8)), return_exceptions=True)
+    after_episode = transport.concurrency_stats()[ORIGIN]
+    await asyncio.gather(transport.request("GET", "/items"), return_exceptions=True)
+    after_second = transport.concurrency_stats()[ORIGIN]
+    await transport.close()
+
+    # Assert
+    assert (after_episode.limit, after_episode.decreases, after_episode.in_flight) == (4, 1, 0)
+    assert (after_second.limit, after_second.decreases) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_release__latency_spike__cuts_limit_to_min_limit_at_least() -> None:
+    """
+    Scenario:
+        Responses take 10 ms, then one takes 100 ms (beyond twice the minimum), then many more are slow.
+    Expected Outcome:
+        The spike halves the limit, and repeated spikes never cut it below min_limit.
+    """
+    # Arrange
+    controller = AdaptiveConcurrency(initial_limit=8, min_limit=3)
+
+    # Act
+    started = await controller.acquire(ORIGIN)
+    controller.release(ORIGIN, started, answered=started + 0.01)
+    started = await controller.acquire(ORIGIN)
+    controller.release(ORIGIN, started, answered=started + 0.1)
+    after_spike = controller.limit(ORIGIN)
+    for _ in range(5):
+        started = await controller.acquire(ORIGIN)
+        controller.release(ORIGIN, started, answered=started + 1.0)
+
+    # Assert
+    assert after_spike == 4
+    assert controller.limit(ORIGIN) == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire__limit_reached__waiters_served_in_order_and_cancellation_frees_the_queue() -> None:
+    """
+    Scenario:
+        With a limit of 1, a slot is held while three more requests wait; the last one is cancelled.
+    Expected Outcome:
+        The waiters are queued and receive the slot in arrival order, the cancelled one leaves the
+        queue, and other origins are not limited by it.
+    """
+    # Arrange
+    controller = AdaptiveConcurrency(initial_limit=1)
+    order: list[int] = []
+
+    async def use_slot(index: int) -> None:
+        started = await controller.acquire(ORIGIN)
+        order.append(index)
+        await asyncio.sleep(0.005)
+        controller.release(ORIGIN, started)
+
+    held = await controller.acquire(ORIGIN)
+    waiters = [asyncio.ensure_future(use_slot(index)) for index in range(3)]
+    await asyncio.sleep(0)
+
+    # Act
+    queued = controller.stats()[ORIGIN].queued
+    waiters[2].cancel()
+    other_origin = await asyncio.wait_for(controller.acquire("https://other.example.com"), 0.1)
+    controller.release(ORIGIN, held)
+    await asyncio.gather(*waiters, return_exceptions=True)
+    stats = controller.stats()[ORIGIN]
+
+    # Assert
+    assert queued == 3
+    assert other_origin > 0
+    assert order == [0, 1]
+    assert (stats.in_flight, stats.queued) == (0, 0)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"min_limit": 0}, {"min_limit": 5, "max_limit": 2}, {"backoff": 1.0}], ids=["zero", "min>max", "backoff"]
+)
+def test_init__invalid_limits__raise_value_error(kwargs: dict[str, Any]) -> None:
+    """
+    Scenario:
+        A controller is created with a minimum limit below 1 or above the maximum, or a backoff of 1.
+    Expected Outcome:
+        ValueError is raised.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(**kwargs)
+
+
+def test_concurrency_stats__no_controller__empty() -> None:
+    """
+    Scenario:
+        An HttpxTransport is created without an adaptive concurrency controller.
+    Expected Outcome:
+        No limits are reported.
+    """
+    # Act / Assert
+    assert HttpxTransport(base_url=ORIGIN).concurrency_stats() == {}
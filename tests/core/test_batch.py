@@ -0,0 +1,164 @@
+"""
+Tests for bounded-concurrency batch execution (core/batch.py).
+"""
+
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.batch import Batch, BatchResult
+from pyopenapi_gen.core.http_transport import HttpxTransport
+
+
+class Tracker:
+    """Counts the calls running at once."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def call(self, value: int, delay: float = 0.01) -> int:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(delay)
+            if value < 0:
+                raise ValueError(f"bad value {value}")
+            return value * 10
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_batch__many_calls__bounded_concurrency_ordered_results_and_captured_errors() -> None:
+    """
+    Scenario:
+        20 calls, two of which raise, run in a batch limited to 4 concurrent calls.
+    Expected Outcome:
+        No more than 4 calls run at once, results are in submission order, and the failing calls
+        are reported as errors without affecting the others.
+    """
+    # Arrange
+    tracker = Tracker()
+    values = [i if i not in (3, 7) else -i for i in range(20)]
+
+    # Act
+    async with Batch(max_concurrency=4) as batch:
+        handles = [batch.submit(tracker.call(value)) for value in values]
+    results = batch.results()
+
+    # Assert
+    assert tracker.peak == 4
+    assert len(batch) == 20
+    assert [r.index for r in results] == list(range(20))
+    assert [r.value for r in results if r.ok] == [v * 10 for v in values if v >= 0]
+    assert [str(r.error) for r in results if not r.ok] == ["bad value -3", "bad value -7"]
+    assert await handles[5] == BatchResult(5, value=50)
+    with pytest.raises(ValueError, match="bad value -3"):
+        results[3].unwrap()
+
+
+@pytest.mark.asyncio
+async def test_batch__as_completed__yields_results_as_calls_finish() -> None:
+    """
+    Scenario:
+        Calls with decreasing durations are submitted and their results streamed.
+    Expected Outcome:
+        Results arrive in completion order, carrying their submission index.
+    """
+    # Arrange
+    tracker = Tracker()
+
+    # Act
+    async with Batch(max_concurrency=10) as batch:
+        for i, delay in enumerate([0.06, 0.04, 0.02]):
+            batch.submit(tracker.call(i, delay))
+        streamed = [result async for result in batch.as_completed()]
+
+    # Assert
+    assert [r.index for r in streamed] == [2, 1, 0]
+    assert [r.value for r in streamed] == [20, 10, 0]
+
+
+@pytest.mark.asyncio
+async def test_batch__block_raises__cancels_pending_calls_without_leaking_coroutines() -> None:
+    """
+    Scenario:
+        The `async with` block raises while one call runs and others wait for a slot.
+    Expected Outcome:
+        The error propagates, every unfinished call is reported as cancelled, and the coroutines
+        that never started are closed (no "never awaited" warning).
+    """
+    # Arrange
+    tracker = Tracker()
+    calls = [tracker.call(i, delay=10) for i in range(3)]
+
+    # Act
+    with pytest.raises(RuntimeError, match="abort"):
+        async with Batch(max_concurrency=1) as batch:
+            for call in calls:
+                batch.submit(call)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("abort")
+    results = batch.results()
+
+    # Assert
+    assert [isinstance(r.error, asyncio.CancelledError) for r in results] == [True, True, True]
+    assert [inspect.getcoroutinestate(call) for call in calls] == [inspect.CORO_CLOSED] * 3
+    assert tracker.running == 0
+
+
+@pytest.mark.asyncio
+async def test_batch__per_host_limit__bounds_requests_in_flight_per_host() -> None:
+    """
+    Scenario:
+        A batch with max_concurrency=12 and per_host_limit=2 sends 6 requests to each of two hosts
+        through one HttpxTransport.
+    Expected Outcome:
+        At most 2 requests are in flight to each host at any time; requests outside a batch are
+        not limited.
+    """
+    # Arrange
+    in_flight: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peaks[host] = max(peaks.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    transport = HttpxTransport(base_url="https://a.example.com")
+    transport._client._transport = httpx.MockTransport(handler)
+    urls = ["/items", "https://b.example.com/items"] * 6
+
+    # Act
+    async with Batch(max_concurrency=12, per_host_limit=2) as batch:
+        for url in urls:
+            batch.submit(transport.request("GET", url))
+    batched_peaks = dict(peaks)
+    peaks.clear()
+    await asyncio.gather(*(transport.request("GET", "/items") for _ in range(4)))
+    await transport.close()
+
+    # Assert
+    assert all(r.ok and r.value.status_code == 200 for r in batch.results())
+    assert batched_peaks == {"a.example.com": 2, "b.example.com": 2}
+    assert peaks == {"a.example.com": 4}
+
+
+def test_batch__invalid_limits__raise_value_error() -> None:
+    """
+    Scenario:
+        A batch is created with no concurrency or a per-host limit below 1.
+    Expected Outcome:
+        ValueError is raised immediately.
+    """
+    with pytest.raises(ValueError, match="max_concurrency"):
+        Batch(max_concurrency=0)
+    with pytest.raises(ValueError, match="per_host_limit"):
+        Batch(per_host_limit=0)
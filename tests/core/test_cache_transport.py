@@ -0,0 +1,278 @@
+"""
+Tests for the HTTP caching transport (core/cache_transport.py).
+"""
+
+import asyncio
+import gzip
+from pathlib import Path
+from typing import Callable
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.cache_transport import CACHE_STATUS_EXTENSION, CacheEntry, CachingTransport, MemoryCacheStore
+from pyopenapi_gen.core.http_transport import HttpxTransport
+
+URL = "https://api.example.com/countries"
+
+
+def _caching_transport(
+    handler: Callable[[httpx.Request], httpx.Response], bearer_token: str | None = None, **kwargs: object
+) -> tuple[CachingTransport, list[httpx.Request]]:
+    """A CachingTransport over an HttpxTransport whose requests are answered by `handler`."""
+    requests: list[httpx.Request] = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    inner = HttpxTransport(base_url="https://api.example.com", bearer_token=bearer_token)
+    inner._client._transport = httpx.MockTransport(recording_handler)
+    return CachingTransport(inner, **kwargs), requests  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_request__fresh_response__is_served_from_cache_without_network() -> None:
+    """
+    Scenario:
+        A gzip-encoded response with `Cache-Control: max-age=60` is requested twice.
+    Expected Outcome:
+        The second request is a cache hit with the decoded body and no transfer headers, and only
+        one request reaches the network.
+    """
+    # Arrange
+    body = b'["fr", "nl"]'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Cache-Control": "max-age=60", "Content-Encoding": "gzip", "Content-Type": "application/json"}
+        return httpx.Response(200, headers=headers, content=gzip.compress(body))
+
+    transport, requests = _caching_transport(handler)
+
+    # Act
+    first = await transport.request("GET", URL, params={"region": "eu"})
+    second = await transport.request("GET", URL, params={"region": "eu"})
+    other_params = await transport.request("GET", URL, params={"region": "us"})
+    await transport.close()
+
+    # Assert
+    assert first.extensions[CACHE_STATUS_EXTENSION] == "miss"
+    assert second.extensions[CACHE_STATUS_EXTENSION] == "hit"
+    assert second.json() == ["fr", "nl"]
+    assert "content-encoding" not in second.headers
+    assert other_params.extensions[CACHE_STATUS_EXTENSION] == "miss"
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request__stale_response_with_etag__revalidates_and_turns_304_into_hit() -> None:
+    """
+    Scenario:
+        A response with `Cache-Control: no-cache` and an ETag is requested again; the server
+        answers the conditional request with 304 Not Modified.
+    Expected Outcome:
+        The second request carries If-None-Match, and the client receives the stored body with status 200.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+        return httpx.Response(200, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}, json={"name": "Belgium"})
+
+    transport, requests = _caching_transport(handler)
+
+    # Act
+    await transport.request("GET", URL)
+    revalidated = await transport.request("GET", URL, headers={"X-Request-Id": "2"})
+    await transport.close()
+
+    # Assert
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"']
+    assert requests[1].headers["x-request-id"] == "2"
+    assert revalidated.status_code == 200
+    assert revalidated.extensions[CACHE_STATUS_EXTENSION] == "revalidated"
+    assert revalidated.json() == {"name": "Belgium"}
+
+
+@pytest.mark.asyncio
+async def test_request__within_stale_while_revalidate__serves_stale_and_refreshes_in_background() -> None:
+    """
+    Scenario:
+        An expired response allows `stale-while-revalidate=60`; the resource has changed on the server.
+    Expected Outcome:
+        The stale body is returned immediately while one background request stores the new one,
+        which the following request receives.
+    """
+    # Arrange
+    versions = iter([b'"v1"', b'"v2"', b'"v3"'])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"Cache-Control": "max-age=0, stale-while-revalidate=60"}, content=next(versions)
+        )
+
+    transport, requests = _caching_transport(handler)
+
+    # Act
+    await transport.request("GET", URL)
+    stale = [await transport.request("GET", URL), await transport.request("GET", URL)]
+    await asyncio.sleep(0.01)  # Let the background revalidation finish
+    refreshed = await transport.request("GET", URL)
+    await asyncio.sleep(0.01)
+    await transport.close()
+
+    # Assert
+    assert [r.extensions[CACHE_STATUS_EXTENSION] for r in stale] == ["stale", "stale"]
+    assert [r.json() for r in stale] == ["v1", "v1"]
+    assert refreshed.json() == "v2"
+    assert len(requests) == 3  # Initial fetch and one revalidation per stale period
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, request_headers, response_headers",
+    [
+        ("GET", {}, {"Cache-Control": "no-store, max-age=60"}),
+        ("GET", {}, {}),
+        ("GET", {"Cache-Control": "no-store"}, {"Cache-Control": "max-age=60"}),
+        ("POST", {}, {"Cache-Control": "max-age=60"}),
+    ],
+    ids=["no-store-response", "no-freshness-or-validator", "no-store-request", "post"],
+)
+async def test_request__uncacheable__always_reaches_the_network(
+    method: str, request_headers: dict[str, str], response_headers: dict[str, str]
+) -> None:
+    """
+    Scenario:
+        Responses forbid storing, carry neither freshness nor validators, or answer a request that
+        forbids storing or is not a GET.
+    Expected Outcome:
+        Every request is sent to the network.
+    """
+    # Arrange
+    transport, requests = _caching_transport(lambda request: httpx.Response(200, headers=response_headers, json=[]))
+
+    # Act
+    for _ in range(2):
+        await transport.request(method, URL, headers=request_headers)
+    await transport.close()
+
+    # Assert
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request__vary_header__stores_per_request_header_value() -> None:
+    """
+    Scenario:
+        A response varies on Accept-Language and is requested in two languages.
+    Expected Outcome:
+        A request in another language than the stored response is a miss.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Cache-Control": "max-age=60", "Vary": "Accept-Language"}
+        return httpx.Response(200, headers=headers, json=request.headers["accept-language"])
+
+    transport, requests = _caching_transport(handler)
+
+    # Act
+    await transport.request("GET", URL, headers={"Accept-Language": "fr"})
+    french = await transport.request("GET", URL, headers={"Accept-Language": "fr"})
+    dutch = await transport.request("GET", URL, headers={"Accept-Language": "nl"})
+    await transport.close()
+
+    # Assert
+    assert (french.extensions[CACHE_STATUS_EXTENSION], french.json()) == ("hit", "fr")
+    assert (dutch.extensions[CACHE_STATUS_EXTENSION], dutch.json()) == ("miss", "nl")
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request__sqlite_tier__serves_responses_stored_by_a_previous_client(tmp_path: Path) -> None:
+    """
+    Scenario:
+        A client with a sqlite cache file stores a fresh response and is closed; a new client uses the same file.
+    Expected Outcome:
+        The new client answers from the file without a network request.
+    """
+    # Arrange
+    path = str(tmp_path / "http-cache.sqlite")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Cache-Control": "max-age=60", "ETag": '"a"'}, json={"id": 1})
+
+    first, first_requests = _caching_transport(handler, path=path)
+    await first.request("GET", URL)
+    await first.close()
+    second, second_requests = _caching_transport(handler, path=path)
+
+    # Act
+    response = await second.request("GET", URL)
+    await second.close()
+
+    # Assert
+    assert response.extensions[CACHE_STATUS_EXTENSION] == "hit"
+    assert response.json() == {"id": 1}
+    assert response.headers["etag"] == '"a"'
+    assert (len(first_requests), len(second_requests)) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_request__sqlite_tier__not_shared_between_credentials_of_the_inner_transport(tmp_path: Path) -> None:
+    """
+    Scenario:
+        Clients whose inner transports add different bearer tokens use one sqlite cache file in turn:
+        alice, then bob, then alice again.
+    Expected Outcome:
+        Bob's request reaches the network and gets his own response; alice's second client is answered
+        from the file with hers.
+    """
+    # Arrange
+    path = str(tmp_path / "http-cache.sqlite")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        user = request.headers["Authorization"].removeprefix("Bearer ")
+        return httpx.Response(200, headers={"Cache-Control": "max-age=60"}, json={"user": user})
+
+    bodies: list[tuple[object, str, int]] = []
+
+    # Act
+    for token in ("alice", "bob", "alice"):
+        transport, requests = _caching_transport(handler, bearer_token=token, path=path)
+        response = await transport.request("GET", URL)
+        await transport.close()
+        bodies.append((response.json()["user"], response.extensions[CACHE_STATUS_EXTENSION], len(requests)))
+
+    # Assert
+    assert bodies == [("alice", "miss", 1), ("bob", "miss", 1), ("alice", "hit", 0)]
+
+
+def test_memory_cache_store__over_max_bytes__evicts_least_recently_used() -> None:
+    """
+    Scenario:
+        Entries of 40 bytes are stored in a 100-byte memory tier, after the first one was read again.
+    Expected Outcome:
+        The least recently used entry is evicted, the total size stays within the limit, and an
+        entry larger than the limit is not stored.
+    """
+    # Arrange
+    store = MemoryCacheStore(max_bytes=100)
+
+    def entry(size: int) -> CacheEntry:
+        return CacheEntry(200, [], b"x" * size, {}, fresh_until=0.0, stale_until=0.0)
+
+    # Act
+    store.set("a", entry(40))
+    store.set("b", entry(40))
+    store.get("a")
+    store.set("c", entry(40))
+    store.set("huge", entry(101))
+
+    # Assert
+    assert store.get("b") is None
+    assert store.get("a") is not None and store.get("c") is not None
+    assert store.get("huge") is None
+    assert (len(store), store.size) == (2, 80)
@@ -6,10 +6,11 @@ Covers:
 - _structure_hooks_registered prevents re-registration across repeated calls (O(N) total)
 - User-registered exact hooks are not overwritten by our lower-priority predicate hooks
 - _unstructure_fn_cache is populated lazily on first call and reused thereafter
+- _union_dispatcher_cache compiles each Union type once (discriminator mapping resolved once)
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Annotated, Any, Union
 from unittest.mock import patch
 
 import pytest
@@ -281,3 +282,94 @@ def test_structure_fn__non_dict_input__raises_type_error_with_type_name(bad_inpu
 
     with pytest.raises(ValueError, match=expected_type_name):
         structure_from_dict(bad_input, SimpleTarget)
+
+
+# ---------------------------------------------------------------------------
+# _union_dispatcher_cache — compile once per Union type
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _DispatchCat:
+    kind: str
+    lives: int
+
+
+@dataclass
+class _DispatchDog:
+    kind: str
+    good: bool
+
+
+@dataclass(frozen=True)
+class _CountingDiscriminator:
+    """Discriminator metadata that counts how often its mapping is resolved."""
+
+    property_name: str
+    calls: list[int]
+
+    def get_mapping(self) -> dict[str, Any]:
+        self.calls.append(1)
+        return {"cat": "_DispatchCat", "dog": _DispatchDog}
+
+    def __hash__(self) -> int:
+        return hash(self.property_name)
+
+
+def _pet_items(count: int) -> list[dict[str, Any]]:
+    return [{"kind": "cat", "lives": 9} if i % 2 == 0 else {"kind": "dog", "good": True} for i in range(count)]
+
+
+def test_union_dispatcher__list_of_discriminated_items__mapping_resolved_once():
+    """
+    Scenario:
+        A list of discriminated union items is structured. The mapping contains both a
+        concrete class and a forward-ref name.
+
+    Expected Outcome:
+        get_mapping() is called once for the whole list (and not again on a second list),
+        forward refs resolve to the union member, and the dispatcher is cached per type.
+    """
+    # Arrange
+    calls: list[int] = []
+    pet_type = Annotated[Union[_DispatchCat, _DispatchDog], _CountingDiscriminator("kind", calls)]
+    cc._union_dispatcher_cache.pop(pet_type, None)
+
+    # Act
+    first = structure_from_dict(_pet_items(50), list[pet_type])  # type: ignore[valid-type]
+    second = structure_from_dict(_pet_items(50), list[pet_type])  # type: ignore[valid-type]
+
+    # Assert
+    assert len(calls) == 1
+    assert first == second
+    assert isinstance(first[0], _DispatchCat) and first[0].lives == 9
+    assert isinstance(first[1], _DispatchDog) and first[1].good is True
+    assert pet_type in cc._union_dispatcher_cache
+
+    # Cleanup
+    cc._union_dispatcher_cache.pop(pet_type, None)
+
+
+def test_union_dispatcher__many_items__variant_structure_fns_resolved_once():
+    """
+    Scenario:
+        Two batches of 500 union items are structured through structure_from_dict.
+
+    Expected Outcome:
+        The variant structure functions are resolved once per variant, when the dispatcher is
+        compiled, and never again per item or per batch (the pre-compilation behaviour resolved
+        them for every item).
+    """
+    # Arrange
+    union_type = Union[_DispatchCat, _DispatchDog, None]
+    items = _pet_items(500)
+    cc._union_dispatcher_cache.pop(union_type, None)
+
+    # Act
+    with patch.object(cc, "_build_variant_structure_fn", wraps=cc._build_variant_structure_fn) as build:
+        first = structure_from_dict(items, list[union_type])  # type: ignore[valid-type]
+        second = structure_from_dict(items, list[union_type])  # type: ignore[valid-type]
+
+    # Assert
+    assert first == second and len(first) == 500
+    assert build.call_count == 2
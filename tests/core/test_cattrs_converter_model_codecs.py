@@ -0,0 +1,113 @@
+"""
+Tests for ahead-of-time model codecs registered through register_model_codec.
+
+Covers:
+- structure_from_dict / unstructure_to_dict dispatch to registered codecs (Model and list[Model])
+- Codecs are used when the model is nested in a union, and take part in fingerprint routing
+- Invalid payloads fall back to the reflective hook so error messages stay unchanged
+"""
+
+from dataclasses import dataclass
+from typing import Any, Union
+
+import pytest
+
+from pyopenapi_gen.core import cattrs_converter as cc
+from pyopenapi_gen.core.cattrs_converter import register_model_codec, structure_from_dict, unstructure_to_dict
+
+
+@dataclass
+class CodecUser:
+    user_name: str
+    age: int | None = None
+
+    class Meta:
+        key_transform_with_load = {"userName": "user_name", "age": "age"}
+        key_transform_with_dump = {"user_name": "userName", "age": "age"}
+
+
+@dataclass
+class CodecGroup:
+    title: str
+
+
+calls: list[str] = []
+
+
+def _codec_user_from_json(data: dict[str, Any]) -> CodecUser:
+    calls.append("from_json")
+    return CodecUser(user_name=str(data["userName"]), age=None if data.get("age") is None else int(data["age"]))
+
+
+def _codec_user_to_json(obj: CodecUser) -> dict[str, Any]:
+    calls.append("to_json")
+    return {"userName": obj.user_name, "age": obj.age}
+
+
+register_model_codec(CodecUser, _codec_user_from_json, _codec_user_to_json)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls() -> None:
+    calls.clear()
+
+
+def test_structure_from_dict__registered_codec__dispatches_for_model_and_list() -> None:
+    """
+    Scenario:
+        A model has registered codecs and is structured directly, as list[Model], and
+        unstructured.
+
+    Expected Outcome:
+        The generated functions do all the work: one from_json call per object and one
+        to_json call per unstructure.
+    """
+    # Act
+    single = structure_from_dict({"userName": "ada", "age": "36"}, CodecUser)
+    many = structure_from_dict([{"userName": "a"}, {"userName": "b"}], list[CodecUser])
+    dumped = unstructure_to_dict(single)
+
+    # Assert
+    assert single == CodecUser(user_name="ada", age=36)
+    assert [user.user_name for user in many] == ["a", "b"]
+    assert dumped == {"userName": "ada", "age": 36}
+    assert calls == ["from_json", "from_json", "from_json", "to_json"]
+
+
+def test_structure_union__codec_model_variant__routed_and_structured_by_codec() -> None:
+    """
+    Scenario:
+        A union contains a codec-backed model and a reflective model.
+
+    Expected Outcome:
+        The codec hook carries a JSON-key fingerprint, so payloads are routed to the right
+        variant, and the codec model is built by its generated function.
+    """
+    # Arrange
+    union_type = Union[CodecGroup, CodecUser]
+
+    # Act
+    user = structure_from_dict({"userName": "ada"}, union_type)
+    group = structure_from_dict({"title": "admins"}, union_type)
+
+    # Assert
+    assert user == CodecUser(user_name="ada")
+    assert group == CodecGroup(title="admins")
+    assert calls == ["from_json"]
+    assert cc._get_union_dispatcher(union_type).fingerprints[1] == (
+        frozenset({"userName"}),
+        frozenset({"userName", "age"}),
+    )
+
+
+def test_structure_from_dict__codec_fails__reports_reflective_error() -> None:
+    """
+    Scenario:
+        A payload is missing a required key, so the generated from_json raises KeyError.
+
+    Expected Outcome:
+        The reflective path re-structures it and reports its usual descriptive error.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError, match="missing 1 required positional argument: 'user_name'"):
+        structure_from_dict({"age": 3}, CodecUser)
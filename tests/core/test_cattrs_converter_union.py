@@ -5,11 +5,13 @@ These tests verify that the cattrs converter can correctly structure Union types
 that are commonly generated from OpenAPI oneOf/anyOf schemas.
 """
 
+import dataclasses
 from dataclasses import dataclass
 from typing import Annotated, Any, Union
 
 import pytest
 
+from pyopenapi_gen.core import cattrs_converter
 from pyopenapi_gen.core.cattrs_converter import converter, structure_from_dict
 
 # =============================================================================
@@ -1134,3 +1136,119 @@ def test_structure_annotated_union__string_annotations_module__discriminator_pre
     # Clean up
     if "_test_lazy_annotations" in sys.modules:
         del sys.modules["_test_lazy_annotations"]
+
+
+# =============================================================================
+# Test: Required-key fingerprint routing for non-discriminated unions
+# =============================================================================
+
+
+def _make_event_variants(count: int) -> list[type]:
+    """Build `count` event dataclasses that each require their own payload key."""
+    variants: list[type] = []
+    for index in range(count):
+        variant = dataclasses.make_dataclass(
+            f"FeedEvent{index}",
+            [("event_id", str), (f"payload_{index}", int), ("note", Union[str, None], None)],
+        )
+        variants.append(variant)
+    return variants
+
+
+def test_structure_union__wide_union_match_at_end__routed_without_trying_other_variants():
+    """
+    Scenario:
+        A non-discriminated union of 20 variants receives a payload that only
+        the last variant can hold (it requires a key no other variant knows).
+
+    Expected Outcome:
+        The fingerprint route puts the matching variant first, so the payload is
+        structured by a single attempt and no other variant hook raises.
+    """
+    # Arrange
+    variants = _make_event_variants(20)
+    union_type = Union[tuple(variants)]  # type: ignore[valid-type]
+    payload = {"event_id": "e-1", "payload_19": 7}
+    dispatcher = cattrs_converter._get_union_dispatcher(union_type)
+
+    # Act
+    route = dispatcher.route(payload)
+    result = structure_from_dict(payload, union_type)
+
+    # Assert
+    assert route[0] == 19
+    assert type(result) is variants[19]
+    assert result.payload_19 == 7  # type: ignore[attr-defined]
+    assert dispatcher.route(payload) is route  # cached per key set
+
+
+def test_structure_union__payload_accepted_by_several_variants__first_declared_wins():
+    """
+    Scenario:
+        Two variants share the same required keys; only the second declares an
+        optional key that is present in the payload.
+
+    Expected Outcome:
+        Routing keeps declaration order among the variants whose required keys are
+        present, so the first declared variant that accepts the payload wins, as
+        with the plain try-all strategy.
+    """
+
+    # Arrange
+    @dataclass
+    class PlainRef:
+        id: str
+
+    @dataclass
+    class LabelledRef:
+        id: str
+        label: Union[str, None] = None
+
+    # Act
+    result = structure_from_dict({"id": "r1", "label": "Root"}, Union[PlainRef, LabelledRef])
+
+    # Assert
+    assert isinstance(result, PlainRef)
+
+
+def test_structure_union__no_variant_has_required_keys__still_tries_all_and_reports_errors():
+    """
+    Scenario:
+        A payload misses required keys for every variant of the union.
+
+    Expected Outcome:
+        The try-all fallback still runs, and the error lists every variant.
+    """
+    # Arrange
+    payload = {"unexpected": True}
+
+    # Act & Assert
+    with pytest.raises(ValueError) as exc_info:
+        structure_from_dict(payload, Union[ConfigTypeA, ConfigTypeB])
+    message = str(exc_info.value)
+    assert "ConfigTypeA" in message
+    assert "ConfigTypeB" in message
+
+
+def test_structure_union__variants_ruled_out_by_route__errors_in_declaration_order():
+    """
+    Scenario:
+        A payload holds the required keys of the last variant only, and fails to
+        structure into it, so every variant fails.
+
+    Expected Outcome:
+        The error lists the variants in declaration order, although the route tried
+        the last one first.
+    """
+    # Arrange
+    variants = _make_event_variants(3)
+    union_type = Union[tuple(variants)]  # type: ignore[valid-type]
+    payload = {"event_id": "e-1", "payload_2": "not a number"}
+
+    # Act & Assert
+    assert cattrs_converter._get_union_dispatcher(union_type).route(payload)[0] == 2
+    with pytest.raises(ValueError) as exc_info:
+        structure_from_dict(payload, union_type)
+    message = str(exc_info.value)
+    positions = [message.index(f"  - FeedEvent{index}:") for index in range(3)]
+    assert positions == sorted(positions)
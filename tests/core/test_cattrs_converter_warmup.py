@@ -0,0 +1,126 @@
+"""
+Tests for warmup_models: ahead-of-time hook registration with per-model timings.
+
+Covers:
+- Hooks, unstructure functions and union dispatchers are built before first use
+- Background warm-up runs in a daemon thread and reports completion
+- Failing models are reported without stopping the warm-up
+- Classes are published as registered only once their nested hooks exist
+"""
+
+from dataclasses import dataclass
+from typing import Union
+
+from pyopenapi_gen.core import cattrs_converter as cc
+from pyopenapi_gen.core.cattrs_converter import structure_from_dict, unstructure_to_dict, warmup_models
+
+
+@dataclass
+class WarmCat:
+    meow_volume: int
+
+
+@dataclass
+class WarmDog:
+    bark_volume: int
+
+
+@dataclass
+class WarmOwner:
+    pet_name: str
+    pet: Union[WarmCat, WarmDog]
+
+
+@dataclass
+class WarmLeaf:
+    leaf_name: str
+
+
+@dataclass
+class WarmBranch:
+    leaves: list[WarmLeaf]
+
+
+class BrokenType:
+    """A type the converter has no structure hook for."""
+
+
+def test_warmup_models__nested_dataclass_with_union__prebuilds_hooks_and_reports_timings() -> None:
+    """
+    Scenario:
+        A model with a nested union field is warmed up.
+
+    Expected Outcome:
+        Both hook directions are registered for the model and its variants, the unstructure
+        function and the union dispatcher are compiled, and each model gets a timing entry.
+    """
+    # Act
+    report = warmup_models([WarmOwner, WarmCat])
+
+    # Assert
+    assert report.finished.is_set()
+    assert set(report.timings) == {"WarmOwner", "WarmCat"}
+    assert report.errors == {}
+    assert report.total_seconds >= sum(report.timings.values())
+    assert {WarmOwner, WarmCat, WarmDog} <= cc._structure_hooks_registered
+    assert {WarmOwner, WarmCat, WarmDog} <= cc._unstructure_hooks_registered
+    assert WarmOwner in cc._unstructure_fn_cache
+    assert Union[WarmCat, WarmDog] in cc._union_dispatcher_cache
+
+    # Warm hooks behave exactly like lazily built ones
+    owner = structure_from_dict({"pet_name": "rex", "pet": {"bark_volume": 3}}, WarmOwner)
+    assert owner == WarmOwner(pet_name="rex", pet=WarmDog(bark_volume=3))
+    assert unstructure_to_dict(owner) == {"pet_name": "rex", "pet": {"bark_volume": 3}}
+
+
+def test_warmup_models__background__runs_in_thread_and_records_errors() -> None:
+    """
+    Scenario:
+        A background warm-up includes a type whose hook cannot be built.
+
+    Expected Outcome:
+        wait() returns once the thread is done; the broken type is reported in errors and
+        the other models are still warmed up.
+    """
+    # Act
+    report = warmup_models([BrokenType, WarmBranch], background=True)
+
+    # Assert
+    assert report.wait(timeout=10)
+    assert set(report.timings) == {"BrokenType", "WarmBranch"}
+    assert "Unsupported type" in report.errors["BrokenType"]
+    assert WarmBranch in cc._structure_hooks_registered
+    assert WarmLeaf in cc._structure_hooks_registered
+
+
+def test_register_structure_hooks__nested_scope__publishes_only_when_outermost_scope_exits() -> None:
+    """
+    Scenario:
+        A class is registered while another registration (e.g. a warm-up thread's) is still
+        in progress.
+
+    Expected Outcome:
+        The class and its nested classes stay out of the registered set until the outermost
+        registration ends, so lock-free checks never see half-registered object graphs.
+    """
+
+    # Arrange
+    @dataclass
+    class ScopedLeaf:
+        value: int
+
+    @dataclass
+    class ScopedRoot:
+        leaf: ScopedLeaf
+
+    # Act
+    with cc._RegistrationScope():
+        cc._register_structure_hooks_recursively(ScopedRoot)
+        published_inside = ScopedRoot in cc._structure_hooks_registered
+        pending_inside = {ScopedRoot, ScopedLeaf} <= cc._pending_structure_registrations
+
+    # Assert
+    assert not published_inside
+    assert pending_inside
+    assert {ScopedRoot, ScopedLeaf} <= cc._structure_hooks_registered
+    assert not cc._pending_structure_registrations
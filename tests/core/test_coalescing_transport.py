@@ -0,0 +1,174 @@
+"""
+Tests for single-flight request coalescing (core/coalescing_transport.py).
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.coalescing_transport import COALESCE_EXTENSION, CoalescingTransport
+from pyopenapi_gen.core.http_transport import HttpxTransport
+
+COALESCE = {"extensions": {COALESCE_EXTENSION: True}}
+
+
+def _coalescing_transport(status_code: int = 200) -> tuple[CoalescingTransport, list[httpx.Request]]:
+    """A CoalescingTransport over an HttpxTransport whose requests take 20 ms to answer."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(status_code, json=str(request.url))
+
+    inner = HttpxTransport(base_url="https://api.example.com")
+    inner._client._transport = httpx.MockTransport(handler)
+    return CoalescingTransport(inner), requests
+
+
+@pytest.mark.asyncio
+async def test_request__identical_concurrent_requests__share_one_network_call() -> None:
+    """
+    Scenario:
+        Ten coroutines request the same resource with the coalesce extension at the same time.
+    Expected Outcome:
+        One request reaches the network and every caller receives its response, including error statuses.
+    """
+    # Arrange
+    transport, requests = _coalescing_transport(status_code=503)
+
+    # Act
+    responses = await asyncio.gather(
+        *(
+            transport.request("GET", "/settings", params={"v": 1}, headers={"X-Tenant": "a"}, **COALESCE)
+            for _ in range(10)
+        )
+    )
+    await transport.close()
+
+    # Assert
+    assert len(requests) == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0].status_code == 503
+    assert transport.coalesced == 9
+    assert COALESCE_EXTENSION not in requests[0].extensions
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "second_kwargs",
+    [
+        {"params": {"v": 2}, **COALESCE},
+        {"params": {"v": 1}, "headers": {"Authorization": "Bearer other"}, **COALESCE},
+        {"params": {"v": 1}},
+    ],
+    ids=["other-params", "other-auth", "not-marked"],
+)
+async def test_request__different_or_unmarked_requests__are_sent_separately(second_kwargs: dict[str, Any]) -> None:
+    """
+    Scenario:
+        Two concurrent requests differ in query parameters or credentials, or one lacks the coalesce extension.
+    Expected Outcome:
+        Both requests reach the network.
+    """
+    # Arrange
+    transport, requests = _coalescing_transport()
+
+    # Act
+    await asyncio.gather(
+        transport.request("GET", "/settings", params={"v": 1}, **COALESCE),
+        transport.request("GET", "/settings", **second_kwargs),
+    )
+    await transport.close()
+
+    # Assert
+    assert len(requests) == 2
+    assert transport.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_request__sequential_requests__are_not_coalesced() -> None:
+    """
+    Scenario:
+        The same coalescible request is sent twice, the second after the first has completed.
+    Expected Outcome:
+        Both reach the network: only requests in flight at the same moment are coalesced.
+    """
+    # Arrange
+    transport, requests = _coalescing_transport()
+
+    # Act
+    for _ in range(2):
+        await transport.request("GET", "/settings", **COALESCE)
+    await transport.close()
+
+    # Assert
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request__one_caller_cancelled__others_still_receive_the_response() -> None:
+    """
+    Scenario:
+        Three callers share a request and the one that started it is cancelled; later, every caller
+        of another shared request is cancelled.
+    Expected Outcome:
+        The remaining callers receive the response; once no caller is left the shared request is
+        abandoned, and a new identical request starts a new network call.
+    """
+    # Arrange
+    transport, requests = _coalescing_transport()
+
+    # Act
+    callers = [asyncio.ensure_future(transport.request("GET", "/settings", **COALESCE)) for _ in range(3)]
+    await asyncio.sleep(0.005)
+    callers[0].cancel()
+    responses = await asyncio.gather(*callers[1:])
+    abandoned = asyncio.ensure_future(transport.request("GET", "/other", **COALESCE))
+    await asyncio.sleep(0.005)
+    abandoned.cancel()
+    await asyncio.gather(abandoned, return_exceptions=True)
+    retried = await transport.request("GET", "/other", **COALESCE)
+    await transport.close()
+
+    # Assert
+    assert callers[0].cancelled()
+    assert [r.json() for r in responses] == ["https://api.example.com/settings"] * 2
+    assert retried.json() == "https://api.example.com/other"
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_request__shared_call_fails__every_caller_receives_the_error() -> None:
+    """
+    Scenario:
+        Identical concurrent requests share a network call that raises a transport error.
+    Expected Outcome:
+        Every caller receives the error, and the failed call is not reused afterwards.
+    """
+    # Arrange
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    inner = HttpxTransport(base_url="https://api.example.com")
+    inner._client._transport = httpx.MockTransport(handler)
+    transport = CoalescingTransport(inner)
+
+    # Act
+    results = await asyncio.gather(
+        *(transport.request("GET", "/settings", **COALESCE) for _ in range(3)), return_exceptions=True
+    )
+    with pytest.raises(httpx.ConnectError):
+        await transport.request("GET", "/settings", **COALESCE)
+    await transport.close()
+
+    # Assert
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert attempts == 2
@@ -0,0 +1,155 @@
+"""
+Tests for deadlines propagated across nested calls (core/deadline.py).
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.deadline import Deadline, DeadlineExceeded, iterate_with_deadline, remaining
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.rate_limit_transport import RateLimitingTransport
+
+
+@pytest.mark.asyncio
+async def test_deadline__nested_scopes__inner_runs_under_the_earlier_deadline() -> None:
+    """
+    Scenario:
+        A 0.1 s deadline encloses a call with a 10 s timeout that sleeps for a second.
+    Expected Outcome:
+        The inner scope inherits the remaining 0.1 s budget, the sleep is cancelled promptly with
+        DeadlineExceeded, and no deadline is current afterwards.
+    """
+    # Arrange
+    seen: list[float | None] = []
+
+    async def call() -> None:
+        async with Deadline(10.0):
+            seen.append(remaining())
+            await asyncio.sleep(1.0)
+
+    # Act
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        async with Deadline(0.1):
+            await call()
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert seen[0] is not None and seen[0] <= 0.1
+    assert elapsed < 0.5
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_deadline__no_timeout__unbounded_and_exceptions_propagate() -> None:
+    """
+    Scenario:
+        A block runs under Deadline(None) without an enclosing deadline and raises ValueError.
+    Expected Outcome:
+        No deadline is current inside the block and the ValueError is not converted.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError):
+        async with Deadline(None):
+            assert remaining() is None
+            raise ValueError("boom")
+
+
+@pytest.mark.asyncio
+async def test_deadline__task_spawned_within__is_cancelled_at_the_inherited_deadline() -> None:
+    """
+    Scenario:
+        Under a 0.1 s deadline, a task is spawned that runs a call without a timeout of its own.
+    Expected Outcome:
+        The task inherits the deadline and is cancelled with DeadlineExceeded when it passes.
+    """
+
+    # Arrange
+    async def call() -> None:
+        async with Deadline(None):
+            await asyncio.sleep(1.0)
+
+    # Act
+    async with Deadline(0.1):
+        task = asyncio.ensure_future(call())
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        await task
+
+    # Assert
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_iterate_with_deadline__slow_source__bounds_the_whole_iteration_and_closes_it() -> None:
+    """
+    Scenario:
+        A source yields an item every 40 ms and is iterated with a 0.1 s timeout.
+    Expected Outcome:
+        Items produced within the budget are received, then DeadlineExceeded is raised and the
+        source is closed. Each item is produced with the remaining budget current.
+    """
+    # Arrange
+    budgets: list[float | None] = []
+    closed = False
+
+    async def source() -> AsyncIterator[int]:
+        nonlocal closed
+        try:
+            for index in range(10):
+                await asyncio.sleep(0.04)
+                budgets.append(remaining())
+                yield index
+        finally:
+            closed = True
+
+    items: list[int] = []
+
+    # Act
+    with pytest.raises(DeadlineExceeded):
+        async for item in iterate_with_deadline(source(), 0.1):
+            items.append(item)
+
+    # Assert
+    assert items in ([0], [0, 1])  # About 2 items fit in the budget
+    assert closed
+    assert all(budget is not None and budget < 0.1 for budget in budgets)
+    assert budgets == sorted(budgets, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request__retry_after_beyond_deadline__429_returned_without_waiting() -> None:
+    """
+    Scenario:
+        Under a 0.2 s deadline, a request is answered with 429 and `Retry-After: 1`.
+    Expected Outcome:
+        The retry, which could not complete within the deadline, is not attempted: the 429 is
+        returned at once.
+    """
+    # Arrange
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "1"})
+
+    inner = HttpxTransport(base_url="https://a.example.com")
+    inner._client._transport = httpx.MockTransport(handler)
+    transport = RateLimitingTransport(inner)
+
+    # Act
+    started = time.monotonic()
+    async with Deadline(0.2):
+        response = await transport.request("GET", "https://a.example.com/items")
+    elapsed = time.monotonic() - started
+    await transport.close()
+
+    # Assert
+    assert response.status_code == 429
+    assert calls == 1
+    assert elapsed < 0.1
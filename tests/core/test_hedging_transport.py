@@ -0,0 +1,195 @@
+"""
+Tests for hedged requests of idempotent operations (core/hedging_transport.py).
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.hedging_transport import HEDGE_EXTENSION, HedgingTransport, LatencyHistogram
+from pyopenapi_gen.core.http_transport import HttpxTransport
+
+HEDGE = {"extensions": {HEDGE_EXTENSION: "getSettings"}}
+
+
+def _hedging_transport(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> HedgingTransport:
+    """A HedgingTransport over an HttpxTransport whose requests are answered by `handler`."""
+    inner = HttpxTransport(base_url="https://api.example.com")
+    inner._client._transport = httpx.MockTransport(handler)
+    return HedgingTransport(inner, **kwargs)
+
+
+async def _warm_up(transport: HedgingTransport, samples: int = 20) -> None:
+    """Send enough requests for the operation's latency percentile to be known."""
+    for _ in range(samples):
+        await transport.request("GET", "/settings", **HEDGE)
+
+
+def test_latency_histogram__percentiles__within_bucket_precision() -> None:
+    """
+    Scenario:
+        95 latencies of 10 ms and 5 of 500 ms are recorded.
+    Expected Outcome:
+        The 90th percentile is about 10 ms and the 99th about 500 ms, within the 10% bucket width.
+    """
+    # Arrange
+    histogram = LatencyHistogram()
+    for _ in range(95):
+        histogram.record(0.01)
+    for _ in range(5):
+        histogram.record(0.5)
+
+    # Act / Assert
+    assert 0.01 <= histogram.percentile(0.9) < 0.011
+    assert 0.5 <= histogram.percentile(0.99) < 0.55
+
+
+@pytest.mark.asyncio
+async def test_request__slow_response__hedge_answers_first_and_first_request_is_cancelled() -> None:
+    """
+    Scenario:
+        After 20 requests answered in 5 ms, a request takes 1 s while its duplicate is answered in 5 ms.
+    Expected Outcome:
+        The duplicate is sent after about the 95th percentile latency, its response is returned long
+        before the slow one would have been, and the slow request is cancelled.
+    """
+    # Arrange
+    calls = 0
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        assert HEDGE_EXTENSION not in request.extensions
+        try:
+            await asyncio.sleep(1.0 if calls == 21 else 0.005)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return httpx.Response(200, json=calls)
+
+    transport = _hedging_transport(handler)
+    await _warm_up(transport)
+
+    # Act
+    started = time.monotonic()
+    response = await transport.request("GET", "/settings", **HEDGE)
+    elapsed = time.monotonic() - started
+    await asyncio.wait_for(cancelled.wait(), 0.1)
+    stats = transport.stats()["getSettings"]
+    await transport.close()
+
+    # Assert
+    assert response.json() == 22
+    assert elapsed < 0.1
+    assert (stats.requests, stats.hedged, stats.hedge_wins) == (21, 1, 1)
+    assert stats.delay_seconds is not None and 0.005 <= stats.delay_seconds < 0.1
+
+
+@pytest.mark.asyncio
+async def test_request__many_slow_responses__hedges_capped_by_budget() -> None:
+    """
+    Scenario:
+        After 20 requests answered in 5 ms, 20 concurrent requests (and their duplicates) take 50 ms.
+    Expected Outcome:
+        Only 5% of the 40 requests are hedged; every request is answered.
+    """
+    # Arrange
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05 if calls > 20 else 0.005)
+        return httpx.Response(200)
+
+    transport = _hedging_transport(handler, budget=0.05)
+    await _warm_up(transport)
+
+    # Act
+    responses = await asyncio.gather(*(transport.request("GET", "/settings", **HEDGE) for _ in range(20)))
+    stats = transport.stats()["getSettings"]
+    await transport.close()
+
+    # Assert
+    assert [response.status_code for response in responses] == [200] * 20
+    assert (stats.requests, stats.hedged) == (40, 2)
+    assert calls == 42
+
+
+@pytest.mark.asyncio
+async def test_request__not_marked_or_streamed__never_hedged() -> None:
+    """
+    Scenario:
+        Requests without the hedge extension, and a streamed request with it, are slow.
+    Expected Outcome:
+        Each is sent exactly once and no operation is tracked for the unmarked requests.
+    """
+    # Arrange
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.005 if calls <= 20 else 0.05)
+        return httpx.Response(200)
+
+    transport = _hedging_transport(handler)
+    await _warm_up(transport)
+
+    # Act
+    await transport.request("GET", "/settings")
+    async with transport.stream("GET", "/settings", **HEDGE) as response:
+        await response.aread()
+    stats = transport.stats()
+    await transport.close()
+
+    # Assert
+    assert calls == 22
+    assert list(stats) == ["getSettings"]
+    assert stats["getSettings"].hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_request__every_attempt_fails__first_error_is_raised() -> None:
+    """
+    Scenario:
+        After warm-up, a slow request is hedged and both attempts fail with transport errors.
+    Expected Outcome:
+        The caller receives the error of the first request.
+    """
+    # Arrange
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        if attempt <= 20:
+            return httpx.Response(200)
+        await asyncio.sleep(0.05 if attempt == 21 else 0.001)
+        raise httpx.ConnectError(f"attempt {attempt}", request=request)
+
+    transport = _hedging_transport(handler)
+    await _warm_up(transport)
+
+    # Act / Assert
+    with pytest.raises(httpx.ConnectError, match="attempt 21"):
+        await transport.request("GET", "/settings", **HEDGE)
+    await transport.close()
+    assert transport.stats()["getSettings"].hedged == 1
+
+
+def test_init__invalid_percentile__raises_value_error() -> None:
+    """
+    Scenario:
+        A HedgingTransport is created with a percentile of 1.
+    Expected Outcome:
+        ValueError is raised: no latency lies beyond the 100th percentile.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError):
+        HedgingTransport(HttpxTransport(base_url="https://api.example.com"), percentile=1.0)
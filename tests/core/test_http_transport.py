@@ -1,10 +1,12 @@
+import asyncio
+import ssl
 import typing
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
-from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.http_transport import HttpxTransport, find_transport, open_stream
 
 
 class DummyAuth:
@@ -152,33 +154,251 @@ async def test_request__server_error_response__returns_response_without_raising(
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_stream__chunked_body__yields_unread_response_with_auth_headers() -> None:
+    """
+    Scenario: A streaming endpoint is called through HttpxTransport.stream().
+    Expected Outcome: The response is yielded before its body is read (no buffering), auth headers
+        are applied as for request(), and the body is delivered chunk by chunk.
+    """
+
+    # Arrange
+    captured: dict[str, object] = {}
+
+    class ChunkedBody(httpx.AsyncByteStream):
+        async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+            yield b"first,"
+            yield b"second"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["headers"] = dict(request.headers)
+        return httpx.Response(200, stream=ChunkedBody())
+
+    client = HttpxTransport(base_url="https://api.example.com", bearer_token="abc123")
+    client._client._transport = httpx.MockTransport(handler)
+
+    # Act
+    async with client.stream("GET", "/export") as response:
+        with pytest.raises(httpx.ResponseNotRead):
+            _ = response.content
+        chunks = [chunk async for chunk in response.aiter_bytes()]
+
+    # Assert
+    assert response.status_code == 200
+    assert b"".join(chunks) == b"first,second"
+    headers = typing.cast(dict[str, str], captured["headers"])
+    assert headers.get("authorization") == "Bearer abc123"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_open_stream__transport_without_stream__falls_back_to_request() -> None:
+    """
+    Scenario: A custom transport implementing only request() and close() is used for a streaming call.
+    Expected Outcome: open_stream sends the request through request() and yields its response, whose
+        body can be iterated as a streamed body would be.
+    """
+
+    # Arrange
+    class RequestOnlyTransport:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, str, dict[str, typing.Any]]] = []
+
+        async def request(self, method: str, url: str, **kwargs: typing.Any) -> httpx.Response:
+            self.calls.append((method, url, kwargs))
+            return httpx.Response(200, content=b"first,second")
+
+        async def close(self) -> None:
+            pass
+
+    transport = RequestOnlyTransport()
+
+    # Act
+    async with open_stream(transport, "GET", "/export", params={"format": "csv"}) as response:
+        chunks = [chunk async for chunk in response.aiter_bytes()]
+
+    # Assert
+    assert transport.calls == [("GET", "/export", {"params": {"format": "csv"}})]
+    assert response.status_code == 200
+    assert b"".join(chunks) == b"first,second"
+
+
 def test_verify_ssl__default__ssl_verification_enabled() -> None:
     """
     Scenario: HttpxTransport created without verify_ssl parameter.
-    Expected Outcome: SSL verification is enabled by default (verify=True passed to httpx).
+    Expected Outcome: SSL verification is enabled by default (a verifying SSL context is passed to httpx).
     """
     # Arrange
     mock_client = MagicMock()
 
     # Act
-    with patch("pyopenapi_gen.core.http_transport.httpx.AsyncClient", return_value=mock_client) as mock_async_client:
+    with (
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncClient", return_value=mock_client) as mock_async_client,
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncHTTPTransport") as mock_pool_transport,
+    ):
         HttpxTransport(base_url="https://api.example.com")
 
     # Assert
-    mock_async_client.assert_called_once_with(base_url="https://api.example.com", timeout=None, verify=True)
+    ssl_context = mock_pool_transport.call_args.kwargs["verify"]
+    assert ssl_context.verify_mode == ssl.CERT_REQUIRED
+    mock_pool_transport.assert_called_once_with(
+        verify=ssl_context,
+        http2=False,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        local_address=None,
+    )
+    assert mock_async_client.call_args.kwargs["base_url"] == "https://api.example.com"
+    assert mock_async_client.call_args.kwargs["timeout"] == httpx.Timeout(None)
+    assert mock_async_client.call_args.kwargs["transport"] is mock_pool_transport.return_value
+    assert mock_async_client.call_args.kwargs["verify"] is ssl_context
 
 
 def test_verify_ssl__disabled__ssl_verification_disabled() -> None:
     """
     Scenario: HttpxTransport created with verify_ssl=False for local development.
-    Expected Outcome: SSL verification is disabled (verify=False passed to httpx).
+    Expected Outcome: SSL verification is disabled (a non-verifying SSL context is passed to httpx).
     """
     # Arrange
     mock_client = MagicMock()
 
     # Act
-    with patch("pyopenapi_gen.core.http_transport.httpx.AsyncClient", return_value=mock_client) as mock_async_client:
+    with (
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncClient", return_value=mock_client),
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncHTTPTransport") as mock_pool_transport,
+    ):
         HttpxTransport(base_url="https://api.example.com", verify_ssl=False)
 
     # Assert
-    mock_async_client.assert_called_once_with(base_url="https://api.example.com", timeout=None, verify=False)
+    ssl_context = mock_pool_transport.call_args.kwargs["verify"]
+    assert ssl_context.verify_mode == ssl.CERT_NONE
+    assert ssl_context.check_hostname is False
+
+
+def test_init__pool_options__configure_limits_http2_timeouts_and_local_address() -> None:
+    """
+    Scenario: HttpxTransport is created with pool limits, HTTP/2, a local address and some per-phase timeouts.
+    Expected Outcome: The pooling transport gets the limits, HTTP/2 flag and local address; phases without
+        their own timeout fall back to `timeout`.
+    """
+    # Arrange
+    mock_client = MagicMock()
+
+    # Act
+    with (
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncClient", return_value=mock_client) as mock_async_client,
+        patch("pyopenapi_gen.core.http_transport.httpx.AsyncHTTPTransport") as mock_pool_transport,
+    ):
+        HttpxTransport(
+            base_url="https://api.example.com",
+            timeout=30.0,
+            max_connections=500,
+            max_keepalive_connections=500,
+            keepalive_expiry=60.0,
+            http2=True,
+            connect_timeout=2.0,
+            pool_timeout=0.5,
+            local_address="10.0.0.5",
+        )
+
+    # Assert
+    mock_pool_transport.assert_called_once_with(
+        verify=mock_pool_transport.call_args.kwargs["verify"],
+        http2=True,
+        limits=httpx.Limits(max_connections=500, max_keepalive_connections=500, keepalive_expiry=60.0),
+        local_address="10.0.0.5",
+    )
+    assert mock_async_client.call_args.kwargs["timeout"] == httpx.Timeout(connect=2.0, read=30.0, write=30.0, pool=0.5)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats__saturated_pool__reports_in_use_idle_waiting_and_wait_time() -> None:
+    """
+    Scenario: Two requests share a pool of one connection to a local server that answers only when released.
+    Expected Outcome: While the first request holds the connection, the second is counted as waiting; afterwards
+        the connection is idle and both requests' waits are recorded, the second one covering the hold time.
+    """
+    # Arrange
+    release = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await release.wait()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()  # Client closed the connection
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = HttpxTransport(base_url=f"http://127.0.0.1:{port}", timeout=5.0, max_connections=1)
+
+    # Act
+    requests = [asyncio.create_task(client.request("GET", "/")) for _ in range(2)]
+    while client.pool_stats().in_use == 0:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    during = client.pool_stats()
+    release.set()
+    responses = await asyncio.gather(*requests)
+    after = client.pool_stats()
+    await client.close()
+    server.close()
+
+    # Assert
+    assert [r.status_code for r in responses] == [200, 200]
+    assert (during.connections, during.in_use, during.idle, during.waiting, during.requests) == (1, 1, 0, 1, 1)
+    assert (after.connections, after.in_use, after.idle, after.waiting, after.requests) == (1, 0, 1, 0, 2)
+    assert after.max_connections == 1
+    assert after.max_wait_seconds >= 0.05
+    assert after.total_wait_seconds >= after.max_wait_seconds
+    assert after.mean_wait_seconds == after.total_wait_seconds / 2
+
+
+@pytest.mark.asyncio
+async def test_prepare_headers__no_auth_no_request_headers__reuses_precomputed_headers() -> None:
+    """
+    Scenario: A transport with default headers and a bearer token sends requests without their own headers.
+    Expected Outcome: The precomputed header dict is reused rather than rebuilt per request, while
+        request-specific headers still produce a merged dict with the bearer token taking precedence.
+    """
+    # Arrange
+    client = HttpxTransport(
+        base_url="https://api.example.com", bearer_token="abc123", default_headers={"X-Client": "demo"}
+    )
+
+    # Act
+    first = await client._prepare_headers({})
+    second = await client._prepare_headers({"headers": None})
+    merged = await client._prepare_headers({"headers": {"X-Trace": "1", "Authorization": "ignored"}})
+
+    # Assert
+    assert first is second
+    assert first == {"X-Client": "demo", "Authorization": "Bearer abc123"}
+    assert merged == {"X-Client": "demo", "X-Trace": "1", "Authorization": "Bearer abc123"}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_find_transport__wrapped_transports__follows_the_inner_chain() -> None:
+    """
+    Scenario: An HttpxTransport is wrapped by a RateLimitingTransport and a CachingTransport.
+    Expected Outcome: find_transport returns the first transport of the requested type along the `inner`
+        chain, and None when the chain holds none or the transport does not wrap anything.
+    """
+    from pyopenapi_gen.core.cache_transport import CachingTransport
+    from pyopenapi_gen.core.hedging_transport import HedgingTransport
+    from pyopenapi_gen.core.rate_limit_transport import RateLimitingTransport
+
+    # Arrange
+    httpx_transport = HttpxTransport(base_url="https://api.example.com")
+    rate_limiter = RateLimitingTransport(httpx_transport)
+    cache = CachingTransport(rate_limiter)
+
+    # Act & Assert
+    assert find_transport(cache, HttpxTransport) is httpx_transport
+    assert find_transport(cache, RateLimitingTransport) is rate_limiter
+    assert find_transport(cache, CachingTransport) is cache
+    assert find_transport(cache, HedgingTransport) is None
+    assert find_transport(object(), HttpxTransport) is None
+    await httpx_transport.close()
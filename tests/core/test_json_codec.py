@@ -0,0 +1,195 @@
+"""
+Tests for the pluggable JSON codecs and their use by HttpxTransport.
+
+Covers:
+- Codec selection by name, "auto" fallback order and custom codec instances
+- Backend round trips (orjson/msgspec only when installed)
+- Request bodies encoded by the transport's codec with Content-Type/Content-Length
+- decode_json using the codec recorded on the response
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core import json_codec
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.json_codec import JsonCodec, StdlibJsonCodec, decode_json, get_json_codec
+
+PAYLOAD: dict[str, Any] = {"name": "Zoë", "tags": ["a", "b"], "count": 3, "ratio": 0.5, "nested": {"ok": None}}
+
+
+class RecordingCodec:
+    """Custom codec that records every call and delegates to the stdlib codec."""
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self._inner = StdlibJsonCodec()
+
+    def loads(self, data: bytes | str) -> Any:
+        self.calls.append("loads")
+        return self._inner.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        self.calls.append("dumps")
+        return self._inner.dumps(value)
+
+
+def test_get_json_codec__names_and_instances__resolve_to_codecs() -> None:
+    """
+    Scenario:
+        Codecs are requested by name, as an instance, and by an unknown name.
+
+    Expected Outcome:
+        Named codecs are created once and cached, instances are returned unchanged and
+        unknown names raise ValueError listing the valid choices.
+    """
+    # Arrange
+    custom = RecordingCodec()
+
+    # Act & Assert
+    assert isinstance(get_json_codec("stdlib"), StdlibJsonCodec)
+    assert get_json_codec("stdlib") is get_json_codec("stdlib")
+    assert get_json_codec(custom) is custom
+    assert isinstance(custom, JsonCodec)
+    assert get_json_codec(None) is get_json_codec("auto")
+    with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+        get_json_codec("yaml")
+
+
+def test_get_json_codec__auto_without_fast_backends__falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Scenario:
+        Neither orjson nor msgspec can be imported.
+
+    Expected Outcome:
+        "auto" resolves to the stdlib codec, while requesting a backend by name raises ImportError.
+    """
+
+    # Arrange
+    def not_installed() -> JsonCodec:
+        raise ImportError("not installed")
+
+    monkeypatch.setattr(json_codec, "_codec_cache", {})
+    monkeypatch.setitem(json_codec._BACKENDS, "orjson", not_installed)
+    monkeypatch.setitem(json_codec._BACKENDS, "msgspec", not_installed)
+
+    # Act
+    codec = get_json_codec("auto")
+
+    # Assert
+    assert codec.name == "stdlib"
+    with pytest.raises(ImportError):
+        get_json_codec("orjson")
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson", "msgspec"])
+def test_json_codec__round_trip__matches_stdlib_json(backend: str) -> None:
+    """
+    Scenario:
+        Each available backend encodes and decodes the same payload.
+
+    Expected Outcome:
+        All backends produce compact UTF-8 bytes and decode them back to the same value.
+    """
+    # Arrange
+    if backend != "stdlib":
+        pytest.importorskip(backend)
+    codec = get_json_codec(backend)
+
+    # Act
+    encoded = codec.dumps(PAYLOAD)
+
+    # Assert
+    assert isinstance(encoded, bytes)
+    assert encoded == StdlibJsonCodec().dumps(PAYLOAD)
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode("utf-8")) == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_httpx_transport__json_body__encoded_by_codec_and_response_decoded_with_it() -> None:
+    """
+    Scenario:
+        A request with a json= body is sent through a transport configured with a custom codec.
+
+    Expected Outcome:
+        The body is sent as the codec's bytes with JSON Content-Type and an exact Content-Length,
+        and decode_json decodes the response with the same codec.
+    """
+    # Arrange
+    captured: dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["headers"] = dict(request.headers)
+        captured["body"] = request.content
+        return httpx.Response(200, content=b'{"id": 1}')
+
+    codec = RecordingCodec()
+    client = HttpxTransport(base_url="https://api.example.com", json_codec=codec)
+    client._client._transport = httpx.MockTransport(handler)
+
+    # Act
+    response = await client.request("POST", "/items", json=PAYLOAD, headers={"X-Trace": "1"})
+    decoded = decode_json(response)
+    await client.close()
+
+    # Assert
+    assert captured["body"] == StdlibJsonCodec().dumps(PAYLOAD)
+    assert captured["headers"]["content-type"] == "application/json"
+    assert captured["headers"]["content-length"] == str(len(captured["body"]))
+    assert captured["headers"]["x-trace"] == "1"
+    assert decoded == {"id": 1}
+    assert codec.calls == ["dumps", "loads"]
+
+
+@pytest.mark.asyncio
+async def test_httpx_transport__explicit_content_type_and_no_body__left_untouched() -> None:
+    """
+    Scenario:
+        One request sets its own JSON content type; another passes json=None.
+
+    Expected Outcome:
+        The caller's Content-Type is kept, and a None body sends no content at all.
+    """
+    # Arrange
+    captured: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(204)
+
+    client = HttpxTransport(base_url="https://api.example.com", json_codec="stdlib")
+    client._client._transport = httpx.MockTransport(handler)
+
+    # Act
+    await client.request("PATCH", "/items/1", json=[1], headers={"Content-Type": "application/merge-patch+json"})
+    await client.request("GET", "/items", json=None)
+    await client.close()
+
+    # Assert
+    assert captured[0].headers["content-type"] == "application/merge-patch+json"
+    assert captured[0].content == b"[1]"
+    assert captured[1].content == b""
+    assert "content-type" not in captured[1].headers
+
+
+def test_decode_json__response_from_other_transport__uses_auto_codec() -> None:
+    """
+    Scenario:
+        A response was not produced by HttpxTransport (e.g. a custom transport or a test double).
+
+    Expected Outcome:
+        decode_json falls back to the auto-detected codec and decodes the raw bytes.
+    """
+    # Arrange
+    response = httpx.Response(200, content='{"name": "Zoë"}'.encode("utf-8"))
+
+    # Act
+    decoded = decode_json(response)
+
+    # Assert
+    assert decoded == {"name": "Zoë"}
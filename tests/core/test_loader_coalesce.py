@@ -0,0 +1,97 @@
+"""
+Tests for request coalescing settings while loading operations (core/loader/operations/coalesce.py).
+"""
+
+from typing import Any
+
+import pytest
+
+from pyopenapi_gen import IRSpec
+from pyopenapi_gen.core.loader.loader import load_ir_from_spec
+from pyopenapi_gen.core.loader.operations.coalesce import apply_coalesce_allowlist
+
+
+def _load(get_extra: dict[str, Any] | None = None, post_extra: dict[str, Any] | None = None) -> IRSpec:
+    """Load a spec with a GET and a POST operation on one path."""
+    ok = {"200": {"description": "ok", "content": {"application/json": {"schema": {"type": "string"}}}}}
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Coalesced", "version": "1.0.0"},
+        "paths": {
+            "/settings": {
+                "get": {"operationId": "getSettings", "responses": ok, **(get_extra or {})},
+                "post": {
+                    "operationId": "updateSettings",
+                    "requestBody": {"content": {"application/json": {"schema": {"type": "string"}}}},
+                    "responses": ok,
+                    **(post_extra or {}),
+                },
+            }
+        },
+    }
+    return load_ir_from_spec(spec)
+
+
+def _coalesced(ir: IRSpec) -> dict[str, bool]:
+    return {op.operation_id: op.coalesce for op in ir.operations}
+
+
+def test_load__x_coalesce_true_on_get__marks_operation() -> None:
+    """
+    Scenario:
+        The GET operation has `x-coalesce: true`, the POST operation has no extension.
+    Expected Outcome:
+        Only the GET operation is coalesced.
+    """
+    # Act
+    ir = _load(get_extra={"x-coalesce": True})
+
+    # Assert
+    assert _coalesced(ir) == {"getSettings": True, "updateSettings": False}
+
+
+@pytest.mark.parametrize(
+    "get_extra, post_extra, message",
+    [
+        ({"x-coalesce": "yes"}, None, "getSettings': must be true or false"),
+        (None, {"x-coalesce": True}, "updateSettings': only GET and HEAD operations"),
+    ],
+    ids=["not-a-boolean", "post"],
+)
+def test_load__invalid_x_coalesce__warns_and_is_ignored(
+    get_extra: dict[str, Any] | None, post_extra: dict[str, Any] | None, message: str
+) -> None:
+    """
+    Scenario:
+        `x-coalesce` is not a boolean, or marks an operation with side effects.
+    Expected Outcome:
+        A warning names the operation and no operation is coalesced.
+    """
+    # Act
+    with pytest.warns(UserWarning, match=message):
+        ir = _load(get_extra, post_extra)
+
+    # Assert
+    assert _coalesced(ir) == {"getSettings": False, "updateSettings": False}
+
+
+def test_apply_coalesce_allowlist__marks_listed_get_operations_and_warns_about_others() -> None:
+    """
+    Scenario:
+        The allowlist names the GET operation, the POST operation and an unknown operation ID.
+    Expected Outcome:
+        The GET operation is coalesced; the POST operation and the unknown ID are reported.
+    """
+    # Arrange
+    ir = _load()
+
+    # Act
+    with pytest.warns(UserWarning) as record:
+        apply_coalesce_allowlist(ir.operations, ["getSettings", "updateSettings", "missing"])
+
+    # Assert
+    assert _coalesced(ir) == {"getSettings": True, "updateSettings": False}
+    assert [str(w.message) for w in record] == [
+        "Coalesce allowlist: operation 'updateSettings' is not a GET or HEAD operation without a request body",
+        "Coalesce allowlist: no operation with ID 'missing'",
+    ]
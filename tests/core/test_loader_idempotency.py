@@ -0,0 +1,67 @@
+"""
+Tests for the idempotency of operations while loading them (core/loader/operations/idempotency.py).
+"""
+
+from typing import Any
+
+import pytest
+
+from pyopenapi_gen.core.loader.loader import load_ir_from_spec
+
+
+def _idempotent(get_extra: dict[str, Any] | None = None, put_extra: dict[str, Any] | None = None) -> dict[str, bool]:
+    """Load a spec with a GET and a PUT operation on one path and report which are idempotent."""
+    ok = {"200": {"description": "ok", "content": {"application/json": {"schema": {"type": "string"}}}}}
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Idempotent", "version": "1.0.0"},
+        "paths": {
+            "/settings": {
+                "get": {"operationId": "getSettings", "responses": ok, **(get_extra or {})},
+                "put": {
+                    "operationId": "putSettings",
+                    "requestBody": {"content": {"application/json": {"schema": {"type": "string"}}}},
+                    "responses": ok,
+                    **(put_extra or {}),
+                },
+            }
+        },
+    }
+    return {op.operation_id: op.idempotent for op in load_ir_from_spec(spec).operations}
+
+
+@pytest.mark.parametrize(
+    "get_extra, put_extra, expected",
+    [
+        (None, None, {"getSettings": True, "putSettings": False}),
+        (None, {"x-idempotent": True}, {"getSettings": True, "putSettings": True}),
+        ({"x-idempotent": False}, None, {"getSettings": False, "putSettings": False}),
+    ],
+    ids=["default", "marked", "opted-out"],
+)
+def test_load__x_idempotent__overrides_method_default(
+    get_extra: dict[str, Any] | None, put_extra: dict[str, Any] | None, expected: dict[str, bool]
+) -> None:
+    """
+    Scenario:
+        GET operations are idempotent by default; `x-idempotent` marks a PUT or opts a GET out.
+    Expected Outcome:
+        Operations are idempotent according to their method unless the extension says otherwise.
+    """
+    # Act / Assert
+    assert _idempotent(get_extra, put_extra) == expected
+
+
+def test_load__invalid_x_idempotent__warns_and_uses_method_default() -> None:
+    """
+    Scenario:
+        `x-idempotent` of the PUT operation is not a boolean.
+    Expected Outcome:
+        A warning names the operation, which is not idempotent as a PUT.
+    """
+    # Act
+    with pytest.warns(UserWarning, match="putSettings': must be true or false"):
+        idempotent = _idempotent(put_extra={"x-idempotent": "yes"})
+
+    # Assert
+    assert idempotent == {"getSettings": True, "putSettings": False}
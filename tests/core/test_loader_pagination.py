@@ -0,0 +1,205 @@
+"""
+Tests for pagination detection while loading operations (core/loader/operations/pagination.py).
+"""
+
+from typing import Any
+
+import pytest
+
+from pyopenapi_gen import IROperation, IRPagination
+from pyopenapi_gen.core.loader.loader import load_ir_from_spec
+
+
+def _query(name: str, schema_type: str = "integer", **schema: Any) -> dict[str, Any]:
+    return {"name": name, "in": "query", "schema": {"type": schema_type, **schema}}
+
+
+def _load_op(
+    parameters: list[dict[str, Any]], body: dict[str, Any], extra: dict[str, Any] | None = None
+) -> IROperation:
+    """Load a single GET operation returning `body` with the given query parameters."""
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Paged", "version": "1.0.0"},
+        "paths": {
+            "/things": {
+                "get": {
+                    "operationId": "listThings",
+                    "parameters": parameters,
+                    "responses": {"200": {"description": "ok", "content": {"application/json": {"schema": body}}}},
+                    **(extra or {}),
+                }
+            }
+        },
+        "components": {
+            "schemas": {"Thing": {"type": "object", "properties": {"name": {"type": "string"}}}},
+        },
+    }
+    return load_ir_from_spec(spec).operations[0]
+
+
+THINGS = {"type": "array", "items": {"$ref": "#/components/schemas/Thing"}}
+
+
+@pytest.mark.parametrize(
+    "parameters, properties, expected",
+    [
+        (
+            [_query("page_token", "string"), _query("limit")],
+            {"results": THINGS, "nextPageToken": {"type": "string"}},
+            IRPagination("cursor", "results", "page_token", "limit", next_field="nextPageToken"),
+        ),
+        (
+            [_query("offset"), _query("limit")],
+            {"data": THINGS, "total_count": {"type": "integer"}},
+            IRPagination("offset", "data", "offset", "limit", total_field="total_count"),
+        ),
+        (
+            [_query("page", default=0), _query("per_page")],
+            {"things": THINGS, "total_pages": {"type": "integer"}, "total": {"type": "integer"}},
+            IRPagination(
+                "page", "things", "page", "per_page", total_field="total", total_pages_field="total_pages", first_page=0
+            ),
+        ),
+    ],
+    ids=["cursor", "offset", "page"],
+)
+def test_detect_pagination__common_shapes__are_recognised(
+    parameters: list[dict[str, Any]], properties: dict[str, Any], expected: IRPagination
+) -> None:
+    """
+    Scenario:
+        Operations use next-token, offset/limit and page/size query parameters with
+        conventionally named response properties.
+
+    Expected Outcome:
+        The matching pagination style is detected with the API names of every part.
+    """
+    # Act
+    op = _load_op(parameters, {"type": "object", "properties": properties})
+
+    # Assert
+    assert op.pagination == expected
+
+
+def test_detect_pagination__link_header_on_array_response__is_link_style() -> None:
+    """
+    Scenario:
+        The success response declares a Link header and returns a bare array.
+
+    Expected Outcome:
+        The link style is detected, with the items being the body itself.
+    """
+    # Arrange
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Paged", "version": "1.0.0"},
+        "paths": {
+            "/things": {
+                "get": {
+                    "operationId": "listThings",
+                    "parameters": [_query("per_page")],
+                    "responses": {
+                        "200": {
+                            "description": "ok",
+                            "headers": {"Link": {"schema": {"type": "string"}}},
+                            "content": {"application/json": {"schema": {"type": "array", "items": {"type": "string"}}}},
+                        }
+                    },
+                }
+            }
+        },
+    }
+
+    # Act
+    op = load_ir_from_spec(spec).operations[0]
+
+    # Assert
+    assert op.pagination == IRPagination("link", None, size_param="per_page")
+
+
+@pytest.mark.parametrize(
+    "parameters, body",
+    [
+        ([_query("limit")], THINGS),
+        ([_query("cursor", "string")], {"type": "object", "properties": {"data": THINGS}}),
+        ([_query("page")], {"type": "object", "properties": {"name": {"type": "string"}}}),
+        ([_query("start", "string", format="date"), _query("limit")], THINGS),
+        ([_query("offset"), _query("count")], THINGS),
+        ([_query("page", "string"), _query("size")], THINGS),
+        (
+            [_query("after", "string", format="date-time")],
+            {"type": "object", "properties": {"data": THINGS, "cursor": {"type": "string"}}},
+        ),
+    ],
+    ids=[
+        "no-page-parameter",
+        "cursor-without-next-field",
+        "no-items",
+        "date-offset",
+        "count-is-not-a-size",
+        "string-page",
+        "date-time-cursor",
+    ],
+)
+def test_detect_pagination__unrecognised_shapes__are_not_paginated(
+    parameters: list[dict[str, Any]], body: dict[str, Any]
+) -> None:
+    """
+    Scenario:
+        An operation has only a size parameter, a cursor parameter without a next-token
+        property, a page parameter on a response without an items array, or parameters with
+        pagination names but other schema types (a date offset, a string page number, a
+        date-time cursor), or a `count` parameter next to an offset.
+
+    Expected Outcome:
+        No pagination is detected.
+    """
+    # Act
+    op = _load_op(parameters, body)
+
+    # Assert
+    assert op.pagination is None
+
+
+def test_detect_pagination__x_pagination__overrides_and_disables_detection() -> None:
+    """
+    Scenario:
+        `x-pagination` describes a cursor with unconventional names, or is false on an
+        operation that would otherwise be detected.
+
+    Expected Outcome:
+        The extension is used as given; `false` turns detection off.
+    """
+    # Arrange
+    parameters = [_query("after", "string"), _query("first")]
+    body = {"type": "object", "properties": {"nodes": THINGS, "endCursor": {"type": "string"}}}
+    extension = {"style": "cursor", "param": "after", "next": "endCursor", "size_param": "first"}
+
+    # Act
+    overridden = _load_op(parameters, body, {"x-pagination": extension})
+    disabled = _load_op([_query("offset"), _query("limit")], THINGS, {"x-pagination": False})
+
+    # Assert
+    assert overridden.pagination == IRPagination("cursor", "nodes", "after", "first", next_field="endCursor")
+    assert disabled.pagination is None
+
+
+def test_detect_pagination__invalid_x_pagination__warns_and_ignores_it() -> None:
+    """
+    Scenario:
+        `x-pagination` names a query parameter the operation does not have.
+
+    Expected Outcome:
+        A UserWarning names the problem, and the operation is loaded without pagination.
+    """
+    # Arrange
+    body = {"type": "object", "properties": {"items": THINGS}}
+
+    # Act
+    with pytest.warns(UserWarning, match="'cursor' is not a query parameter"):
+        op = _load_op([], body, {"x-pagination": {"style": "cursor", "param": "cursor", "next": "next"}})
+
+    # Assert
+    assert op.operation_id == "listThings"
+    assert op.pagination is None
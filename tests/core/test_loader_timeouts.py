@@ -0,0 +1,89 @@
+"""
+Tests for the default deadlines of operations while loading them (core/loader/operations/timeouts.py).
+"""
+
+from typing import Any
+
+import pytest
+
+from pyopenapi_gen.core.loader.loader import load_ir_from_spec
+from pyopenapi_gen.core.loader.operations.timeouts import apply_operation_timeouts
+
+
+def _spec(get_extra: dict[str, Any] | None = None) -> dict[str, Any]:
+    """A spec with a GET and a PUT operation on one path."""
+    ok = {"200": {"description": "ok", "content": {"application/json": {"schema": {"type": "string"}}}}}
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "Timeouts", "version": "1.0.0"},
+        "paths": {
+            "/settings": {
+                "get": {"operationId": "getSettings", "responses": ok, **(get_extra or {})},
+                "put": {"operationId": "putSettings", "responses": ok},
+            }
+        },
+    }
+
+
+def test_load__x_timeout__sets_operation_default() -> None:
+    """
+    Scenario:
+        The GET operation has `x-timeout: 5`; the PUT operation has none.
+    Expected Outcome:
+        The GET operation's default deadline is 5 seconds and the PUT operation has none.
+    """
+    # Act
+    operations = load_ir_from_spec(_spec({"x-timeout": 5})).operations
+
+    # Assert
+    assert {op.operation_id: op.timeout for op in operations} == {"getSettings": 5.0, "putSettings": None}
+
+
+@pytest.mark.parametrize("value", [0, -1, "5s", True], ids=["zero", "negative", "string", "bool"])
+def test_load__invalid_x_timeout__warns_and_is_ignored(value: Any) -> None:
+    """
+    Scenario:
+        `x-timeout` of the GET operation is not a positive number.
+    Expected Outcome:
+        A warning names the operation, which has no default deadline.
+    """
+    # Act
+    with pytest.warns(UserWarning, match="getSettings': must be a positive number of seconds"):
+        operations = load_ir_from_spec(_spec({"x-timeout": value})).operations
+
+    # Assert
+    assert all(op.timeout is None for op in operations)
+
+
+def test_apply_operation_timeouts__listed_ids__override_x_timeout_and_warn_on_unknown() -> None:
+    """
+    Scenario:
+        Timeouts are given at generation time for the GET operation (which has `x-timeout: 5`),
+        the PUT operation and an unknown operation ID.
+    Expected Outcome:
+        The given timeouts win over the extension and the unknown ID is reported.
+    """
+    # Arrange
+    operations = load_ir_from_spec(_spec({"x-timeout": 5})).operations
+
+    # Act
+    with pytest.warns(UserWarning, match="no operation with ID 'deleteSettings'"):
+        apply_operation_timeouts(operations, {"getSettings": 1.5, "putSettings": 30, "deleteSettings": 2})
+
+    # Assert
+    assert {op.operation_id: op.timeout for op in operations} == {"getSettings": 1.5, "putSettings": 30.0}
+
+
+def test_apply_operation_timeouts__non_positive__raises_value_error() -> None:
+    """
+    Scenario:
+        A timeout of 0 seconds is given at generation time.
+    Expected Outcome:
+        ValueError is raised.
+    """
+    # Arrange
+    operations = load_ir_from_spec(_spec()).operations
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        apply_operation_timeouts(operations, {"getSettings": 0})
@@ -0,0 +1,218 @@
+"""
+Tests for per-operation phase metrics (core/metrics.py).
+
+Covers:
+- HdrHistogram percentiles within 2% of the recorded latencies
+- Disabled, nothing is measured
+- A call through HttpxTransport records auth, serialize, network, deserialize and call phases,
+  bytes and status codes
+- Nested (de)serialization hooks count once, unattributed requests are not recorded
+- snapshot() and prometheus() exports
+"""
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.auth.plugins import BearerAuth
+from pyopenapi_gen.core.deadline import Deadline, iterate_with_deadline
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.json_codec import RESPONSE_CODEC_EXTENSION
+from pyopenapi_gen.core.metrics import HdrHistogram, MetricsRegistry, metrics
+from pyopenapi_gen.core.model_decoder import decode_model
+from pyopenapi_gen.core.utils import DataclassSerializer
+
+
+@dataclass
+class Widget:
+    name: str
+    size: int
+
+
+@pytest.fixture
+def recording() -> Iterator[MetricsRegistry]:
+    """The process-wide registry, enabled for the test and reset afterwards."""
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def _transport(auth: BearerAuth | None = None) -> HttpxTransport:
+    """An HttpxTransport whose requests are answered with a widget."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"name": "gear", "size": 3})
+
+    transport = HttpxTransport(base_url="https://api.example.com", auth=auth)
+    transport._client._transport = httpx.MockTransport(handler)
+    return transport
+
+
+def test_hdr_histogram__percentiles__within_two_percent() -> None:
+    """
+    Scenario:
+        90 latencies of 1 ms, 9 of 20 ms and 1 of 3 s are recorded.
+    Expected Outcome:
+        p50, p90 and p99 are within 2% of 1 ms, 1 ms and 20 ms; p100 is the slowest sample exactly.
+    """
+    # Arrange
+    histogram = HdrHistogram()
+    for seconds in [0.001] * 90 + [0.02] * 9 + [3.0]:
+        histogram.record(seconds)
+
+    # Act / Assert
+    assert 0.001 <= histogram.percentile(0.5) < 0.00102
+    assert 0.001 <= histogram.percentile(0.9) < 0.00102
+    assert 0.02 <= histogram.percentile(0.99) < 0.0204
+    assert histogram.percentile(1.0) == 3.0
+    assert (histogram.count, histogram.max) == (100, 3.0)
+
+
+@pytest.mark.asyncio
+async def test_deadline__metrics_disabled__nothing_recorded() -> None:
+    """
+    Scenario:
+        With metrics disabled, a request is sent within the Deadline scope of an operation.
+    Expected Outcome:
+        No call is started and the snapshot stays empty.
+    """
+    # Arrange
+    registry = MetricsRegistry()
+    transport = _transport()
+
+    # Act
+    async with Deadline(None, operation="createWidget"):
+        await transport.request("POST", "/widgets", json={"name": "gear"})
+    await transport.close()
+
+    # Assert
+    assert registry.start_call("createWidget") is None
+    assert metrics.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_call__enabled__records_every_phase_bytes_and_status(recording: MetricsRegistry) -> None:
+    """
+    Scenario:
+        Within the Deadline scope of `createWidget`, a widget is serialized, sent with bearer auth and
+        its response decoded, twice.
+    Expected Outcome:
+        Each phase has one sample per call, the call covers its phases, and the bytes sent and
+        received and the status codes are counted.
+    """
+    # Arrange
+    transport = _transport(auth=BearerAuth("secret"))
+
+    # Act
+    for _ in range(2):
+        async with Deadline(5.0, operation="createWidget"):
+            body = DataclassSerializer.serialize(Widget(name="gear", size=3))
+            response = await transport.request("POST", "/widgets", json=body)
+            decode_model(response, Widget)
+    await transport.close()
+    state = recording.snapshot()["createWidget"]
+
+    # Assert
+    assert set(state["phases"]) == {"auth", "serialize", "network", "deserialize", "call"}
+    assert all(phase["count"] == 2 for phase in state["phases"].values())
+    assert state["phases"]["call"]["sum_seconds"] >= state["phases"]["network"]["sum_seconds"]
+    assert state["request_bytes"] == 2 * len(b'{"name":"gear","size":3}')
+    assert state["response_bytes"] == 2 * len(response.content)
+    assert state["status_codes"] == {"201": 2}
+
+
+@pytest.mark.asyncio
+async def test_decode_model__nested_structuring__one_deserialize_sample_per_call(recording: MetricsRegistry) -> None:
+    """
+    Scenario:
+        decode_model is called with a custom codec, so it structures the body with structure_from_dict.
+    Expected Outcome:
+        The nested structure_from_dict is part of decode_model's sample, not a second one.
+    """
+
+    # Arrange
+    class Codec:
+        def loads(self, data: bytes | str) -> object:
+            return {"name": "gear", "size": 3}
+
+    response = httpx.Response(200, content=b"{}", extensions={RESPONSE_CODEC_EXTENSION: Codec()})
+
+    # Act
+    async with Deadline(None, operation="getWidget"):
+        widget = decode_model(response, Widget)
+
+    # Assert
+    assert widget == Widget(name="gear", size=3)
+    assert recording.snapshot()["getWidget"]["phases"]["deserialize"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iterate_with_deadline__operation__records_one_call(recording: MetricsRegistry) -> None:
+    """
+    Scenario:
+        Three items are iterated with iterate_with_deadline for operation `listWidgets`.
+    Expected Outcome:
+        The iteration is recorded as a single call.
+    """
+
+    # Arrange
+    async def items() -> AsyncIterator[int]:
+        for item in range(3):
+            yield item
+
+    # Act
+    collected = [item async for item in iterate_with_deadline(items(), None, operation="listWidgets")]
+
+    # Assert
+    assert collected == [0, 1, 2]
+    assert recording.snapshot()["listWidgets"]["phases"]["call"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request__outside_operation__not_recorded(recording: MetricsRegistry) -> None:
+    """
+    Scenario:
+        With metrics enabled, a request is sent outside the Deadline scope of any operation.
+    Expected Outcome:
+        Nothing is recorded: there is no operation to attribute it to.
+    """
+    # Arrange
+    transport = _transport(auth=BearerAuth("secret"))
+
+    # Act
+    await transport.request("GET", "/widgets")
+    await transport.close()
+
+    # Assert
+    assert recording.snapshot() == {}
+
+
+def test_prometheus__recorded_metrics__text_exposition_with_escaped_labels() -> None:
+    """
+    Scenario:
+        A network latency and an exchange are recorded for an operation whose ID holds a quote.
+    Expected Outcome:
+        The summary quantiles, sum and count and the byte and response counters are exported, with
+        the label value escaped.
+    """
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    registry.record('get"Widget', "network", 0.25)
+    registry.record_exchange('get"Widget', 200, 10, 512)
+
+    # Act
+    text = registry.prometheus(namespace="shop")
+
+    # Assert
+    labels = 'operation="get\\"Widget",phase="network"'
+    assert "# TYPE shop_phase_seconds summary" in text
+    assert f'shop_phase_seconds{{{labels},quantile="0.99"}} 0.25\n' in text
+    assert f"shop_phase_seconds_sum{{{labels}}} 0.25\n" in text
+    assert f"shop_phase_seconds_count{{{labels}}} 1\n" in text
+    assert 'shop_bytes_total{operation="get\\"Widget",direction="sent"} 10\n' in text
+    assert 'shop_bytes_total{operation="get\\"Widget",direction="received"} 512\n' in text
+    assert 'shop_responses_total{operation="get\\"Widget",status="200"} 1\n' in text
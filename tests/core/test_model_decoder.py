@@ -0,0 +1,316 @@
+"""
+Tests for single-pass decoding of JSON bodies into models (core/model_decoder.py).
+
+Covers:
+- structure_from_json builds the same models as structure_from_dict(json.loads(...))
+- Nested, nullable, recursive and renamed fields, unknown keys and whitespace
+- Invalid payloads fall back to structure_from_dict and keep its error messages
+- decode_model decodes with the response's codec, in a single pass only from the client's threshold
+- JsonArrayDecoder yields the same items for any chunking of the body
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core import model_decoder
+from pyopenapi_gen.core.cattrs_converter import structure_from_dict
+from pyopenapi_gen.core.json_codec import RESPONSE_CODEC_EXTENSION, StdlibJsonCodec
+from pyopenapi_gen.core.model_decoder import SINGLE_PASS_EXTENSION, JsonArrayDecoder, decode_model, structure_from_json
+
+
+class ReportStatus(str, Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+@dataclass
+class ReportTag:
+    name: str
+    weight: float | None = None
+
+
+@dataclass
+class ReportRow:
+    row_id: int
+    title: str
+    created_at: datetime
+    status: ReportStatus
+    tags: list[ReportTag] = field(default_factory=list)
+    parent: ReportRow | None = None
+    counts: dict[str, int] | None = None
+
+    class Meta:
+        key_transform_with_load = {
+            "rowId": "row_id",
+            "title": "title",
+            "createdAt": "created_at",
+            "status": "status",
+            "tags": "tags",
+            "parent": "parent",
+            "counts": "counts",
+        }
+
+
+ROWS: list[dict[str, Any]] = [
+    {
+        "rowId": 1,
+        "title": "first",
+        "createdAt": "2024-01-02T03:04:05+00:00",
+        "status": "open",
+        "tags": [{"name": "a", "weight": 1}, {"name": "b"}],
+        "parent": {"rowId": 0, "title": "root", "createdAt": "2024-01-01T00:00:00", "status": "closed"},
+        "counts": {"x": 1},
+        "unknownField": [1, {"nested": None}],
+    },
+    {"rowId": 2, "title": "second", "createdAt": "2024-01-03T00:00:00+00:00", "status": "closed", "parent": None},
+]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_structure_from_json__models_and_lists__match_two_pass_result(indent: int | None) -> None:
+    """
+    Scenario:
+        A list of models with nested, nullable, recursive, renamed and unknown fields is
+        decoded from compact and indented JSON bytes.
+
+    Expected Outcome:
+        The result equals structure_from_dict(json.loads(...)), including scalar conversion
+        (int weight to float), enums, datetimes and dataclass defaults.
+    """
+    # Arrange
+    data = json.dumps(ROWS, indent=indent).encode()
+
+    # Act
+    rows = structure_from_json(data, list[ReportRow])
+    single = structure_from_json(json.dumps(ROWS[0]).encode(), ReportRow)
+
+    # Assert
+    assert rows == structure_from_dict(json.loads(data), list[ReportRow])
+    assert single == rows[0]
+    assert rows[0].created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert rows[0].status is ReportStatus.OPEN
+    assert rows[0].tags[0].weight == 1.0 and isinstance(rows[0].tags[0].weight, float)
+    assert rows[0].parent is not None and rows[0].parent.tags == []
+    assert rows[1].parent is None and rows[1].counts is None
+
+
+def test_structure_from_json__model_targets__do_not_build_a_dict_tree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Scenario:
+        A list of models is decoded.
+
+    Expected Outcome:
+        The two-pass path (codec loads + structure_from_dict) is never taken.
+    """
+
+    # Arrange
+    def fail(*_args: Any) -> Any:
+        raise AssertionError("two-pass path used")
+
+    monkeypatch.setattr(model_decoder, "structure_from_dict", fail)
+
+    # Act
+    rows = structure_from_json(json.dumps(ROWS).encode(), list[ReportRow])
+
+    # Assert
+    assert [row.row_id for row in rows] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'[{"rowId": 1, "title": "x", "createdAt": "2024-01-01T00:00:00", "status": "open"} trailing',
+        b'[{"title": "x", "createdAt": "2024-01-01T00:00:00", "status": "open"}]',
+        b'[{"rowId": 1, "title": "x", "createdAt": "2024-01-01T00:00:00", "status": "bogus"}]',
+        b'{"rowId": 1}',
+    ],
+)
+def test_structure_from_json__invalid_payloads__raise_like_structure_from_dict(payload: bytes) -> None:
+    """
+    Scenario:
+        The body is invalid JSON, misses a required field, has an invalid enum value or has
+        the wrong shape for the target.
+
+    Expected Outcome:
+        A ValueError is raised, with the same message as the two-pass path for valid JSON.
+    """
+    # Act
+    with pytest.raises(ValueError) as exc_info:
+        structure_from_json(payload, list[ReportRow])
+
+    # Assert
+    try:
+        decoded = json.loads(payload)
+    except json.JSONDecodeError:
+        return
+    with pytest.raises(ValueError) as expected:
+        structure_from_dict(decoded, list[ReportRow])
+    assert str(exc_info.value) == str(expected.value)
+
+
+def test_structure_from_json__targets_without_models__use_two_pass_path() -> None:
+    """
+    Scenario:
+        The target contains no dataclass (dict of ints) or is text rather than bytes.
+
+    Expected Outcome:
+        Values are decoded and structured as before.
+    """
+    # Act & Assert
+    assert structure_from_json(b'{"a": "1"}', dict[str, int]) == {"a": 1}
+    assert structure_from_json('  {"name": "t"}\n', ReportTag) == ReportTag(name="t")
+
+
+class RecordingCodec(StdlibJsonCodec):
+    name = "recording-test"
+
+    def __init__(self) -> None:
+        self.loaded: list[bytes | str] = []
+
+    def loads(self, data: bytes | str) -> Any:
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+def test_decode_model__single_pass_threshold__builtin_codec_used_below_it_custom_always(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Scenario:
+        A body is decoded without a single-pass threshold, below and at it with the stdlib codec,
+        and at it with a custom codec.
+
+    Expected Outcome:
+        All produce the same model. The codec decodes the body except for the stdlib codec at the
+        threshold, where the single-pass parser does; a custom codec is always used.
+    """
+    # Arrange
+    body = json.dumps(ROWS[1]).encode()
+    stdlib_loaded: list[bytes | str] = []
+    stdlib_loads = StdlibJsonCodec.loads
+    monkeypatch.setattr(
+        StdlibJsonCodec, "loads", lambda self, data: stdlib_loaded.append(data) or stdlib_loads(self, data)
+    )
+    custom_codec = RecordingCodec()
+
+    def decode(codec: StdlibJsonCodec, single_pass_bytes: int | None) -> ReportRow:
+        extensions: dict[str, Any] = {RESPONSE_CODEC_EXTENSION: codec}
+        if single_pass_bytes is not None:
+            extensions[SINGLE_PASS_EXTENSION] = single_pass_bytes
+        return decode_model(httpx.Response(200, content=body, extensions=extensions), ReportRow)
+
+    # Act
+    without_threshold = decode(StdlibJsonCodec(), None)
+    below_threshold = decode(StdlibJsonCodec(), len(body) + 1)
+    loaded_before_single_pass = len(stdlib_loaded)
+    single_pass = decode(StdlibJsonCodec(), len(body))
+    loaded_after_single_pass = len(stdlib_loaded)
+    custom = decode(custom_codec, len(body))
+
+    # Assert
+    assert without_threshold == below_threshold == single_pass == custom
+    assert single_pass.title == "second"
+    assert loaded_before_single_pass == loaded_after_single_pass == 2
+    assert custom_codec.loaded == [body]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100_000])
+def test_json_array_decoder__any_chunking__yields_same_items_as_whole_body(chunk_size: int) -> None:
+    """
+    Scenario:
+        An indented JSON array of models (with a UTF-8 character split across chunks) is fed
+        in chunks of various sizes.
+
+    Expected Outcome:
+        The items returned by feed() and close() equal the result of decoding the whole body,
+        and each item is returned as soon as the chunk completing it arrives.
+    """
+    # Arrange
+    rows = [dict(ROWS[0], title="fïrst"), ROWS[1]]
+    data = b"\xef\xbb\xbf" + json.dumps(rows, indent=2, ensure_ascii=False).encode()
+    decoder = JsonArrayDecoder(ReportRow)
+    items: list[ReportRow] = []
+
+    # Act
+    for start in range(0, len(data), chunk_size):
+        items.extend(decoder.feed(data[start : start + chunk_size]))
+        if start + chunk_size < len(data) - 10:
+            assert len(items) < 2
+    items.extend(decoder.close())
+
+    # Assert
+    assert items == structure_from_dict(rows, list[ReportRow])
+
+
+def test_json_array_decoder__scalars_split_across_chunks__wait_for_the_next_chunk() -> None:
+    """
+    Scenario:
+        A number is split across chunks, so the first part alone is a valid number.
+
+    Expected Outcome:
+        The number is only returned once it is complete.
+    """
+    # Arrange
+    decoder = JsonArrayDecoder(int)
+
+    # Act & Assert
+    assert decoder.feed(b"[ 12") == []
+    assert decoder.feed(b"34 , 5") == [1234]
+    assert decoder.feed(b"]") == [5]
+    assert decoder.close() == []
+
+
+def test_json_array_decoder__large_item_over_many_chunks__parsed_once_when_complete() -> None:
+    """
+    Scenario:
+        A 250 KB item, with strings holding brackets, commas, quotes and backslashes, is fed in
+        1 KB chunks, followed by a small item.
+
+    Expected Outcome:
+        Each item is parsed exactly once, when the chunk closing it arrives, instead of on every
+        chunk; the buffered text is joined only then.
+    """
+    # Arrange
+    big = {"rows": [{"id": i, "text": 'a "quoted" \\ [x], {y}'} for i in range(5000)]}
+    data = json.dumps([big, {"rows": []}]).encode()
+    decoder = JsonArrayDecoder(dict[str, Any])
+    parse_item = decoder._parse_item
+    parsed_at: list[int] = []
+    decoder._parse_item = lambda s, i: parsed_at.append(i) or parse_item(s, i)
+    items: list[dict[str, Any]] = []
+
+    # Act
+    for start in range(0, len(data), 1024):
+        items.extend(decoder.feed(data[start : start + 1024]))
+    items.extend(decoder.close())
+
+    # Assert
+    assert len(data) > 200_000
+    assert items == [big, {"rows": []}]
+    assert len(parsed_at) == 2
+
+
+@pytest.mark.parametrize("payload", [b"", b'[{"name": "a"}', b'{"name": "a"}', b'[{"name": "a"} {"name": "b"}]'])
+def test_json_array_decoder__malformed_or_truncated_body__raises_value_error(payload: bytes) -> None:
+    """
+    Scenario:
+        The body is empty, truncated, not an array or misses a separator.
+
+    Expected Outcome:
+        ValueError is raised by feed() or close().
+    """
+    # Arrange
+    decoder = JsonArrayDecoder(ReportTag)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        decoder.feed(payload)
+        decoder.close()
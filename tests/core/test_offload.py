@@ -0,0 +1,206 @@
+"""
+Tests for decoding large response bodies off the event loop (core/offload.py).
+
+Covers:
+- Through HttpxTransport, bodies below the threshold decode inline and larger ones through the offload
+- The event loop keeps running while a body is decoded in the thread pool
+- A process pool is sent the body bytes and returns the same models
+- The deserialize phase is recorded once per call
+- Pools are shut down by close() and created again on use; given executors are left running
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.deadline import Deadline
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.json_codec import RESPONSE_CODEC_EXTENSION
+from pyopenapi_gen.core.metrics import MetricsRegistry, metrics
+from pyopenapi_gen.core.model_decoder import decode_model
+from pyopenapi_gen.core.offload import DECODE_OFFLOAD_EXTENSION, DecodeOffload, decode_offload
+
+
+@dataclass
+class Widget:
+    name: str
+    size: int
+
+
+def _response(content: bytes, offload: DecodeOffload, codec: Any = None) -> httpx.Response:
+    """A response as received by a transport with `offload` (and a custom `codec`, if given)."""
+    extensions: dict[str, Any] = {DECODE_OFFLOAD_EXTENSION: offload}
+    if codec is not None:
+        extensions[RESPONSE_CODEC_EXTENSION] = codec
+    return httpx.Response(200, content=content, extensions=extensions)
+
+
+@pytest.fixture
+def recording() -> Iterator[MetricsRegistry]:
+    """The process-wide metrics registry, enabled for the test and reset afterwards."""
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_decode_offload__through_transport__applies_from_the_threshold() -> None:
+    """
+    Scenario:
+        An HttpxTransport with a 100-byte threshold receives a list of one widget and one of ten.
+    Expected Outcome:
+        The short body is left to decode_model; the long one is decoded by the offload into the same
+        models as decode_model.
+    """
+    # Arrange
+    offload = DecodeOffload(threshold_bytes=100)
+    transport = HttpxTransport(base_url="https://api.example.com", decode_offload=offload)
+    transport._client._transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=[{"name": "gear", "size": 3}] * int(request.url.params["count"]))
+    )
+
+    # Act
+    short = await transport.request("GET", "/widgets", params={"count": 1})
+    long = await transport.request("GET", "/widgets", params={"count": 10})
+    offloaded = decode_offload(long)
+    assert offloaded is not None
+    widgets = await offloaded.decode(long, List[Widget])
+    await transport.close()
+
+    # Assert
+    assert decode_offload(short) is None
+    assert offloaded is offload
+    assert widgets == decode_model(long, List[Widget]) == [Widget(name="gear", size=3)] * 10
+
+
+@pytest.mark.asyncio
+async def test_decode__thread_pool__event_loop_keeps_running() -> None:
+    """
+    Scenario:
+        A body is decoded with a codec whose loads() only returns once a coroutine on the event loop has
+        run.
+    Expected Outcome:
+        The decode completes (inline, it would wait for the loop forever): it runs on a pool thread
+        while the loop runs the coroutine.
+    """
+    # Arrange
+    loop_ran = threading.Event()
+    decoded_on: list[threading.Thread] = []
+
+    class WaitingCodec:
+        name = "waiting"
+
+        def loads(self, data: bytes | str) -> Any:
+            decoded_on.append(threading.current_thread())
+            assert loop_ran.wait(timeout=5), "the event loop did not run during the decode"
+            return {"name": "gear", "size": 3}
+
+        def dumps(self, value: Any) -> bytes:
+            raise NotImplementedError
+
+    async def on_loop() -> None:
+        await asyncio.sleep(0.01)
+        loop_ran.set()
+
+    offload = DecodeOffload(threshold_bytes=0)
+    response = _response(b"{}", offload, codec=WaitingCodec())
+
+    # Act
+    widget, _ = await asyncio.gather(offload.decode(response, Widget), on_loop())
+    offload.close()
+
+    # Assert
+    assert widget == Widget(name="gear", size=3)
+    assert decoded_on[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_decode__process_pool__same_models_as_inline() -> None:
+    """
+    Scenario:
+        A list of widgets is decoded by a process pool.
+    Expected Outcome:
+        The models returned from the worker equal those decoded inline.
+    """
+    # Arrange
+    offload = DecodeOffload(threshold_bytes=0, executor="process", max_workers=1)
+    response = _response(b'[{"name": "gear", "size": 3}, {"name": "cog", "size": 5}]', offload)
+
+    # Act
+    try:
+        widgets = await offload.decode(response, List[Widget])
+    finally:
+        await asyncio.to_thread(offload.close)
+
+    # Assert
+    assert widgets == decode_model(response, List[Widget]) == [Widget("gear", 3), Widget("cog", 5)]
+
+
+@pytest.mark.asyncio
+async def test_decode__metrics_enabled__one_deserialize_sample(recording: MetricsRegistry) -> None:
+    """
+    Scenario:
+        With metrics enabled, a body is decoded by the thread pool within the Deadline scope of `getWidget`.
+    Expected Outcome:
+        The decode is the single deserialize sample of the call.
+    """
+    # Arrange
+    offload = DecodeOffload(threshold_bytes=0)
+    response = _response(b'{"name": "gear", "size": 3}', offload)
+
+    # Act
+    async with Deadline(None, operation="getWidget"):
+        await offload.decode(response, Widget)
+    offload.close()
+
+    # Assert
+    assert recording.snapshot()["getWidget"]["phases"]["deserialize"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close__own_pool_recreated_given_executor_left_running() -> None:
+    """
+    Scenario:
+        An offload with its own thread pool and one with a given executor are closed, then used again.
+    Expected Outcome:
+        The own pool is shut down and a new one is created for the next decode; the given executor
+        stays usable.
+    """
+    # Arrange
+    own = DecodeOffload(threshold_bytes=0)
+    executor = ThreadPoolExecutor(max_workers=1)
+    given = DecodeOffload(threshold_bytes=0, executor=executor)
+    body = b'{"name": "gear", "size": 3}'
+    await own.decode(_response(body, own), Widget)
+    first_pool = own._pool
+
+    # Act
+    own.close()
+    given.close()
+    again = await own.decode(_response(body, own), Widget)
+    via_given = await given.decode(_response(body, given), Widget)
+    own.close()
+    executor.shutdown()
+
+    # Assert
+    assert first_pool is not None and own._pool is None
+    assert again == via_given == Widget(name="gear", size=3)
+
+
+def test_init__unknown_executor__raises_value_error() -> None:
+    """
+    Scenario:
+        DecodeOffload is given an executor name other than "thread" or "process".
+    Expected Outcome:
+        ValueError is raised.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError, match="executor"):
+        DecodeOffload(executor="fiber")
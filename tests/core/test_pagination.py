@@ -2,12 +2,20 @@
 Tests for the pagination module that provides utilities for paginated API endpoints.
 """
 
+import asyncio
 from typing import Any, List
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
-from pyopenapi_gen.core.pagination import paginate_by_next
+from pyopenapi_gen.core.pagination import (
+    paginate_by_link,
+    paginate_by_next,
+    paginate_by_offset,
+    paginate_by_page,
+    paginate_pipelined,
+)
 
 
 @pytest.mark.asyncio
@@ -207,3 +215,262 @@ def test_paginate_by_next__returns_async_iterator() -> None:
     # Verify it has the expected async iterator methods
     assert hasattr(iterator, "__aiter__")
     assert hasattr(iterator, "__anext__")
+
+
+@pytest.mark.asyncio
+async def test_paginate_pipelined__slow_consumer__fetches_up_to_prefetch_pages_ahead() -> None:
+    """
+    Scenario:
+        paginate_pipelined follows a cursor through 6 pages while the consumer is slow
+    Expected Outcome:
+        Items are yielded in order, the next pages are requested while a page is being
+        consumed, and never more than `prefetch` pages are fetched ahead of the consumer
+    """
+    fetched: List[int] = []
+    consumed_pages: List[int] = []
+    max_ahead = 0
+
+    async def fetch_page(cursor: int = 0) -> dict[str, Any]:
+        fetched.append(cursor)
+        await asyncio.sleep(0)
+        return {"data": [cursor * 10, cursor * 10 + 1], "next": cursor + 1 if cursor < 5 else None}
+
+    def next_params(page: dict[str, Any], params: dict[str, Any]) -> dict[str, Any] | None:
+        return None if page["next"] is None else {**params, "cursor": page["next"]}
+
+    collected: List[int] = []
+    async for item in paginate_pipelined(fetch_page, lambda page: page["data"], next_params, prefetch=2):
+        collected.append(item)
+        if item % 10 == 0:
+            consumed_pages.append(item // 10)
+            await asyncio.sleep(0.01)  # Slow consumer: let the producer run ahead
+            max_ahead = max(max_ahead, len(fetched) - len(consumed_pages))
+
+    assert collected == [n for cursor in range(6) for n in (cursor * 10, cursor * 10 + 1)]
+    assert fetched == [0, 1, 2, 3, 4, 5]
+    assert max_ahead == 2
+
+
+@pytest.mark.asyncio
+async def test_paginate_by_offset__total_known__fans_out_under_concurrency_limit_in_order() -> None:
+    """
+    Scenario:
+        paginate_by_offset crawls 95 items in pages of 10; later pages answer faster
+    Expected Outcome:
+        All remaining offsets are requested concurrently (never more than `concurrency` at
+        once) and the items are still yielded in order
+    """
+    in_flight = 0
+    max_in_flight = 0
+    offsets: List[int] = []
+
+    async def fetch_page(offset: int = 0, limit: int = 10) -> dict[str, Any]:
+        nonlocal in_flight, max_in_flight
+        offsets.append(offset)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (100 - offset) / 10)
+        in_flight -= 1
+        return {"items": list(range(offset, min(offset + limit, 95))), "total": 95}
+
+    collected = [
+        item
+        async for item in paginate_by_offset(
+            fetch_page, lambda page: page["items"], lambda page: page["total"], concurrency=3, limit=10
+        )
+    ]
+
+    assert collected == list(range(95))
+    assert sorted(offsets) == list(range(0, 100, 10))
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_by_offset__total_unknown__crawls_until_short_page() -> None:
+    """
+    Scenario:
+        paginate_by_offset crawls a collection whose responses do not report a total
+    Expected Outcome:
+        Offsets advance by the number of items received and the crawl stops at the first short page
+    """
+    calls: List[dict[str, Any]] = []
+
+    async def fetch_page(**kwargs: Any) -> List[int]:
+        calls.append(kwargs)
+        offset = kwargs.get("skip", 0)
+        return list(range(offset, min(offset + 4, 10)))
+
+    collected = [
+        item
+        async for item in paginate_by_offset(
+            fetch_page, lambda page: page, lambda page: None, offset_param="skip", limit_param="take", take=4
+        )
+    ]
+
+    assert collected == list(range(10))
+    assert calls == [{"take": 4}, {"take": 4, "skip": 4}, {"take": 4, "skip": 8}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reports_total", [True, False])
+async def test_paginate_by_offset__server_caps_page_size__steps_by_first_page(reports_total: bool) -> None:
+    """
+    Scenario:
+        paginate_by_offset asks for pages of 250 from a server that returns at most 100 of its
+        1000 items, with and without reporting the total
+    Expected Outcome:
+        All 1000 items are yielded once: offsets advance by the 100 items of the first page
+    """
+    offsets: List[int] = []
+
+    async def fetch_page(offset: int = 0, limit: int = 250) -> dict[str, Any]:
+        offsets.append(offset)
+        return {"items": list(range(offset, min(offset + min(limit, 100), 1000))), "total": 1000}
+
+    collected = [
+        item
+        async for item in paginate_by_offset(
+            fetch_page,
+            lambda page: page["items"],
+            lambda page: page["total"] if reports_total else None,
+            limit=250,
+        )
+    ]
+
+    assert collected == list(range(1000))
+    expected_offsets = list(range(0, 1000, 100)) if reports_total else list(range(0, 1100, 100))
+    assert sorted(offsets) == expected_offsets
+
+
+@pytest.mark.asyncio
+async def test_paginate_by_page__total_pages_known_and_unknown__yield_all_items() -> None:
+    """
+    Scenario:
+        paginate_by_page crawls 3 pages, once with the page count reported and once without
+    Expected Outcome:
+        Both crawls yield all items in order; without a page count the crawl stops at the first empty page
+    """
+    pages = {1: ["a", "b"], 2: ["c", "d"], 3: ["e"]}
+    requested: List[int] = []
+
+    async def fetch_page(page: int = 1, size: int = 2) -> dict[str, Any]:
+        requested.append(page)
+        return {"results": pages.get(page, []), "pages": len(pages)}
+
+    with_total = [
+        item async for item in paginate_by_page(fetch_page, lambda r: r["results"], lambda r: r["pages"], size=2)
+    ]
+    requested_with_total = sorted(requested)
+    requested.clear()
+    without_total = [
+        item async for item in paginate_by_page(fetch_page, lambda r: r["results"], lambda r: None, prefetch=0)
+    ]
+
+    assert with_total == without_total == ["a", "b", "c", "d", "e"]
+    assert requested_with_total == [1, 2, 3]
+    assert requested == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_paginate_by_link__follows_relative_next_links__until_last_page() -> None:
+    """
+    Scenario:
+        paginate_by_link crawls 3 pages whose Link headers point to the next page with a relative URL
+    Expected Outcome:
+        All items are yielded in order; later pages are requested by their resolved URL without extra params
+    """
+    pages = {
+        "https://api.test/v1/users?page=1": (["a", "b"], '</v1/users?page=2>; rel="next"'),
+        "https://api.test/v1/users?page=2": (["c"], '<users?page=3>; rel="next", </v1/users?page=1>; rel="first"'),
+        "https://api.test/v1/users?page=3": (["d"], None),
+    }
+    calls: List[tuple[str, dict[str, Any] | None]] = []
+
+    async def fetch_page(url: str, params: dict[str, Any] | None) -> httpx.Response:
+        calls.append((url, params))
+        request = httpx.Request("GET", url, params=params)
+        items, link = pages[str(request.url)]
+        return httpx.Response(200, json=items, headers={"Link": link} if link else {}, request=request)
+
+    collected = [
+        item
+        async for item in paginate_by_link(
+            fetch_page, lambda response: response.json(), "https://api.test/v1/users", {"page": 1}
+        )
+    ]
+
+    assert collected == ["a", "b", "c", "d"]
+    assert calls == [
+        ("https://api.test/v1/users", {"page": 1}),
+        ("https://api.test/v1/users?page=2", None),
+        ("https://api.test/v1/users?page=3", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_paginate_pipelined__failing_page__raises_after_earlier_items() -> None:
+    """
+    Scenario:
+        The third page request fails while earlier pages were fetched successfully
+    Expected Outcome:
+        The items of the first two pages are yielded before the error is raised
+    """
+
+    async def fetch_page(cursor: int = 0) -> List[int]:
+        if cursor == 2:
+            raise RuntimeError("page 2 failed")
+        return [cursor]
+
+    collected: List[int] = []
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        async for item in paginate_pipelined(
+            fetch_page, lambda page: page, lambda page, params: {"cursor": params.get("cursor", 0) + 1}, prefetch=4
+        ):
+            collected.append(item)
+
+    assert collected == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_paginate_by_offset__consumer_stops_early__cancels_pending_fetches() -> None:
+    """
+    Scenario:
+        The consumer closes a fanned-out crawl while prefetched page requests are still in flight
+    Expected Outcome:
+        The pending page requests are cancelled
+    """
+    cancelled: List[int] = []
+
+    async def fetch_page(offset: int = 0, limit: int = 1) -> dict[str, Any]:
+        if offset >= 2:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(offset)
+                raise
+        return {"items": [offset], "total": 100}
+
+    iterator = paginate_by_offset(
+        fetch_page, lambda page: page["items"], lambda page: page["total"], prefetch=3, limit=1
+    )
+    collected = [await iterator.__anext__(), await iterator.__anext__()]
+    await asyncio.sleep(0)  # Let the prefetched requests start
+    await iterator.aclose()  # type: ignore[attr-defined]
+
+    assert collected == [0, 1]
+    assert sorted(cancelled) == [2, 3, 4]
+
+
+def test_paginate_pipelined__negative_prefetch__raises_value_error() -> None:
+    """
+    Scenario:
+        A paginator is created with a negative prefetch depth or no concurrency
+    Expected Outcome:
+        ValueError is raised immediately
+    """
+    mock_fetch = AsyncMock(return_value={})
+
+    with pytest.raises(ValueError, match="prefetch"):
+        paginate_pipelined(mock_fetch, lambda page: [], lambda page, params: None, prefetch=-1)
+    with pytest.raises(ValueError, match="concurrency"):
+        paginate_by_page(mock_fetch, lambda page: [], lambda page: None, concurrency=0)
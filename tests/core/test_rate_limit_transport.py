@@ -0,0 +1,190 @@
+"""
+Tests for rate-limit-aware request scheduling (core/rate_limit_transport.py).
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.rate_limit_transport import RateLimitingTransport, parse_rate_limit
+
+
+class WindowedServer:
+    """Allows `limit` requests per `window` seconds per host, advertising its budget in RateLimit-* headers."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.windows: dict[str, tuple[float, int]] = {}
+        self.statuses: list[int] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        now = time.monotonic()
+        start, count = self.windows.get(request.url.host, (now, 0))
+        if now >= start + self.window:
+            start, count = now, 0
+        count += 1
+        self.windows[request.url.host] = (start, count)
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(max(self.limit - count, 0)),
+            "RateLimit-Reset": f"{start + self.window - now:.3f}",
+        }
+        status = 200 if count <= self.limit else 429
+        self.statuses.append(status)
+        await asyncio.sleep(0.005)
+        return httpx.Response(status, headers=headers)
+
+
+def _rate_limited(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> RateLimitingTransport:
+    """A RateLimitingTransport over an HttpxTransport whose requests are answered by `handler`."""
+    inner = HttpxTransport(base_url="https://a.example.com")
+    inner._client._transport = httpx.MockTransport(handler)
+    return RateLimitingTransport(inner, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"RateLimit-Limit": "100", "RateLimit-Remaining": "42", "RateLimit-Reset": "30"}, (100, 42, 30)),
+        ({"RateLimit": "limit=100, remaining=42, reset=30"}, (100, 42, 30)),
+        ({"RateLimit": '"default";r=42;t=30', "RateLimit-Policy": '"default";q=100;w=60'}, (100, 42, 30)),
+        ({"RateLimit-Policy": "100;w=60", "RateLimit-Remaining": "42", "RateLimit-Reset": "30"}, (100, 42, 30)),
+        ({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "42"}, (100, 42, None)),
+        ({}, (None, None, None)),
+    ],
+    ids=["ietf-fields", "combined", "structured", "policy", "x-ratelimit", "none"],
+)
+def test_parse_rate_limit__header_variants__read_limit_remaining_and_reset(
+    headers: dict[str, str], expected: tuple[float | None, float | None, float | None]
+) -> None:
+    """
+    Scenario:
+        Responses advertise their rate limit with the header variants in use.
+    Expected Outcome:
+        The same limit, remaining budget and reset delay are read from each of them.
+    """
+    # Act
+    parsed = parse_rate_limit(httpx.Headers(headers))
+
+    # Assert
+    assert parsed == expected
+
+
+def test_parse_rate_limit__epoch_reset__converted_to_seconds_from_now() -> None:
+    """
+    Scenario:
+        X-RateLimit-Reset carries the epoch time of the reset instead of delta-seconds.
+    Expected Outcome:
+        The reset is reported as the seconds left until that time.
+    """
+    # Act
+    _, _, reset = parse_rate_limit(httpx.Headers({"X-RateLimit-Reset": str(int(time.time()) + 30)}))
+
+    # Assert
+    assert reset is not None and 28 < reset <= 30
+
+
+@pytest.mark.asyncio
+async def test_request__burst_beyond_budget__is_queued_until_the_window_resets_without_429s() -> None:
+    """
+    Scenario:
+        A server allows 3 requests per 100 ms; after a first request reveals the budget, 10 requests
+        are sent at once, and one to another host.
+    Expected Outcome:
+        No request is rejected: the excess waits in the queue for the next windows, the queue depth
+        is visible while it waits, and the other host is not delayed.
+    """
+    # Arrange
+    server = WindowedServer(limit=3, window=0.1)
+    transport = _rate_limited(server.handler)
+    await transport.request("GET", "https://a.example.com/items")
+
+    # Act
+    started = time.monotonic()
+    burst = asyncio.gather(*(transport.request("GET", "https://a.example.com/items") for _ in range(10)))
+    await asyncio.sleep(0.02)
+    queued = transport.stats()["https://a.example.com"].queued
+    await transport.request("GET", "https://b.example.com/items")
+    other_host_seconds = time.monotonic() - started
+    responses = await burst
+    elapsed = time.monotonic() - started
+    stats = transport.stats()["https://a.example.com"]
+    await transport.close()
+
+    # Assert
+    assert [r.status_code for r in responses] == [200] * 10
+    assert 429 not in server.statuses
+    assert queued >= 5
+    assert other_host_seconds < 0.15
+    assert elapsed >= 0.3  # 2 requests left in the first window, then 3 per window
+    assert (stats.limit, stats.requests, stats.throttled, stats.queued) == (3, 11, 0, 0)
+    assert stats.delayed >= 5
+    assert stats.max_wait_seconds >= 0.3
+    assert 0 < stats.mean_wait_seconds <= stats.max_wait_seconds
+
+
+@pytest.mark.asyncio
+async def test_request__429_with_retry_after__pauses_origin_and_retries() -> None:
+    """
+    Scenario:
+        The server answers the first request with 429 and `Retry-After: 0.1`, then accepts requests.
+    Expected Outcome:
+        The request is retried after the pause and returns the 200; a request sent during the pause
+        waits for it too.
+    """
+    # Arrange
+    sent: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        if len(sent) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.1"})
+        return httpx.Response(200)
+
+    transport = _rate_limited(handler)
+
+    # Act
+    first = asyncio.ensure_future(transport.request("GET", "https://a.example.com/items"))
+    await asyncio.sleep(0.02)
+    second = await transport.request("GET", "https://a.example.com/items")
+    response = await first
+    stats = transport.stats()["https://a.example.com"]
+    await transport.close()
+
+    # Assert
+    assert (response.status_code, second.status_code) == (200, 200)
+    assert all(t - sent[0] >= 0.09 for t in sent[1:])
+    assert (stats.requests, stats.throttled) == (3, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_retries, max_retry_wait", [(0, 60.0), (3, 0.5)], ids=["no-retries", "wait-too-long"])
+async def test_request__429_not_retried__is_returned(max_retries: int, max_retry_wait: float) -> None:
+    """
+    Scenario:
+        A 429 is received with retries disabled, or with a Retry-After longer than max_retry_wait.
+    Expected Outcome:
+        The 429 response is returned to the caller after one request.
+    """
+    # Arrange
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    transport = _rate_limited(handler, max_retries=max_retries, max_retry_wait=max_retry_wait)
+
+    # Act
+    response = await transport.request("GET", "https://a.example.com/items")
+    await transport.close()
+
+    # Assert
+    assert response.status_code == 429
+    assert attempts == 1
@@ -0,0 +1,242 @@
+"""
+Tests for the slow-request sampler (core/sampler.py) and its use by HttpxTransport.
+
+Covers:
+- Requests slower than the threshold are captured with their operation, path template, sizes,
+  pool wait and phases; faster ones only at the sample rate
+- The ring buffer keeps the latest traces
+- Retries of RateLimitingTransport, failed requests and streamed bodies are traced
+- Traces are dumped as JSON lines on demand and on a signal
+"""
+
+import asyncio
+import io
+import json
+import os
+import signal
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.deadline import Deadline
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.rate_limit_transport import RateLimitingTransport
+from pyopenapi_gen.core.sampler import SlowRequestSampler
+
+
+def _transport(handler: Callable[[httpx.Request], Any], sampler: SlowRequestSampler) -> HttpxTransport:
+    """An HttpxTransport whose requests are answered by `handler`."""
+    transport = HttpxTransport(base_url="https://api.example.com", sampler=sampler)
+    transport._client._transport = httpx.MockTransport(handler)
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_request__slower_than_threshold__trace_captured() -> None:
+    """
+    Scenario:
+        Within the Deadline scope of `updateWidget`, a request with a JSON body waits 10 ms for a
+        connection and is then answered in 50 ms, against a threshold of 20 ms.
+    Expected Outcome:
+        One "slow" trace names the operation and its path template, and holds the status code, both
+        sizes, the pool wait and the phase timings.
+    """
+
+    # Arrange
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        # The first trace event of a request is sent once it holds a pool connection
+        await request.extensions["trace"]("connection.connect_tcp.started", {})
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"name": "gear"})
+
+    sampler = SlowRequestSampler(threshold_seconds=0.02)
+    transport = _transport(handler, sampler)
+
+    # Act
+    async with Deadline(None, operation="updateWidget", route="/widgets/{widgetId}"):
+        await transport.request("PUT", "/widgets/7", json={"name": "gear"})
+    await transport.close()
+
+    # Assert
+    [trace] = sampler.traces
+    assert (trace.reason, trace.operation, trace.url_template) == ("slow", "updateWidget", "/widgets/{widgetId}")
+    assert (trace.method, trace.url, trace.status_code, trace.error) == ("PUT", "/widgets/7", 200, None)
+    assert trace.request_bytes == len(b'{"name":"gear"}')
+    assert trace.response_bytes == len(b'{"name":"gear"}')
+    assert trace.duration_seconds >= 0.06 and trace.retries == 0
+    assert set(trace.phases) == {"prepare", "queue", "pool_wait", "network"}
+    assert trace.pool_wait_seconds is not None and 0.01 <= trace.pool_wait_seconds < 0.05
+    assert trace.phases["pool_wait"] == trace.pool_wait_seconds
+    assert trace.phases["network"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_request__fast__captured_only_at_sample_rate() -> None:
+    """
+    Scenario:
+        Fast requests are sent outside any operation, through a sampler with a rate of 0 and another
+        with a rate of 1.
+    Expected Outcome:
+        The first captures nothing; the second captures every request as "sampled", without operation.
+    """
+    # Arrange
+    never = SlowRequestSampler(threshold_seconds=1.0, sample_rate=0.0)
+    always = SlowRequestSampler(threshold_seconds=None, sample_rate=1.0)
+    transports = [_transport(lambda request: httpx.Response(204), sampler) for sampler in (never, always)]
+
+    # Act
+    for transport in transports:
+        for _ in range(3):
+            await transport.request("GET", "/widgets")
+        await transport.close()
+
+    # Assert
+    assert list(never.traces) == []
+    assert [(trace.reason, trace.operation) for trace in always.traces] == [("sampled", None)] * 3
+
+
+@pytest.mark.asyncio
+async def test_sampler__more_traces_than_capacity__keeps_the_latest() -> None:
+    """
+    Scenario:
+        Five requests are sampled into a ring buffer of 3 traces.
+    Expected Outcome:
+        The traces of the last three requests are kept, oldest first.
+    """
+    # Arrange
+    sampler = SlowRequestSampler(sample_rate=1.0, capacity=3)
+    transport = _transport(lambda request: httpx.Response(200), sampler)
+
+    # Act
+    for index in range(5):
+        await transport.request("GET", f"/widgets/{index}")
+    await transport.close()
+
+    # Assert
+    assert [trace.url for trace in sampler.traces] == ["/widgets/2", "/widgets/3", "/widgets/4"]
+
+
+@pytest.mark.asyncio
+async def test_request__retried_by_rate_limiter__retry_number_traced() -> None:
+    """
+    Scenario:
+        A RateLimitingTransport retries a request answered with 429 (Retry-After: 0).
+    Expected Outcome:
+        Both attempts are traced, with retry numbers 0 and 1.
+    """
+    # Arrange
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "0"}) if calls == 1 else httpx.Response(200)
+
+    sampler = SlowRequestSampler(sample_rate=1.0)
+    transport = RateLimitingTransport(_transport(handler, sampler))
+
+    # Act
+    response = await transport.request("GET", "/widgets")
+    await transport.close()
+
+    # Assert
+    assert response.status_code == 200
+    assert [(trace.status_code, trace.retries) for trace in sampler.traces] == [(429, 0), (200, 1)]
+
+
+@pytest.mark.asyncio
+async def test_request__fails__traced_with_error() -> None:
+    """
+    Scenario:
+        A slow request fails with a connection error.
+    Expected Outcome:
+        The error is raised and traced, without status code or sizes.
+    """
+
+    # Arrange
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        raise httpx.ConnectError("refused", request=request)
+
+    sampler = SlowRequestSampler(threshold_seconds=0.01)
+    transport = _transport(handler, sampler)
+
+    # Act
+    with pytest.raises(httpx.ConnectError):
+        await transport.request("GET", "/widgets")
+    await transport.close()
+
+    # Assert
+    [trace] = sampler.traces
+    assert (trace.status_code, trace.error, trace.response_bytes) == (None, "ConnectError: refused", None)
+
+
+@pytest.mark.asyncio
+async def test_stream__body_read_slowly__body_phase_excluded_from_duration() -> None:
+    """
+    Scenario:
+        A streamed response is answered at once and its body read only after 50 ms.
+    Expected Outcome:
+        It is not captured as slow: the duration ends with the headers. Sampled, its trace has a
+        `body` phase of at least 50 ms and the bytes read.
+    """
+    # Arrange
+    body = b"x" * 1000
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield body
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunks())
+
+    slow_only = SlowRequestSampler(threshold_seconds=0.04)
+    sampled = SlowRequestSampler(threshold_seconds=None, sample_rate=1.0)
+    transports = [_transport(handler, sampler) for sampler in (slow_only, sampled)]
+
+    # Act
+    for transport in transports:
+        async with transport.stream("GET", "/exports/1") as response:
+            await asyncio.sleep(0.05)
+            await response.aread()
+        await transport.close()
+
+    # Assert
+    assert list(slow_only.traces) == []
+    [trace] = sampled.traces
+    assert trace.duration_seconds < 0.04
+    assert trace.phases["body"] >= 0.05
+    assert trace.response_bytes == len(body)
+
+
+@pytest.mark.asyncio
+async def test_dump__file_and_signal__json_lines_of_the_traces() -> None:
+    """
+    Scenario:
+        Two requests are sampled, then the traces are dumped to a file, and SIGUSR1 is received with
+        a signal handler installed.
+    Expected Outcome:
+        dump() returns the traces as plain data, and both dumps write them as one JSON line each.
+    """
+    # Arrange
+    sampler = SlowRequestSampler(sample_rate=1.0)
+    transport = _transport(lambda request: httpx.Response(200), sampler)
+    for index in range(2):
+        await transport.request("GET", f"/widgets/{index}")
+    await transport.close()
+    dumped, signalled = io.StringIO(), io.StringIO()
+    previous = signal.getsignal(signal.SIGUSR1)
+
+    # Act
+    traces = sampler.dump(dumped)
+    try:
+        sampler.install_signal_handler(file=signalled)
+        os.kill(os.getpid(), signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    # Assert
+    assert [trace["url"] for trace in traces] == ["/widgets/0", "/widgets/1"]
+    assert [json.loads(line) for line in dumped.getvalue().splitlines()] == traces
+    assert [json.loads(line) for line in signalled.getvalue().splitlines()] == traces
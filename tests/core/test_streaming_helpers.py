@@ -1,4 +1,5 @@
 import asyncio
+from dataclasses import dataclass
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,6 +9,7 @@ from pyopenapi_gen.core.streaming_helpers import (
     SSEEvent,
     _parse_sse_event,
     iter_bytes,
+    iter_json_array,
     iter_ndjson,
     iter_sse,
 )
@@ -77,6 +79,40 @@ def test_iter_ndjson__yields_json_objects() -> None:
     assert out == [{"a": 1}, {"b": 2}]
 
 
+@dataclass
+class StreamedItem:
+    item_id: int
+    label: str | None = None
+
+    class Meta:
+        key_transform_with_load = {"itemId": "item_id", "label": "label"}
+
+
+def test_iter_json_array__chunked_array_body__yields_structured_items_in_order() -> None:
+    """
+    Scenario:
+        iter_json_array reads a JSON array of objects whose chunks split items and keys.
+    Expected Outcome:
+        Each item is structured into the requested model and yielded in order.
+    """
+    chunks = [b'[{"itemId": 1, "la', b'bel": "a"},', b' {"itemId"', b": 2}]"]
+    response = MagicMock(spec=httpx.Response)
+
+    async def aiter() -> AsyncGenerator[bytes, None]:
+        for c in chunks:
+            yield c
+
+    response.aiter_bytes = aiter
+    out = []
+
+    async def run() -> None:
+        async for item in iter_json_array(response, StreamedItem):
+            out.append(item)
+
+    asyncio.run(run())
+    assert out == [StreamedItem(item_id=1, label="a"), StreamedItem(item_id=2)]
+
+
 def test_iter_sse__yields_events() -> None:
     """
     Scenario:
@@ -20,6 +20,7 @@ def test_telemetry_enabled_env_var(capsys: Any, monkeypatch: Any) -> None:
     monkeypatch.setenv("PYOPENAPI_TELEMETRY_ENABLED", "true")
     client = TelemetryClient()
     client.track_event("evt", {"a": 1})
+    client.flush()
     captured = capsys.readouterr()
     out = captured.out.strip()
     # Should start with TELEMETRY and valid JSON
@@ -36,6 +37,7 @@ def test_telemetry_enabled_parameter(capsys: Any) -> None:
     os.environ.pop("PYOPENAPI_TELEMETRY_ENABLED", None)
     client = TelemetryClient(enabled=True)
     client.track_event("param_evt", None)
+    client.flush()
     captured = capsys.readouterr()
     out = captured.out.strip()
     assert out.startswith("TELEMETRY ")
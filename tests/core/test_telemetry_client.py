@@ -1,9 +1,13 @@
 import json
 import os
+import threading
 import time
+from pathlib import Path
 from typing import Any
 
-from pyopenapi_gen.core.telemetry import TelemetryClient
+import httpx
+
+from pyopenapi_gen.core.telemetry import DROPPED_EVENT, HttpSink, JsonlFileSink, TelemetryClient, TelemetryStats
 
 
 def test_telemetry_client_default_disabled(monkeypatch: Any, capsys: Any) -> None:
@@ -28,6 +32,7 @@ def test_telemetry_client_enabled_via_env(monkeypatch: Any, capsys: Any) -> None
     # Capture time to validate timestamp
     start = time.time()
     tc.track_event("my_event", {"foo": 123})
+    tc.flush()
     captured = capsys.readouterr()
     assert captured.out.startswith("TELEMETRY ")
     payload = json.loads(captured.out[len("TELEMETRY ") :])
@@ -43,6 +48,7 @@ def test_telemetry_client_enabled_via_constructor(monkeypatch: Any, capsys: Any)
     tc = TelemetryClient(enabled=True)
     assert tc.enabled
     tc.track_event("evt", None)
+    tc.flush()
     captured = capsys.readouterr()
     assert captured.out.startswith("TELEMETRY ")
     data = json.loads(captured.out.split(None, 1)[1])
@@ -51,7 +57,7 @@ def test_telemetry_client_enabled_via_constructor(monkeypatch: Any, capsys: Any)
 
 
 def test_track_event_handles_print_exceptions(monkeypatch: Any, capsys: Any) -> None:
-    """If print/json dumping throws, track_event should catch and not raise."""
+    """If print/json dumping throws, the event is counted as failed and nothing is raised."""
     # Simulate enabled
     tc = TelemetryClient(enabled=True)
     # Monkeypatch print to raise
@@ -61,6 +67,100 @@ def test_track_event_handles_print_exceptions(monkeypatch: Any, capsys: Any) ->
     )
     # Should not propagate
     tc.track_event("e", None)
+    tc.flush()
     # No output since print fails
     captured = capsys.readouterr()
     assert captured.out == ""
+    assert tc.stats().failed == 1
+
+
+class _BlockingSink:
+    """Sink whose writes wait until released, recording each batch."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.batches: list[list[dict[str, Any]]] = []
+
+    def write(self, events: list[dict[str, Any]]) -> None:
+        self.release.wait(5)
+        self.batches.append(events)
+
+    def close(self) -> None:
+        pass
+
+
+def test_track_event_does_not_wait_for_slow_sink() -> None:
+    """Tracking returns immediately while the sink is blocked; queued events are written in batches."""
+    sink = _BlockingSink()
+    tc = TelemetryClient(enabled=True, sink=sink, batch_size=50)
+    start = time.perf_counter()
+    for i in range(100):
+        tc.track_event("stage", {"i": i})
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.5
+    assert tc.stats().pending == 100
+    sink.release.set()
+    assert tc.flush(timeout=5)
+    assert [event["properties"]["i"] for batch in sink.batches for event in batch] == list(range(100))
+    # Events queued behind the blocked write are written in batches of at most 50
+    assert len(sink.batches) >= 2 and all(len(batch) <= 50 for batch in sink.batches)
+    assert tc.stats() == TelemetryStats(sent=100, dropped=0, failed=0, pending=0)
+    tc.close()
+
+
+def test_track_event_full_queue_drops_and_reports_count() -> None:
+    """Events beyond the queue size are dropped, counted and reported to the sink."""
+    sink = _BlockingSink()
+    tc = TelemetryClient(enabled=True, sink=sink, max_queue_size=5)
+    tc.track_event("first")
+    # Wait until the worker holds the first event, so the queue is empty
+    while tc._queue.qsize():
+        time.sleep(0.001)
+    for _ in range(8):
+        tc.track_event("burst")
+    sink.release.set()
+    assert tc.flush(timeout=5)
+    tc.track_event("after")
+    tc.close()
+    events = [event for batch in sink.batches for event in batch]
+    assert [e["event"] for e in events].count("burst") == 5
+    assert [e["properties"] for e in events if e["event"] == DROPPED_EVENT] == [{"count": 3}]
+    assert tc.stats() == TelemetryStats(sent=7, dropped=3, failed=0, pending=0)
+
+
+def test_close_flushes_jsonl_file_and_ignores_later_events(tmp_path: Path) -> None:
+    """close() writes the queued events to the JSONL file; events tracked afterwards are ignored."""
+    path = tmp_path / "telemetry" / "events.jsonl"
+    tc = TelemetryClient(enabled=True, sink=JsonlFileSink(path))
+    tc.track_event("generate", {"stage": "load"})
+    tc.track_event("generate", {"stage": "emit"})
+    tc.close()
+    tc.track_event("late")
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["properties"]["stage"] for line in lines] == ["load", "emit"]
+    assert tc._thread is not None and not tc._thread.is_alive()
+
+
+def test_sink_from_env(monkeypatch: Any, tmp_path: Path) -> None:
+    """PYOPENAPI_TELEMETRY_URL selects an HTTP collector, PYOPENAPI_TELEMETRY_FILE a JSONL file."""
+    monkeypatch.delenv("PYOPENAPI_TELEMETRY_URL", raising=False)
+    monkeypatch.setenv("PYOPENAPI_TELEMETRY_FILE", str(tmp_path / "events.jsonl"))
+    assert isinstance(TelemetryClient(enabled=False).sink, JsonlFileSink)
+    monkeypatch.setenv("PYOPENAPI_TELEMETRY_URL", "http://127.0.0.1:4318/events")
+    assert isinstance(TelemetryClient(enabled=False).sink, HttpSink)
+
+
+def test_http_sink_posts_batches() -> None:
+    """HttpSink POSTs each batch as a JSON array to the collector."""
+    received: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    sink = HttpSink("http://collector.local/events")
+    sink._client = httpx.Client(transport=httpx.MockTransport(handler))
+    tc = TelemetryClient(enabled=True, sink=sink)
+    tc.track_event("generate", {"stage": "emit"})
+    tc.close()
+    assert [[event["event"] for event in batch] for batch in received] == [["generate"]]
@@ -0,0 +1,221 @@
+"""
+Tests for the process-wide registry of shared httpx clients (core/transport_registry.py).
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import httpx
+import pytest
+
+from pyopenapi_gen.core.http_transport import HttpxTransport
+from pyopenapi_gen.core.transport_registry import registry, shared_ssl_context
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keeps connections open, so the client pools them
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """A local keep-alive HTTP server answering every GET with 200, outliving event loops."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_shared_transports__same_origin__share_one_client_until_the_last_is_closed() -> None:
+    """
+    Scenario:
+        Two shared transports point at different base paths of one host, with different timeouts.
+    Expected Outcome:
+        Both use one pooled client; relative URLs resolve against each transport's own base path
+        with each transport's own timeout, and the client is closed only with the last transport.
+    """
+    # Arrange
+    seen: list[tuple[str, float | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.extensions["timeout"]["read"]))
+        return httpx.Response(200)
+
+    before = len(registry)
+    users = HttpxTransport("https://api.example.com/users/v1", timeout=5.0, shared=True)
+    orders = HttpxTransport("https://api.example.com/orders/v2/", timeout=30.0, shared=True)
+    users._client._transport = httpx.MockTransport(handler)
+    opened = len(registry) - before
+
+    # Act
+    await users.request("GET", "/me")
+    await orders.request("GET", "recent", params={"limit": 1})
+    await orders.request("GET", "https://api.example.com/health")
+    await users.close()
+    await users.close()  # Closing twice releases once
+    closed_after_first = orders._client.is_closed
+    await orders.close()
+
+    # Assert
+    assert users._client is orders._client
+    assert opened == 1
+    assert seen == [
+        ("https://api.example.com/users/v1/me", 5.0),
+        ("https://api.example.com/orders/v2/recent?limit=1", 30.0),
+        ("https://api.example.com/health", 30.0),
+    ]
+    assert closed_after_first is False
+    assert orders._client.is_closed
+    assert len(registry) == before
+
+
+@pytest.mark.asyncio
+async def test_shared_transports__different_origin_or_settings__use_separate_clients() -> None:
+    """
+    Scenario:
+        Shared transports differ in host, TLS verification or pool limits, and one is not shared.
+    Expected Outcome:
+        Each gets its own client; the unshared transport never touches the registry.
+    """
+    # Arrange
+    before = len(registry)
+    base = HttpxTransport("https://api.example.com", shared=True)
+    others = [
+        HttpxTransport("https://other.example.com", shared=True),
+        HttpxTransport("https://api.example.com", verify_ssl=False, shared=True),
+        HttpxTransport("https://api.example.com", max_connections=10, shared=True),
+    ]
+    private = HttpxTransport("https://api.example.com")
+
+    # Act
+    clients = {id(t._client) for t in [base, *others, private]}
+    registered = len(registry) - before
+    for transport in [base, *others, private]:
+        await transport.close()
+
+    # Assert
+    assert len(clients) == 5
+    assert registered == 4
+    assert len(registry) == before
+
+
+@pytest.mark.asyncio
+async def test_shared_transports__cookies__kept_per_transport() -> None:
+    """
+    Scenario:
+        Two shared transports of one host use different bearer tokens. The server sets a session
+        cookie on the first one's request, then both send requests.
+    Expected Outcome:
+        Only the transport that received the cookie sends it back; the shared client stores none.
+    """
+    # Arrange
+    sent: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append((request.headers["Authorization"], request.headers.get("Cookie")))
+        if request.url.path == "/login":
+            return httpx.Response(200, headers={"Set-Cookie": "session=ALICE; Path=/"})
+        return httpx.Response(200)
+
+    alice = HttpxTransport("https://api.example.com", bearer_token="alice", shared=True)
+    bob = HttpxTransport("https://api.example.com", bearer_token="bob", shared=True)
+    alice._client._transport = httpx.MockTransport(handler)
+
+    # Act
+    await alice.request("GET", "/login")
+    await bob.request("GET", "/me")
+    await alice.request("GET", "/me")
+    await alice.close()
+    await bob.close()
+
+    # Assert
+    assert alice._client is bob._client
+    assert sent == [("Bearer alice", None), ("Bearer bob", None), ("Bearer alice", "session=ALICE")]
+    assert not alice._client.cookies.jar
+
+
+def test_shared_transports__different_event_loops__use_separate_clients() -> None:
+    """
+    Scenario:
+        A shared transport is created in each of two event loops run one after the other, the
+        first one without being closed.
+    Expected Outcome:
+        The second loop gets its own client: pooled connections cannot cross event loops.
+    """
+
+    # Arrange
+    async def create() -> HttpxTransport:
+        return HttpxTransport("https://api.example.com", shared=True)
+
+    before = len(registry)
+
+    # Act
+    first = asyncio.run(create())
+    second = asyncio.run(create())
+
+    # Assert
+    assert first._client is not second._client
+    asyncio.run(first.close())
+    asyncio.run(second.close())
+    assert len(registry) == before
+
+
+def test_shared_transports__created_outside_a_loop__bind_to_the_loop_of_their_requests(server_url: str) -> None:
+    """
+    Scenario:
+        Two shared transports are created in sync code, and each sends a request in its own
+        `asyncio.run` call; the first transport then sends another one in a third call.
+    Expected Outcome:
+        Every request succeeds: no transport reuses the pooled connections of a closed event loop,
+        and the registry holds no client once the transports are closed.
+    """
+    # Arrange
+    before = len(registry)
+    first = HttpxTransport(server_url, shared=True)
+    second = HttpxTransport(server_url, shared=True)
+
+    # Act
+    statuses = [
+        asyncio.run(first.request("GET", "/a")).status_code,
+        asyncio.run(second.request("GET", "/b")).status_code,
+        asyncio.run(first.request("GET", "/c")).status_code,
+    ]
+
+    # Assert
+    assert statuses == [200, 200, 200]
+    asyncio.run(first.close())
+    asyncio.run(second.close())
+    assert len(registry) == before
+
+
+def test_shared_ssl_context__is_created_once_per_verification_mode() -> None:
+    """
+    Scenario:
+        SSL contexts are requested repeatedly, for verified and unverified connections, with and
+        without HTTP/2.
+    Expected Outcome:
+        The same context is returned for the same settings, and distinct ones otherwise.
+    """
+    # Act
+    verified = shared_ssl_context()
+    unverified = shared_ssl_context(verify=False)
+
+    # Assert
+    assert shared_ssl_context() is verified
+    assert shared_ssl_context(verify=False) is unverified
+    assert shared_ssl_context(http2=True) is not verified
+    assert verified is not unverified
@@ -11,13 +11,13 @@ from pyopenapi_gen import generate_client
 def test_response_with_data_field__no_automatic_unwrapping() -> None:
     """
     Scenario: API response schema has a "data" field as part of its structure
-    Expected Outcome: Generated code uses response.json() directly without unwrapping ["data"]
+    Expected Outcome: Generated code uses decode_json(response) directly without unwrapping ["data"]
 
     This is a regression test for a bug where ANY response schema with a "data" property
-    would automatically get unwrapped with response.json()["data"], even when "data" was
+    would automatically get unwrapped with decode_json(response)["data"], even when "data" was
     just a normal field in the response structure.
 
-    The correct behavior is to use response.json() and let cattrs handle deserialization
+    The correct behavior is to use decode_json(response) and let cattrs handle deserialization
     based on the full schema structure.
     """
     # Arrange
@@ -97,14 +97,14 @@ def test_response_with_data_field__no_automatic_unwrapping() -> None:
         endpoint_content = endpoint_file.read_text()
 
         # NEW BEHAVIOR: No automatic unwrapping
-        # Even though VectorDatabaseListResponse has a "data" field, we use full response.json()
+        # Even though VectorDatabaseListResponse has a "data" field, we decode the full body
         assert (
-            "return structure_from_dict(response.json(), VectorDatabaseListResponse)" in endpoint_content
-        ), "Should use response.json() directly without unwrapping"
+            "return decode_model(response, VectorDatabaseListResponse)" in endpoint_content
+        ), "Should decode the full body without unwrapping"
 
         # Verify NO unwrapping happens
         assert (
-            'response.json()["data"]' not in endpoint_content
+            'decode_json(response)["data"]' not in endpoint_content
         ), "Should NOT automatically unwrap data field - this was the bug we're fixing"
 
         # Additional check: The response schema should be imported correctly
@@ -114,7 +114,7 @@ def test_response_with_data_field__no_automatic_unwrapping() -> None:
 def test_simple_response_without_data_field__uses_response_json() -> None:
     """
     Scenario: API response schema does NOT have a "data" field
-    Expected Outcome: Generated code uses response.json() directly (no change from before)
+    Expected Outcome: Generated code uses decode_json(response) directly (no change from before)
 
     This test ensures our fix doesn't break the normal case where responses
     don't have a "data" field.
@@ -177,13 +177,13 @@ def test_simple_response_without_data_field__uses_response_json() -> None:
 
         endpoint_content = endpoint_file.read_text()
 
-        # Should use response.json() directly
+        # Should decode the full body directly
         assert (
-            "return structure_from_dict(response.json(), User)" in endpoint_content
-        ), "Should use response.json() directly for simple schemas"
+            "return decode_model(response, User)" in endpoint_content
+        ), "Should decode the full body directly for simple schemas"
 
         # Verify NO unwrapping
-        assert 'response.json()["data"]' not in endpoint_content, "Should NOT unwrap data field"
+        assert 'decode_json(response)["data"]' not in endpoint_content, "Should NOT unwrap data field"
 
 
 if __name__ == "__main__":
@@ -272,6 +272,12 @@ def test_models_emitter_init_file(tmp_path: Path) -> None:
     assert "'Pet'," in init_content
     assert "'User'," in init_content
 
+    # warmup() covers every exported model without being exported itself
+    assert "from test_client.core.cattrs_converter import warmup_models as _warmup_models" in init_content
+    assert "def warmup(background: bool = False) -> _WarmupReport:" in init_content
+    assert "            Order,\n            Pet,\n            User,\n" in init_content
+    assert "'warmup'" not in init_content
+
 
 def test_models_emitter__emit_single_schema__generates_module_and_init(tmp_path: Path) -> None:
     """Test emitting a single schema creates its module and updates __init__."""
@@ -313,6 +313,10 @@ class TestOverloadParameterNamingIntegration:
             assert "{tenant_id}" in all_code, "URL should use snake_case {tenant_id}"
             assert "{data_source_id}" in all_code, "URL should use snake_case {data_source_id}"
 
-            # Check URL doesn't use camelCase variables
-            assert "{tenantId}" not in all_code, "URL should not use camelCase {tenantId}"
-            assert "{dataSourceId}" not in all_code, "URL should not use camelCase {dataSourceId}"
+            # Check URL doesn't use camelCase variables (the `route=` path template keeps the spec's names)
+            url_lines = [line for line in all_code.splitlines() if 'url = f"' in line]
+            assert url_lines, "No URL construction found"
+            assert not any("{tenantId}" in line for line in url_lines), "URL should not use camelCase {tenantId}"
+            assert not any(
+                "{dataSourceId}" in line for line in url_lines
+            ), "URL should not use camelCase {dataSourceId}"
@@ -0,0 +1,144 @@
+"""End-to-end runtime tests for ahead-of-time model codecs (``--model-codecs``).
+
+A client is generated with model codecs enabled and its models are structured and
+unstructured through the core entry points. The generated ``_from_json``/``_to_json``
+functions must produce exactly what the reflective cattrs path produces, including
+error messages for invalid payloads.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from pyopenapi_gen.generator.client_generator import ClientGenerator
+
+TEST_TIMEOUT_SEC = 120
+
+SPEC: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {"title": "Codec API", "version": "1.0.0"},
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "list_pets",
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "PetStatus": {"type": "string", "enum": ["available", "sold"]},
+            "Owner": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string"}, "since": {"type": "string", "format": "date"}},
+            },
+            "Pet": {
+                "type": "object",
+                "required": ["id", "displayName"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "displayName": {"type": "string"},
+                    "weight": {"type": "number"},
+                    "status": {"$ref": "#/components/schemas/PetStatus"},
+                    "createdAt": {"type": "string", "format": "date-time"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                    "previousOwners": {"type": "array", "items": {"$ref": "#/components/schemas/Owner"}},
+                    "attributes": {"type": "object", "additionalProperties": {"type": "string"}},
+                    "nickname": {"type": "string", "default": "buddy"},
+                },
+            },
+        }
+    },
+}
+
+PET_PAYLOAD: dict[str, Any] = {
+    "id": 7,
+    "displayName": "Rex",
+    "weight": 12,
+    "status": "sold",
+    "createdAt": "2024-05-01T10:00:00Z",
+    "tags": ["good", "dog"],
+    "owner": {"name": "Ada", "since": "2020-01-02"},
+    "previousOwners": [{"name": "Bob"}],
+    "attributes": {"colour": "brown"},
+}
+
+
+@pytest.mark.timeout(TEST_TIMEOUT_SEC)
+def test_generated_models__model_codecs__match_reflective_cattrs_path(tmp_path: Path) -> None:
+    """
+    Scenario: A client is generated with model_codecs=True and a payload covering scalars,
+        enums, datetimes, dates, nested models, lists of models, a typed dict and an
+        absent field with a literal default is converted both ways.
+    Expected Outcome:
+        - Every model module registers generated codecs with the core converter.
+        - structure_from_dict (single model and list[Model]) and unstructure_to_dict return
+          exactly what the reflective structure/unstructure functions return.
+        - An invalid payload fails with the same message as the reflective path.
+    """
+    # Arrange: generate a self-contained client with model codecs
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(yaml.safe_dump(SPEC))
+
+    pkg = "codec_e2e_client"
+    ClientGenerator().generate(
+        spec_path=str(spec_path),
+        project_root=tmp_path,
+        output_package=pkg,
+        force=True,
+        no_postprocess=True,
+        model_codecs=True,
+    )
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        pet_mod = importlib.import_module(f"{pkg}.models.pet")
+        owner_mod = importlib.import_module(f"{pkg}.models.owner")
+        cc = importlib.import_module(f"{pkg}.core.cattrs_converter")
+        Pet = pet_mod.Pet
+        Owner = owner_mod.Owner
+
+        assert "def _pet_from_json(data: dict[str, Any]) -> Pet:" in Path(pet_mod.__file__).read_text()
+        assert Pet in cc._model_structure_fns
+        assert Owner in cc._model_unstructure_fns
+
+        # Act
+        pet = cc.structure_from_dict(PET_PAYLOAD, Pet)
+        pets = cc.structure_from_dict([PET_PAYLOAD, PET_PAYLOAD], list[Pet])
+        dumped = cc.unstructure_to_dict(pet)
+
+        # Assert: identical to the reflective path
+        reflective_pet = cc._make_dataclass_structure_fn(Pet)(PET_PAYLOAD, Pet)
+        assert pet == reflective_pet
+        assert pets == [reflective_pet, reflective_pet]
+        assert pet.weight == 12.0 and isinstance(pet.weight, float)
+        assert pet.owner == Owner(name="Ada", since=reflective_pet.owner.since)
+        assert pet.nickname == "buddy"
+        cc._register_unstructure_hooks_recursively(Owner)
+        assert dumped == cc._make_dataclass_unstructure_fn(Pet)(pet)
+        assert dumped["createdAt"] == "2024-05-01T10:00:00+00:00"
+        assert dumped["status"] == "sold"
+
+        # Assert: invalid payloads report the reflective error
+        with pytest.raises(ValueError, match="missing 1 required positional argument: 'id_'"):
+            cc.structure_from_dict({"displayName": "Rex"}, Pet)
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in list(sys.modules):
+            if name == pkg or name.startswith(pkg + "."):
+                del sys.modules[name]
@@ -0,0 +1,207 @@
+"""End-to-end runtime tests for slotted, frozen and keyword-only models.
+
+Models are generated with ``--model-slots``, ``--model-frozen`` and ``--model-kw-only`` and
+without, from the same spec. The cattrs hooks, the ``Meta`` key transforms, ``DataclassSerializer``
+and decode_model (two-pass and single-pass) must give identical results for both. The memory benchmark reports the
+bytes held by each model instance with and without slots.
+"""
+
+import dataclasses
+import importlib
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+import httpx
+import pytest
+import yaml
+
+from pyopenapi_gen.generator.client_generator import ClientGenerator
+
+TEST_TIMEOUT_SEC = 120
+
+SPEC: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {"title": "Slots API", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "post": {
+                "operationId": "create_user",
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                },
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Address": {
+                "type": "object",
+                "required": ["streetName"],
+                "properties": {"streetName": {"type": "string"}, "zip": {"type": "string"}},
+            },
+            "Labels": {"type": "object", "additionalProperties": {"$ref": "#/components/schemas/Address"}},
+            "User": {
+                "type": "object",
+                "required": ["id", "firstName"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "firstName": {"type": "string"},
+                    "email": {"type": "string"},
+                    "createdAt": {"type": "string", "format": "date-time"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "address": {"$ref": "#/components/schemas/Address"},
+                    "labels": {"$ref": "#/components/schemas/Labels"},
+                },
+            },
+        }
+    },
+}
+
+USER_PAYLOAD: dict[str, Any] = {
+    "id": 7,
+    "firstName": "Ada",
+    "email": "ada@example.com",
+    "createdAt": "2024-05-01T10:00:00Z",
+    "tags": ["admin"],
+    "address": {"streetName": "Main Street", "zip": "12345"},
+    "labels": {"home": {"streetName": "Elm Street"}},
+}
+
+OPTIONS = {"model_slots": True, "model_frozen": True, "model_kw_only": True}
+
+
+def _generate(tmp_path: Path, pkg: str, **options: bool) -> None:
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(yaml.safe_dump(SPEC))
+    ClientGenerator().generate(
+        spec_path=str(spec_path),
+        project_root=tmp_path,
+        output_package=pkg,
+        force=True,
+        no_postprocess=True,
+        **options,
+    )
+
+
+@pytest.fixture
+def clients(tmp_path: Path) -> Iterator[tuple[ModuleType, ModuleType]]:
+    """The core packages of a client generated without and one generated with every model option."""
+    packages = {"plain_models_client": {}, "slotted_models_client": OPTIONS}
+    for pkg, options in packages.items():
+        _generate(tmp_path, pkg, **options)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module("plain_models_client.core"), importlib.import_module("slotted_models_client.core")
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in list(sys.modules):
+            if name.split(".")[0] in packages:
+                del sys.modules[name]
+
+
+def _bytes_per_instance(cls: type, kwargs: dict[str, Any], count: int = 20_000) -> float:
+    """Memory allocated per instance of `cls` built from `kwargs` (values shared between instances)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [cls(**kwargs) for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return (allocated - sys.getsizeof(instances)) / count
+
+
+@pytest.mark.timeout(TEST_TIMEOUT_SEC)
+def test_generated_models__slots_frozen_kw_only__same_results_as_plain_models(
+    clients: tuple[ModuleType, ModuleType],
+) -> None:
+    """
+    Scenario: The same payload is structured, decoded from bytes and serialized with models
+        generated with and without --model-slots, --model-frozen and --model-kw-only.
+    Expected Outcome:
+        - The generated classes carry the options: no instance __dict__, immutable (dict wrappers
+          without __setitem__), keyword-only.
+        - structure_from_dict, decode_model, unstructure_to_dict and DataclassSerializer give the
+          same results for both, including renamed (Meta) fields, nested models and dict wrappers.
+    """
+    # Arrange
+    plain, slotted = clients
+    results = []
+
+    for core in (plain, slotted):
+        User = importlib.import_module(core.__name__.replace(".core", ".models")).User
+        body = json.dumps(USER_PAYLOAD).encode()
+        response = httpx.Response(200, content=body)
+        single_pass_response = httpx.Response(
+            200, content=body, extensions={core.model_decoder.SINGLE_PASS_EXTENSION: 0}
+        )
+
+        # Act
+        user = core.structure_from_dict(USER_PAYLOAD, User)
+        decoded = core.decode_model(response, User)
+        decoded_single_pass = core.decode_model(single_pass_response, User)
+        results.append(
+            (core.unstructure_to_dict(user), core.DataclassSerializer.serialize(user), user.labels["home"].street_name)
+        )
+
+        # Assert
+        assert decoded == decoded_single_pass == user
+        assert user.first_name == "Ada" and user.address.street_name == "Main Street"
+
+    assert results[0] == results[1]
+    assert results[0][0]["firstName"] == "Ada" and results[0][0]["createdAt"] == "2024-05-01T10:00:00+00:00"
+
+    SlottedUser = importlib.import_module("slotted_models_client.models").User
+    user = slotted.structure_from_dict(USER_PAYLOAD, SlottedUser)
+    params = SlottedUser.__dataclass_params__
+    assert (params.slots, params.frozen, params.kw_only) == (True, True, True)
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.first_name = "Grace"
+    with pytest.raises(TypeError):
+        SlottedUser(7, "Ada")
+    assert not hasattr(user.labels, "__setitem__")
+
+
+@pytest.mark.timeout(TEST_TIMEOUT_SEC)
+def test_memory_benchmark__slotted_models__fewer_bytes_per_instance(
+    clients: tuple[ModuleType, ModuleType], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """
+    Scenario: 20,000 instances of User (7 fields) and of Address (2 fields) are built from models
+        generated with and without --model-slots.
+    Expected Outcome:
+        - Slotted instances take less memory: on CPython 3.12, 88 instead of 128 bytes per User and
+          48 instead of 80 bytes per Address.
+    """
+    # Arrange
+    measured: dict[str, tuple[float, float]] = {}
+
+    for model, kwargs in (
+        ("User", {"id_": 7, "first_name": "Ada", "email_": "ada@example.com", "tags": None}),
+        ("Address", {"street_name": "Main Street"}),
+    ):
+        # Act
+        plain_cls, slotted_cls = (
+            getattr(importlib.import_module(f"{pkg}.models"), model)
+            for pkg in ("plain_models_client", "slotted_models_client")
+        )
+        measured[model] = (_bytes_per_instance(plain_cls, kwargs), _bytes_per_instance(slotted_cls, kwargs))
+
+    # Assert
+    with capsys.disabled():
+        for model, (plain_bytes, slotted_bytes) in measured.items():
+            print(f"\n{model}: {plain_bytes:.0f} bytes per instance, {slotted_bytes:.0f} with slots")
+    for plain_bytes, slotted_bytes in measured.values():
+        assert slotted_bytes < 0.8 * plain_bytes
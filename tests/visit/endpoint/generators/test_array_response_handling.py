@@ -44,7 +44,7 @@ class TestArrayResponseHandling:
         Scenario: Response type is an array type alias (e.g., AgentListResponse = List[AgentListResponseItem])
                   where AgentListResponseItem is a dataclass with properties.
         Expected Outcome: Generated code uses list comprehension with .from_dict() for each item,
-                         NOT cast(AgentListResponse, response.json()).
+                         NOT cast(AgentListResponse, decode_json(response)).
         """
         # Arrange
         # Create item schema (dataclass with properties)
@@ -106,13 +106,15 @@ class TestArrayResponseHandling:
         written_code = "\n".join([call[0][0] for call in code_writer_mock.write_line.call_args_list])
 
         # Should use single structure_from_dict call with the type alias
-        assert "structure_from_dict(response.json(), AgentListResponse)" in written_code
+        assert "decode_model(response, AgentListResponse)" in written_code
 
         # Should NOT use manual list comprehension
-        assert "[structure_from_dict(item, AgentListResponseItem) for item in response.json()]" not in written_code
+        assert (
+            "[structure_from_dict(item, AgentListResponseItem) for item in decode_json(response)]" not in written_code
+        )
 
         # Should NOT use cast()
-        assert "cast(AgentListResponse, response.json())" not in written_code
+        assert "cast(AgentListResponse, decode_json(response))" not in written_code
 
     def test_array_type_alias_with_primitive_items__uses_cast(self, render_context_mock, code_writer_mock):
         """
@@ -165,7 +167,7 @@ class TestArrayResponseHandling:
         written_code = "\n".join([call[0][0] for call in code_writer_mock.write_line.call_args_list])
 
         # Should use cast() for primitive arrays
-        assert "cast(StringListResponse, response.json())" in written_code
+        assert "cast(StringListResponse, decode_json(response))" in written_code
 
         # Should NOT use list comprehension
         assert ".from_dict(item) for item in" not in written_code
@@ -173,7 +175,7 @@ class TestArrayResponseHandling:
     def test_dataclass_response__uses_from_dict(self, render_context_mock, code_writer_mock):
         """
         Scenario: Response type is a direct dataclass (not an array).
-        Expected Outcome: Generated code uses .from_dict(response.json()).
+        Expected Outcome: Generated code uses .from_dict(decode_json(response)).
         """
         # Arrange
         dataclass_schema = IRSchema(
@@ -223,7 +225,7 @@ class TestArrayResponseHandling:
         written_code = "\n".join([call[0][0] for call in code_writer_mock.write_line.call_args_list])
 
         # Should use structure_from_dict() for dataclass
-        assert "structure_from_dict(response.json(), AgentResponse)" in written_code
+        assert "decode_model(response, AgentResponse)" in written_code
 
         # Should NOT use cast()
         assert "cast(AgentResponse" not in written_code
@@ -347,7 +349,7 @@ class TestArrayResponseHandling:
         generator = EndpointResponseHandlerGenerator(schemas={})
 
         # Act
-        result = generator._get_cattrs_deserialization_code("List[AgentListResponseItem]", "response.json()")
+        result = generator._get_cattrs_deserialization_code("List[AgentListResponseItem]", "decode_json(response)")
 
         # Assert
-        assert result == "structure_from_dict(response.json(), List[AgentListResponseItem])"
+        assert result == "structure_from_dict(decode_json(response), List[AgentListResponseItem])"
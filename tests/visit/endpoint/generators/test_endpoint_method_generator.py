@@ -166,6 +166,7 @@ class TestEndpointMethodGenerator:
             mock_render_context,
             mock_url_args_gen.return_value,  # has_header_params from url_args_gen
             primary_content_type_fixture,
+            streaming=False,  # No streaming response on this operation
         )
 
         # Check that response handler was called with response strategy
@@ -182,7 +183,11 @@ class TestEndpointMethodGenerator:
         # Check CodeWriter usage
         # get_code is called twice, once for snapshot, once for final
         assert mock_writer_instance.get_code.call_count == 3
-        mock_writer_instance.dedent.assert_called_once()  # From the end of generate method
+        # Closing the deadline scope, and the end of generate method
+        assert mock_writer_instance.dedent.call_count == 2
+        mock_writer_instance.write_line.assert_any_call(
+            f'async with Deadline(timeout, operation="{mock_op.operation_id}", route="{mock_op.path}"):'
+        )
 
         # Check final result
         assert result_code == "def test_op():\n    # Docstring here\n    pass"
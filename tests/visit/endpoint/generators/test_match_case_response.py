@@ -176,10 +176,10 @@ class TestMatchCaseResponseGeneration:
         assert "case _:" in match_content  # catch-all
 
         # Verify no unwrapping code appears (since no data wrapper expected)
-        assert 'raw_data = response.json().get("data")' not in match_content
+        assert 'raw_data = decode_json(response).get("data")' not in match_content
 
         # Should have clean return for success case (now uses cattrs)
-        assert "return structure_from_dict(response.json(), Chat)" in match_content
+        assert "return decode_model(response, Chat)" in match_content
 
     def test_default_response_handling__uses_conditional_case__handles_catch_all(self) -> None:
         """
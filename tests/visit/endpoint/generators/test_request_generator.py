@@ -11,6 +11,7 @@ from pyopenapi_gen.visit.endpoint.generators.request_generator import EndpointRe
 class TestEndpointRequestGenerator(unittest.TestCase):
     def setUp(self) -> None:
         self.render_context_mock = MagicMock(spec=RenderContext)
+        self.render_context_mock.core_package_name = "test_client.core"
         self.code_writer_mock = MagicMock(spec=CodeWriter)
         self.generator = EndpointRequestGenerator()
 
@@ -80,6 +81,107 @@ class TestEndpointRequestGenerator(unittest.TestCase):
         # self.assertIn("timeout=timeout", all_written_lines) # Timeout is not currently added
         self.code_writer_mock.write_line.assert_any_call("")
 
+    def test_generate_request_call__streaming__opens_transport_stream_block(self) -> None:
+        """
+        Scenario: The operation returns a streaming response (SSE, NDJSON or binary download).
+        Expected Outcome: The call is emitted as `async with open_stream(self._transport, ...) as response:`
+            and the writer is left indented so the response handling is written inside the block.
+        """
+        operation = IROperation(
+            operation_id="export_items",
+            summary="Export items",
+            description="Stream all items.",
+            method=HTTPMethod.GET,
+            path="/items/export",
+            tags=["items"],
+            parameters=[],
+            request_body=None,
+            responses=[],
+        )
+
+        self.generator.generate_request_call(
+            self.code_writer_mock,
+            operation,
+            self.render_context_mock,
+            has_header_params=False,
+            primary_content_type=None,
+            streaming=True,
+        )
+
+        all_written_lines = "".join(c[0][0] for c in self.code_writer_mock.write_line.call_args_list)
+        self.assertIn('async with open_stream(self._transport, "GET", url', all_written_lines)
+        self.assertIn(") as response:", all_written_lines)
+        self.assertNotIn("await self._transport.request(", all_written_lines)
+        self.render_context_mock.add_import.assert_any_call("test_client.core.http_transport", "open_stream")
+        # Left indented inside the `async with` block for the response handling
+        self.assertEqual(self.code_writer_mock.indent.call_count, self.code_writer_mock.dedent.call_count + 1)
+
+    def test_generate_request_call__coalesced_operation__passes_coalesce_extension(self) -> None:
+        """
+        Scenario: A GET operation is marked for request coalescing (`x-coalesce: true` or `--coalesce`).
+        Expected Outcome: The request call passes the `coalesce` request extension, which a
+            CoalescingTransport uses to share identical in-flight requests; its stream variant does not.
+        """
+        operation = IROperation(
+            operation_id="get_settings",
+            summary="Get settings",
+            description="Retrieve the settings.",
+            method=HTTPMethod.GET,
+            path="/settings",
+            tags=["settings"],
+            coalesce=True,
+        )
+
+        self.generator.generate_request_call(
+            self.code_writer_mock,
+            operation,
+            self.render_context_mock,
+            has_header_params=False,
+            primary_content_type=None,
+        )
+        request_lines = "".join(c[0][0] for c in self.code_writer_mock.write_line.call_args_list)
+        self.code_writer_mock.reset_mock()
+        self.generator.generate_request_call(
+            self.code_writer_mock,
+            operation,
+            self.render_context_mock,
+            has_header_params=False,
+            primary_content_type=None,
+            streaming=True,
+        )
+        stream_lines = "".join(c[0][0] for c in self.code_writer_mock.write_line.call_args_list)
+
+        self.assertIn('extensions={"coalesce": True}', request_lines)
+        self.assertNotIn("extensions=", stream_lines)
+
+    def test_generate_request_call__idempotent_operation__passes_hedge_extension_with_operation_id(self) -> None:
+        """
+        Scenario: A GET operation is idempotent and coalesced.
+        Expected Outcome: The request call passes both request extensions in one `extensions` argument;
+            the `hedge` extension carries the operation ID a HedgingTransport tracks latencies under.
+        """
+        operation = IROperation(
+            operation_id="get_settings",
+            summary="Get settings",
+            description="Retrieve the settings.",
+            method=HTTPMethod.GET,
+            path="/settings",
+            tags=["settings"],
+            coalesce=True,
+            idempotent=True,
+        )
+
+        self.generator.generate_request_call(
+            self.code_writer_mock,
+            operation,
+            self.render_context_mock,
+            has_header_params=False,
+            primary_content_type=None,
+        )
+        request_lines = "".join(c[0][0] for c in self.code_writer_mock.write_line.call_args_list)
+
+        self.assertIn('extensions={"coalesce": True, "hedge": "get_settings"}', request_lines)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -84,8 +84,7 @@ class TestEndpointResponseHandlerGenerator:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), Item)"
-            for c in code_writer_mock.write_line.call_args_list
+            c[0][0].strip() == "return decode_model(response, Item)" for c in code_writer_mock.write_line.call_args_list
         )
         render_context_mock.add_import.assert_any_call(
             f"{render_context_mock.core_package_name}.exceptions", "HTTPError"
@@ -149,25 +148,25 @@ class TestEndpointResponseHandlerGenerator:
     def test_get_extraction_code_any_type(self, generator, render_context_mock, mock_op) -> None:
         """
         Scenario: _get_extraction_code is called with return_type="Any"
-        Expected Outcome: Returns "response.json())  # Type is Any" and registers import for Any
+        Expected Outcome: Returns "decode_json(response)  # Type is Any" and registers import for Any
         """
         # Act
         code = generator._get_extraction_code(return_type="Any", context=render_context_mock, op=mock_op)
 
         # Assert
-        assert code == "response.json()  # Type is Any"
+        assert code == "decode_json(response)  # Type is Any"
         render_context_mock.add_import.assert_called_with("typing", "Any")
 
     def test_get_extraction_code_model_type(self, generator, render_context_mock, mock_op) -> None:
         """
         Scenario: _get_extraction_code is called with a model type string (e.g., "MyModel")
-        Expected Outcome: Returns "structure_from_dict(response.json(), MyModel)" for BaseSchema deserialization and registers imports
+        Expected Outcome: Returns "decode_model(response, MyModel)" for BaseSchema deserialization and registers imports
         """
         # Act
         code = generator._get_extraction_code(return_type="MyModel", context=render_context_mock, op=mock_op)
 
         # Assert
-        assert code == "structure_from_dict(response.json(), MyModel)"
+        assert code == "decode_model(response, MyModel)"
         render_context_mock.add_typing_imports_for_type.assert_called_with("MyModel")
 
     def test_get_extraction_code_model_type_no_unwrapping(self, generator, render_context_mock, mock_op) -> None:
@@ -179,9 +178,28 @@ class TestEndpointResponseHandlerGenerator:
         code = generator._get_extraction_code(return_type="MyDataModel", context=render_context_mock, op=mock_op)
 
         # Assert
-        assert code == "structure_from_dict(response.json(), MyDataModel)"
+        assert code == "decode_model(response, MyDataModel)"
         render_context_mock.add_typing_imports_for_type.assert_called_with("MyDataModel")
 
+    def test_get_extraction_code__list_and_nullable_models__single_pass_only_for_non_nullable(
+        self, generator, render_context_mock, mock_op
+    ) -> None:
+        """
+        Scenario: _get_extraction_code is called for list[Model] and Model | None
+        Expected Outcome: Lists of models decode straight from the body with decode_model; nullable
+        models keep structure_from_dict with the None check
+        """
+        # Act
+        list_code = generator._get_extraction_code(return_type="list[MyModel]", context=render_context_mock, op=mock_op)
+        nullable_code = generator._get_extraction_code(
+            return_type="MyModel | None", context=render_context_mock, op=mock_op
+        )
+
+        # Assert
+        assert list_code == "decode_model(response, list[MyModel])"
+        render_context_mock.add_import.assert_any_call("test_client.core.model_decoder", "decode_model")
+        assert nullable_code.startswith("structure_from_dict(decode_json(response), MyModel)")
+
     def test_generate_response_handling_error_404(self, generator, code_writer_mock, render_context_mock) -> None:
         """
         Scenario: Test response handling for a 404 Not Found error
@@ -297,7 +315,7 @@ class TestEndpointResponseHandlerGenerator:
         # Default case can be handled with case _ if status_code >= 0 or case _
         assert "case _ if response.status_code >= 0:" in written_code or "case _:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), DefaultSuccessData)"
+            c[0][0].strip() == "return decode_model(response, DefaultSuccessData)"
             for c in code_writer_mock.write_line.call_args_list
         )
         # Verify proper imports are registered
@@ -348,7 +366,7 @@ class TestEndpointResponseHandlerGenerator:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), SuccessData)"
+            c[0][0].strip() == "return decode_model(response, SuccessData)"
             for c in code_writer_mock.write_line.call_args_list
         )
 
@@ -416,10 +434,10 @@ class TestEndpointResponseHandlerGenerator:
             'raise HTTPError(response=response, message="Default error"' in line for line in written_lines
         ), f"Expected default fallback to raise HTTPError, got:\n{written_code}"
         assert not any(
-            line == "return structure_from_dict(response.json(), ErrorData)" for line in written_lines
+            line == "return structure_from_dict(decode_json(response), ErrorData)" for line in written_lines
         ), "Default error body must not be returned"
         assert not any(
-            line == "return structure_from_dict(response.json(), SuccessData)"
+            line == "return structure_from_dict(decode_json(response), SuccessData)"
             and idx > written_lines.index("case _:  # Default response")
             for idx, line in enumerate(written_lines)
         ), "Default case must not return the success type for unhandled codes"
@@ -471,7 +489,7 @@ class TestEndpointResponseHandlerGenerator:
             # Default case can be handled with case _ if status_code >= 0 or case _
             assert "case _ if response.status_code >= 0:" in written_code or "case _:" in written_code
             assert any(
-                c[0][0].strip() == "return structure_from_dict(response.json(), PrimaryDefault)"
+                c[0][0].strip() == "return decode_model(response, PrimaryDefault)"
                 for c in code_writer_mock.write_line.call_args_list
             )
             # Verify that proper imports are registered
@@ -534,12 +552,12 @@ class TestEndpointResponseHandlerGenerator:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), ModelA)"
+            c[0][0].strip() == "return decode_model(response, ModelA)"
             for c in code_writer_mock.write_line.call_args_list
         )
         assert "case 201:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), ModelB)"
+            c[0][0].strip() == "return decode_model(response, ModelB)"
             for c in code_writer_mock.write_line.call_args_list
         )
 
@@ -692,13 +710,13 @@ class TestEndpointResponseHandlerGenerator:
         assert "case 200:" in written_code
         assert "try:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), ModelA)"
+            c[0][0].strip() == "return structure_from_dict(decode_json(response), ModelA)"
             for c in code_writer_mock.write_line.call_args_list
             if "try:" in written_code and "except Exception:" not in written_code[: written_code.find(c[0][0])]
         )
         assert "except Exception:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), ModelB)"
+            c[0][0].strip() == "return structure_from_dict(decode_json(response), ModelB)"
             for c in code_writer_mock.write_line.call_args_list
             if "except Exception:" in written_code[: written_code.find(c[0][0])]
         )
@@ -745,12 +763,12 @@ class TestEndpointResponseHandlerGenerator:
         assert "case 200:" in written_code_union
         assert "try:" in written_code_union
         # With unified service, no manual unwrapping should be generated for union types
-        assert "return structure_from_dict(response.json(), ModelA)" in written_lines_stripped_union
+        assert "return structure_from_dict(decode_json(response), ModelA)" in written_lines_stripped_union
         assert "except Exception:" in written_code_union
-        assert "return structure_from_dict(response.json(), ModelB)" in written_lines_stripped_union
+        assert "return structure_from_dict(decode_json(response), ModelB)" in written_lines_stripped_union
 
         # Ensure no unwrapping code is generated (unified service handles it)
-        assert "raw_data = response.json()).get('data')" not in written_lines_stripped_union
+        assert "raw_data = decode_json(response)).get('data')" not in written_lines_stripped_union
         assert "return_value = structure_from_dict(raw_data, ModelA)" not in written_lines_stripped_union
         assert "return return_value" not in written_lines_stripped_union
 
@@ -788,10 +806,10 @@ class TestEndpointResponseHandlerGenerator:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         # With unified service, no manual unwrapping should be generated
-        assert "return structure_from_dict(response.json(), ModelC)" in written_lines_stripped
+        assert "return decode_model(response, ModelC)" in written_lines_stripped
 
         # Ensure no unwrapping code is generated (unified service handles it)
-        assert "raw_data = response.json()).get('data')" not in written_lines_stripped
+        assert "raw_data = decode_json(response)).get('data')" not in written_lines_stripped
         assert "structure_from_dict(raw_data, ModelC)" not in written_code
         assert "return return_value" not in written_code
 
@@ -800,7 +818,7 @@ class TestEndpointResponseHandlerGenerator:
     ) -> None:
         """
         Scenario: Response schema is a wrapper object with 'data' field (e.g., paginated response)
-        Expected Outcome: Generated code unwraps the data field using response.json())["data"]
+        Expected Outcome: Generated code unwraps the data field using decode_json(response))["data"]
         """
         # Arrange - Create a paginated response wrapper schema
         item_schema = IRSchema(type="object", properties={"id": IRSchema(type="integer")}, name="Agent")
@@ -858,17 +876,17 @@ class TestEndpointResponseHandlerGenerator:
         written_lines = [call[0][0] for call in code_writer_mock.write_line.call_args_list]
         written_lines_stripped = [line.strip() for line in written_lines]
 
-        # NEW BEHAVIOR: No automatic unwrapping - use full response.json()
+        # NEW BEHAVIOR: No automatic unwrapping - use full decode_json(response)
         # Even if the schema has a "data" property, we treat it as part of the response structure
         assert any(
-            "return structure_from_dict(response.json(), AgentListResponse)" in line for line in written_lines_stripped
-        ), "Expected return statement to use full response.json() without unwrapping. Generated lines: " + "\n".join(
+            "return decode_model(response, AgentListResponse)" in line for line in written_lines_stripped
+        ), "Expected return statement to decode the full body without unwrapping. Generated lines: " + "\n".join(
             written_lines_stripped
         )
 
         # Verify NO unwrapping happens
         assert not any(
-            'response.json()["data"]' in line for line in written_lines_stripped
+            'decode_json(response)["data"]' in line for line in written_lines_stripped
         ), "Should NOT unwrap data field automatically"
 
 
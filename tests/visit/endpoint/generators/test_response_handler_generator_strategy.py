@@ -74,10 +74,47 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         assert any(
-            c[0][0].strip() == "return structure_from_dict(response.json(), User)"
-            for c in code_writer_mock.write_line.call_args_list
+            c[0][0].strip() == "return decode_model(response, User)" for c in code_writer_mock.write_line.call_args_list
         )
 
+    def test_generate_response_handling__model_response__large_bodies_decoded_by_offload(
+        self, generator, code_writer_mock, render_context_mock
+    ) -> None:
+        """
+        Scenario: A list-of-models response is handled
+        Expected Outcome: The body is decoded by the transport's DecodeOffload when decode_offload() returns
+        one, and inline with decode_model otherwise
+        """
+        # Arrange
+        item_schema = IRSchema(type="object", name="User")
+        list_schema = IRSchema(type="array", items=item_schema)
+        operation = IROperation(
+            operation_id="list_users",
+            method=HTTPMethod.GET,
+            path="/users",
+            responses=[IRResponse(status_code="200", description="Users", content={"application/json": list_schema})],
+            summary="list users",
+            description="list users",
+        )
+        strategy = ResponseStrategy(
+            return_type="List[User]",
+            response_schema=list_schema,
+            is_streaming=False,
+            response_ir=operation.responses[0],
+        )
+
+        # Act
+        generator.generate_response_handling(code_writer_mock, operation, render_context_mock, strategy)
+
+        # Assert
+        lines = [c[0][0].strip() for c in code_writer_mock.write_line.call_args_list]
+        start = lines.index("if (offload := decode_offload(response)) is not None:")
+        assert lines[start + 1 : start + 3] == [
+            "return await offload.decode(response, List[User])",
+            "return decode_model(response, List[User])",
+        ]
+        render_context_mock.add_import.assert_any_call("test_client.core.offload", "decode_offload")
+
     def test_generate_response_handling__wrapper_schema_response__unwraps_data_field(
         self,
         generator,
@@ -86,7 +123,7 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
     ) -> None:
         """
         Scenario: Response with wrapper schema containing data field (e.g., paginated response)
-        Expected Outcome: Automatically unwraps the data field using response.json())["data"]
+        Expected Outcome: Automatically unwraps the data field using decode_json(response))["data"]
         """
         # Arrange
         user_schema = IRSchema(type="object", name="User")
@@ -124,11 +161,11 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
 
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
-        # NEW BEHAVIOR: No automatic unwrapping - use full response.json()
+        # NEW BEHAVIOR: No automatic unwrapping - use full decode_json(response)
         # Even if the schema has a "data" property, we treat it as part of the response structure
-        assert "return structure_from_dict(response.json(), UserResponse)" in written_code
+        assert "return decode_model(response, UserResponse)" in written_code
         # Should NOT unwrap data field automatically
-        assert 'response.json()["data"]' not in written_code
+        assert 'decode_json(response)["data"]' not in written_code
 
     def test_generate_response_handling__none_return_type__generates_return_none(
         self, generator, code_writer_mock, render_context_mock
@@ -244,6 +281,8 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         assert "case 200:" in written_code
         assert "iter_bytes" in written_code
         assert "yield chunk" in written_code
+        # The streamed body is unread, so error paths read it before raising
+        assert "await response.aread()" in written_code
 
     def test_generate_response_handling__error_responses__generates_exception_raises(
         self, generator, code_writer_mock, render_context_mock
@@ -292,6 +331,8 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         # Now expects human-readable exception names
         assert "raise NotFoundError" in written_code
         assert "raise InternalServerError" in written_code
+        # Buffered responses are already read; no explicit aread() is needed
+        assert "aread()" not in written_code
 
     def test_generate_response_handling__union_return_type__generates_fallback_parsing(
         self, generator, code_writer_mock, render_context_mock
@@ -334,8 +375,8 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         assert "try:" in written_code
         assert "except Exception:" in written_code
         # Should attempt to parse as both types
-        assert "structure_from_dict(response.json(), ModelA)" in written_code
-        assert "structure_from_dict(response.json(), ModelB)" in written_code
+        assert "structure_from_dict(decode_json(response), ModelA)" in written_code
+        assert "structure_from_dict(decode_json(response), ModelB)" in written_code
 
     def test_generate_response_handling__list_return_type__handles_list_deserialization(
         self, generator, code_writer_mock, render_context_mock
@@ -376,7 +417,7 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         # Should handle list deserialization using generic cattrs approach
-        assert "structure_from_dict(response.json(), List[User])" in written_code
+        assert "decode_model(response, List[User])" in written_code
 
     def test_generate_response_handling__multiple_success_responses__handles_all_success_codes(
         self, generator, code_writer_mock, render_context_mock
@@ -430,5 +471,5 @@ class TestEndpointResponseHandlerGeneratorWithStrategy:
         assert "match response.status_code:" in written_code
         assert "case 200:" in written_code
         assert "case 201:" in written_code
-        assert "structure_from_dict(response.json(), ModelA)" in written_code
-        assert "structure_from_dict(response.json(), ModelB)" in written_code
+        assert "decode_model(response, ModelA)" in written_code
+        assert "decode_model(response, ModelB)" in written_code
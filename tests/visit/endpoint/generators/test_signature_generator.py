@@ -85,7 +85,13 @@ class TestEndpointMethodSignatureGenerator:
         )
 
         generated_code = writer.get_code().strip()
-        expected_signature_parts = ["async def get_basic(", "    self,", ") -> None:"]
+        expected_signature_parts = [
+            "async def get_basic(",
+            "    self,",
+            "    *,",
+            "    timeout: float | None = None,",
+            ") -> None:",
+        ]
         actual_lines = [line.strip() for line in generated_code.splitlines() if line.strip()]
         expected_lines = [line.strip() for line in expected_signature_parts if line.strip()]
         assert actual_lines[: len(expected_lines)] == expected_lines
@@ -146,6 +152,8 @@ class TestEndpointMethodSignatureGenerator:
             "    id_: int,",  # 'id' is sanitized to 'id_'
             "    token: str,",
             "    limit: int | None = None,",
+            "    *,",
+            "    timeout: float | None = None,",
             ") -> SomeReturnType:",
         ]
         actual_lines = [line.strip() for line in generated_code.splitlines() if line.strip()]
@@ -156,3 +164,50 @@ class TestEndpointMethodSignatureGenerator:
         render_context_mock_for_sig.add_typing_imports_for_type.assert_any_call("str")
         render_context_mock_for_sig.add_typing_imports_for_type.assert_any_call("int | None")
         render_context_mock_for_sig.add_typing_imports_for_type.assert_any_call("SomeReturnType")
+
+    def test_generate_signature__operation_timeout_and_timeout_parameter__default_on_renamed_argument(
+        self,
+        render_context_mock_for_sig: MagicMock,
+        schemas_for_sig: dict[str, IRSchema],
+    ) -> None:
+        """
+        Scenario:
+            An operation has a default timeout of 2.5 seconds and a query parameter named `timeout`.
+        Expected Outcome:
+            The query parameter keeps its name and the keyword-only deadline argument becomes
+            `timeout_`, defaulting to 2.5.
+        """
+        # Arrange
+        generator = EndpointMethodSignatureGenerator(schemas=schemas_for_sig)
+        writer = CodeWriter()
+        op = IROperation(
+            path="/jobs",
+            method=HTTPMethod.GET,
+            operation_id="list_jobs",
+            summary=None,
+            description=None,
+            parameters=[IRParameter(name="timeout", param_in="query", required=False, schema=IRSchema(type="integer"))],
+            responses=[],
+            timeout=2.5,
+        )
+        ordered_params: List[dict[str, Any]] = [
+            {
+                "name": "timeout",
+                "type": "int | None",
+                "required": False,
+                "default": None,
+                "param_in": "query",
+                "original_name": "timeout",
+            },
+        ]
+        response_strategy = ResponseStrategy(
+            return_type="None", response_schema=None, is_streaming=False, response_ir=None
+        )
+
+        # Act
+        with patch("pyopenapi_gen.visit.endpoint.generators.signature_generator.get_param_type", return_value="int"):
+            generator.generate_signature(writer, op, render_context_mock_for_sig, ordered_params, response_strategy)
+
+        # Assert
+        actual_lines = [line.strip() for line in writer.get_code().splitlines() if line.strip()]
+        assert actual_lines[2:5] == ["timeout: int | None = None,", "*,", "timeout_: float | None = 2.5,"]
@@ -5,7 +5,7 @@ These tests validate actual Protocol and Mock generation behavior using real
 IROperation objects and real code generation without mocking internal components.
 """
 
-from pyopenapi_gen import IROperation, IRParameter, IRRequestBody, IRResponse, IRSchema
+from pyopenapi_gen import IROperation, IRPagination, IRParameter, IRRequestBody, IRResponse, IRSchema
 from pyopenapi_gen.context.render_context import RenderContext
 from pyopenapi_gen.http_types import HTTPMethod
 from pyopenapi_gen.visit.endpoint.endpoint_visitor import EndpointVisitor
@@ -372,3 +372,203 @@ class TestProtocolAndImplementationIntegration:
         assert "def __init__(self, transport: HttpTransport, base_url: str)" in complete_code
         assert "self._transport = transport" in complete_code
         assert "self.base_url: str = base_url" in complete_code
+
+    def test_emit_endpoint_client_class__array_response__adds_stream_variant_everywhere(self) -> None:
+        """
+        Scenario: Generate a client, Protocol and mock for an operation returning a JSON array of models
+        Expected Outcome: A stream_<operation>() async-iterator variant parsing the array incrementally
+        is emitted next to the buffered method in the implementation, the Protocol and the mock
+        """
+        # Arrange
+        user_schema = IRSchema(name="User", type="object", properties={"id": IRSchema(type="integer")})
+        user_schema.generation_name = "User"
+        user_schema.final_module_stem = "user"
+        operation = IROperation(
+            path="/users",
+            method=HTTPMethod.GET,
+            operation_id="list_users",
+            summary="List users",
+            description="List users",
+            parameters=[],
+            request_body=None,
+            responses=[
+                IRResponse(
+                    status_code="200",
+                    description="Success",
+                    content={"application/json": IRSchema(type="array", items=user_schema)},
+                ),
+                IRResponse(status_code="204", description="No users", content={}),
+            ],
+            tags=["users"],
+        )
+        context = RenderContext(core_package_name="test_core")
+        visitor = EndpointVisitor({"User": user_schema})
+
+        # Act
+        method_code = visitor.visit_IROperation(operation, context)
+        complete_code = visitor.emit_endpoint_client_class("users", [method_code], context, operations=[operation])
+        mock_code = visitor.generate_endpoint_mock_class("users", [operation], context)
+
+        # Assert
+        protocol_code, impl_code = complete_code.split("class UsersClient(UsersClientProtocol):")
+        assert "async def list_users(" in protocol_code
+        assert "def stream_list_users(" in protocol_code and "async def stream_list_users(" not in protocol_code
+        assert ") -> AsyncIterator[User]: ..." in protocol_code
+        assert "async def list_users(" in impl_code
+        assert "async def stream_list_users(" in impl_code
+        assert "async with open_stream(self._transport, " in impl_code
+        assert "async for item in iter_json_array(response, User):" in impl_code
+        assert "return None" not in impl_code.split("async def stream_list_users(")[1]
+        compile("class UsersClient:" + impl_code, "<client>", "exec")
+        assert "MockUsersClient.list_users() not implemented" in mock_code
+        assert "MockUsersClient.stream_list_users() not implemented" in mock_code
+
+    def test_emit_endpoint_client_class__paginated_operations__adds_iter_variant_everywhere(self) -> None:
+        """
+        Scenario: Generate a client, Protocol and mock for a cursor-paginated and a Link-header-paginated operation
+        Expected Outcome: iter_<operation>() methods yielding the page items are emitted without the page
+        parameter, paging through the typed method or following the Link header
+        """
+        # Arrange
+        user_schema = IRSchema(name="User", type="object", properties={"id": IRSchema(type="integer")})
+        user_schema.generation_name = "User"
+        user_schema.final_module_stem = "user"
+        page_schema = IRSchema(
+            name="UserPage",
+            type="object",
+            properties={
+                "results": IRSchema(type="array", items=user_schema),
+                "next_cursor": IRSchema(type="string"),
+            },
+            required=["results"],
+        )
+        page_schema.generation_name = "UserPage"
+        page_schema.final_module_stem = "user_page"
+        cursor = IRParameter(name="cursor", param_in="query", required=False, schema=IRSchema(type="string"))
+        limit = IRParameter(name="limit", param_in="query", required=False, schema=IRSchema(type="integer"))
+        list_users = IROperation(
+            path="/users",
+            method=HTTPMethod.GET,
+            operation_id="list_users",
+            summary="List users",
+            description="List users",
+            parameters=[cursor, limit],
+            request_body=None,
+            responses=[IRResponse(status_code="200", description="Success", content={"application/json": page_schema})],
+            tags=["users"],
+            pagination=IRPagination("cursor", "results", "cursor", "limit", next_field="next_cursor"),
+        )
+        list_admins = IROperation(
+            path="/admins",
+            method=HTTPMethod.GET,
+            operation_id="list_admins",
+            summary="List admins",
+            description="List admins",
+            parameters=[limit],
+            request_body=None,
+            responses=[
+                IRResponse(
+                    status_code="200",
+                    description="Success",
+                    content={"application/json": IRSchema(type="array", items=user_schema)},
+                )
+            ],
+            tags=["users"],
+            pagination=IRPagination("link", None, size_param="limit"),
+        )
+        context = RenderContext(core_package_name="test_core")
+        visitor = EndpointVisitor({"User": user_schema, "UserPage": page_schema})
+        operations = [list_users, list_admins]
+
+        # Act
+        methods = [visitor.visit_IROperation(op, context) for op in operations]
+        complete_code = visitor.emit_endpoint_client_class("users", methods, context, operations=operations)
+        mock_code = visitor.generate_endpoint_mock_class("users", operations, context)
+
+        # Assert
+        protocol_code, impl_code = complete_code.split("class UsersClient(UsersClientProtocol):")
+        assert "def iter_list_users(" in protocol_code and "def iter_list_admins(" in protocol_code
+        iter_users = impl_code.split("async def iter_list_users(")[1].split("async def ")[0]
+        assert "cursor" not in iter_users.split(")")[0]
+        assert "pages = paginate_pipelined(" in iter_users
+        assert "async for item in iterate_with_deadline(pages, timeout):" in iter_users
+        assert "self.list_users," in iter_users
+        assert "lambda page: page.results," in iter_users
+        assert '{**params, "cursor": page.next_cursor} if page.next_cursor else None' in iter_users
+        iter_admins = impl_code.split("async def iter_list_admins(")[1]
+        assert "async def fetch_page(url: str, params: dict[str, Any] | None) -> httpx.Response:" in iter_admins
+        assert "pages = paginate_by_link(" in iter_admins
+        assert (
+            'async for item in iterate_with_deadline(pages, timeout, operation="list_admins", route="/admins"):'
+            in iter_admins
+        )
+        compile("class UsersClient:" + impl_code, "<client>", "exec")
+        assert "MockUsersClient.iter_list_users() not implemented" in mock_code
+        assert "MockUsersClient.iter_list_admins() not implemented" in mock_code
+
+    def test_emit_endpoint_client_class__operation_timeouts__methods_run_under_deadline(self) -> None:
+        """
+        Scenario: Generate a client for a JSON operation with a 2.5 second default timeout and a
+            streamed binary operation without one
+        Expected Outcome: Both methods take a keyword-only timeout argument with the operation's
+            default; the JSON call runs in a Deadline scope and the stream is iterated through
+            iterate_with_deadline, whose nested generator stays out of the Protocol
+        """
+        # Arrange
+        get_report = IROperation(
+            path="/report",
+            method=HTTPMethod.GET,
+            operation_id="get_report",
+            summary="Get report",
+            description="Get report",
+            parameters=[],
+            request_body=None,
+            responses=[
+                IRResponse(
+                    status_code="200", description="Success", content={"application/json": IRSchema(type="string")}
+                )
+            ],
+            tags=["reports"],
+            timeout=2.5,
+        )
+        download_report = IROperation(
+            path="/report/file",
+            method=HTTPMethod.GET,
+            operation_id="download_report",
+            summary="Download report",
+            description="Download report",
+            parameters=[],
+            request_body=None,
+            responses=[
+                IRResponse(
+                    status_code="200",
+                    description="Success",
+                    content={"application/octet-stream": IRSchema(type="string", format="binary")},
+                    stream=True,
+                )
+            ],
+            tags=["reports"],
+        )
+        context = RenderContext(core_package_name="test_core")
+        visitor = EndpointVisitor({})
+        operations = [get_report, download_report]
+
+        # Act
+        methods = [visitor.visit_IROperation(op, context) for op in operations]
+        complete_code = visitor.emit_endpoint_client_class("reports", methods, context, operations=operations)
+
+        # Assert
+        protocol_code, impl_code = complete_code.split("class ReportsClient(ReportsClientProtocol):")
+        assert "timeout: float | None = 2.5" in protocol_code
+        assert "_iterate" not in protocol_code
+        get_code = impl_code.split("async def get_report(")[1].split("async def download_report(")[0]
+        assert 'async with Deadline(timeout, operation="get_report", route="/report"):' in get_code
+        download_code = impl_code.split("async def download_report(")[1]
+        assert "timeout: float | None = None" in download_code
+        assert "async def _iterate() -> AsyncIterator[bytes]:" in download_code
+        assert (
+            'iterate_with_deadline(_iterate(), timeout, operation="download_report", route="/report/file"):'
+            in download_code
+        )
+        assert "Deadline" in context.import_collector.imports.get("test_core.deadline", set())
+        compile("class ReportsClient:" + impl_code, "<client>", "exec")
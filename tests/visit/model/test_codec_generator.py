@@ -0,0 +1,148 @@
+"""Unit tests for ModelCodecGenerator (ahead-of-time _from_json/_to_json functions)."""
+
+import pytest
+
+from pyopenapi_gen import IRSchema
+from pyopenapi_gen.context.render_context import RenderContext
+from pyopenapi_gen.core.writers.python_construct_renderer import PythonConstructRenderer
+from pyopenapi_gen.visit.model.codec_generator import CodecField, ModelCodecGenerator
+from pyopenapi_gen.visit.model.dataclass_generator import DataclassGenerator
+
+
+@pytest.fixture
+def render_context() -> RenderContext:
+    """Create a render context with model codecs enabled."""
+    return RenderContext(
+        core_package_name="testclient.core",
+        package_root_for_generated_code="/tmp/testclient",
+        overall_project_root="/tmp",
+        parsed_schemas={},
+        model_codecs=True,
+    )
+
+
+def test_generate__scalars_lists_and_defaults__inlines_conversions(render_context: RenderContext) -> None:
+    """
+    Scenario:
+        A model has a required renamed scalar, an optional list with a default factory
+        and an optional field with a literal default.
+
+    Expected Outcome:
+        Field renames and scalar calls are inlined, absent keys fall back to the defaults,
+        and the functions are registered with the core converter.
+    """
+    # Arrange
+    generator = ModelCodecGenerator({})
+    fields = [
+        CodecField("id_", "id", "int", None),
+        CodecField("tags", "tags", "List[str] | None", "field(default_factory=list)"),
+        CodecField("nickname", "nickName", "str | None", '"buddy"'),
+    ]
+
+    # Act
+    code = generator.generate("Pet", fields, render_context)
+
+    # Assert
+    assert "def _pet_from_json(data: dict[str, Any]) -> Pet:" in code
+    assert 'id_=int(data["id"]),' in code
+    assert (
+        'tags=(None if data["tags"] is None else [str(item0) for item0 in data["tags"]]) if "tags" in data else [],'
+        in code
+    )
+    assert (
+        'nickname=(None if data["nickName"] is None else str(data["nickName"])) if "nickName" in data else "buddy",'
+        in code
+    )
+    assert '"tags": None if obj.tags is None else list(obj.tags),' in code
+    assert '"nickName": obj.nickname,' in code
+    assert "register_model_codec(Pet, _pet_from_json, _pet_to_json)" in code
+    assert "register_model_codec" in render_context.import_collector.imports["testclient.core.cattrs_converter"]
+
+
+def test_generate__enum_model_and_forward_ref__use_enum_call_and_model_dispatch(
+    render_context: RenderContext,
+) -> None:
+    """
+    Scenario:
+        A model references an enum, another model and itself (quoted forward reference).
+
+    Expected Outcome:
+        Enums are called/`.value`-ed directly; models go through structure_model and
+        unstructure_model, with the forward reference unquoted.
+    """
+    # Arrange
+    schemas = {
+        "Status": IRSchema(name="Status", type="string", enum=["a", "b"]),
+        "Owner": IRSchema(name="Owner", type="object", properties={}),
+        "Node": IRSchema(name="Node", type="object", properties={}),
+    }
+    generator = ModelCodecGenerator(schemas)
+    fields = [
+        CodecField("status", "status", "Status", None),
+        CodecField("owner", "owner", "Owner | None", "None"),
+        CodecField("children", "children", 'List["Node"]', None),
+    ]
+
+    # Act
+    code = generator.generate("Node", fields, render_context)
+
+    # Assert
+    assert 'status=Status(data["status"]),' in code
+    assert 'owner=None if data.get("owner") is None else structure_model(data["owner"], Owner),' in code
+    assert 'children=[structure_model(item0, Node) for item0 in data["children"]],' in code
+    assert '"status": obj.status.value,' in code
+    assert '"children": [unstructure_model(item0) for item0 in obj.children],' in code
+
+
+def test_generate__union_field__falls_back_to_converter_with_resolved_field_type(
+    render_context: RenderContext,
+) -> None:
+    """
+    Scenario:
+        A field has a type the generator does not inline (a Union / dict).
+
+    Expected Outcome:
+        The field is converted through the converter with the field's resolved type, and
+        the converter helpers are imported.
+    """
+    # Arrange
+    generator = ModelCodecGenerator({})
+    fields = [CodecField("value", "value", "Union[str, int]", None)]
+
+    # Act
+    code = generator.generate("Holder", fields, render_context)
+
+    # Assert
+    assert 'value=converter.structure(data["value"], model_field_type(Holder, "value")),' in code
+    assert '"value": converter.unstructure(obj.value, model_field_type(Holder, "value")),' in code
+    core_imports = render_context.import_collector.imports["testclient.core.cattrs_converter"]
+    assert {"converter", "model_field_type"} <= core_imports
+
+
+def test_dataclass_generator__model_codecs_disabled__emits_no_codecs() -> None:
+    """
+    Scenario:
+        The dataclass generator renders a model with model codecs enabled and disabled.
+
+    Expected Outcome:
+        Codec functions (with the original JSON keys) are only emitted when enabled.
+    """
+    # Arrange
+    schema = IRSchema(
+        name="User",
+        type="object",
+        properties={"userName": IRSchema(name="userName", type="string")},
+        required=["userName"],
+    )
+    generator = DataclassGenerator(PythonConstructRenderer(), {})
+    disabled_context = RenderContext(core_package_name="testclient.core", parsed_schemas={})
+    enabled_context = RenderContext(core_package_name="testclient.core", parsed_schemas={}, model_codecs=True)
+
+    # Act
+    plain_code = generator.generate(schema, "User", disabled_context)
+    codec_code = generator.generate(schema, "User", enabled_context)
+
+    # Assert
+    assert "_from_json" not in plain_code
+    assert 'user_name=str(data["userName"]),' in codec_code
+    assert '"userName": obj.user_name,' in codec_code
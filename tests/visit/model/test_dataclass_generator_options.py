@@ -0,0 +1,98 @@
+"""Unit tests for the dataclass options of generated models (--model-slots, --model-frozen, --model-kw-only).
+
+Tests that DataclassGenerator emits the `@dataclass` decorator with the options of the render context,
+for regular models as well as the dict wrappers of additionalProperties schemas.
+"""
+
+import pytest
+
+from pyopenapi_gen import IRSchema
+from pyopenapi_gen.context.render_context import RenderContext
+from pyopenapi_gen.core.writers.python_construct_renderer import PythonConstructRenderer
+from pyopenapi_gen.visit.model.dataclass_generator import DataclassGenerator
+
+
+def _render_context(**options: bool) -> RenderContext:
+    return RenderContext(
+        core_package_name="testclient.core",
+        package_root_for_generated_code="/tmp/testclient",
+        overall_project_root="/tmp",
+        parsed_schemas={},
+        **options,
+    )
+
+
+@pytest.fixture
+def dataclass_generator() -> DataclassGenerator:
+    """Create a DataclassGenerator for testing."""
+    return DataclassGenerator(renderer=PythonConstructRenderer(), all_schemas={})
+
+
+USER_SCHEMA = IRSchema(
+    name="User",
+    type="object",
+    properties={
+        "firstName": IRSchema(name="firstName", type="string"),
+        "email": IRSchema(name="email", type="string"),
+    },
+    required=["firstName"],
+)
+
+
+@pytest.mark.parametrize(
+    "options, decorator",
+    [
+        ({}, "@dataclass\n"),
+        ({"model_slots": True}, "@dataclass(slots=True)\n"),
+        ({"model_frozen": True, "model_kw_only": True}, "@dataclass(frozen=True, kw_only=True)\n"),
+        (
+            {"model_slots": True, "model_frozen": True, "model_kw_only": True},
+            "@dataclass(slots=True, frozen=True, kw_only=True)\n",
+        ),
+    ],
+)
+def test_generate__model_options__decorator_carries_them(
+    dataclass_generator: DataclassGenerator, options: dict[str, bool], decorator: str
+) -> None:
+    """
+    Scenario:
+        - A model with a renamed field is generated with each combination of model options
+
+    Expected Outcome:
+        - The class is decorated with `@dataclass` and exactly the chosen options
+        - The Meta key-transform class is still emitted
+    """
+    # Arrange
+    context = _render_context(**options)
+
+    # Act
+    code = dataclass_generator.generate(USER_SCHEMA, "User", context)
+
+    # Assert
+    assert f"{decorator}class User:" in code
+    assert '"firstName": "first_name",' in code
+
+
+def test_generate__additional_properties_wrapper__decorator_carries_options(
+    dataclass_generator: DataclassGenerator,
+) -> None:
+    """
+    Scenario:
+        - A schema with only additionalProperties is generated with --model-slots and --model-frozen
+
+    Expected Outcome:
+        - Its dict wrapper class gets the same decorator as regular models
+        - The frozen wrapper has no __setitem__; the wrapper generated without the options keeps it
+    """
+    # Arrange
+    schema = IRSchema(name="Labels", type="object", additional_properties=True)
+    context = _render_context(model_slots=True, model_frozen=True)
+
+    # Act
+    code = dataclass_generator.generate(schema, "Labels", context)
+    mutable_code = dataclass_generator.generate(schema, "Labels", _render_context())
+
+    # Assert
+    assert "@dataclass(slots=True, frozen=True)\nclass Labels:" in code
+    assert "__setitem__" not in code and 'obj["new_key"]' not in code
+    assert "def __setitem__(self, key: str, value: Any) -> None:" in mutable_code
@@ -3,8 +3,9 @@ Tests for the ClientVisitor which generates the main API client class.
 """
 
 import re
+from dataclasses import replace
 
-from pyopenapi_gen import IROperation, IRSpec
+from pyopenapi_gen import IROperation, IRRequestBody, IRResponse, IRSchema, IRSpec
 from pyopenapi_gen.context.render_context import RenderContext
 from pyopenapi_gen.http_types import HTTPMethod  # Import for method type
 from pyopenapi_gen.visit.client_visitor import ClientVisitor
@@ -50,6 +51,32 @@ class TestClientVisitor:
         assert "__init__" in result
         assert "self.config = config" in result
         assert "self.transport = transport" in result
+        assert "max_connections=config.max_connections," in result
+        assert "http2=config.http2," in result
+        assert "pool_timeout=config.pool_timeout," in result
+        assert "local_address=config.local_address," in result
+        assert "shared=config.shared_transport," in result
+        assert "single_pass_decode_bytes=config.single_pass_decode_bytes," in result
+        assert (
+            "concurrency=AdaptiveConcurrency(max_limit=config.max_connections or 100)"
+            " if config.adaptive_concurrency else None," in result
+        )
+        assert "def concurrency_stats(self) -> dict[str, ConcurrencyStats]:" in result
+        assert "if config.rate_limit:" in result
+        assert "transport, max_retries=config.rate_limit_retries, max_retry_wait=config.rate_limit_max_wait" in result
+        assert "def rate_limit_stats(self) -> dict[str, RateLimitStats]:" in result
+        assert "if config.cache:" in result
+        assert (
+            "transport = CachingTransport(transport, max_bytes=config.cache_max_bytes, path=config.cache_path)"
+            in result
+        )
+        assert "def pool_stats(self) -> PoolStats | None:" in result
+        assert "transport = find_transport(self.transport, HttpxTransport)" in result
+        assert "rate_limiter = find_transport(self.transport, RateLimitingTransport)" in result
+        assert 'getattr(transport, "inner", None)' not in result
+        assert (
+            "def batch(self, max_concurrency: int | None = None, per_host_limit: int | None = None) -> Batch:" in result
+        )
         assert "async def close(self)" in result
         assert "async def __aenter__" in result
         assert "async def __aexit__" in result
@@ -370,3 +397,146 @@ class TestClientVisitor:
         assert "if hasattr(self.transport, '__aexit__'):" in result
         assert "await self.transport.__aexit__(exc_type, exc_val, exc_tb)" in result
         assert "await self.close()" in result
+
+    def test_visit__generates_warmup_method(self) -> None:
+        """
+        Scenario:
+            Generate a client class without operations
+        Expected Outcome:
+            APIClient.warmup() calls the core warmup_models with no models and returns its
+            WarmupReport; __init__ runs it in the background when config.warmup is set
+        """
+        # Arrange
+        spec = IRSpec(title="Test API", version="1.0.0", description="Test API", operations=[])
+
+        # Act
+        result = self.visitor.visit(spec, self.context)
+
+        # Assert
+        assert "def warmup(self, background: bool = False) -> WarmupReport:" in result
+        assert "return warmup_models([], background=background)" in result
+        assert "from . import models" not in result
+        assert (
+            "self.warmup_report: WarmupReport | None = self.warmup(background=True) if config.warmup else None"
+            in result
+        )
+        imports = self.context.import_collector.imports["test_app.core.cattrs_converter"]
+        assert {"WarmupReport", "warmup_models"} <= imports
+
+    def test_visit__warmup__covers_only_the_models_of_the_operations(self) -> None:
+        """
+        Scenario:
+            The spec has three models: User is returned inside an array, Order is the request
+            body of an operation and Audit is used by no operation
+        Expected Outcome:
+            APIClient.warmup() warms User and Order by their generated class names, not Audit
+        """
+        # Arrange
+        user = IRSchema(name="User", type="object", generation_name="User", final_module_stem="user")
+        order = IRSchema(name="order", type="object", generation_name="Order", final_module_stem="order")
+        audit = IRSchema(name="Audit", type="object", generation_name="Audit", final_module_stem="audit")
+        operations = [
+            IROperation(
+                operation_id="listUsers",
+                path="/users",
+                method=HTTPMethod.GET,
+                summary=None,
+                description=None,
+                responses=[
+                    IRResponse(
+                        status_code="200",
+                        description="OK",
+                        content={"application/json": IRSchema(type="array", items=user)},
+                    )
+                ],
+            ),
+            IROperation(
+                operation_id="createOrder",
+                path="/orders",
+                method=HTTPMethod.POST,
+                summary=None,
+                description=None,
+                request_body=IRRequestBody(required=True, content={"application/json": order}),
+                responses=[IRResponse(status_code="204", description="No Content", content={})],
+            ),
+        ]
+        spec = IRSpec(
+            title="Test API",
+            version="1.0.0",
+            schemas={"User": user, "order": order, "Audit": audit},
+            operations=operations,
+        )
+
+        # Act
+        result = self.visitor.visit(spec, self.context)
+
+        # Assert
+        assert "from . import models" in result
+        assert "models.Order,\n" in result and "models.User,\n" in result
+        assert "models.Audit" not in result
+
+    def test_visit__coalesced_operations__wrap_transport_in_coalescing_transport(self) -> None:
+        """
+        Scenario:
+            Generate a client class for a spec without coalesced operations, and for one where an
+            operation is marked for request coalescing
+        Expected Outcome:
+            Only the second client wraps its transport in a CoalescingTransport, unless
+            ClientConfig.coalesce is turned off
+        """
+        # Arrange
+        operation = IROperation(
+            operation_id="getSettings",
+            path="/settings",
+            method=HTTPMethod.GET,
+            summary="Get settings",
+            description="Get settings",
+            tags=["settings"],
+        )
+        plain_spec = IRSpec(title="Test API", version="1.0.0", operations=[operation])
+        coalesced_spec = IRSpec(title="Test API", version="1.0.0", operations=[replace(operation, coalesce=True)])
+
+        # Act
+        plain = self.visitor.visit(plain_spec, self.context)
+        coalesced = self.visitor.visit(coalesced_spec, self.context)
+
+        # Assert
+        assert "CoalescingTransport" not in plain
+        assert "if config.coalesce:" in coalesced
+        assert "transport = CoalescingTransport(transport)" in coalesced
+        assert "CoalescingTransport" in self.context.import_collector.imports["test_app.core.coalescing_transport"]
+
+    def test_visit__idempotent_operations__wrap_transport_in_hedging_transport(self) -> None:
+        """
+        Scenario:
+            Generate a client class for a spec without idempotent operations, and for one with an
+            idempotent operation
+        Expected Outcome:
+            Only the second client wraps its transport in a HedgingTransport when ClientConfig.hedge
+            is set, and reports hedging statistics
+        """
+        # Arrange
+        operation = IROperation(
+            operation_id="createOrder",
+            path="/orders",
+            method=HTTPMethod.POST,
+            summary="Create order",
+            description="Create order",
+            tags=["orders"],
+        )
+        plain_spec = IRSpec(title="Test API", version="1.0.0", operations=[operation])
+        hedged_spec = IRSpec(title="Test API", version="1.0.0", operations=[replace(operation, idempotent=True)])
+
+        # Act
+        plain = self.visitor.visit(plain_spec, self.context)
+        hedged = self.visitor.visit(hedged_spec, self.context)
+
+        # Assert
+        assert "HedgingTransport" not in plain
+        assert "if config.hedge:" in hedged
+        assert (
+            "transport = HedgingTransport(transport, percentile=config.hedge_percentile, budget=config.hedge_budget)"
+            in hedged
+        )
+        assert "def hedge_stats(self) -> dict[str, HedgeStats]:" in hedged
+        assert "HedgingTransport" in self.context.import_collector.imports["test_app.core.hedging_transport"]